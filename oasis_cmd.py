@@ -7,6 +7,9 @@ Usage examples:
   python cmd.py inspect schemas              # Print Schemas sheet of generated $index.xlsx
   python cmd.py inspect schemas listAlerts   # Print Schemas sheet of a specific output xlsx
   python cmd.py check arrays                 # Find all root-level array schemas in output
+  python cmd.py diff-batch old.yaml new1.yaml new2.yaml -o out   # One baseline vs many specs
+  python cmd.py import api.yaml out --progress-json                # OAS -> Excel, JSON-line progress
+  python cmd.py lint out/*.yaml --engine vacuum                    # Lint several specs in parallel
 """
 import sys
 import shutil
@@ -134,5 +137,14 @@ if __name__ == "__main__":
         inspect_schemas(args[2] if len(args) > 2 else "")
     elif cmd == "check" and len(args) >= 2 and args[1].lower() == "arrays":
         check_arrays()
+    elif cmd == "diff-batch":
+        from oas_diff.batch import main as diff_batch_main
+        sys.exit(diff_batch_main(args[1:]))
+    elif cmd == "import":
+        from src.oas_importer.oas_converter import main as import_main
+        sys.exit(import_main(args[1:]))
+    elif cmd == "lint":
+        from src.linter import main as lint_main
+        sys.exit(lint_main(args[1:]))
     else:
         print(__doc__)
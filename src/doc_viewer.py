@@ -11,6 +11,11 @@ import sys
 import ctypes
 import pygetwindow as gw
 
+try:
+    from .redoc_gen import inline_shared_asset
+except ImportError:
+    from redoc_gen import inline_shared_asset
+
 
 class RECT(ctypes.Structure):
     _fields_ = [
@@ -37,9 +42,11 @@ def debug_log(msg):
 class DocViewerAPI:
     """JavaScript API exposed to the webview for IPC."""
 
-    def __init__(self, snap_flag, sync_queue=None):
+    def __init__(self, snap_flag, sync_queue=None, html_path=None):
         self._snap_flag = snap_flag
         self._sync_queue = sync_queue
+        self._html_path = html_path
+        self._window = None  # set once the webview window exists
 
     def toggle_snap(self):
         """Toggle snap state - called from JavaScript."""
@@ -55,8 +62,26 @@ class DocViewerAPI:
     def print_doc(self):
         pass
 
-    def save_html(self):
-        pass
+    def save_html(self, html_content):
+        """
+        Save the page (as serialised by JavaScript) with the shared Redoc JS
+        inlined, so the copy works without the generated folder.
+        """
+        if self._window is None or not self._html_path:
+            return False
+        import webview
+
+        target = self._window.create_file_dialog(
+            webview.SAVE_DIALOG, save_filename="api_documentation.html"
+        )
+        if not target:
+            return False
+        if isinstance(target, (list, tuple)):
+            target = target[0]
+        debug_log(f"save_html to {target}")
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(inline_shared_asset(html_content, os.path.dirname(self._html_path)))
+        return True
 
     def sync_editor(self, info):
         """Called from JS to sync the YAML editor to the current documentation section."""
@@ -76,7 +101,7 @@ def _run_webview_docked(
         debug_log(f"Starting webview process for {title}")
 
         # Create API instance with shared snap flag and sync queue
-        api = DocViewerAPI(snap_flag, sync_queue=sync_queue)
+        api = DocViewerAPI(snap_flag, sync_queue=sync_queue, html_path=html_path)
 
         window = webview.create_window(
             title,
@@ -88,6 +113,7 @@ def _run_webview_docked(
             min_size=(400, 300),
             js_api=api,  # Expose Python API to JavaScript
         )
+        api._window = window
 
         def monitor_snap(window, snap_flag, cmd_queue=None):
             import time
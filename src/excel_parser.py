@@ -2,6 +2,7 @@ import pandas as pd
 import os
 import difflib
 import re
+from openpyxl import Workbook
 
 try:
     from .swift_services import SWIFT_SERVER_URL_KEY, read_swift_servers_from_general_description
@@ -9,14 +10,24 @@ except ImportError:
     from swift_services import SWIFT_SERVER_URL_KEY, read_swift_servers_from_general_description
 
 
+def _excel_engine(source):
+    """
+    pandas engine for a template source: auto-detected for files, openpyxl for
+    workbooks already loaded in memory (e.g. built by the roundtrip check).
+    """
+    return "openpyxl" if isinstance(source, Workbook) else None
+
+
 def load_excel_sheet(file_path, sheet_name):
     """
     Helper function to load a specific sheet from an Excel file.
     Includes smart header detection.
+    file_path may also be an in-memory openpyxl Workbook.
     """
+    engine = _excel_engine(file_path)
     try:
         # First read with no header to find the header row
-        df_raw = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+        df_raw = pd.read_excel(file_path, sheet_name=sheet_name, header=None, engine=engine)
 
         # Search for the header row
         header_row_idx = -1
@@ -42,7 +53,9 @@ def load_excel_sheet(file_path, sheet_name):
 
         if header_row_idx != -1:
             # Read with dtype=str to preserve exact numeric format (e.g., 100000000000000 not 1e14)
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row_idx, dtype=str)
+            df = pd.read_excel(
+                file_path, sheet_name=sheet_name, header=header_row_idx, dtype=str, engine=engine
+            )
 
             # Capture Metadata from rows above header (Gener generalized parsing)
             # Scan rows preceding the header for "Response" definition layout
@@ -94,7 +107,7 @@ def load_excel_sheet(file_path, sheet_name):
 
         else:
             # Fallback to default - still use dtype=str for consistency
-            df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str)
+            df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str, engine=engine)
 
         df.columns = df.columns.str.strip()
         df.attrs["sheet_name"] = sheet_name
@@ -352,9 +365,10 @@ def parse_components(file_path):
 
 def parse_operation_file(file_path):
     """
-    Parses a single operation Excel file.
+    Parses a single operation Excel file (path or in-memory openpyxl Workbook).
     """
-    if not os.path.exists(file_path):
+    in_memory = isinstance(file_path, Workbook)
+    if not in_memory and not os.path.exists(file_path):
         return None
 
     op_details = {}
@@ -366,9 +380,12 @@ def parse_operation_file(file_path):
 
     # Responses
     try:
-        xl = pd.ExcelFile(file_path)
-        response_sheets = [s for s in xl.sheet_names if s.isdigit()]
-        xl.close()  # Close Excel file to release file handle
+        if in_memory:
+            response_sheets = [s for s in file_path.sheetnames if s.isdigit()]
+        else:
+            xl = pd.ExcelFile(file_path)
+            response_sheets = [s for s in xl.sheet_names if s.isdigit()]
+            xl.close()  # Close Excel file to release file handle
         op_details["responses"] = {}
         for code in response_sheets:
             op_details["responses"][code] = load_excel_sheet(file_path, code)
@@ -8,7 +8,7 @@ from datetime import datetime
 from collections import OrderedDict
 
 # Import YAML utilities from generator_pkg package
-from src.generator_pkg.yaml_output import RawYAML, OASDumper, raw_yaml_presenter
+from src.generator_pkg.yaml_output import RawYAML, OASDumper, dump_with_line_index, raw_yaml_presenter
 from src.generator_pkg.swift_customizer import apply_swift_customization as _apply_swift_customization
 from src.generator_pkg.row_helpers import (
     get_col_value as _get_col_value_fn,
@@ -1405,7 +1405,15 @@ class OASGenerator:
         
         return schema
 
-    def get_yaml(self):
+    def get_yaml(self, line_index=None):
+        return self.render_yaml(self.get_document(), line_index=line_index)
+
+    def get_document(self):
+        """
+        Returns the post-processed OAS (section order, cleanups, example coercion)
+        exactly as get_yaml() serialises it. Operations may still carry their
+        __RAW_EXTENSIONS__ marker holding raw YAML text.
+        """
         # Cleanup components that were inlined and are no longer referenced
         self._cleanup_unused_inlined_components()
         
@@ -1509,20 +1517,30 @@ class OASGenerator:
         if self.generation_mode == GENERATION_MODE_MINIMAL:
             self._remove_all_examples(ordered_oas)
 
-        # Generate YAML
-        yaml_output = yaml.dump(
-            ordered_oas,
-            Dumper=OASDumper,
+        return ordered_oas
+
+    def render_yaml(self, ordered_oas, line_index=None):
+        """
+        Serialises a document returned by get_document() (consumes its raw extension markers).
+
+        line_index: Optional dict filled with JSON path tuple -> 0-based (line, column)
+        of every node in the returned text, recorded while emitting (no re-parse).
+        """
+        dump_options = dict(
             sort_keys=False,
             default_flow_style=False,
             allow_unicode=True,
             width=10000,
-
-
         )
+        if line_index is None:
+            # Generate YAML
+            yaml_output = yaml.dump(ordered_oas, Dumper=OASDumper, **dump_options)
+        else:
+            yaml_output, emitted_index = dump_with_line_index(ordered_oas, **dump_options)
+            line_index.update(emitted_index)
 
         # Post-process: Replace __RAW_EXTENSIONS__ markers with actual raw YAML
-        yaml_output = self._insert_raw_extensions(yaml_output, ordered_oas)
+        yaml_output = self._insert_raw_extensions(yaml_output, ordered_oas, line_index)
 
         return yaml_output
 
@@ -1734,7 +1752,7 @@ class OASGenerator:
         
         return '\n'.join(trimmed_lines).rstrip()
 
-    def _insert_raw_extensions(self, yaml_text: str, oas_dict: dict) -> str:
+    def _insert_raw_extensions(self, yaml_text: str, oas_dict: dict, line_index: dict = None) -> str:
         """
         Replace __RAW_EXTENSIONS__ markers with raw YAML text.
         
@@ -1745,6 +1763,9 @@ class OASGenerator:
         
         The extension text is already trimmed (normalized to column 0), so we
         just need to add the operation-level indentation (6 spaces).
+
+        If line_index is given, its lines are shifted to match the new text, the
+        marker entries are dropped and the top-level extension keys are added.
         """
         if "paths" not in oas_dict:
             return yaml_text
@@ -1753,12 +1774,15 @@ class OASGenerator:
         
         output_lines = yaml_text.split("\n")
         new_output = []
+        new_line_of = {}  # old line number -> line number in new_output
+        extension_lines = {}  # top-level raw extension keys -> (line, column) in new_output
         i = 0
         
         while i < len(output_lines):
             line = output_lines[i]
             
             if "__RAW_EXTENSIONS__:" in line:
+                marker_line = len(new_output)
                 # Found a marker - get the indentation level
                 marker_indent = len(line) - len(line.lstrip())
                 
@@ -1780,30 +1804,47 @@ class OASGenerator:
                     # Insert the extension text with proper indentation
                     for ext_line in raw_text.split("\n"):
                         if ext_line.strip():
+                            if not ext_line[0].isspace() and ":" in ext_line:
+                                ext_key = ext_line.split(":", 1)[0].strip().strip("'\"")
+                                extension_lines[("paths", str(path_url), str(method), ext_key)] = (
+                                    len(new_output), len(OPERATION_INDENT)
+                                )
                             new_output.append(OPERATION_INDENT + ext_line)
                         else:
                             new_output.append("")
                 
                 # Skip the marker line and any continuation (yaml.dump may have
                 # serialized the string as multiline |- or quoted)
+                new_line_of[i] = marker_line
                 i += 1
                 while i < len(output_lines):
                     next_line = output_lines[i]
                     if next_line.strip() == "":
                         # Empty line could be part of the value or separator
+                        new_line_of[i] = marker_line
                         i += 1
                         continue
                     next_indent = len(next_line) - len(next_line.lstrip())
                     if next_indent > marker_indent:
                         # Continuation of the yaml value, skip it
+                        new_line_of[i] = marker_line
                         i += 1
                     else:
                         # Back to normal content
                         break
             else:
+                new_line_of[i] = len(new_output)
                 new_output.append(line)
                 i += 1
 
+        if line_index:
+            for path, (line_no, column) in list(line_index.items()):
+                if path[-1:] == ("__RAW_EXTENSIONS__",):
+                    del line_index[path]
+                else:
+                    line_index[path] = (new_line_of.get(line_no, line_no), column)
+            line_index.update(extension_lines)
+
         return "\n".join(new_output)
 
     def _reorder_dict(self, d, keys_order):
@@ -4,9 +4,19 @@ YAML Output Utilities for OAS Generation.
 Contains custom YAML serialization classes for OpenAPI spec output.
 """
 
+import io
+
 import yaml
 from collections import OrderedDict
 
+# libyaml's C parser, loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as FastSafeDumper, CSafeLoader as FastSafeLoader
+    from yaml.cyaml import CParser
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as FastSafeDumper, SafeLoader as FastSafeLoader
+    CParser = None
+
 
 class SafeLoaderNoTimestamp(yaml.SafeLoader):
     """Custom YAML loader that doesn't parse timestamps into datetime objects."""
@@ -115,3 +125,118 @@ OASDumper.add_representer(
         "tag:yaml.org,2002:map", data.items()
     ),
 )
+
+
+class LineIndexingDumper(OASDumper):
+    """
+    OASDumper that records where every node is written while emitting.
+
+    line_index maps the JSON path of each node (tuple of str keys / list
+    indexes) to its 0-based (line, column) in the output, the same shape
+    native_linter.load_with_lines() builds by re-parsing the text.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.line_index = {}
+        self._node_paths = []
+
+    def serialize_node(self, node, parent, index):
+        if parent is None:
+            path = ()
+        elif isinstance(parent, yaml.SequenceNode):
+            path = self._node_paths[-1] + (str(index),)
+        elif index is None:
+            # Mapping key: located where its entry starts
+            path = self._node_paths[-1] + (str(node.value),)
+        else:
+            path = self._node_paths[-1] + (str(index.value),)
+        self._node_paths.append(path)
+        try:
+            super().serialize_node(node, parent, index)
+        finally:
+            self._node_paths.pop()
+
+    def emit(self, event):
+        if self._node_paths and isinstance(event, yaml.NodeEvent):
+            event.json_path = self._node_paths[-1]
+        super().emit(event)
+
+    def expect_node(self, root=False, sequence=False, mapping=False, simple_key=False):
+        path = getattr(self.event, "json_path", None)
+        if path is not None:
+            self.line_index.setdefault(path, (self.line, self.column))
+        super().expect_node(root, sequence, mapping, simple_key)
+
+
+def dump_with_line_index(data, **kwargs):
+    """
+    yaml.dump(data, Dumper=LineIndexingDumper, **kwargs) that also returns
+    the JSON path -> (line, column) index built during emission.
+    """
+    stream = io.StringIO()
+    dumper = LineIndexingDumper(stream, **kwargs)
+    try:
+        dumper.open()
+        dumper.represent(data)
+        dumper.close()
+    finally:
+        dumper.dispose()
+    return stream.getvalue(), dumper.line_index
+
+
+def _dumped_scalar_text(value):
+    """String normalisation applied by OASDumper.represent_scalar."""
+    value = value.replace("_x000D_", "").replace("\r", "").replace("\t", "    ")
+    if "\n" in value:
+        value = "\n".join(line.rstrip() for line in value.split("\n"))
+    return value
+
+
+def _dumped_float_text(value):
+    """Float text as written by SafeDumper (read back verbatim by SafeLoaderRawNumbers)."""
+    if value != value:
+        return ".nan"
+    if value in (float("inf"), float("-inf")):
+        return ".inf" if value > 0 else "-.inf"
+    text = repr(value).lower()
+    if "." not in text and "e" in text:
+        text = text.replace("e", ".0e", 1)
+    return text
+
+
+def as_loaded(obj, raw_yaml_key=None):
+    """
+    Returns a plain copy of a generated document as it reads back after being
+    dumped with OASDumper and loaded with SafeLoaderRawNumbers, without going
+    through YAML text: strings get the dumper's normalisation, numbers become
+    their textual form and ordered/marker types become plain dicts and strings.
+
+    raw_yaml_key names a mapping key whose string value is raw YAML spliced into
+    the output after dumping (e.g. "__RAW_EXTENSIONS__"); its entries are
+    parsed and merged in its place.
+    """
+    if isinstance(obj, dict):
+        loaded = {}
+        for key, value in obj.items():
+            if raw_yaml_key is not None and key == raw_yaml_key:
+                if value:
+                    raw = yaml.load(value, Loader=SafeLoaderRawNumbers)
+                    if isinstance(raw, dict):
+                        loaded.update(raw)
+                continue
+            loaded[as_loaded(key)] = as_loaded(value, raw_yaml_key)
+        return loaded
+    if isinstance(obj, (list, tuple)):
+        return [as_loaded(item, raw_yaml_key) for item in obj]
+    if isinstance(obj, RawYAML):
+        return _dumped_scalar_text(obj.raw_text)
+    if isinstance(obj, str):
+        return _dumped_scalar_text(str(obj))
+    if isinstance(obj, bool) or obj is None:
+        return obj
+    if isinstance(obj, int):
+        return str(obj)
+    if isinstance(obj, float):
+        return _dumped_float_text(obj)
+    return obj
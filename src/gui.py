@@ -26,7 +26,11 @@ try:
     from . import main as main_script
     from .linter import SpectralRunner
     from .charts import SemanticPieChart
+    from .validation_issue_list import VirtualIssueList
     from .redoc_gen import RedocGenerator
+    from .text_search import TextSearchIndex
+    from .yaml_structure import SourceMapIndex, YamlStructureIndex, json_pointer_path
+    from .yaml_highlighter import LazyCodeView
     from .preferences import (
         DEFAULT_GENERATION_MODE,
         GENERATION_MODES,
@@ -40,7 +44,8 @@ try:
     from .update_checker import check_for_update, load_update_release_index
     from .splash_screen import SplashScreen
     from .oas_importer.oas_converter import OASToExcelConverter
-    from .oas_importer.oas_comparator import OASComparator
+    from .oas_importer.import_progress import ImportProgress
+    from .oas_importer.roundtrip import run_roundtrip
     from .legacy_converter import LegacyConverter
     from .legacy_converter_dialog import LegacyConversionMetadataDialog, LegacyConverterDialog
     from .conversion_metadata_preferences import load_metadata_preferences, save_metadata_preferences
@@ -67,7 +72,11 @@ except ImportError:
     import main as main_script
     from linter import SpectralRunner
     from charts import SemanticPieChart
+    from validation_issue_list import VirtualIssueList
     from redoc_gen import RedocGenerator
+    from text_search import TextSearchIndex
+    from yaml_structure import SourceMapIndex, YamlStructureIndex, json_pointer_path
+    from yaml_highlighter import LazyCodeView
     from preferences import (
         DEFAULT_GENERATION_MODE,
         GENERATION_MODES,
@@ -81,7 +90,8 @@ except ImportError:
     from update_checker import check_for_update, load_update_release_index
     from splash_screen import SplashScreen
     from oas_importer.oas_converter import OASToExcelConverter
-    from oas_importer.oas_comparator import OASComparator
+    from oas_importer.import_progress import ImportProgress
+    from oas_importer.roundtrip import run_roundtrip
     from legacy_converter import LegacyConverter
     from legacy_converter_dialog import LegacyConversionMetadataDialog, LegacyConverterDialog
     from conversion_metadata_preferences import load_metadata_preferences, save_metadata_preferences
@@ -104,7 +114,6 @@ except ImportError:
         list_existing_oas_files,
     )
 
-from chlorophyll import CodeView
 import pygments.lexers
 
 
@@ -1206,6 +1215,8 @@ class OASGenApp(ctk.CTk):
         
         if linter_engine == "vacuum":
             binary_name = "vacuum.exe"
+        elif linter_engine == "native":
+            binary_name = "native"  # In-process, no binary
         else:
             binary_name = "spectral.exe"
             linter_engine = "spectral"  # Fallback
@@ -1224,12 +1235,15 @@ class OASGenApp(ctk.CTk):
             if os.path.exists(local_path):
                 linter_cmd = local_path
                 
-        self.linter = SpectralRunner(cmd=linter_cmd, engine=linter_engine)
+        # Lint results persist across sessions, keyed by file content (see lint_cache)
+        self.lint_cache_dir = self.prefs_manager.get_config_dir() / "lint_cache"
+        self.linter = SpectralRunner(cmd=linter_cmd, engine=linter_engine, cache_dir=self.lint_cache_dir)
         self.last_lint_result = None
         self.last_generated_files = []  # Track files from generation
         self.validated_file = None  # Track which file was validated (basename)
         self.validated_file_path = None  # Full path for caching
         self.validated_file_mtime = 0 
+        self.batch_lint_results = {}  # {normalized path: (mtime, result)} from "Validate All" or generation
         self.validation_issues = {}  # {line_number: [(severity, message), ...]}
         self.active_filters = set()   # codes to HIDE from issue list
         self.filter_buttons = []      # button refs for resize handler
@@ -1316,6 +1330,15 @@ class OASGenApp(ctk.CTk):
         self.chk_hide_info.grid(row=0, column=4, padx=(10, 0), sticky="w")
         self.chk_hide_info.select()  # Default Checked
 
+        # Validate every listed file at once
+        self.btn_validate_all = ctk.CTkButton(
+            self.frame_val_top,
+            text="Validate All",
+            width=100,
+            command=self.run_validation_all,
+        )
+        self.btn_validate_all.grid(row=0, column=5, padx=(20, 0))
+
         # Progress Bar (Indeterminate)
         self.progress_val = ctk.CTkProgressBar(self.tab_val, orientation="horizontal", mode="indeterminate")
         self.progress_val.grid(row=2, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 5))
@@ -1415,11 +1438,15 @@ class OASGenApp(ctk.CTk):
         )
         self.frame_list_container.grid_rowconfigure(0, weight=1)
         self.frame_list_container.grid_columnconfigure(0, weight=1)
-        self.frame_list = ctk.CTkScrollableFrame(
-            self.frame_list_container, label_text="Issues List", border_width=0, corner_radius=0
+        self.frame_list = VirtualIssueList(
+            self.frame_list_container,
+            goto_line=self._goto_line,
+            open_template=self._open_excel_file,
+            label_text="Issues List",
+            border_width=0,
+            corner_radius=0,
         )
         self.frame_list.grid(row=0, column=0, sticky="nsew", padx=1, pady=1)
-        self.frame_list_container.bind("<Configure>", self._on_validation_list_resize)
         self.paned_val_main.add(
             self.frame_list_container, minsize=280, sticky="nsew", stretch="always"
         )
@@ -1705,12 +1732,12 @@ class OASGenApp(ctk.CTk):
             command=self._goto_first_marker,
         )
         self.btn_first_marker.pack(side="right", padx=1)
-        # CodeView with YAML lexer and line numbers
+        # CodeView with YAML lexer and line numbers, highlighted around the viewport only
         self._current_marker_line = None
         yaml_font_size = self.prefs_manager.get("yaml_font_size", 12)
         yaml_font_family = self.prefs_manager.get("yaml_font", "Consolas")
         yaml_word_wrap = self.prefs_manager.get("yaml_word_wrap", True)
-        self.txt_yaml = CodeView(
+        self.txt_yaml = LazyCodeView(
             self.frame_yaml,
             lexer=pygments.lexers.YamlLexer,
             color_scheme="monokai",  # Use built-in initially
@@ -1718,6 +1745,12 @@ class OASGenApp(ctk.CTk):
             wrap=("word" if yaml_word_wrap else "none"),
         )
         self.txt_yaml.pack(fill="both", expand=True, padx=2, pady=2)
+        self._yaml_viewport_job = None
+        self._yaml_search_index = None  # TextSearchIndex of the shown YAML, built on first search
+        self._yaml_search_current = None  # (query, match number, cursor offset) of the last jump
+        self._yaml_structure_index = None  # YamlStructureIndex of the shown YAML, built on first sync
+        self._source_map_index = None  # SourceMapIndex of current_source_map
+        self.txt_yaml.configure(yscrollcommand=self._on_yaml_yview)
 
         if not hasattr(self, "_tooltip_window"):
             self._tooltip_window = None
@@ -1777,6 +1810,7 @@ class OASGenApp(ctk.CTk):
         tools_menu = self._create_styled_menu(menubar)
         tools_menu.add_command(label="Create Template from OAS", command=self.open_import_dialog)
         tools_menu.add_command(label="OAS Comparison", command=self.open_oas_diff)
+        tools_menu.add_command(label="Export Documentation for Output Folder", command=self.export_output_docs)
         tools_menu.add_separator()
         tools_menu.add_command(label="Legacy Template Converter", command=self.open_legacy_converter)
         tools_menu.add_command(label="Template Schema Tracer", command=self.open_legacy_schema_tracer)
@@ -2224,35 +2258,6 @@ class OASGenApp(ctk.CTk):
         except Exception:
             return 11
 
-    def _get_validation_wraplength(self):
-        try:
-            width = self.frame_list_container.winfo_width()
-            if width and width > 120:
-                return max(220, width - 70)
-        except Exception:
-            pass
-        return 350
-
-    def _on_validation_list_resize(self, event=None):
-        """Re-wrap issue cards when the issues panel width changes materially."""
-        if not getattr(self, "_current_validation_details", None):
-            return
-        try:
-            width = int(self.frame_list_container.winfo_width())
-        except Exception:
-            return
-        last_width = getattr(self, "_last_validation_render_width", 0)
-        if abs(width - last_width) < 24:
-            return
-        if hasattr(self, "_validation_resize_job") and self._validation_resize_job:
-            try:
-                self.after_cancel(self._validation_resize_job)
-            except Exception:
-                pass
-        self._validation_resize_job = self.after(
-            80, lambda: self._render_validation_issue_list(self._current_validation_details)
-        )
-
     def _on_validation_font_size_change(self, value):
         """Handle font size slider change in Validation tab."""
         if getattr(self, "_suspend_validation_font_events", False):
@@ -2269,138 +2274,25 @@ class OASGenApp(ctk.CTk):
             self.show_results(self.last_lint_result, fresh_run=False)
 
     def _render_validation_issue_list(self, details):
-        """Render validation issues using the configured accessibility font size."""
-        self._current_validation_details = list(details or [])
-        self._validation_resize_job = None
-        try:
-            self._last_validation_render_width = int(self.frame_list_container.winfo_width())
-        except Exception:
-            self._last_validation_render_width = 0
-        for widget in self.frame_list.winfo_children():
-            widget.destroy()
-
-        total_issues = len(details)
+        """Show validation issues (virtualized) using the configured accessibility font size."""
         font_size = self._get_validation_font_size()
-        wraplength = self._get_validation_wraplength()
-        badge_font_size = max(8, font_size - 1)
-        code_font_size = max(9, font_size)
-        path_font_size = max(8, font_size - 1)
-        line_font_size = max(8, font_size - 1)
-        empty_font_size = max(12, font_size + 5)
-
-        if total_issues == 0:
-            ctk.CTkLabel(
-                self.frame_list,
-                text="No issues found! Great job!",
-                text_color="#0A809E",
-                font=("Arial", empty_font_size),
-            ).pack(pady=20)
+        if not details:
+            self.frame_list.show_message("No issues found! Great job!", font_size=max(12, font_size + 5))
             return
+        self.frame_list.set_issues(
+            details,
+            font_size=font_size,
+            template_for=self._issue_template_source if self.current_source_map else None,
+        )
 
-        for item in details:
-            card = ctk.CTkFrame(
-                self.frame_list,
-                border_width=1,
-                border_color="#C0C0C0",
-                fg_color=("#E0E0E0", "#2B2B2B"),
-                corner_radius=6,
-            )
-            card.pack(fill="x", pady=3, padx=2)
-
-            r1 = ctk.CTkFrame(card, fg_color="transparent")
-            r1.pack(fill="x", padx=6, pady=6)
-
-            badge_fg = "gray"
-            badge_text_color = "white"
-            if item["severity"] == "error":
-                badge_fg = "#FF4444"
-            elif item["severity"] == "warning":
-                badge_fg = "#FFBB33"
-                badge_text_color = "black"
-            elif item["severity"] == "info":
-                badge_fg = "#33B5E5"
-
-            ctk.CTkLabel(
-                r1,
-                text=f" {item['severity'].upper()} ",
-                fg_color=badge_fg,
-                text_color=badge_text_color,
-                corner_radius=6,
-                font=("Arial", badge_font_size, "bold"),
-                height=20,
-            ).pack(side="left")
-
-            ctk.CTkLabel(
-                r1,
-                text=item["code"],
-                font=("Arial", code_font_size, "bold"),
-                text_color=("#333333", "#F0F0F0"),
-            ).pack(side="left", padx=8)
-
-            line_num = item["line"]
-            line_btn = ctk.CTkButton(
-                r1,
-                text=f"Line {line_num}",
-                font=("Arial", line_font_size),
-                fg_color="transparent",
-                text_color=("#666666", "#AAAAAA"),
-                hover_color=("#D0D0D0", "#3A3A3A"),
-                border_width=1,
-                border_color=("#BBBBBB", "#555555"),
-                corner_radius=4,
-                width=60,
-                height=20,
-                command=lambda ln=line_num: self._goto_line(ln),
-            )
-            line_btn.pack(side="right")
-
-            if self.current_source_map and item["path"]:
-                source_info = self._resolve_source_file(item["path"])
-                if source_info:
-                    if isinstance(source_info, dict):
-                        filename = source_info.get("file")
-                        sheetname = source_info.get("sheet")
-                    else:
-                        filename = source_info
-                        sheetname = None
-
-                    if filename:
-                        ctk.CTkButton(
-                            r1,
-                            text="Template Sheet",
-                            height=20,
-                            width=100,
-                            fg_color="transparent",
-                            border_width=1,
-                            border_color="#107C41",
-                            text_color="#107C41",
-                            hover_color="#E6F2EA",
-                            font=("Arial", line_font_size, "bold"),
-                            corner_radius=4,
-                            command=lambda f=filename, s=sheetname: self._open_excel_file(f, s),
-                        ).pack(side="right", padx=5)
-
-            if item["path"] and item["path"] != "Root":
-                path_color = ("#555555", "#AAAAAA")
-                ctk.CTkLabel(
-                    card,
-                    text=f"Path: {item['path']}",
-                    text_color=path_color,
-                    font=("Consolas", path_font_size),
-                    anchor="w",
-                    justify="left",
-                    wraplength=wraplength,
-                ).pack(fill="x", padx=5, pady=2)
-
-            ctk.CTkLabel(
-                card,
-                text=item["message"],
-                anchor="w",
-                justify="left",
-                wraplength=wraplength,
-                font=("Arial", font_size),
-                text_color=("#333333", "#FFFFFF"),
-            ).pack(fill="x", padx=5, pady=(0, 5))
+    def _issue_template_source(self, path):
+        """(file, sheet) of the template an issue path comes from, or None."""
+        source_info = self._resolve_source_file(path)
+        if not source_info:
+            return None
+        if isinstance(source_info, dict):
+            return source_info.get("file"), source_info.get("sheet")
+        return source_info, None
 
     def _on_close(self):
         """Handle window close - save geometry and exit."""
@@ -2618,6 +2510,13 @@ class OASGenApp(ctk.CTk):
             except Exception:
                 pass
 
+        if "excel_gen_keep_artefacts" in new_prefs:
+            try:
+                if hasattr(self, "var_keep_artefacts"):
+                    self.var_keep_artefacts.set(new_prefs["excel_gen_keep_artefacts"])
+            except Exception:
+                pass
+
         # Apply log themes immediately
         if "gen_log_theme" in new_prefs:
             theme = new_prefs["gen_log_theme"]
@@ -2669,7 +2568,7 @@ class OASGenApp(ctk.CTk):
                     base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
                     local = os.path.join(base, "bin", binary_name)
                     if os.path.exists(local): linter_cmd = local
-                self.linter = SpectralRunner(cmd=linter_cmd, engine=new_engine)
+                self.linter = SpectralRunner(cmd=linter_cmd, engine=new_engine, cache_dir=self.lint_cache_dir)
                 # Update toggle button labels
                 engine_label = new_engine.capitalize()
                 self.btn_toggle_log_h.configure(text=f"▼ {engine_label} Output")
@@ -2677,6 +2576,7 @@ class OASGenApp(ctk.CTk):
                 # Invalidate validation cache to force re-run
                 self.validated_file_path = None
                 self.validated_file_mtime = 0
+                self.batch_lint_results = {}
 
         # Refresh file list with new sort order
         # Refresh file list with new sort order
@@ -3052,7 +2952,8 @@ class OASGenApp(ctk.CTk):
                         self.last_generated_files.append(parts[1].strip())
                         self.after(0, self.update_file_list)
 
-            main_script.generate_oas(
+            lint_generated = self.prefs_manager.get("lint_after_generation", False)
+            lint_results = main_script.generate_oas(
                 base_dir,
                 gen_30=gen_30,
                 gen_31=gen_31,
@@ -3061,7 +2962,19 @@ class OASGenApp(ctk.CTk):
                 x_info_options=x_info_options,
                 output_dir=output_dir,
                 log_callback=gui_logger,
+                linter=self.linter if lint_generated else None,
             )
+            if lint_results and self.linter.engine == "native":
+                # Same rules and lines as validating the written file: reuse them there
+                mtimes = {path: os.path.getmtime(path) for path in lint_results if os.path.exists(path)}
+
+                def seed_lint_results():
+                    for path, mtime in mtimes.items():
+                        if lint_results[path].get("success"):
+                            key = os.path.normcase(os.path.normpath(path))
+                            self.batch_lint_results[key] = (mtime, lint_results[path])
+
+                self.after(0, seed_lint_results)
 
         except Exception as e:
             self.after(0, self.log_gen, f"CRITICAL ERROR: {e}")
@@ -3145,14 +3058,20 @@ class OASGenApp(ctk.CTk):
         # Update cache state (full path for caching)
         self.validated_file_path = selected_file
         self.validated_file_mtime = current_mtime
+
+        # Already linted by "Validate All" (or right after generation) and unchanged since
+        batch_entry = self.batch_lint_results.get(os.path.normcase(os.path.normpath(selected_file)))
+        if batch_entry and batch_entry[0] == current_mtime:
+            self.val_log_print(f"Using earlier lint results for: {selected_name}")
+            self.show_results(batch_entry[1], fresh_run=True)
+            return
         
         self.val_log_print(f"Starting validation for: {selected_name}")
         
         # Show Floating Progress Modal (Splash Style)
         prog_win, prog_lbl = self._show_progress_modal(f"Running {self.linter.engine.capitalize()}...")
 
-        for widget in self.frame_list.winfo_children():
-            widget.destroy()
+        self.frame_list.clear()
 
         def validate_thread():
             try:
@@ -3172,6 +3091,58 @@ class OASGenApp(ctk.CTk):
         t = threading.Thread(target=validate_thread)
         t.start()
 
+    def run_validation_all(self):
+        """Lint every file in the list concurrently, then show the selected one."""
+        paths = [path for path in self.file_map.values() if os.path.exists(path)]
+        if not paths:
+            self.val_log_print("No OAS files to validate.")
+            return
+
+        # mtimes before linting: a file rewritten meanwhile is linted again later
+        mtimes = {path: os.path.getmtime(path) for path in paths}
+        self.val_log_print(f"Starting validation for {len(paths)} files...")
+        self.btn_validate_all.configure(state="disabled")
+        prog_win, prog_lbl = self._show_progress_modal(
+            f"Running {self.linter.engine.capitalize()} on {len(paths)} files..."
+        )
+
+        def show_batch(results):
+            for row in self.linter.summarize_many(results):
+                name = os.path.basename(row["file"])
+                if row["success"]:
+                    self.val_log_print(
+                        f"  {name}: {row['error']} errors, {row['warning']} warnings, "
+                        f"{row['info']} info, {row['hint']} hints"
+                    )
+                else:
+                    self.val_log_print(f"  {name}: FAILED ({row['error_msg']})")
+            for path, result in results.items():
+                if result.get("success"):
+                    self.batch_lint_results[os.path.normcase(os.path.normpath(path))] = (mtimes[path], result)
+            self.btn_validate_all.configure(state="normal")
+
+            selected_file = self.file_map.get(self.cbo_files.get())
+            if selected_file in results:
+                self.validated_file_path = selected_file
+                self.validated_file_mtime = mtimes[selected_file]
+                self.show_results(results[selected_file], prog_win, prog_lbl, fresh_run=True)
+            else:
+                prog_win.destroy()
+
+        def validate_all_thread():
+            try:
+                def thread_logger(msg):
+                    self.after(0, lambda: self.val_log_print(msg))
+
+                results = self.linter.run_lint_many(paths, log_callback=thread_logger)
+                self.after(0, lambda: show_batch(results))
+            except Exception as e:
+                self.after(0, lambda: self.val_log_print(f"THREAD CRASH: {e}"))
+                self.after(0, lambda: self.btn_validate_all.configure(state="normal"))
+                self.after(0, prog_win.destroy)
+
+        threading.Thread(target=validate_all_thread).start()
+
     def _show_progress_modal(self, message="Validating..."):
         """Create a floating modal with progress bar."""
         top = ctk.CTkToplevel(self)
@@ -3221,17 +3192,8 @@ class OASGenApp(ctk.CTk):
 
         if not result["success"]:
             self.val_log_print(f"Error: {result.get('error_msg', 'Unknown Error')}")
-            self.frame_list.configure(label_text="Error")
-            # Clear previous
-            for widget in self.frame_list.winfo_children():
-                widget.destroy()
-
-            err_lbl = ctk.CTkLabel(
-                self.frame_list,
-                text=result.get("error_msg", "Unknown Error"),
-                text_color="red",
-            )
-            err_lbl.pack()
+            self.frame_list.set_title("Error")
+            self.frame_list.show_message(result.get("error_msg", "Unknown Error"), text_color="red")
             close_progress()
             return
 
@@ -3282,7 +3244,7 @@ class OASGenApp(ctk.CTk):
         total_issues = len(details)
 
         self.val_log_print(f"Check Complete: {total_issues} issues found.")
-        self.frame_list.configure(label_text=f"Issues ({total_issues})")
+        self.frame_list.set_title(f"Issues ({total_issues})")
 
         # Store validation issues by line for YAML viewer markers
         # Update validated_file to basename for marker matching (full path stays in validated_file_path)
@@ -3322,13 +3284,16 @@ class OASGenApp(ctk.CTk):
                             self.current_source_map = json.load(f)
         except Exception as e:
             print(f"Error loading source map: {e}")
+        self._source_map_index = SourceMapIndex(self.current_source_map)
 
-        # Populate Raw JSON Tab
-        raw_data = result.get("raw_data", [])
-        formatted_json = json.dumps(raw_data, indent=2)
+        # Populate Raw JSON Tab (unfiltered: unchanged when only the filters change)
+        if getattr(self, "_raw_json_result", None) is not result:
+            self._raw_json_result = result
+            raw_data = result.get("raw_data", [])
+            formatted_json = json.dumps(raw_data, indent=2)
 
-        self.val_json_log.delete("0.0", "end")
-        self.val_json_log.insert("0.0", formatted_json)
+            self.val_json_log.delete("0.0", "end")
+            self.val_json_log.insert("0.0", formatted_json)
 
         # Update modal message for card construction phase
         if progress_label:
@@ -3337,7 +3302,7 @@ class OASGenApp(ctk.CTk):
         
         self._render_validation_issue_list(details)
 
-        # Force complete rendering of all cards BEFORE closing modal
+        # Force rendering of the visible cards BEFORE closing modal
         # This ensures the "PAM!" effect where everything appears at once
         self.update()
         
@@ -3718,18 +3683,10 @@ class OASGenApp(ctk.CTk):
         self._update_sync_button_visibility()
 
     def _set_yaml_view_content(self, content: str) -> None:
-        """Set YAML viewer content without triggering per-line highlight loops."""
+        """Set YAML viewer content without triggering per-line or full-text highlighting."""
         # Ensure writable for update
         self.txt_yaml.config(state="normal")
 
-        # Cancel any pending highlight job from a previous file load
-        if hasattr(self, "_yaml_highlight_job") and self._yaml_highlight_job is not None:
-            try:
-                self.after_cancel(self._yaml_highlight_job)
-            except Exception:
-                pass
-            self._yaml_highlight_job = None
-
         # Bypass chlorophyll command proxy if available
         orig = getattr(self.txt_yaml, "_orig", None)
         if orig:
@@ -3773,40 +3730,8 @@ class OASGenApp(ctk.CTk):
         except Exception:
             pass
 
-        # Schedule a single highlight pass (debounced) so the UI can paint first
-        def _do_highlight():
-            self._yaml_highlight_job = None
-
-            # If the user scrolls immediately after the content is loaded, the deferred
-            # highlight/line-number refresh can cause a visible yview "bounce" (most
-            # noticeable at the end of the file). Preserve the current viewport.
-            try:
-                yview = self.txt_yaml.yview()
-                xview = self.txt_yaml.xview()
-            except Exception:
-                yview = None
-                xview = None
-            try:
-                self.txt_yaml.highlight_all()
-            except Exception:
-                pass
-
-            # Re-sync scrollbars after highlighting (highlighting adds/removes tags)
-            try:
-                self.txt_yaml.scroll_line_update()
-            except Exception:
-                pass
-
-            # Restore viewport after the redraw.
-            try:
-                if yview is not None:
-                    self.txt_yaml.yview_moveto(yview[0])
-                if xview is not None:
-                    self.txt_yaml.xview_moveto(xview[0])
-            except Exception:
-                pass
-
-        self._yaml_highlight_job = self.after(10, _do_highlight)
+        # Tokenise off the UI thread; only the lines around the viewport get tagged
+        self.txt_yaml.highlighter.load(content, self.txt_yaml._lexer)
 
     def open_in_browser(self):
         """Generate Redoc HTML and open it in the system's default browser."""
@@ -3816,15 +3741,15 @@ class OASGenApp(ctk.CTk):
             return
 
         try:
-            # Generate HTML
-            html_content = self.redoc_gen.get_html_content(self._current_yaml_content)
-
             # Save to file in the generated folder
             base_dir = self.entry_dir.get()
             gen_dir = os.path.join(base_dir, "generated")
             if not os.path.exists(gen_dir):
                 os.makedirs(gen_dir)
 
+            # Generate HTML (self-contained: the browser's Save HTML keeps it standalone)
+            html_content = self.redoc_gen.get_html_content(self._current_yaml_content)
+
             # Create a nice filename
             html_filename = self._current_file_name.replace(
                 ".yaml", "_redoc.html"
@@ -3842,21 +3767,51 @@ class OASGenApp(ctk.CTk):
         except Exception as e:
             self.val_log_print(f"Error opening browser: {e}")
 
+    def export_output_docs(self):
+        """Render the Redoc HTML of every OAS file in the output folder (in the background)."""
+        oas_dir = self.entry_oas_folder.get()
+        if not oas_dir or not os.path.isdir(oas_dir):
+            tk.messagebox.showerror("Error", "OAS output folder is not set or valid.")
+            return
+
+        prog_win, _ = self._show_progress_modal("Exporting documentation...")
+
+        def show_summary(results):
+            prog_win.destroy()
+            statuses = [result["status"] for result in results.values()]
+            self.log_gen(
+                f"Documentation export: {statuses.count('exported')} exported, "
+                f"{statuses.count('unchanged')} unchanged, {statuses.count('removed')} removed, "
+                f"{statuses.count('failed')} failed"
+            )
+
+        def export_thread():
+            try:
+                results = self.redoc_gen.export_folder(
+                    oas_dir, log_callback=lambda msg: self.after(0, self.log_gen, msg)
+                )
+                self.after(0, lambda: show_summary(results))
+            except Exception as e:
+                self.after(0, self.log_gen, f"Error exporting documentation: {e}")
+                self.after(0, prog_win.destroy)
+
+        threading.Thread(target=export_thread, daemon=True).start()
+
     def open_documentation_viewer(self):
         """Open documentation in a docked viewer window."""
         if not hasattr(self, "_current_yaml_content") or not self._current_yaml_content:
             return
 
         try:
-            # Generate HTML content
-            html_content = self.redoc_gen.get_html_content(self._current_yaml_content)
-
             # Save to file (pywebview needs a file path)
             base_dir = self.entry_dir.get()
             gen_dir = os.path.join(base_dir, "generated")
             if not os.path.exists(gen_dir):
                 os.makedirs(gen_dir)
 
+            # Generate HTML content (referencing the Redoc JS shared by the files of the folder)
+            html_content = self.redoc_gen.get_html_content(self._current_yaml_content, asset_dir=gen_dir)
+
             # Correct filename: same as YAML but with .html
             base_name = os.path.splitext(self._current_file_name)[0]
             html_filename = f"{base_name}.html"
@@ -3984,9 +3939,7 @@ class OASGenApp(ctk.CTk):
         # Otherwise, clearing/retagging thousands of lines can cause redraw flicker.
         if not getattr(self, "validated_file", None) or self.validated_file != filename or not self.validation_issues:
             try:
-                self.txt_yaml.tag_remove("error_line", "1.0", "end")
-                self.txt_yaml.tag_remove("warning_line", "1.0", "end")
-                self.txt_yaml.tag_remove("info_line", "1.0", "end")
+                self.txt_yaml.highlighter.set_line_tags({})
             except Exception:
                 pass
 
@@ -4000,11 +3953,6 @@ class OASGenApp(ctk.CTk):
             self._hide_tooltip()
             return
 
-        # Remove previous tags
-        self.txt_yaml.tag_remove("error_line", "1.0", "end")
-        self.txt_yaml.tag_remove("warning_line", "1.0", "end")
-        self.txt_yaml.tag_remove("info_line", "1.0", "end")
-
         # Configure tags for highlighting with theme-aware colors
         current_theme = (
             self.cbo_yaml_theme.get() if hasattr(self, "cbo_yaml_theme") else "oas-dark"
@@ -4033,24 +3981,18 @@ class OASGenApp(ctk.CTk):
         # Prevents log pollution on startup
 
 
-        # Apply tags to lines with issues
+        # Tag lines with issues; the highlighter only tags the lines around the viewport
+        line_tags = {}
         for line_num, issues in self.validation_issues.items():
             # Determine highest severity for this line
             severities = [issue["severity"] for issue in issues]
             if "error" in severities:
-                tag = "error_line"
+                line_tags[line_num] = "error_line"
             elif "warning" in severities:
-                tag = "warning_line"
+                line_tags[line_num] = "warning_line"
             else:
-                tag = "info_line"
-
-            # Apply tag to entire line (including beyond last character)
-            start = f"{line_num}.0"
-            end = f"{line_num}.end+1c"  # +1c includes the newline, making full line colored
-            try:
-                self.txt_yaml.tag_add(tag, start, end)
-            except:
-                pass  # Line might not exist
+                line_tags[line_num] = "info_line"
+        self.txt_yaml.highlighter.set_line_tags(line_tags)
 
         # Raise tag priority to be above syntax highlighting
         self.txt_yaml.tag_raise("error_line")
@@ -4329,32 +4271,17 @@ class OASGenApp(ctk.CTk):
             )
             return
 
-        # Find first operationId visible in the editor viewport
+        # Operation at the top of the editor viewport, else the first one below it
         try:
-            import re
-
-            # Get the visible range in the text widget
             # @0,0 is the top-left corner of the visible area
-            first_visible = self.txt_yaml.index("@0,0")
-            first_line = int(first_visible.split(".")[0])
-
-            # Get all content
-            content_lines = self.txt_yaml.get("1.0", "end").splitlines()
+            first_line = int(self.txt_yaml.index("@0,0").split(".")[0])
+            index = self._get_yaml_structure_index()
+            operation = index.operation_at(first_line) or index.next_operation(first_line)
             target_path = ""
-
-            # Search from the first visible line downwards for the first operationId
-            for i in range(first_line - 1, len(content_lines)):
-                line = content_lines[i]
-
-                # Regex for operationId (handles optional quotes and spacing)
-                op_id_match = re.search(r"operationId:\s+['\"]?([\w\.-]+)['\"]?", line)
-                if op_id_match:
-                    op_id = op_id_match.group(1)
-                    target_path = f"#/operations/{op_id}"
-                    self.val_log_print(
-                        f"Found visible operationId '{op_id}' at line {i+1}"
-                    )
-                    break
+            if operation:
+                op_id, op_line = operation
+                target_path = f"#/operations/{op_id}"
+                self.val_log_print(f"Found visible operationId '{op_id}' at line {op_line}")
 
             if target_path:
                 self.val_log_print(f"📲 Syncing viewer to: {target_path}")
@@ -4380,60 +4307,42 @@ class OASGenApp(ctk.CTk):
         if debug_info:
             self.val_log_print(f"🔍 JS Detection: {debug_info}")
 
-        search_terms = []
+        index = self._get_yaml_structure_index()
+        targets = []  # (description, line or None), most reliable first
 
         # 1. Prioritize operationId (most reliable if present)
         if operation_id:
-            search_terms.append(f"operationId: {operation_id}")
-            search_terms.append(f"operationId: '{operation_id}'")
-            search_terms.append(f'operationId: "{operation_id}"')
+            targets.append((f"operationId: {operation_id}", index.operation_ids.get(operation_id)))
 
         # 2. Try to extract from hash
-        if hash_val and not search_terms:
-            clean_hash = hash_val.lstrip("#/")
-            if "operations/" in clean_hash:
-                op_id = clean_hash.split("operations/")[1]
-                search_terms.append(f"operationId: {op_id}")
-            elif "paths/" in clean_hash:
-                path_raw = clean_hash.split("paths/")[1]
-                path = path_raw.replace("~1", "/")
-                search_terms.append(f"  {path}:")  # 2-space indent for path entries
+        clean_hash = hash_val.lstrip("#/") if hash_val else ""
+        if "operations/" in clean_hash:
+            op_id = clean_hash.split("operations/")[1]
+            targets.append((f"operationId: {op_id}", index.operation_ids.get(op_id)))
+        elif "paths/" in clean_hash:
+            path = json_pointer_path("paths/" + clean_hash.split("paths/")[1])
+            targets.append((" > ".join(path), index.closest_line(path)))
 
         # 3. Fallback to section title
-        if section_title and not search_terms:
-            search_terms.append(f"summary: {section_title}")
+        if section_title:
+            targets.append((f"summary: {section_title}", index.summaries.get(section_title)))
 
-        if not search_terms:
+        if not targets:
             self.val_log_print(
                 "⚠️ Sync: No valid operationId or path detected from viewer."
             )
             return
 
-        # Search in YAML
-        content = self.txt_yaml.get("1.0", "end")
-        lines = content.splitlines()
-
-        found_line = -1
-        matched_term = ""
-        for term in search_terms:
-            if not term:
-                continue
-            for i, line in enumerate(lines):
-                if term in line:
-                    found_line = i + 1
-                    matched_term = term
-                    break
-            if found_line != -1:
-                break
-
-        if found_line != -1:
+        found = next(((term, line) for term, line in targets if line is not None), None)
+        if found:
+            matched_term, found_line = found
             self.val_log_print(
                 f"⬆️ Syncing editor to line {found_line} (matched: '{matched_term}')"
             )
             # Defer highlight slightly to ensure window focus and tab switch are complete
             self.after(50, lambda: self._scroll_to_line_and_highlight(found_line))
         else:
-            self.val_log_print(f"⚠️ Sync: Could not find '{search_terms[0]}' in YAML.")
+            self.val_log_print(f"⚠️ Sync: Could not find '{targets[0][0]}' in YAML.")
 
     def _scroll_to_line_and_highlight(self, line_no):
         """Scroll to a line, center it, and apply a temporary highlight 'flash' effect."""
@@ -4505,6 +4414,7 @@ class OASGenApp(ctk.CTk):
             def on_search_close():
                 try:
                     self.txt_yaml.tag_remove("found", "1.0", "end")
+                    self.txt_yaml.tag_remove("found_all", "1.0", "end")
                 except:
                     pass
                 self.search_window.destroy()
@@ -4568,6 +4478,7 @@ class OASGenApp(ctk.CTk):
             # 2. Count Label
             self.lbl_search_count = ctk.CTkLabel(frame, text="0/0", width=60, text_color="gray60")
             self.lbl_search_count.grid(row=0, column=2, padx=(0, 5))
+            self.lbl_search_count.bind("<Button-1>", self._goto_match_prompt)
 
             # 3. Buttons (Icon style)
             btn_prev = ctk.CTkButton(
@@ -4708,8 +4619,27 @@ class OASGenApp(ctk.CTk):
         # Debounce slightly could be good, but simple is fine for now
         self._update_match_count()
 
+    def _get_yaml_search_index(self):
+        """Search index over the YAML shown in the viewer (rebuilt when the file changes)."""
+        content = getattr(self, "_current_yaml_content", None) or ""
+        index = self._yaml_search_index
+        if index is None or index.text is not content:
+            index = TextSearchIndex(content)
+            self._yaml_search_index = index
+            self._yaml_search_current = None
+        return index
+
+    def _get_yaml_structure_index(self):
+        """Path/line/operation index of the YAML shown in the viewer (rebuilt when the file changes)."""
+        content = getattr(self, "_current_yaml_content", None) or ""
+        index = self._yaml_structure_index
+        if index is None or index.text is not content:
+            index = YamlStructureIndex(content)
+            self._yaml_structure_index = index
+        return index
+
     def _update_match_count(self, current_match_start=None):
-        """Count all occurrences and identify current index."""
+        """Show the exact match count and the number of the current match."""
         if current_match_start is None:
             try:
                 current_match_start = self.txt_yaml.index("insert")
@@ -4722,68 +4652,96 @@ class OASGenApp(ctk.CTk):
         query = self.search_entry.get()
         if not query:
             self.lbl_search_count.configure(text="0/0")
+            self._highlight_visible_matches()
             return
             
-        # Count matches
         try:
-            matches = []
-            start = "1.0"
-            max_count = 100 # Safety limit to prevent freezing on large files/many matches
-            
-            while True:
-                pos = self.txt_yaml.search(query, start, stopindex="end", nocase=True)
-                if not pos:
-                    break
-                matches.append(pos)
-                start = f"{pos}+1c"
-                
-                if len(matches) >= max_count:
-                    break
-            
-            total = len(matches)
+            index = self._get_yaml_search_index()
+            total = index.count(query)
             current = 0
-            
             if current_match_start:
-                 # Find which match corresponds to current_match_start
-                 # Robust logic: The "current" match is the LAST match that starts BEFORE (or at) the cursor.
-                 # This handles cases where user deletes char from search query:
-                 # Query: "Foo" -> Cursor at end of "Foo".
-                 # User deletes "o" -> Query: "Fo". Match ends before cursor.
-                 # But we still want this to be the "current" match.
-                 
-                 found_current = False
-                 for i, pos in enumerate(matches):
-                     # If start of match is > cursor, then we passed our candidate
-                     if self.txt_yaml.compare(pos, ">", current_match_start):
-                         break
-                     
-                     # Otherwise, this match is a candidate (starts before or at cursor)
-                     # We keep updating 'current' until we find one that is strictly after
-                     current = i + 1
-                     found_current = True
-                     
-                     # Optimization: If we find a match that explicitly *contains* the cursor, that's definitely it.
-                     # But the "last start <= cursor" logic covers containment too, provided matches are ordered.
-                     # The only edge case is if cursor is way past the match (e.g. standard editing).
-                     # In that case, showing the "previous" match as current is still acceptable/helpful.
-                     
-                 # If we didn't find any match starting before cursor (cursor is at top of doc, matches are below)
-                 # Then current remains 0 (correct, we are before first match)
-            
+                # The "current" match is the LAST match that starts BEFORE (or at) the cursor,
+                # so it stays current while the query is shortened.
+                current = index.match_at_or_before(query, index.offset_of_index(current_match_start)) + 1
+
             if total == 0:
                 self.lbl_search_count.configure(text="0/0")
-            elif total >= max_count:
-                # Indicate limit reached
-                prefix = f"{current}/" if current > 0 else "?/"
-                self.lbl_search_count.configure(text=f"{prefix}{max_count}+")
             else:
                 prefix = f"{current}/" if current > 0 else "?/"
                 self.lbl_search_count.configure(text=f"{prefix}{total}")
+            self._highlight_visible_matches()
 
         except Exception as e:
             print(f"Count error: {e}")
             self.lbl_search_count.configure(text="Err")
-            
+
+    def _highlight_visible_matches(self):
+        """Tag the matches inside the viewport only (cheap at any file size)."""
+        try:
+            self.txt_yaml.tag_remove("found_all", "1.0", "end")
+        except Exception:
+            return
+        if not hasattr(self, "search_window") or not self.search_window or not self.search_window.winfo_exists():
+            return
+        query = self.search_entry.get()
+        if not query:
+            return
+        index = self._get_yaml_search_index()
+        try:
+            first_line = int(self.txt_yaml.index("@0,0").split(".")[0])
+            last_line = int(self.txt_yaml.index(f"@0,{self.txt_yaml.winfo_height()}").split(".")[0])
+        except Exception:
+            return
+        for number in index.matches_in_lines(query, first_line, last_line):
+            start, end = index.span(query, number)
+            self.txt_yaml.tag_add("found_all", index.index(start), index.index(end))
+        self.txt_yaml.tag_config("found_all", background="#FFF59D", foreground="#000000")
+        self.txt_yaml.tag_raise("found_all")
+        self.txt_yaml.tag_raise("found")
+
+    def _on_yaml_yview(self, first, last):
+        """yscrollcommand of the YAML viewer: keep CodeView's scrollbar, refresh viewport work."""
+        self.txt_yaml.vertical_scroll(first, last)
+        if getattr(self, "_yaml_viewport_job", None) is None:
+            self._yaml_viewport_job = self.after_idle(self._on_yaml_viewport_changed)
+
+    def _on_yaml_viewport_changed(self):
+        self._yaml_viewport_job = None
+        self.txt_yaml.highlighter.refresh()
+        self._highlight_visible_matches()
+
+    def _goto_match_prompt(self, event=None):
+        """Ask for a match number and jump to it (click on the match count)."""
+        query = self.search_entry.get() if hasattr(self, "search_entry") else ""
+        total = self._get_yaml_search_index().count(query) if query else 0
+        if not total:
+            return
+        dialog = ctk.CTkInputDialog(text=f"Go to match (1-{total}):", title="Find")
+        try:
+            number = int(str(dialog.get_input() or "").strip())
+        except ValueError:
+            return
+        self._goto_match(min(max(number, 1), total) - 1)
+
+    def _goto_match(self, number, backwards=False):
+        """Select and show the match with 0-based number for the current query."""
+        query = self.search_entry.get()
+        index = self._get_yaml_search_index()
+        start, end = index.span(query, number)
+        pos, end_pos = index.index(start), index.index(end)
+
+        self.txt_yaml.tag_remove("found", "1.0", "end")
+        self.txt_yaml.tag_add("found", pos, end_pos)
+        self.txt_yaml.tag_config("found", background="#FFFF00", foreground="#000000")
+        self.txt_yaml.tag_raise("found")
+        self.txt_yaml.see(pos)
+
+        # Cursor at the start going backwards, at the end going forwards
+        cursor = start if backwards else end
+        self.txt_yaml.mark_set("insert", index.index(cursor))
+        self._yaml_search_current = (query, number, cursor)
+        self._update_match_count(current_match_start=pos)
+
     def _show_history_menu(self):
         """Show search history in a native menu."""
         try:
@@ -4919,63 +4877,26 @@ class OASGenApp(ctk.CTk):
         if not query:
             return
 
-        # Remove previous highlight
-        self.txt_yaml.tag_remove("found", "1.0", "end")
-        
-        # Start search from insert cursor
-        start_pos = self.txt_yaml.index("insert")
-        
-        # Perform Search
-        # Perform Search
-        if backwards:
-            # Search backwards from cursor
-            # If we are currently at a match, we need to move back 1 char or else we find same match
-            start_search = self.txt_yaml.index(f"{start_pos}-1c")
-            
-            pos = self.txt_yaml.search(query, start_search, stopindex="1.0", backwards=True, nocase=True)
-            
-            if not pos: # Wrap to end
-                 pos = self.txt_yaml.search(query, "end", stopindex="1.0", backwards=True, nocase=True)
-        else:
-            # Search forwards
-            pos = self.txt_yaml.search(query, start_pos, stopindex="end", nocase=True)
-            
-            # If stuck on same match (because search starts AT index)
-            if pos and self.txt_yaml.compare(pos, "==", start_pos):
-                 pos = self.txt_yaml.search(query, f"{start_pos}+1c", stopindex="end", nocase=True)
-
-            if not pos: # Wrap to start
-                 pos = self.txt_yaml.search(query, "1.0", stopindex="end", nocase=True)
+        index = self._get_yaml_search_index()
+        cursor = index.offset_of_index(self.txt_yaml.index("insert"))
+        current = self._yaml_search_current
+        total = index.count(query)
 
-        if pos:
-            # Calculate end position
-            length = len(query)
-            end_pos = f"{pos}+{length}c"
-            
-            # Highlight
-            self.txt_yaml.tag_add("found", pos, end_pos)
-            self.txt_yaml.tag_config("found", background="#FFFF00", foreground="#000000")
-            self.txt_yaml.tag_raise("found")
-            
-            # Scroll to show
-            self.txt_yaml.see(pos)
-            
-            # Move cursor to start of match (so next search continues from there? No, from end for fwd, start for back)
-            if backwards:
-                 self.txt_yaml.mark_set("insert", pos)
-            else:
-                 self.txt_yaml.mark_set("insert", end_pos)
-                 
-            # Update Count with current index
-            self._update_match_count(current_match_start=pos)
-            
-            # Add to history
-            self._add_to_search_history(query)
-            
-        else:
+        if not total:
             # Not found
+            self.txt_yaml.tag_remove("found", "1.0", "end")
             self._update_match_count()
-            pass
+            return
+
+        if current and current[0] == query and current[2] == cursor:
+            # Cursor still where the last jump left it: step from that match
+            number = (current[1] + (-1 if backwards else 1)) % total
+        else:
+            number = index.next_match(query, cursor, backwards=backwards)
+        self._goto_match(number, backwards=backwards)
+
+        # Add to history
+        self._add_to_search_history(query)
 
 
     def _on_close(self):
@@ -5015,28 +4936,12 @@ class OASGenApp(ctk.CTk):
     def _resolve_source_file(self, json_path):
         """
         Attempts to find the source Excel file for a given OAS path.
-        Traverses up the path keys if exact match is not found.
+        Falls back to the closest mapped parent path if there is no exact match.
         """
-        if not json_path:
-            return None
-            
-        # Standardize path: Linter uses " > ", Map uses "."
-        # Note: Paths like /v1/foo are preserved as single segments if we just string replace
-        # But wait, 2.0 > /v1/foo > post
-        # If we replace " > " with "." we get paths./v1/foo.post which matches the map key!
-        clean_path = json_path.replace(" > ", ".")
-        clean_path = clean_path.replace("Root.", "") # Just in case
-        
-        keys = clean_path.split(".")
-        
-        # Try full path first, then parent, etc.
-        while keys:
-            current_path = ".".join(keys)
-            if current_path in self.current_source_map:
-                return self.current_source_map[current_path]
-            keys.pop() # Remove last segment
-            
-        return None
+        index = self._source_map_index
+        if index is None or index.source_map is not self.current_source_map:
+            index = self._source_map_index = SourceMapIndex(self.current_source_map)
+        return index.resolve(json_path)
 
     def _open_excel_file(self, filename, sheetname=None):
         """Opens the specified Excel file, optionally navigating to a sheet."""
@@ -5252,6 +5157,12 @@ class ImportDialog(ctk.CTkToplevel):
                         fg_color="#0A809E", hover_color="#076075",
                         font=ctk.CTkFont(size=12)).pack(side="left", padx=15)
 
+        self.var_keep_artefacts = tk.BooleanVar(value=self.prefs_manager.get("excel_gen_keep_artefacts", False))
+        ctk.CTkCheckBox(opts_frame, text="Keep Roundtrip Artefacts",
+                        variable=self.var_keep_artefacts,
+                        fg_color="#0A809E", hover_color="#076075",
+                        font=ctk.CTkFont(size=12)).pack(side="left", padx=15)
+
         # Action Buttons Frame
         btn_frame = ctk.CTkFrame(self.container, fg_color="transparent")
         btn_frame.pack(pady=10)
@@ -5268,6 +5179,16 @@ class ImportDialog(ctk.CTkToplevel):
                                            command=self.start_roundtrip_check)
         self.btn_roundtrip.pack(side="left", padx=10)
 
+        # Import progress (shown while an import runs)
+        self.import_progress_frame = ctk.CTkFrame(self.container, fg_color="transparent")
+        self.import_progress_bar = ctk.CTkProgressBar(self.import_progress_frame, orientation="horizontal",
+                                                      mode="determinate", progress_color="#0A809E")
+        self.import_progress_bar.pack(fill="x", padx=10)
+        self.import_progress_bar.set(0)
+        self.lbl_import_progress = ctk.CTkLabel(self.import_progress_frame, text="",
+                                                font=ctk.CTkFont(size=12))
+        self.lbl_import_progress.pack(anchor="w", padx=10)
+
         # Progress/Log Area
         self.import_log_area = ctk.CTkTextbox(self.container, font=("Consolas", 11),
                                               fg_color="#F0F4F5", text_color="#333333",
@@ -5278,6 +5199,35 @@ class ImportDialog(ctk.CTkToplevel):
 
     # --- Helpers ---
 
+    def _show_import_progress(self, visible):
+        if visible:
+            self.import_progress_bar.set(0)
+            self.lbl_import_progress.configure(text="Reading OAS...")
+            self.import_progress_frame.pack(fill="x", pady=(0, 5), before=self.import_log_area)
+        else:
+            self.import_progress_frame.pack_forget()
+
+    def _on_import_progress(self, event):
+        """ImportProgress listener (import thread): render the event on the UI thread."""
+        if event.event == "done":
+            return
+        phase = {
+            "parse": "Reading OAS",
+            "index_write": "Writing $index.xlsx",
+            "endpoint_writes": "Writing endpoint files",
+        }.get(event.phase, "Importing")
+        text = f"{phase}: {event.operations_done}/{event.operations_total} operations, " \
+               f"{event.rows_flattened} rows, {event.bytes_written / (1024 * 1024):.1f} MB written"
+        if event.eta is not None:
+            minutes, seconds = divmod(int(event.eta + 0.5), 60)
+            text += f" - about {minutes}:{seconds:02d} left"
+        fraction = event.operations_done / event.operations_total if event.operations_total else 0
+
+        def _update():
+            self.import_progress_bar.set(fraction)
+            self.lbl_import_progress.configure(text=text)
+        self.after(0, _update)
+
     def _browse_source(self):
         current = self.entry_imp_file.get()
         initial = os.path.dirname(current) if current and os.path.exists(current) else None
@@ -5432,6 +5382,7 @@ class ImportDialog(ctk.CTkToplevel):
                 return
 
         self.btn_import.configure(state="disabled")
+        self._show_import_progress(True)
         threading.Thread(
             target=self._run_oas_import,
             args=(src_path, dst_folder, metadata_overrides),
@@ -5441,7 +5392,8 @@ class ImportDialog(ctk.CTkToplevel):
         defaults = load_metadata_preferences(self.prefs_manager)
 
         try:
-            info = OASToExcelConverter(src_path).parser.get_info()
+            # Info only: no need to load the paths
+            info = OASToExcelConverter(src_path, streaming=True).parser.get_info()
         except Exception as exc:
             self._log(f"[Metadata] Could not read OAS info metadata: {exc}")
             return defaults, True
@@ -5495,20 +5447,51 @@ class ImportDialog(ctk.CTkToplevel):
             self._log(f"Source: {src_path}")
             self._log(f"Destination: {dst_folder}")
 
-            converter = OASToExcelConverter(src_path, log_callback=self._log)
+            def on_progress(done, total, filepath):
+                if done == total or done % 25 == 0:
+                    self._log(f"   Exported {done}/{total} endpoint files...")
+
+            progress = ImportProgress(self._on_import_progress)
+
+            streaming_min_mb = self.prefs_manager.get("import_streaming_min_mb", 50) if self.prefs_manager else 50
+            size_mb = os.path.getsize(src_path) / (1024 * 1024)
+            if streaming_min_mb and size_mb >= streaming_min_mb:
+                # Large file: one path item (and one endpoint workbook) in memory at a time
+                self._log(f"Large OAS ({size_mb:.0f} MB): streaming import, one path at a time...")
+                converter = OASToExcelConverter(src_path, log_callback=self._log, streaming=True,
+                                                progress=progress)
+                _, files = converter.stream_import(
+                    dst_folder,
+                    index_path=os.path.join(dst_folder, "$index.xlsx"),
+                    info_overrides=metadata_overrides,
+                    progress_callback=on_progress,
+                )
+            else:
+                converter = OASToExcelConverter(src_path, log_callback=self._log, progress=progress)
 
-            self._log("Generating Index File...")
-            converter.generate_index_file(
-                os.path.join(dst_folder, "$index.xlsx"),
-                info_overrides=metadata_overrides,
-            )
+                self._log("Generating Index File...")
+                converter.generate_index_file(
+                    os.path.join(dst_folder, "$index.xlsx"),
+                    info_overrides=metadata_overrides,
+                )
+
+                self._log("Generating Endpoint Files (this may take time)...")
+                workers = self.prefs_manager.get("import_export_workers", 1) if self.prefs_manager else 1
 
-            self._log("Generating Endpoint Files (this may take time)...")
-            files = converter.generate_all_endpoint_files(dst_folder)
+                files = converter.generate_all_endpoint_files(
+                    dst_folder,
+                    max_workers=workers,
+                    progress_callback=on_progress,
+                )
+                progress.finish()
 
             for f in files:
                 self._log(f"   [Created] {os.path.basename(f)}")
 
+            timings = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in progress.phase_seconds.items())
+            self._log(f"Timings: {timings} ({progress.rows_flattened} rows flattened, "
+                      f"{progress.bytes_written / (1024 * 1024):.1f} MB written)")
+
             self._log(f"Success! Generated {len(files)} files.")
             self._log("Import Completed.")
 
@@ -5522,6 +5505,7 @@ class ImportDialog(ctk.CTkToplevel):
             self._log(traceback.format_exc())
             self._show_error("Error", f"An unexpected error occurred:\n{e}")
         finally:
+            self.after(0, lambda: self._show_import_progress(False))
             self.after(0, lambda: self.btn_import.configure(state="normal"))
 
     # --- Roundtrip Check ---
@@ -5531,71 +5515,43 @@ class ImportDialog(ctk.CTkToplevel):
         dst_folder = self.entry_imp_dst.get()
         line_diff = self.var_line_diff.get()
         attr_diff = self.var_attr_diff.get()
+        keep_artefacts = self.var_keep_artefacts.get()
 
         if not src_path or not os.path.exists(src_path):
             self._show_error("Error", "Invalid OAS File")
             return
-        if not dst_folder:
+        # The check runs in memory; the folder is only needed to keep artefacts
+        if keep_artefacts and not dst_folder:
             self._show_error("Error", "Invalid Output Folder")
             return
 
         self.btn_roundtrip.configure(state="disabled")
-        threading.Thread(target=self._run_roundtrip_check, args=(src_path, dst_folder, line_diff, attr_diff)).start()
+        threading.Thread(
+            target=self._run_roundtrip_check,
+            args=(src_path, dst_folder, line_diff, attr_diff, keep_artefacts),
+        ).start()
 
-    def _run_roundtrip_check(self, src_path, dst_folder, line_diff, attr_diff):
+    def _run_roundtrip_check(self, src_path, dst_folder, line_diff, attr_diff, keep_artefacts=False):
         try:
             self._log("\n=== STARTING ROUNDTRIP CHECK ===")
 
-            import yaml
-            gen_30 = False
-            gen_31 = False
-            try:
-                with open(src_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    version = data.get('openapi', '')
-                    if version.startswith('3.1'):
-                        gen_31 = True
-                        self._log(f"[Setup] Detected OAS 3.1 (Version: {version})")
-                    elif version.startswith('3.0'):
-                        gen_30 = True
-                        self._log(f"[Setup] Detected OAS 3.0 (Version: {version})")
-                    else:
-                        self._log(f"[Setup] Unknown OAS version '{version}'. Defaulting to 3.0 Generation.")
-                        gen_30 = True
-            except Exception as e:
-                self._log(f"[Setup] Could not detect version: {e}. Defaulting to 3.0.")
-                gen_30 = True
-
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            rt_dir = os.path.join(dst_folder, "_roundtrip_history", timestamp)
-            os.makedirs(rt_dir, exist_ok=True)
-            self._log("[Gen] Generating OAS from Templates...")
-            self._log(f"Target: {rt_dir}")
-
-            generated_paths = []
-            def gen_log(msg):
-                self._log(f"  [Gen] {msg}")
-                if "Writing OAS" in msg:
-                    parts = msg.split(": ")
-                    if len(parts) > 1:
-                        generated_paths.append(parts[1].strip())
-
-            main_script.generate_oas(dst_folder, gen_30=gen_30, gen_31=gen_31, gen_swift=False, output_dir=rt_dir, log_callback=gen_log)
+            rt_dir = None
+            if keep_artefacts:
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                rt_dir = os.path.join(dst_folder, "_roundtrip_history", timestamp)
+                self._log(f"Artefacts: {rt_dir}")
+
+            result = run_roundtrip(
+                src_path,
+                with_text=line_diff,
+                artefact_dir=rt_dir,
+                log_callback=self._log,
+            )
             self._log("[Gen] Generation Complete.")
 
-            if not generated_paths:
-                self._log("ERROR: No OAS files were generated for comparison.")
-                return
+            self._log(f"[Compare] Comparing Source ({os.path.basename(src_path)}) vs Generated (OAS {result.version}, in memory)...")
 
-            gen_path = generated_paths[0]
-
-            if not os.path.exists(gen_path):
-                self._log(f"ERROR: Generated OAS file not found at expected path: {gen_path}")
-                return
-
-            self._log(f"[Compare] Comparing Source ({os.path.basename(src_path)}) vs Generated ({os.path.basename(gen_path)})...")
-
-            comparator = OASComparator(src_path, gen_path)
+            comparator = result.comparator
 
             # Structure Summary
             struct_stats = comparator.get_structure_comparison()
@@ -5794,11 +5750,13 @@ class ImportDialog(ctk.CTkToplevel):
         return dialog.choice
 
     def _on_close(self):
-        """Save paths on dialog close."""
-        if self.prefs_manager and self.prefs_manager.get("remember_paths", True):
+        """Save paths and the roundtrip artefacts choice on dialog close."""
+        if self.prefs_manager:
             try:
-                self.prefs_manager.set("last_excel_output", self.entry_imp_dst.get())
-                self.prefs_manager.set("import_source_file", self.entry_imp_file.get())
+                self.prefs_manager.set("excel_gen_keep_artefacts", bool(self.var_keep_artefacts.get()))
+                if self.prefs_manager.get("remember_paths", True):
+                    self.prefs_manager.set("last_excel_output", self.entry_imp_dst.get())
+                    self.prefs_manager.set("import_source_file", self.entry_imp_file.get())
                 self.prefs_manager.save()
             except:
                 pass
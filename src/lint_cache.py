@@ -0,0 +1,65 @@
+"""
+Persistent, content-addressed cache of OASLinter results.
+
+A lint result depends only on the bytes of the linted file, the engine, the
+engine version and the ruleset, so it is stored under the SHA-256 of those
+four together. Regenerating an unchanged spec (new mtime, same bytes) or
+validating a byte-identical copy under another name hits the cache, across
+sessions.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+CACHE_FILE_SUFFIX = ".lint.json"
+
+
+def lint_cache_key(content: bytes, engine: str, engine_version: str, ruleset: bytes) -> str:
+    """Returns the cache key (hex SHA-256) for one lint run."""
+    digest = hashlib.sha256()
+    for part in (
+        hashlib.sha256(content).hexdigest(),
+        engine,
+        engine_version,
+        hashlib.sha256(ruleset).hexdigest(),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def read_cached_result(cache_dir: str, key: str) -> Optional[Dict[str, Any]]:
+    """The stored result for key, or None (missing or unreadable entries are misses)."""
+    try:
+        with open(os.path.join(cache_dir, key + CACHE_FILE_SUFFIX), "r", encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def write_cached_result(cache_dir: str, key: str, result: Dict[str, Any]):
+    """Stores result under key (atomically: readers never see a partial file)."""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        target = os.path.join(cache_dir, key + CACHE_FILE_SUFFIX)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp, target)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not write lint cache: {e}")
+
+
+def clear_lint_cache(cache_dir: str):
+    """Removes every cached lint result in cache_dir."""
+    if not os.path.isdir(cache_dir):
+        return
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_FILE_SUFFIX):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
@@ -1,24 +1,92 @@
+import argparse
 import subprocess
 import json
 import os
+import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    from . import native_linter
+    from .lint_cache import lint_cache_key, read_cached_result, write_cached_result, clear_lint_cache
+except ImportError:
+    import native_linter
+    from lint_cache import lint_cache_key, read_cached_result, write_cached_result, clear_lint_cache
 
 
 class OASLinter:
     """
-    Unified OpenAPI linter supporting both Spectral and Vacuum engines.
-    Both produce Spectral-compatible JSON output, so parsing is identical.
+    Unified OpenAPI linter supporting the Spectral and Vacuum engines and a
+    native in-process engine (see native_linter). All produce
+    Spectral-compatible JSON output, so parsing is identical.
     """
 
-    ENGINES = ("spectral", "vacuum")
+    ENGINES = ("spectral", "vacuum", "native")
 
-    def __init__(self, cmd, engine="spectral"):
+    def __init__(self, cmd, engine="spectral", cache_dir=None):
+        """
+        cache_dir: Optional folder for persistent lint results, keyed by file
+        content, engine, engine version and ruleset (see lint_cache).
+        """
         self.cmd = cmd
         self.engine = engine if engine in self.ENGINES else "spectral"
+        self.cache_dir = str(cache_dir) if cache_dir else None
+        self._engine_version = None
+        self._version_lock = threading.Lock()
+
+    def engine_version(self):
+        """Version reported by the engine executable ("" if it cannot be determined)."""
+        if self.engine == "native":
+            return native_linter.NATIVE_LINTER_VERSION
+        with self._version_lock:
+            if self._engine_version is None:
+                flag = "version" if self.engine == "vacuum" else "--version"
+                try:
+                    process = subprocess.run(
+                        f'"{self.cmd}" {flag}',
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=30,
+                        stdin=subprocess.DEVNULL,
+                    )
+                    self._engine_version = process.stdout.strip() if process.returncode == 0 else ""
+                except (OSError, subprocess.SubprocessError):
+                    self._engine_version = ""
+            return self._engine_version
+
+    def clear_cache(self):
+        """Removes the persistent lint results (no-op without cache_dir)."""
+        if self.cache_dir:
+            clear_lint_cache(self.cache_dir)
+
+    @contextmanager
+    def _ruleset(self, log):
+        """Yields the ruleset path: ./.spectral.yaml, or a temporary default removed afterwards."""
+        ruleset_path = os.path.abspath(".spectral.yaml")
+        if os.path.exists(ruleset_path):
+            yield ruleset_path
+            return
+
+        log("Ruleset not found. Creating temporary default ruleset...")
+        fd_r, temp_ruleset = tempfile.mkstemp(suffix=".yaml")
+        os.close(fd_r)
+        with open(temp_ruleset, "w") as f:
+            f.write("extends: spectral:oas\n")
+        try:
+            yield temp_ruleset
+        finally:
+            if os.path.exists(temp_ruleset):
+                os.remove(temp_ruleset)
 
-    def run_lint(self, file_path, log_callback=None):
+    def run_lint(self, file_path, log_callback=None, ruleset_path=None):
         """
         Runs linting on the given file using the configured engine.
+
+        ruleset_path: Ruleset to lint with (default: ./.spectral.yaml, or a
+        temporary default ruleset when that does not exist).
         """
 
         def log(msg):
@@ -34,20 +102,179 @@ class OASLinter:
                 "details": [],
             }
 
-        fd, temp_out = tempfile.mkstemp(suffix=".json")
-        os.close(fd)
+        if ruleset_path is None:
+            with self._ruleset(log) as ruleset_path:
+                return self._lint_cached(file_path, ruleset_path, log)
+        return self._lint_cached(file_path, ruleset_path, log)
 
-        # Determine ruleset path
-        ruleset_path = os.path.abspath(".spectral.yaml")
-        temp_ruleset = None
+    def run_lint_many(self, file_paths, log_callback=None, max_workers=None):
+        """
+        Lints several files concurrently.
+
+        At most max_workers (default: one per CPU) linter processes run at a
+        time, all with the same ruleset (a temporary default one is written
+        once for the whole batch). Log lines are prefixed with the file name.
+
+        Returns:
+            Dict of file path -> run_lint() result, in the order given
+        """
+        file_paths = list(dict.fromkeys(file_paths))
+        if not file_paths:
+            return {}
+
+        def log(msg):
+            if log_callback:
+                log_callback(msg)
+
+        def file_logger(path):
+            name = os.path.basename(path)
+            return lambda msg: log(f"[{name}] {msg}")
+
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(file_paths)))
+        log(f"Linting {len(file_paths)} files with up to {workers} {self.engine} processes...")
+        with self._ruleset(log) as ruleset_path:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    lambda path: self.run_lint(path, file_logger(path), ruleset_path=ruleset_path),
+                    file_paths,
+                ))
+        return dict(zip(file_paths, results))
+
+    @staticmethod
+    def summarize_many(results):
+        """
+        One summary row per run_lint_many() result: file, success, error_msg
+        and the error/warning/info/hint counts.
+        """
+        rows = []
+        for path, result in results.items():
+            summary = result.get("summary", {})
+            row = {
+                "file": path,
+                "success": result.get("success", False),
+                "error_msg": result.get("error_msg", ""),
+            }
+            for severity in ("error", "warning", "info", "hint"):
+                row[severity] = summary.get(severity, 0)
+            rows.append(row)
+        return rows
+
+    def _cache_key(self, file_path, ruleset_path):
+        """Cache key for linting file_path, or None when results cannot be cached."""
+        version = self.engine_version()
+        if not version:
+            return None  # Results of an unknown engine build could be stale
+        try:
+            with open(file_path, "rb") as f:
+                content = f.read()
+            with open(ruleset_path, "rb") as f:
+                ruleset = f.read()
+        except OSError:
+            return None
+        return lint_cache_key(content, self.engine, version, ruleset)
+
+    def _lint_cached(self, file_path, ruleset_path, log):
+        """_lint() served from / stored to the persistent cache when one is configured."""
+        key = self._cache_key(file_path, ruleset_path) if self.cache_dir else None
+        if key:
+            result = read_cached_result(self.cache_dir, key)
+            if result is not None:
+                log(f"[{self.engine.upper()}] Unchanged content: using cached results ({result.get('raw_count', 0)} issues).")
+                # The entry may come from a byte-identical file under another name
+                for item in result.get("raw_data", []):
+                    if isinstance(item, dict) and "source" in item:
+                        item["source"] = os.path.abspath(file_path)
+                result["cached"] = True
+                return result
+
+        result = self._lint(file_path, ruleset_path, log)
+        if key and result.get("success"):
+            write_cached_result(self.cache_dir, key, result)
+        return result
+
+    def _simplify(self, results):
+        """Builds the result dict from Spectral-format issues (identical format for all engines)."""
+        summary = {"error": 0, "warning": 0, "info": 0, "hint": 0}
+        code_summary = {}
+        simplified_details = []
 
-        if not os.path.exists(ruleset_path):
-            log("Ruleset not found. Creating temporary default ruleset...")
-            fd_r, temp_ruleset = tempfile.mkstemp(suffix=".yaml")
-            os.close(fd_r)
-            with open(temp_ruleset, "w") as f:
-                f.write("extends: spectral:oas\n")
-            ruleset_path = temp_ruleset
+        for item in results:
+            severity_map = {0: "error", 1: "warning", 2: "info", 3: "hint"}
+            severity_code = item.get("severity", 0)
+            severity_str = severity_map.get(severity_code, "error")
+
+            code = item.get("code", "unknown")
+            summary[severity_str] = summary.get(severity_str, 0) + 1
+
+            if code not in code_summary:
+                code_summary[code] = {"count": 0, "severity": severity_str}
+            code_summary[code]["count"] += 1
+
+            raw_path = item.get("path", [])
+            path_str = (
+                " > ".join([str(p) for p in raw_path]) if raw_path else "Root"
+            )
+
+            simplified_details.append(
+                {
+                    "code": code,
+                    "message": item.get("message"),
+                    "path": path_str,
+                    "line": item.get("range", {}).get("start", {}).get("line", 0)
+                    + 1,
+                    "severity": severity_str,
+                }
+            )
+
+        return {
+            "success": True,
+            "summary": summary,
+            "code_summary": code_summary,
+            "details": simplified_details,
+            "raw_count": len(results),
+            "raw_data": results,
+            "engine": self.engine,
+        }
+
+    def lint_document(self, document, line_of=None, source=None, ruleset_path=None):
+        """
+        Lints an in-memory OAS document with the native rules, whatever the configured engine.
+
+        line_of: Optional function(JSON path tuple) -> 0-based (line, column)
+        source: File name reported in the issues
+        ruleset_path: Ruleset for rule severities (default: ./.spectral.yaml if present)
+        """
+        if ruleset_path is None and os.path.exists(".spectral.yaml"):
+            ruleset_path = os.path.abspath(".spectral.yaml")
+        try:
+            severities, _ = native_linter.rule_severities(native_linter.load_ruleset(ruleset_path))
+            results = native_linter.lint_document(document, line_of, source=source, severities=severities)
+        except Exception as e:
+            return {"success": False, "error_msg": str(e), "summary": {}, "details": []}
+        result = self._simplify(results)
+        result["engine"] = "native"
+        return result
+
+    def _lint_native(self, file_path, ruleset_path, log):
+        """Lints one file in-process (no external engine)."""
+        log(f"[NATIVE] Linting in-process: {file_path}")
+        try:
+            results, skipped = native_linter.lint_file(file_path, ruleset_path)
+        except Exception as e:
+            log(f"Exception: {str(e)}")
+            return {"success": False, "error_msg": str(e), "summary": {}, "details": []}
+        if skipped:
+            log(f"Ruleset rules not available natively (skipped): {', '.join(skipped)}")
+        log(f"Found {len(results)} issues.")
+        return self._simplify(results)
+
+    def _lint(self, file_path, ruleset_path, log):
+        """Runs the engine on one file with the given ruleset and simplifies its output."""
+        if self.engine == "native":
+            return self._lint_native(file_path, ruleset_path, log)
+
+        fd, temp_out = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
 
         # Build command based on engine
         if self.engine == "vacuum":
@@ -67,10 +294,6 @@ class OASLinter:
                 stdin=subprocess.DEVNULL,
             )
 
-            # Cleanup temp ruleset if we created one
-            if temp_ruleset and os.path.exists(temp_ruleset):
-                os.remove(temp_ruleset)
-
             log(f"Process ended. Return Code: {process.returncode}")
             if process.stderr:
                 log(f"STDERR: {process.stderr[:200]}...")
@@ -90,48 +313,7 @@ class OASLinter:
 
             log(f"Found {len(results)} issues.")
 
-            # Analyze results - identical format for both engines
-            summary = {"error": 0, "warning": 0, "info": 0, "hint": 0}
-            code_summary = {}
-            simplified_details = []
-
-            for item in results:
-                severity_map = {0: "error", 1: "warning", 2: "info", 3: "hint"}
-                severity_code = item.get("severity", 0)
-                severity_str = severity_map.get(severity_code, "error")
-
-                code = item.get("code", "unknown")
-                summary[severity_str] = summary.get(severity_str, 0) + 1
-
-                if code not in code_summary:
-                    code_summary[code] = {"count": 0, "severity": severity_str}
-                code_summary[code]["count"] += 1
-
-                raw_path = item.get("path", [])
-                path_str = (
-                    " > ".join([str(p) for p in raw_path]) if raw_path else "Root"
-                )
-
-                simplified_details.append(
-                    {
-                        "code": code,
-                        "message": item.get("message"),
-                        "path": path_str,
-                        "line": item.get("range", {}).get("start", {}).get("line", 0)
-                        + 1,
-                        "severity": severity_str,
-                    }
-                )
-
-            return {
-                "success": True,
-                "summary": summary,
-                "code_summary": code_summary,
-                "details": simplified_details,
-                "raw_count": len(results),
-                "raw_data": results,
-                "engine": self.engine,
-            }
+            return self._simplify(results)
 
         except subprocess.TimeoutExpired:
             log("Error: Timeout Expired!")
@@ -154,3 +336,36 @@ class OASLinter:
 
 # Backward compatibility alias
 SpectralRunner = OASLinter
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.linter",
+        description="Lint OAS files with Spectral or Vacuum, several at a time.",
+    )
+    parser.add_argument("files", nargs="+", help="OAS files to lint")
+    parser.add_argument("-e", "--engine", choices=OASLinter.ENGINES, default="spectral", help="Linter engine")
+    parser.add_argument("--cmd", default=None, help="Linter executable (default: the engine name on PATH)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Parallel linter processes (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print the per-file summaries as JSON")
+    parser.add_argument("--cache-dir", default=None, help="Optional persistent lint result cache folder")
+    args = parser.parse_args(argv)
+
+    linter = OASLinter(args.cmd or args.engine, engine=args.engine, cache_dir=args.cache_dir)
+    results = linter.run_lint_many(args.files, max_workers=args.workers)
+    rows = linter.summarize_many(results)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        for row in rows:
+            if row["success"]:
+                counts = ", ".join(f"{row[sev]} {sev}" for sev in ("error", "warning", "info", "hint"))
+                print(f"{os.path.basename(row['file'])}: {counts}")
+            else:
+                print(f"{os.path.basename(row['file'])}: FAILED ({row['error_msg']})")
+    return 1 if any(not row["success"] or row["error"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -28,6 +28,7 @@ REQUIRED_INDEX_SHEETS = (
     "Responses",
 )
 REQUIRED_OPERATION_SHEETS = ("Parameters",)
+MAX_LOGGED_LINT_ISSUES = 20  # Per generated file, in the Generation log
 
 
 def find_best_match_file(target, directory, files_list):
@@ -130,6 +131,145 @@ def get_converted_template_validation_errors(base_dir):
     return errors
 
 
+def _parse_templates(index_source, resolve_operation_file, log_callback=print):
+    """
+    Parses the master index and the operation templates it references.
+
+    index_source: $index template, as a path or an in-memory openpyxl Workbook
+    resolve_operation_file: function(file name from the Paths sheet) returning
+        the operation template (path or Workbook), or None when it is missing
+    """
+    df_info = parser.load_excel_sheet(index_source, "General Description")
+    info_data, inline_servers = parser.parse_info(df_info)
+
+    df_tags = parser.load_excel_sheet(index_source, "Tags")
+    tags_data = parser.parse_tags(df_tags)
+
+    # Parse Servers and Security
+    servers_data = parser.parse_servers(parser.load_excel_sheet(index_source, "Servers"))
+    if not servers_data and inline_servers:
+        servers_data = inline_servers
+
+    security_schemes, security_req = parser.parse_security(
+        parser.load_excel_sheet(index_source, "Security")
+    )
+
+    df_paths = parser.load_excel_sheet(index_source, "Paths")
+    paths_list = parser.parse_paths_index(df_paths)
+
+    components_data = parser.parse_components(index_source)  # Global components
+
+    # Parse Operation Files
+    log_callback("Parsing operation details...")
+    operations_details = {}
+
+    # Identify unique files to parse
+    unique_files = set()
+    for op in paths_list:
+        if op.get("file"):
+            unique_files.add(op.get("file"))
+
+    for raw_file_name in unique_files:
+        if not raw_file_name:
+            continue
+        source = resolve_operation_file(raw_file_name)
+        if source is not None:
+            op_det = parser.parse_operation_file(source)
+            if op_det:
+                operations_details[raw_file_name] = op_det
+        else:
+            log_callback(f"  Operation file not found for: {raw_file_name}")
+
+    return {
+        "info": info_data,
+        "tags": tags_data,
+        "servers": servers_data,
+        "security_schemes": security_schemes,
+        "security": security_req,
+        "paths": paths_list,
+        "components": components_data,
+        "operations": operations_details,
+    }
+
+
+def _clean_info(info_data):
+    """Info fields for the generator (internal template fields excluded)."""
+    clean_info = info_data.copy()
+    for internal_key in ["filename_pattern", "swift_servers"]:
+        clean_info.pop(internal_key, None)
+    return clean_info
+
+
+def _merge_security_schemes(components_data, security_schemes):
+    if security_schemes:
+        if "securitySchemes" not in components_data:
+            components_data["securitySchemes"] = {}
+        components_data["securitySchemes"].update(security_schemes)
+
+
+def _build_standard_generator(
+    version, templates, clean_info, generation_mode, x_info_options, log_callback
+):
+    """Builds a standard (non-SWIFT) generator from parsed templates."""
+    generator = OASGenerator(
+        version=version,
+        generation_mode=generation_mode,
+        log_callback=log_callback,
+        x_info_options=x_info_options,
+    )
+    generator.build_info(clean_info)
+    # Always record tags source - needed for validation warnings even when tags are empty
+    generator._record_source("tags", INDEX_FILENAME, "Tags")
+    if templates["tags"]:
+        generator.oas["tags"] = templates["tags"]
+    if templates["servers"]:
+        generator.oas["servers"] = templates["servers"]
+    if templates["security"]:
+        generator.oas["security"] = templates["security"]
+
+    generator.build_components(templates["components"], source_file=INDEX_FILENAME)
+    generator.build_paths(templates["paths"], templates["operations"])
+    return generator
+
+
+def generate_oas_documents(
+    index_source,
+    operation_sources,
+    gen_30=True,
+    gen_31=True,
+    generation_mode=DEFAULT_GENERATION_MODE,
+    x_info_options=None,
+    log_callback=print,
+):
+    """
+    In-memory counterpart of generate_oas() for the standard (non-SWIFT) outputs.
+    Nothing is written: callers serialise or compare the generators' documents.
+
+    index_source: $index template (openpyxl Workbook or path)
+    operation_sources: {file name referenced by the Paths sheet: Workbook or path}
+    Returns {"3.0": OASGenerator, "3.1": OASGenerator} for the requested versions.
+    """
+    generation_mode = normalize_generation_mode(generation_mode)
+    x_info_options = normalize_x_info_options(x_info_options)
+
+    templates = _parse_templates(index_source, operation_sources.get, log_callback)
+    clean_info = _clean_info(templates["info"])
+
+    generators = {}
+    if gen_30:
+        log_callback("Generating OAS 3.0...")
+        _merge_security_schemes(templates["components"], templates["security_schemes"])
+        generators["3.0"] = _build_standard_generator(
+            "3.0.0", templates, clean_info, generation_mode, x_info_options, log_callback
+        )
+    if gen_31:
+        log_callback("Generating OAS 3.1...")
+        generators["3.1"] = _build_standard_generator(
+            "3.1.0", templates, clean_info, generation_mode, x_info_options, log_callback
+        )
+    return generators
+
+
 def generate_oas(
     base_dir,
     gen_30=True,
@@ -139,11 +279,17 @@ def generate_oas(
     x_info_options=None,
     output_dir=None,
     log_callback=print,
+    linter=None,
 ):
     """
     Main execution function.
     base_dir: Directory containing '$index.xlsm'
     output_dir: Directory to write generated OAS files (defaults to base_dir/generated if None)
+    linter: Optional OASLinter. Each written OAS is then linted from its in-memory
+            document (native rules, line numbers recorded while writing the YAML)
+            and the issues are logged right after the file.
+
+    Returns {written OAS path: lint result} (empty without a linter).
     """
     if not os.path.exists(base_dir):
         log_callback(f"Error: Directory not found: {base_dir}")
@@ -163,50 +309,22 @@ def generate_oas(
     # 1. Setup Paths
     index_path = os.path.join(base_dir, INDEX_FILENAME)
 
-    # 2. Parse Master Index
+    def resolve_operation_file(raw_file_name):
+        full_path = os.path.join(base_dir, raw_file_name)
+        return full_path if os.path.exists(full_path) else None
+
+    # 2-3. Parse Master Index and Operation Files
     log_callback(f"Parsing index: {os.path.basename(index_path)}")
-    df_info = parser.load_excel_sheet(index_path, "General Description")
-    info_data, inline_servers = parser.parse_info(df_info)
+    templates = _parse_templates(index_path, resolve_operation_file, log_callback)
+    info_data = templates["info"]
     swift_servers_data = info_data.get("swift_servers", [])
-
-    df_tags = parser.load_excel_sheet(index_path, "Tags")
-    tags_data = parser.parse_tags(df_tags)
-
-    # Parse Servers and Security
-    servers_data = parser.parse_servers(parser.load_excel_sheet(index_path, "Servers"))
-    if not servers_data and inline_servers:
-        servers_data = inline_servers
-
-    security_schemes, security_req = parser.parse_security(
-        parser.load_excel_sheet(index_path, "Security")
-    )
-
-    df_paths = parser.load_excel_sheet(index_path, "Paths")
-    paths_list = parser.parse_paths_index(df_paths)
-
-    components_data = parser.parse_components(index_path)  # Global components
-
-    # 3. Parse Operation Files
-    log_callback("Parsing operation details...")
-    operations_details = {}
-
-    # Identify unique files to parse
-    unique_files = set()
-    for op in paths_list:
-        if op.get("file"):
-            unique_files.add(op.get("file"))
-
-    for raw_file_name in unique_files:
-        if not raw_file_name:
-            continue
-        full_path = os.path.join(base_dir, raw_file_name)
-        if os.path.exists(full_path):
-            # log_callback(f"  Parsing: {os.path.basename(full_path)}")
-            op_det = parser.parse_operation_file(full_path)
-            if op_det:
-                operations_details[raw_file_name] = op_det
-        else:
-            log_callback(f"  Operation file not found for: {raw_file_name}")
+    tags_data = templates["tags"]
+    servers_data = templates["servers"]
+    security_schemes = templates["security_schemes"]
+    security_req = templates["security"]
+    paths_list = templates["paths"]
+    components_data = templates["components"]
+    operations_details = templates["operations"]
 
     # Output Directory: Use provided output_dir or fall back to base_dir/generated
     if output_dir is None:
@@ -290,6 +408,42 @@ def generate_oas(
     except OSError:
         pass
 
+    lint_results = {}
+
+    def log_lint_result(out_path, result):
+        name = os.path.basename(out_path)
+        if not result.get("success"):
+            log_callback(f"Lint of {name} failed: {result.get('error_msg')}")
+            return
+        summary = result["summary"]
+        log_callback(
+            f"Lint {name}: {summary['error']} errors, {summary['warning']} warnings, "
+            f"{summary['info']} info, {summary['hint']} hints"
+        )
+        details = result["details"]
+        for detail in details[:MAX_LOGGED_LINT_ISSUES]:
+            log_callback(f"  line {detail['line']} [{detail['severity']}] {detail['code']}: {detail['message']}")
+        if len(details) > MAX_LOGGED_LINT_ISSUES:
+            log_callback(f"  ... {len(details) - MAX_LOGGED_LINT_ISSUES} more (see the Validation tab)")
+
+    def write_oas(generator, out_path):
+        """Writes one OAS file, then lints the document it was written from."""
+        if linter is None:
+            with open(out_path, "w", encoding="utf-8") as f:
+                f.write(generator.get_yaml())
+            return
+        document = generator.get_document()
+        line_index = {}
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(generator.render_yaml(document, line_index=line_index))
+        result = linter.lint_document(
+            document,
+            line_of=lambda path: line_index.get(tuple(str(p) for p in path)),
+            source=os.path.abspath(out_path),
+        )
+        lint_results[str(out_path)] = result
+        log_lint_result(out_path, result)
+
     def build_filename(oas_ver, customization=""):
         pattern = info_data.get("filename_pattern")
         if not pattern or pd.isna(pattern):
@@ -326,39 +480,17 @@ def generate_oas(
         return fname.strip()
 
     # Prepare Clean Info (Exclude internal fields)
-    clean_info = info_data.copy()
-    for internal_key in ["filename_pattern", "swift_servers"]:
-        clean_info.pop(internal_key, None)
+    clean_info = _clean_info(info_data)
 
     # 4. Generate OAS 3.0
     if gen_30:
         log_callback("Generating OAS 3.0...")
-        generator_30 = OASGenerator(
-            version="3.0.0",
-            generation_mode=generation_mode,
-            log_callback=log_callback,
-            x_info_options=x_info_options,
-        )
-        generator_30.build_info(clean_info)
-        # Always record tags source - needed for validation warnings even when tags are empty
-        generator_30._record_source("tags", "$index.xlsx", "Tags")
-        if tags_data:
-            generator_30.oas["tags"] = tags_data
-        if servers_data:
-            generator_30.oas["servers"] = servers_data
-        if security_req:
-            generator_30.oas["security"] = security_req
-
         # Add Security Schemes to Components
-        if security_schemes:
-            if "securitySchemes" not in components_data:
-                components_data["securitySchemes"] = {}
-            components_data["securitySchemes"].update(security_schemes)
-
-            components_data["securitySchemes"].update(security_schemes)
+        _merge_security_schemes(components_data, security_schemes)
 
-        generator_30.build_components(components_data, source_file=os.path.basename(index_path))
-        generator_30.build_paths(paths_list, operations_details)
+        generator_30 = _build_standard_generator(
+            "3.0.0", templates, clean_info, generation_mode, x_info_options, log_callback
+        )
 
         # Ensure OAS output folder exists
         os.makedirs(gen_dir, exist_ok=True)
@@ -366,8 +498,7 @@ def generate_oas(
         fname_30 = build_filename("3.0")
         out_30 = Path(gen_dir) / fname_30
         log_callback(f"Writing OAS 3.0 to: {out_30.as_posix()}")
-        with open(out_30, "w", encoding="utf-8") as f:
-            f.write(generator_30.get_yaml())
+        write_oas(generator_30, out_30)
 
         # Write Source Map
         map_30 = Path(map_dir) / (fname_30 + ".map.json")
@@ -378,24 +509,9 @@ def generate_oas(
     # 5. Generate OAS 3.1
     if gen_31:
         log_callback("Generating OAS 3.1...")
-        generator_31 = OASGenerator(
-            version="3.1.0",
-            generation_mode=generation_mode,
-            log_callback=log_callback,
-            x_info_options=x_info_options,
+        generator_31 = _build_standard_generator(
+            "3.1.0", templates, clean_info, generation_mode, x_info_options, log_callback
         )
-        generator_31.build_info(clean_info)
-        # Always record tags source - needed for validation warnings even when tags are empty
-        generator_31._record_source("tags", "$index.xlsx", "Tags")
-        if tags_data:
-            generator_31.oas["tags"] = tags_data
-        if servers_data:
-            generator_31.oas["servers"] = servers_data
-        if security_req:
-            generator_31.oas["security"] = security_req
-
-        generator_31.build_components(components_data, source_file=os.path.basename(index_path))
-        generator_31.build_paths(paths_list, operations_details)
 
         # Ensure OAS output folder exists
         os.makedirs(gen_dir, exist_ok=True)
@@ -403,8 +519,7 @@ def generate_oas(
         fname_31 = build_filename("3.1")
         out_31 = Path(gen_dir) / fname_31
         log_callback(f"Writing OAS 3.1 to: {out_31.as_posix()}")
-        with open(out_31, "w", encoding="utf-8") as f:
-            f.write(generator_31.get_yaml())
+        write_oas(generator_31, out_31)
 
         # Write Source Map
         map_31 = Path(map_dir) / (fname_31 + ".map.json")
@@ -452,8 +567,7 @@ def generate_oas(
 
         out_sw_30 = Path(gen_dir) / build_filename("3.0", "SWIFT")
         log_callback(f"Writing OAS 3.0 (SWIFT) to: {out_sw_30.as_posix()}")
-        with open(out_sw_30, "w", encoding="utf-8") as f:
-            f.write(sw_gen_30.get_yaml())
+        write_oas(sw_gen_30, out_sw_30)
 
         # Write Source Map
         map_sw_30 = Path(map_dir) / (out_sw_30.name + ".map.json")
@@ -489,8 +603,7 @@ def generate_oas(
 
         out_sw_31 = Path(gen_dir) / build_filename("3.1", "SWIFT")
         log_callback(f"Writing OAS 3.1 (SWIFT) to: {out_sw_31.as_posix()}")
-        with open(out_sw_31, "w", encoding="utf-8") as f:
-            f.write(sw_gen_31.get_yaml())
+        write_oas(sw_gen_31, out_sw_31)
         
         # Write Source Map
         map_sw_31 = Path(map_dir) / (out_sw_31.name + ".map.json")
@@ -500,6 +613,7 @@ def generate_oas(
 
     log_schema_parent_issue_report()
     log_callback("\n=== OAS GENERATION COMPLETED ===\n")
+    return lint_results
 
 
 def main():
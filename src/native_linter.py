@@ -0,0 +1,539 @@
+"""
+Native (in-process) OAS linter.
+
+Implements the common `spectral:oas` rules listed in rules_data.SPECTRAL_RULES
+directly on a parsed document, so validation needs no Node/Go process and no
+second parse. Issues are returned in Spectral's JSON output format (code,
+message, path, severity, range), which OASLinter simplifies like the output of
+the external engines.
+
+Line numbers come from a line index: lint_file() builds one while parsing the
+file (a single libyaml compose); lint_document() takes any JSON path -> line
+lookup, e.g. one recorded while the generator emitted the YAML.
+
+Not implemented (they need a JSON Schema validator): oas3-schema,
+oas3-valid-media-example, oas3-valid-schema-example.
+
+Usage:
+    issues = lint_file('path/to/oas.yaml', '.spectral.yaml')
+    issues = lint_document(document, line_of=index.get)
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+from src.generator_pkg.yaml_output import FastSafeLoader as _SafeLoader
+
+# Bump when rules change: it is the engine version of the lint cache key
+NATIVE_LINTER_VERSION = "native-1"
+
+ERROR, WARN, INFO, HINT = 0, 1, 2, 3
+SEVERITY_NAMES = {"error": ERROR, "warn": WARN, "warning": WARN, "info": INFO, "hint": HINT}
+
+# code: (severity, on by default); the defaults follow the spectral:oas recommended set
+RULES = {
+    "contact-properties": (WARN, False),
+    "duplicated-entry-in-enum": (WARN, True),
+    "info-contact": (WARN, True),
+    "info-description": (WARN, True),
+    "info-license": (WARN, False),
+    "license-url": (WARN, False),
+    "no-$ref-siblings": (ERROR, True),
+    "no-script-tags-in-markdown": (WARN, True),
+    "oas3-api-servers": (WARN, True),
+    "oas3-examples-value-or-externalValue": (WARN, True),
+    "oas3-operation-security-defined": (WARN, True),
+    "oas3-parameter-description": (WARN, False),
+    "oas3-server-trailing-slash": (WARN, True),
+    "oas3-unused-component": (WARN, True),
+    "openapi-tags": (WARN, True),
+    "openapi-tags-alphabetical": (WARN, False),
+    "operation-description": (WARN, True),
+    "operation-operationId": (WARN, True),
+    "operation-operationId-unique": (ERROR, True),
+    "operation-parameters": (WARN, True),
+    "operation-success-response": (WARN, True),
+    "operation-tag-defined": (WARN, True),
+    "operation-tags": (WARN, True),
+    "path-declarations-must-exist": (WARN, True),
+    "path-keys-no-trailing-slash": (WARN, True),
+    "path-not-include-query": (WARN, True),
+    "path-params": (ERROR, True),
+    "tag-description": (WARN, False),
+    "typed-enum": (WARN, True),
+}
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+# Component types checked by oas3-unused-component
+REUSABLE_COMPONENTS = (
+    "schemas", "responses", "parameters", "examples",
+    "requestBodies", "headers", "links", "callbacks",
+)
+# Generator marker for raw extension YAML (not part of the document proper)
+RAW_EXTENSIONS_KEY = "__RAW_EXTENSIONS__"
+
+_PATH_TEMPLATE = re.compile(r"{([^}]*)}")
+_SCRIPT_TAG = re.compile(r"<script", re.IGNORECASE)
+
+Path = Tuple[Any, ...]
+LineLookup = Callable[[Path], Optional[Tuple[int, int]]]
+
+
+def rule_severities(ruleset: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Active rules and their severities for a parsed Spectral ruleset.
+
+    Entries under `rules` switch native rules on or off or change their
+    severity (`off`/false, `true`, `error`/`warn`/`info`/`hint`, or a mapping
+    with `severity`). Rules the native engine does not implement are
+    returned as the second item so the caller can report them.
+    """
+    severities = {code: severity for code, (severity, enabled) in RULES.items() if enabled}
+    skipped = []
+    rules = (ruleset or {}).get("rules") or {}
+    if not isinstance(rules, dict):
+        return severities, skipped
+    for code, setting in rules.items():
+        if code not in RULES:
+            skipped.append(code)
+            continue
+        if isinstance(setting, dict):
+            setting = setting.get("severity", True)
+        if setting is False or setting == "off":
+            severities.pop(code, None)
+        elif setting is True:
+            severities[code] = RULES[code][0]
+        elif isinstance(setting, str) and setting in SEVERITY_NAMES:
+            severities[code] = SEVERITY_NAMES[setting]
+    return severities, skipped
+
+
+def load_ruleset(ruleset_path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parses a Spectral ruleset file (None without a path or for a non-mapping file)."""
+    if not ruleset_path:
+        return None
+    with open(ruleset_path, "r", encoding="utf-8") as f:
+        ruleset = yaml.load(f, Loader=_SafeLoader)
+    return ruleset if isinstance(ruleset, dict) else None
+
+
+def load_with_lines(text: str) -> Tuple[Any, Dict[Path, Tuple[int, int]]]:
+    """
+    Parses YAML/JSON text once and returns (document, line index).
+
+    The index maps JSON paths (keys and list indices as strings) to the
+    0-based (line, column) of the mapping key or list item.
+    """
+    loader = _SafeLoader(text)
+    try:
+        node = loader.get_single_node()
+        document = loader.construct_document(node) if node is not None else None
+    finally:
+        loader.dispose()
+    index: Dict[Path, Tuple[int, int]] = {}
+    if node is not None:
+        index[()] = (node.start_mark.line, node.start_mark.column)
+        _index_node(node, (), index)
+    return document, index
+
+
+def _index_node(node, path: Path, index: Dict[Path, Tuple[int, int]]):
+    stack = [(node, path)]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                child = path + (str(key_node.value),)
+                index[child] = (key_node.start_mark.line, key_node.start_mark.column)
+                stack.append((value_node, child))
+        elif isinstance(node, yaml.SequenceNode):
+            for position, item in enumerate(node.value):
+                child = path + (str(position),)
+                index[child] = (item.start_mark.line, item.start_mark.column)
+                stack.append((item, child))
+
+
+def lint_file(file_path: str, ruleset_path: Optional[str] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Lints an OAS file; returns (Spectral-format issues, ruleset rules skipped).
+    """
+    with open(file_path, "r", encoding="utf-8-sig") as f:
+        document, index = load_with_lines(f.read())
+    severities, skipped = rule_severities(load_ruleset(ruleset_path))
+    line_of = lambda path: index.get(tuple(str(part) for part in path))
+    return lint_document(document, line_of, source=file_path, severities=severities), skipped
+
+
+def lint_document(
+    document: Any,
+    line_of: Optional[LineLookup] = None,
+    source: Optional[str] = None,
+    severities: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Lints a parsed OAS document.
+
+    Args:
+        document: The OAS as nested dicts/lists
+        line_of: Optional function(JSON path tuple) -> 0-based (line, column)
+                 or None; parents are tried for paths it does not know
+        source: File name reported in each issue
+        severities: Active rules (default: rule_severities())
+
+    Returns:
+        Issues in Spectral's JSON output format, ordered by line
+    """
+    if severities is None:
+        severities = rule_severities()[0]
+    if not isinstance(document, dict):
+        return []
+
+    issues = []
+    reported = set()
+    for code, path, message in _check_document(document):
+        # Path-level parameters are checked once per operation of the path
+        if code not in severities or (code, path, message) in reported:
+            continue
+        reported.add((code, path, message))
+        line, column = _locate(line_of, path)
+        issue = {
+            "code": code,
+            "message": message,
+            "path": list(path),
+            "severity": severities[code],
+            "range": {
+                "start": {"line": line, "character": column},
+                "end": {"line": line, "character": column},
+            },
+        }
+        if source:
+            issue["source"] = source
+        issues.append(issue)
+    issues.sort(key=lambda issue: (issue["range"]["start"]["line"], issue["code"]))
+    return issues
+
+
+def _locate(line_of: Optional[LineLookup], path: Path) -> Tuple[int, int]:
+    if line_of is None:
+        return 0, 0
+    path = tuple(path)
+    while True:
+        position = line_of(path)
+        if position is not None or not path:
+            return position or (0, 0)
+        path = path[:-1]
+
+
+# --- Rules ---------------------------------------------------------------
+
+Issue = Tuple[str, Path, str]
+
+
+def _check_document(doc: Dict[str, Any]) -> Iterator[Issue]:
+    yield from _check_info(doc)
+    yield from _check_servers(doc)
+    yield from _check_tags(doc)
+    yield from _check_paths(doc)
+    yield from _check_security(doc)
+    yield from _check_nodes(doc)
+    yield from _check_unused_components(doc)
+
+
+def _is_blank(value: Any) -> bool:
+    return not isinstance(value, str) or not value.strip()
+
+
+def _check_info(doc):
+    info = doc.get("info")
+    if not isinstance(info, dict):
+        return
+    contact = info.get("contact")
+    if not isinstance(contact, dict):
+        yield "info-contact", ("info",), 'Info object must have "contact" object.'
+    else:
+        for field in ("name", "url", "email"):
+            if not contact.get(field):
+                yield "contact-properties", ("info", "contact"), f'Contact object must have "{field}".'
+    if _is_blank(info.get("description")):
+        yield "info-description", ("info",), 'Info "description" must be present and non-empty string.'
+    license_info = info.get("license")
+    if not isinstance(license_info, dict):
+        yield "info-license", ("info",), 'Info object must have "license" object.'
+    elif not license_info.get("url"):
+        yield "license-url", ("info", "license"), 'License object must include "url".'
+
+
+def _check_servers(doc):
+    servers = doc.get("servers")
+    if not isinstance(servers, list) or not servers:
+        yield "oas3-api-servers", (), 'OpenAPI "servers" must be present and non-empty array.'
+        return
+    for position, server in enumerate(servers):
+        url = server.get("url") if isinstance(server, dict) else None
+        if isinstance(url, str) and url.endswith("/") and url != "/":
+            yield "oas3-server-trailing-slash", ("servers", position, "url"), "Server URL must not have trailing slash."
+
+
+def _check_tags(doc):
+    tags = doc.get("tags")
+    if not isinstance(tags, list) or not tags:
+        yield "openapi-tags", (), 'OpenAPI object must have non-empty "tags" array.'
+        return
+    names = [tag.get("name") for tag in tags if isinstance(tag, dict)]
+    for position, (previous, name) in enumerate(zip(names, names[1:]), start=1):
+        if isinstance(previous, str) and isinstance(name, str) and name.lower() < previous.lower():
+            yield "openapi-tags-alphabetical", ("tags", position), 'OpenAPI object must have alphabetical "tags".'
+            break
+    for position, tag in enumerate(tags):
+        if isinstance(tag, dict) and _is_blank(tag.get("description")):
+            yield "tag-description", ("tags", position), 'Tag object must have "description".'
+
+
+def _resolve(doc: Dict[str, Any], value: Any) -> Any:
+    """Follows a local '#/...' $ref (once); anything else is returned as is."""
+    if not isinstance(value, dict) or not isinstance(value.get("$ref"), str):
+        return value
+    ref = value["$ref"]
+    if not ref.startswith("#/"):
+        return value
+    target: Any = doc
+    for part in ref[2:].split("/"):
+        part = part.replace("~1", "/").replace("~0", "~")
+        if isinstance(target, dict) and part in target:
+            target = target[part]
+        elif isinstance(target, list) and part.isdigit() and int(part) < len(target):
+            target = target[int(part)]
+        else:
+            return value
+    return target
+
+
+def _operations(doc) -> Iterator[Tuple[str, Dict[str, Any], str, Dict[str, Any]]]:
+    paths = doc.get("paths")
+    if not isinstance(paths, dict):
+        return
+    for path_key, path_item in paths.items():
+        if not isinstance(path_item, dict):
+            continue
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+            if isinstance(operation, dict):
+                yield str(path_key), path_item, method, operation
+
+
+def _check_paths(doc):
+    paths = doc.get("paths")
+    if isinstance(paths, dict):
+        for path_key in paths:
+            path_key = str(path_key)
+            if len(path_key) > 1 and path_key.endswith("/"):
+                yield "path-keys-no-trailing-slash", ("paths", path_key), "Path must not end with slash."
+            if "?" in path_key:
+                yield "path-not-include-query", ("paths", path_key), "Path must not include query string."
+            if "{}" in path_key:
+                yield ("path-declarations-must-exist", ("paths", path_key),
+                       'Path parameter declarations must not be empty, ex."/given/{}" is invalid.')
+
+    global_tags = {tag.get("name") for tag in doc.get("tags") or [] if isinstance(tag, dict)}
+    operation_ids: Dict[str, Path] = {}
+    for path_key, path_item, method, operation in _operations(doc):
+        op_path = ("paths", path_key, method)
+
+        operation_id = operation.get("operationId")
+        if _is_blank(operation_id):
+            yield "operation-operationId", op_path, 'Operation must have "operationId".'
+        elif operation_id in operation_ids:
+            yield ("operation-operationId-unique", op_path + ("operationId",),
+                   'Every operation must have unique "operationId".')
+        else:
+            operation_ids[operation_id] = op_path
+
+        if _is_blank(operation.get("description")):
+            yield "operation-description", op_path, 'Operation "description" must be present and non-empty string.'
+
+        tags = operation.get("tags")
+        if not isinstance(tags, list) or not tags:
+            yield "operation-tags", op_path, 'Operation must have non-empty "tags" array.'
+        else:
+            for position, tag in enumerate(tags):
+                if tag not in global_tags:
+                    yield ("operation-tag-defined", op_path + ("tags", position),
+                           'Operation tags must be defined in global tags.')
+
+        responses = operation.get("responses")
+        codes = [str(code).upper() for code in responses] if isinstance(responses, dict) else []
+        if not any(code[:1] in ("2", "3") for code in codes):
+            yield ("operation-success-response", op_path + (("responses",) if isinstance(responses, dict) else ()),
+                   'Operation must have at least one "2xx" or "3xx" response.')
+
+        yield from _check_parameters(doc, path_key, path_item, method, operation)
+
+
+def _check_parameters(doc, path_key, path_item, method, operation):
+    op_path = ("paths", path_key, method)
+    declared: Dict[str, Path] = {}
+
+    for owner, location in ((path_item, ("paths", path_key)), (operation, op_path)):
+        parameters = owner.get("parameters")
+        if not isinstance(parameters, list):
+            continue
+        seen_here = set()
+        for position, raw in enumerate(parameters):
+            parameter = _resolve(doc, raw)
+            if not isinstance(parameter, dict):
+                continue
+            param_path = location + ("parameters", position)
+            name, where = parameter.get("name"), parameter.get("in")
+            if owner is operation:
+                if (name, where) in seen_here:
+                    yield ("operation-parameters", param_path,
+                           'A parameter in this operation already exposes the same combination of "name" and "in" values.')
+                seen_here.add((name, where))
+            if not (isinstance(raw, dict) and "$ref" in raw) and _is_blank(parameter.get("description")):
+                yield "oas3-parameter-description", param_path, 'Parameter objects must have "description".'
+            if where == "path" and isinstance(name, str):
+                if parameter.get("required") is not True:
+                    yield ("path-params", param_path,
+                           f'Path parameter "{name}" must have "required" property that is set to "true".')
+                declared[name] = param_path
+
+    used = _PATH_TEMPLATE.findall(path_key)
+    for name in used:
+        if name and name not in declared:
+            yield ("path-params", op_path,
+                   f'Operation must define parameter "{{{name}}}" as expected by path "{path_key}".')
+    for name, param_path in declared.items():
+        if name not in used:
+            yield "path-params", param_path, f'Parameter "{name}" must be used in path "{path_key}".'
+
+
+def _check_security(doc):
+    schemes = (doc.get("components") or {}).get("securitySchemes") or {}
+    requirements = [(("security",), doc.get("security"), "API")]
+    for path_key, _, method, operation in _operations(doc):
+        requirements.append((("paths", path_key, method, "security"), operation.get("security"), "Operation"))
+    for location, security, owner in requirements:
+        if not isinstance(security, list):
+            continue
+        for position, requirement in enumerate(security):
+            if not isinstance(requirement, dict):
+                continue
+            for name in requirement:
+                if name not in schemes:
+                    yield ("oas3-operation-security-defined", location + (position, name),
+                           f'{owner} "security" values must match a scheme defined in the '
+                           f'"components.securitySchemes" object.')
+
+
+def _check_nodes(doc):
+    """Rules applying wherever their keyword appears: $ref siblings, examples, enums, markdown."""
+    check_ref_siblings = not str(doc.get("openapi", "")).startswith("3.1")
+    stack: List[Tuple[Any, Path, Optional[str]]] = [(doc, (), None)]
+    while stack:
+        node, path, parent_key = stack.pop()
+        if isinstance(node, list):
+            for position in range(len(node) - 1, -1, -1):
+                stack.append((node[position], path + (position,), parent_key))
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        # A properties map holds field names, not keywords
+        if parent_key != "properties":
+            if check_ref_siblings and "$ref" in node and len(node) > 1:
+                for key in node:
+                    if key != "$ref":
+                        yield "no-$ref-siblings", path + (key,), "$ref must not be placed next to any other properties"
+
+            examples = node.get("examples")
+            if isinstance(examples, dict) and parent_key != "examples":
+                for name, example in examples.items():
+                    if isinstance(example, dict) and "$ref" not in example:
+                        if ("value" in example) == ("externalValue" in example):
+                            yield ("oas3-examples-value-or-externalValue", path + ("examples", name),
+                                   'Examples must have either "value" or "externalValue" field.')
+
+            if isinstance(node.get("enum"), list):
+                yield from _check_enum(node, path)
+
+            description = node.get("description")
+            if isinstance(description, str) and _SCRIPT_TAG.search(description):
+                yield ("no-script-tags-in-markdown", path + ("description",),
+                       'Markdown descriptions must not have "<script>" tags.')
+
+        for key in reversed(list(node)):
+            # Example payloads and extensions are free-form data
+            if parent_key != "properties" and (
+                key in ("example", "value", RAW_EXTENSIONS_KEY) or str(key).startswith("x-")
+            ):
+                continue
+            stack.append((node[key], path + (key,), key))
+
+
+def _enum_type_matches(value: Any, schema_type: str) -> bool:
+    if value is None:
+        return True  # nullable enums
+    if schema_type == "string":
+        return isinstance(value, str) and not _is_raw_number(value)
+    if schema_type == "integer":
+        if _is_raw_number(value):
+            return re.fullmatch(r"-?\d+", value) is not None
+        return isinstance(value, int) and not isinstance(value, bool)
+    if schema_type == "number":
+        return _is_raw_number(value) or (isinstance(value, (int, float)) and not isinstance(value, bool))
+    if schema_type == "boolean":
+        return isinstance(value, bool)
+    if schema_type == "array":
+        return isinstance(value, list)
+    if schema_type == "object":
+        return isinstance(value, dict)
+    return True
+
+
+def _is_raw_number(value: Any) -> bool:
+    # Generator documents keep numbers as RawNumericValue (a str subclass)
+    return isinstance(value, str) and type(value).__name__ == "RawNumericValue"
+
+
+def _check_enum(node, path):
+    enum = node["enum"]
+    schema_type = node.get("type")
+    if isinstance(schema_type, str):
+        for position, value in enumerate(enum):
+            if not _enum_type_matches(value, schema_type):
+                yield ("typed-enum", path + ("enum", position),
+                       f'Enum value "{value}" must be "{schema_type}".')
+    seen = []
+    for position, value in enumerate(enum):
+        if value in seen:
+            yield "duplicated-entry-in-enum", path + ("enum", position), f'Enum has duplicate value "{value}".'
+        else:
+            seen.append(value)
+
+
+def _check_unused_components(doc):
+    components = doc.get("components")
+    if not isinstance(components, dict):
+        return
+    referenced = set()
+    stack = [doc]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                referenced.add(ref)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    for component_type in REUSABLE_COMPONENTS:
+        entries = components.get(component_type)
+        if not isinstance(entries, dict):
+            continue
+        for name in entries:
+            pointer_name = str(name).replace("~", "~0").replace("/", "~1")
+            if f"#/components/{component_type}/{pointer_name}" not in referenced:
+                yield ("oas3-unused-component", ("components", component_type, name),
+                       "Potentially unused component has been detected.")
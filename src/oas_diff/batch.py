@@ -0,0 +1,223 @@
+"""
+Batch comparison: one baseline OAS against many candidate specs.
+
+The baseline is parsed and resolved once, handed to each pool worker a single
+time through the pool initializer, and reused for every candidate that worker
+compares. Each candidate gets its own report folder; a CSV summary matrix with
+the change counts of every candidate is written next to them.
+
+CLI:
+    python -m src.oas_diff.batch OLD.yaml NEW1.yaml [NEW2.yaml ...] -o OUTPUT_DIR
+"""
+
+import argparse
+import csv
+import datetime
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .heuristic_engine import Severity
+from .report_manager import OASDiffReportManager, REPORT_FILE_LABELS
+from .resolver import resolve_spec
+from .spec_loader import load_spec
+
+SUMMARY_COLUMNS = [
+    "candidate",
+    "breaking",
+    "high",
+    "medium",
+    "low",
+    "info",
+    "new_paths",
+    "removed_paths",
+    "modified_paths",
+    "report_dir",
+    "elapsed_seconds",
+    "error",
+]
+
+# Baseline state installed once per worker process by _init_worker
+_baseline: Optional[Dict[str, Any]] = None
+
+
+def load_baseline(old_path: str, report_types=None, spec_cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Parses the baseline spec once and, when the compatibility report is requested,
+    resolves its paths so every comparison can reuse them.
+    """
+    spec = load_spec(old_path, cache_dir=spec_cache_dir)
+    needs_resolved = report_types is None or 'compatibility' in report_types
+    return {
+        "path": old_path,
+        "spec": spec,
+        "resolved": resolve_spec(spec) if needs_resolved else None,
+    }
+
+
+def compare_batch(old_path: str, new_paths: List[str], output_dir: str, report_types=None,
+                  preferences=None, max_workers: Optional[int] = None,
+                  spec_cache_dir: Optional[str] = None, log_callback=print) -> Dict[str, Any]:
+    """
+    Compares old_path against every spec in new_paths and writes per-pair reports
+    plus a summary matrix into output_dir.
+
+    Returns {"summary_path": str, "rows": [summary row dict per candidate]}.
+    Candidates that fail are reported in the 'error' column instead of aborting the batch.
+    """
+    report_types = [t for t in REPORT_FILE_LABELS if report_types is None or t in report_types]
+    preferences = preferences or {}
+    os.makedirs(output_dir, exist_ok=True)
+
+    log_callback(f"Loading baseline: {os.path.basename(old_path)}")
+    baseline = load_baseline(old_path, report_types, spec_cache_dir)
+
+    jobs = []
+    for index, new_path, folder in _candidate_folders(new_paths):
+        jobs.append({
+            "index": index,
+            "new_path": new_path,
+            "output_dir": os.path.join(output_dir, folder),
+            "report_types": report_types,
+            "preferences": preferences,
+            "spec_cache_dir": spec_cache_dir,
+        })
+
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    log_callback(f"Comparing {len(jobs)} candidate(s) using {max(1, workers)} worker(s)...")
+
+    rows = []
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(baseline,)) as pool:
+            futures = [pool.submit(_compare_candidate, job) for job in jobs]
+            for future in futures:
+                rows.append(future.result())
+                _log_row(rows[-1], log_callback)
+    else:
+        _init_worker(baseline)
+        for job in jobs:
+            rows.append(_compare_candidate(job))
+            _log_row(rows[-1], log_callback)
+
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    summary_path = os.path.join(output_dir, f"OAS_Batch_Comparison_Summary_{timestamp}.csv")
+    write_summary(summary_path, rows)
+    log_callback(f"Summary matrix: {summary_path}")
+    return {"summary_path": summary_path, "rows": rows}
+
+
+def write_summary(path: str, rows: List[Dict[str, Any]]):
+    """Writes the breaking-change matrix (one row per candidate) as CSV."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({key: row.get(key, "") for key in SUMMARY_COLUMNS})
+
+
+def _candidate_folders(new_paths: List[str]):
+    """Yields (index, path, report folder name), keeping folder names unique."""
+    used = set()
+    for index, new_path in enumerate(new_paths):
+        stem = os.path.splitext(os.path.basename(new_path))[0]
+        folder = stem
+        suffix = 2
+        while folder in used:
+            folder = f"{stem}_{suffix}"
+            suffix += 1
+        used.add(folder)
+        yield index, new_path, folder
+
+
+def _init_worker(baseline: Dict[str, Any]):
+    global _baseline
+    _baseline = baseline
+
+
+def _compare_candidate(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Runs one baseline-vs-candidate comparison against the worker's shared baseline."""
+    started = time.perf_counter()
+    row = {
+        "candidate": job["new_path"],
+        "report_dir": job["output_dir"],
+        "error": "",
+    }
+    try:
+        manager = OASDiffReportManager(
+            _baseline["path"],
+            job["new_path"],
+            job["output_dir"],
+            job["preferences"],
+            spec_cache_dir=job["spec_cache_dir"],
+            old_spec=_baseline["spec"],
+        )
+        manager.resolved1 = _baseline["resolved"]
+        diff = manager.run_comparison()
+        # Already inside a pool worker: render this pair's reports serially
+        manager.generate_reports(job["report_types"], parallel=False)
+
+        counts = {severity: 0 for severity in Severity}
+        for insight in manager.insights:
+            counts[insight.severity] += 1
+        row.update({
+            "breaking": counts[Severity.CRITICAL],
+            "high": counts[Severity.HIGH],
+            "medium": counts[Severity.MEDIUM],
+            "low": counts[Severity.LOW],
+            "info": counts[Severity.INFO],
+            "new_paths": len(diff.new_paths),
+            "removed_paths": len(diff.removed_paths),
+            "modified_paths": len(diff.modified_paths),
+        })
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    row["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+    return row
+
+
+def _log_row(row: Dict[str, Any], log_callback):
+    name = os.path.basename(row["candidate"])
+    if row["error"]:
+        log_callback(f"  FAILED {name}: {row['error']}")
+    else:
+        log_callback(f"  {name}: {row['breaking']} breaking change(s) ({row['elapsed_seconds']}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.oas_diff.batch",
+        description="Compare one baseline OAS against many candidate specs.",
+    )
+    parser.add_argument("old_spec", help="Baseline (published) OAS file")
+    parser.add_argument("new_specs", nargs="+", help="Candidate OAS files")
+    parser.add_argument("-o", "--output-dir", required=True, help="Folder for reports and the summary matrix")
+    parser.add_argument(
+        "-r", "--reports",
+        default=",".join(REPORT_FILE_LABELS),
+        help=f"Comma-separated report types ({', '.join(REPORT_FILE_LABELS)})",
+    )
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Parallel comparisons (default: CPU count)")
+    parser.add_argument("--cache-dir", default=None, help="Optional persistent parsed-spec cache folder")
+    args = parser.parse_args(argv)
+
+    report_types = [t.strip() for t in args.reports.split(",") if t.strip()]
+    unknown = [t for t in report_types if t not in REPORT_FILE_LABELS]
+    if unknown:
+        parser.error(f"unknown report type(s): {', '.join(unknown)}")
+
+    result = compare_batch(
+        args.old_spec,
+        args.new_specs,
+        args.output_dir,
+        report_types=report_types,
+        max_workers=args.workers,
+        spec_cache_dir=args.cache_dir,
+    )
+    return 1 if any(row["error"] for row in result["rows"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import yaml
 from typing import Any, Dict, List, Optional, Union
+from .spec_loader import load_spec
 
 class DiffResult:
     def __init__(self):
@@ -15,8 +16,7 @@ class DiffResult:
         self.servers_changes = {}
 
 def load_yaml(file_path: str) -> Dict[str, Any]:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return load_spec(file_path)
 
 import os
 
@@ -1,4 +1,4 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 from dataclasses import dataclass, field
 from .comparator import _unwrap_schema
 import re
@@ -46,6 +46,8 @@ class CompatibilityAnalyzer:
     Compares fully resolved OpenAPI paths to verify constraint identity
     and report differences in parameters, payloads, and response headers.
     """
+    _METHODS = ['get', 'post', 'put', 'delete', 'patch', 'options', 'head', 'trace']
+
     def __init__(
         self,
         resolved_spec1: Dict[str, Any],
@@ -70,6 +72,15 @@ class CompatibilityAnalyzer:
         return True
 
     def analyze(self) -> List[CompatibilityIssue]:
+        issues = list(self.iter_issues())
+        self.issues = issues
+        return issues
+
+    def iter_issues(self) -> Iterator[CompatibilityIssue]:
+        """
+        Yields issues endpoint by endpoint instead of accumulating them, so callers
+        can stream very large comparisons straight to a sink.
+        """
         self.issues = []
 
         old_paths = set(self.spec1.keys())
@@ -77,31 +88,33 @@ class CompatibilityAnalyzer:
 
         for path in sorted(old_paths - new_paths):
             self._record_path_removed(path, self.spec1[path])
+            yield from self._drain_issues()
 
         for path in sorted(new_paths - old_paths):
             self._record_path_added(path, self.spec2[path])
+            yield from self._drain_issues()
 
         # Compare paths present in both specs
         common_paths = old_paths & new_paths
         for path in common_paths:
-            self._analyze_path(path, self.spec1[path], self.spec2[path])
-            
-        return self.issues
-
-    def _analyze_path(self, path: str, path_item1: Dict, path_item2: Dict):
-        methods = ['get', 'post', 'put', 'delete', 'patch', 'options', 'head', 'trace']
-        
-        for method in methods:
-            if method in path_item1 and method in path_item2:
-                self._analyze_operation(path, method.upper(), path_item1[method], path_item2[method])
-            elif method in path_item1:
-                self._record_method_removed(path, method)
-            elif method in path_item2:
-                self._record_method_added(path, method)
+            for method in self._METHODS:
+                self._analyze_path_method(path, method, self.spec1[path], self.spec2[path])
+                yield from self._drain_issues()
+
+    def _drain_issues(self) -> List[CompatibilityIssue]:
+        pending, self.issues = self.issues, []
+        return pending
+
+    def _analyze_path_method(self, path: str, method: str, path_item1: Dict, path_item2: Dict):
+        if method in path_item1 and method in path_item2:
+            self._analyze_operation(path, method.upper(), path_item1[method], path_item2[method])
+        elif method in path_item1:
+            self._record_method_removed(path, method)
+        elif method in path_item2:
+            self._record_method_added(path, method)
 
     def _http_methods_in(self, path_item: Dict) -> List[str]:
-        methods = ['get', 'post', 'put', 'delete', 'patch', 'options', 'head', 'trace']
-        return [method for method in methods if method in path_item]
+        return [method for method in self._METHODS if method in path_item]
 
     def _record_path_removed(self, path: str, path_item: Dict):
         methods = self._http_methods_in(path_item)
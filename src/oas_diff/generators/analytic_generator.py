@@ -10,6 +10,7 @@ import os
 import difflib
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT, WD_COLOR_INDEX
 from ..dependency_tracer import DependencyTracer
+from .diff_segments import cached_runs, line_diff_segments, word_diff_segments
 
 # --- OXML Helpers (Safe Insertion) ---
 def get_or_add_child(parent, tag_name, order_list=None):
@@ -1850,34 +1851,11 @@ class AnalyticDocxGenerator:
                     merged_opcodes.append(('replace', start_i1, last_i2, start_j1, last_j2))
                 i = k
 
+    @cached_runs(2)
     def _render_rich_diff(self, p_old, p_new, text_old, text_new):
         """Renders description diff with paragraph-level tracking and splitting lopsided replacements."""
         if not isinstance(text_old, str): text_old = str(text_old or "")
         if not isinstance(text_new, str): text_new = str(text_new or "")
-        
-        # 1. Split into paragraphs
-        lines_old = text_old.splitlines(keepends=True)
-        lines_new = text_new.splitlines(keepends=True)
-        
-        s = difflib.SequenceMatcher(None, lines_old, lines_new, autojunk=False)
-        opcodes = s.get_opcodes()
-        
-        # Split "lopsided" replace opcodes: e.g. replace 1..4 with 1 -> replace 1 with 1 + delete 2..4
-        refined_opcodes = []
-        for tag, i1, i2, j1, j2 in opcodes:
-            if tag == 'replace':
-                old_count = i2 - i1
-                new_count = j2 - j1
-                if old_count > new_count:
-                    refined_opcodes.append(('replace', i1, i1 + new_count, j1, j2))
-                    refined_opcodes.append(('delete', i1 + new_count, i2, j2, j2))
-                elif new_count > old_count:
-                    refined_opcodes.append(('replace', i1, i2, j1, j1 + old_count))
-                    refined_opcodes.append(('insert', i2, i2, j1 + old_count, j2))
-                else:
-                    refined_opcodes.append((tag, i1, i2, j1, j2))
-            else:
-                refined_opcodes.append((tag, i1, i2, j1, j2))
 
         def apply_shading(run, color_hex):
             rPr = run._r.get_or_add_rPr()
@@ -1886,52 +1864,7 @@ class AnalyticDocxGenerator:
             shd.set(qn('w:fill'), color_hex)
 
         def render_word_diff(para_old, para_new, t_old, t_new):
-            import re
-            def split_words(text):
-                return re.findall(r'\w+|[^\w\s]|\s+', text)
-            
-            w_old = split_words(t_old)
-            w_new = split_words(t_new)
-            ws = difflib.SequenceMatcher(None, w_old, w_new, autojunk=False)
-            w_ops = ws.get_opcodes()
-            
-            # Refined merging: bridge only very small gaps (e.g. whitespace)
-            # to keep keywords distinct if they are pure removals.
-            merged_w_ops = []
-            wi = 0
-            while wi < len(w_ops):
-                tag, i1, i2, j1, j2 = w_ops[wi]
-                if tag == 'equal':
-                    merged_w_ops.append((tag, i1, i2, j1, j2))
-                    wi += 1
-                else:
-                    sw_i1, lw_i2 = i1, i2
-                    sw_j1, lw_j2 = j1, j2
-                    actual_o = tag in ('delete', 'replace')
-                    actual_n = tag in ('insert', 'replace')
-                    
-                    wk = wi + 1
-                    while wk < len(w_ops):
-                        nt, ni1, ni2, nj1, nj2 = w_ops[wk]
-                        is_bridge = False
-                        if nt == 'equal':
-                            eq_text = "".join(w_old[ni1:ni2])
-                            if len(eq_text) <= 3 and '\n' not in eq_text: is_bridge = True
-                        
-                        if nt != 'equal' or is_bridge:
-                            if nt in ('delete', 'replace'): actual_o = True
-                            if nt in ('insert', 'replace'): actual_n = True
-                            lw_i2, lw_j2 = ni2, nj2
-                            wk += 1
-                        else: break
-                    
-                    wt = 'replace' if (actual_o and actual_n) else ('delete' if actual_o else 'insert')
-                    merged_w_ops.append((wt, sw_i1, lw_i2, sw_j1, lw_j2))
-                    wi = wk
-
-            for wt, wi1, wi2, wj1, wj2 in merged_w_ops:
-                txt_o = "".join(w_old[wi1:wi2])
-                txt_n = "".join(w_new[wj1:wj2])
+            for wt, txt_o, txt_n in word_diff_segments(t_old, t_new):
                 if wt == 'equal':
                     para_old.add_run(txt_o)
                     para_new.add_run(txt_n)
@@ -1946,41 +1879,23 @@ class AnalyticDocxGenerator:
                     # AGGIUNTA: Verde in New
                     apply_shading(para_new.add_run(txt_n), "D4EDDA")
 
-        for tag, i1, i2, j1, j2 in refined_opcodes:
+        # Paragraph-level segments (cached per text pair, see diff_segments)
+        for tag, txt_o, txt_n in line_diff_segments(text_old, text_new):
             if tag == 'equal':
-                p_old.add_run("".join(lines_old[i1:i2]))
-                p_new.add_run("".join(lines_new[j1:j2]))
+                p_old.add_run(txt_o)
+                p_new.add_run(txt_n)
             elif tag == 'delete':
-                apply_shading(p_old.add_run("".join(lines_old[i1:i2])), "F8D7DA")
+                apply_shading(p_old.add_run(txt_o), "F8D7DA")
             elif tag == 'insert':
-                apply_shading(p_new.add_run("".join(lines_new[j1:j2])), "D4EDDA")
+                apply_shading(p_new.add_run(txt_n), "D4EDDA")
             elif tag == 'replace':
-                render_word_diff(p_old, p_new, "".join(lines_old[i1:i2]), "".join(lines_new[j1:j2]))
+                render_word_diff(p_old, p_new, txt_o, txt_n)
 
+    @cached_runs(1)
     def _render_rich_diff_inline(self, p, text_old, text_new):
         """Renders description diff inline with line splitting and color accuracy."""
         if not isinstance(text_old, str): text_old = str(text_old or "")
         if not isinstance(text_new, str): text_new = str(text_new or "")
-        
-        lines_old = text_old.splitlines(keepends=True)
-        lines_new = text_new.splitlines(keepends=True)
-        
-        s = difflib.SequenceMatcher(None, lines_old, lines_new, autojunk=False)
-        opcodes = s.get_opcodes()
-        
-        refined_opcodes = []
-        for tag, i1, i2, j1, j2 in opcodes:
-            if tag == 'replace':
-                old_count = i2 - i1
-                new_count = j2 - j1
-                if old_count > new_count:
-                    refined_opcodes.append(('replace', i1, i1 + new_count, j1, j2))
-                    refined_opcodes.append(('delete', i1 + new_count, i2, j2, j2))
-                elif new_count > old_count:
-                    refined_opcodes.append(('replace', i1, i2, j1, j1 + old_count))
-                    refined_opcodes.append(('insert', i2, i2, j1 + old_count, j2))
-                else: refined_opcodes.append((tag, i1, i2, j1, j2))
-            else: refined_opcodes.append((tag, i1, i2, j1, j2))
 
         def apply_shading(run, color_hex):
             rPr = run._r.get_or_add_rPr()
@@ -1989,59 +1904,18 @@ class AnalyticDocxGenerator:
             shd.set(qn('w:fill'), color_hex)
 
         def render_word_diff_inline(para, t_old, t_new):
-            import re
-            def split_words(text):
-                return re.findall(r'\w+|[^\w\s]|\s+', text)
-            
-            w_old = split_words(t_old)
-            w_new = split_words(t_new)
-            ws = difflib.SequenceMatcher(None, w_old, w_new, autojunk=False)
-            w_ops = ws.get_opcodes()
-            
-            merged_w_ops = []
-            wi = 0
-            while wi < len(w_ops):
-                tag, i1, i2, j1, j2 = w_ops[wi]
-                if tag == 'equal':
-                    merged_w_ops.append((tag, i1, i2, j1, j2))
-                    wi += 1
-                else:
-                    sw_i1, lw_i2 = i1, i2
-                    sw_j1, lw_j2 = j1, j2
-                    actual_o = tag in ('delete', 'replace')
-                    actual_n = tag in ('insert', 'replace')
-                    wk = wi + 1
-                    while wk < len(w_ops):
-                        nt, ni1, ni2, nj1, nj2 = w_ops[wk]
-                        is_bridge = False
-                        if nt == 'equal':
-                            eq_text = "".join(w_old[ni1:ni2])
-                            if len(eq_text) <= 3 and '\n' not in eq_text: is_bridge = True
-                        if nt != 'equal' or is_bridge:
-                            if nt in ('delete', 'replace'): actual_o = True
-                            if nt in ('insert', 'replace'): actual_n = True
-                            lw_i2, lw_j2 = ni2, nj2
-                            wk += 1
-                        else: break
-                    wt = 'replace' if (actual_o and actual_n) else ('delete' if actual_o else 'insert')
-                    merged_w_ops.append((wt, sw_i1, lw_i2, sw_j1, lw_j2))
-                    wi = wk
-
-            for wt, wi1, wi2, wj1, wj2 in merged_w_ops:
-                txt = "".join(w_old[wi1:wi2])
+            segments = word_diff_segments(t_old, t_new)
+            for wt, txt, _ in segments:
                 if wt == 'equal': para.add_run(txt)
                 elif wt == 'delete': apply_shading(para.add_run(txt), "F8D7DA")
                 elif wt == 'replace': apply_shading(para.add_run(txt), "FFF3CD")
             para.add_run(" \u2192 ")
-            for wt, wi1, wi2, wj1, wj2 in merged_w_ops:
-                txt = "".join(w_new[wj1:wj2])
+            for wt, _, txt in segments:
                 if wt == 'equal': para.add_run(txt)
                 elif wt == 'insert': apply_shading(para.add_run(txt), "D4EDDA")
                 elif wt == 'replace': apply_shading(para.add_run(txt), "FFF3CD")
 
-        for tag, i1, i2, j1, j2 in refined_opcodes:
-            txt_o = "".join(lines_old[i1:i2])
-            txt_n = "".join(lines_new[j1:j2])
+        for tag, txt_o, txt_n in line_diff_segments(text_old, text_new):
             if tag == 'equal': p.add_run(txt_o)
             elif tag == 'delete': apply_shading(p.add_run(txt_o), "F8D7DA")
             elif tag == 'insert': 
@@ -6,10 +6,10 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 import os
 import datetime
-import difflib
 import re
 from typing import List
 from ..compatibility_analyzer import CompatibilityIssue
+from .diff_segments import cached_runs, token_diff_opcodes
 
 # Helper for OXML
 # --- OXML Helpers (Safe Insertion) ---
@@ -512,6 +512,7 @@ class CompatibilityDocxGenerator:
         if txt is None: return ''
         return re.sub(r'\s+', ' ', str(txt)).strip()
 
+    @cached_runs(2)
     def _render_rich_diff(self, p_old, p_new, text_old, text_new):
         """Renders word-level diff with semantic coloring (Red for removal, Green for addition)."""
         # 1. Standardize text to eliminate whitespace-only differences
@@ -537,29 +538,24 @@ class CompatibilityDocxGenerator:
             p_new.add_run("<None>")
             return
 
-        # 2. Word-level diff on normalized text
-        words1 = v1.split()
-        words2 = v2.split()
-        
-        # Disable autojunk for precise technical text comparison
-        sm = difflib.SequenceMatcher(None, words1, words2, autojunk=False)
-        for tag, i1, i2, j1, j2 in sm.get_opcodes():
+        # 2. Word-level diff on normalized text (cached per text pair, see diff_segments)
+        for tag, old_words, new_words in token_diff_opcodes(v1, v2):
             if tag == 'equal':
-                for word in words1[i1:i2]:
+                for word in old_words:
                     p_old.add_run(word + " ")
                     p_new.add_run(word + " ")
             elif tag == 'replace':
                 # Deleted parts in red (old)
-                r_old = p_old.add_run(" ".join(words1[i1:i2]) + " ")
+                r_old = p_old.add_run(" ".join(old_words) + " ")
                 self._apply_shading(r_old, "F8D7DA")
                 # Added parts in green (new)
-                r_new = p_new.add_run(" ".join(words2[j1:j2]) + " ")
+                r_new = p_new.add_run(" ".join(new_words) + " ")
                 self._apply_shading(r_new, "D4EDDA")
             elif tag == 'delete':
-                r_old = p_old.add_run(" ".join(words1[i1:i2]) + " ")
+                r_old = p_old.add_run(" ".join(old_words) + " ")
                 self._apply_shading(r_old, "F8D7DA")
             elif tag == 'insert':
-                r_new = p_new.add_run(" ".join(words2[j1:j2]) + " ")
+                r_new = p_new.add_run(" ".join(new_words) + " ")
                 self._apply_shading(r_new, "D4EDDA")
 
     def _apply_shading(self, run, color):
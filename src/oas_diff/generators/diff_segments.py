@@ -0,0 +1,205 @@
+"""
+Memoised text-diff segments shared by the DOCX generators.
+
+The same old/new description pair (typically shared validation-rule text)
+shows up under many properties and endpoints. Diffing is pure, so segments
+are cached per (old text, new text) for the whole process and every generator
+in a run reuses them. On top of that, @cached_runs remembers the <w:r> elements
+a renderer produced for a text pair and appends deep copies on repeats, which
+yields the same run structure without going through python-docx again.
+"""
+
+import difflib
+import functools
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from copy import deepcopy
+from functools import lru_cache
+
+DIFF_CACHE_SIZE = 4096
+RUN_CACHE_SIZE = 2048
+
+_WORD_RE = re.compile(r'\w+|[^\w\s]|\s+')
+
+
+def split_words(text):
+    """Tokenises text into words, punctuation and whitespace runs."""
+    return _WORD_RE.findall(text)
+
+
+@lru_cache(maxsize=DIFF_CACHE_SIZE)
+def line_diff_segments(text_old, text_new):
+    """
+    Line-level diff of two descriptions as a tuple of (tag, old_text, new_text).
+    Lopsided replacements are split so extra lines become pure deletes/inserts:
+    e.g. replace 1..4 with 1 -> replace 1 with 1 + delete 2..4.
+    """
+    lines_old = text_old.splitlines(keepends=True)
+    lines_new = text_new.splitlines(keepends=True)
+
+    s = difflib.SequenceMatcher(None, lines_old, lines_new, autojunk=False)
+
+    refined_opcodes = []
+    for tag, i1, i2, j1, j2 in s.get_opcodes():
+        if tag == 'replace':
+            old_count = i2 - i1
+            new_count = j2 - j1
+            if old_count > new_count:
+                refined_opcodes.append(('replace', i1, i1 + new_count, j1, j2))
+                refined_opcodes.append(('delete', i1 + new_count, i2, j2, j2))
+            elif new_count > old_count:
+                refined_opcodes.append(('replace', i1, i2, j1, j1 + old_count))
+                refined_opcodes.append(('insert', i2, i2, j1 + old_count, j2))
+            else:
+                refined_opcodes.append((tag, i1, i2, j1, j2))
+        else:
+            refined_opcodes.append((tag, i1, i2, j1, j2))
+
+    return tuple(
+        (tag, "".join(lines_old[i1:i2]), "".join(lines_new[j1:j2]))
+        for tag, i1, i2, j1, j2 in refined_opcodes
+    )
+
+
+@lru_cache(maxsize=DIFF_CACHE_SIZE)
+def word_diff_segments(t_old, t_new):
+    """
+    Word-level diff of two text blocks as a tuple of (tag, old_text, new_text).
+    Consecutive changes are merged, bridging only very small gaps (e.g. whitespace)
+    to keep keywords distinct if they are pure removals.
+    """
+    w_old = split_words(t_old)
+    w_new = split_words(t_new)
+    ws = difflib.SequenceMatcher(None, w_old, w_new, autojunk=False)
+    w_ops = ws.get_opcodes()
+
+    merged_w_ops = []
+    wi = 0
+    while wi < len(w_ops):
+        tag, i1, i2, j1, j2 = w_ops[wi]
+        if tag == 'equal':
+            merged_w_ops.append((tag, i1, i2, j1, j2))
+            wi += 1
+        else:
+            sw_i1, lw_i2 = i1, i2
+            sw_j1, lw_j2 = j1, j2
+            actual_o = tag in ('delete', 'replace')
+            actual_n = tag in ('insert', 'replace')
+
+            wk = wi + 1
+            while wk < len(w_ops):
+                nt, ni1, ni2, nj1, nj2 = w_ops[wk]
+                is_bridge = False
+                if nt == 'equal':
+                    eq_text = "".join(w_old[ni1:ni2])
+                    if len(eq_text) <= 3 and '\n' not in eq_text: is_bridge = True
+
+                if nt != 'equal' or is_bridge:
+                    if nt in ('delete', 'replace'): actual_o = True
+                    if nt in ('insert', 'replace'): actual_n = True
+                    lw_i2, lw_j2 = ni2, nj2
+                    wk += 1
+                else: break
+
+            wt = 'replace' if (actual_o and actual_n) else ('delete' if actual_o else 'insert')
+            merged_w_ops.append((wt, sw_i1, lw_i2, sw_j1, lw_j2))
+            wi = wk
+
+    return tuple(
+        (wt, "".join(w_old[wi1:wi2]), "".join(w_new[wj1:wj2]))
+        for wt, wi1, wi2, wj1, wj2 in merged_w_ops
+    )
+
+
+@lru_cache(maxsize=DIFF_CACHE_SIZE)
+def token_diff_opcodes(v1, v2):
+    """
+    Whitespace-token diff of two normalised strings as a tuple of
+    (tag, old_words, new_words), with the word slices as tuples.
+    """
+    words1 = v1.split()
+    words2 = v2.split()
+    # Disable autojunk for precise technical text comparison
+    sm = difflib.SequenceMatcher(None, words1, words2, autojunk=False)
+    return tuple(
+        (tag, tuple(words1[i1:i2]), tuple(words2[j1:j2]))
+        for tag, i1, i2, j1, j2 in sm.get_opcodes()
+    )
+
+
+RunCacheInfo = namedtuple("RunCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_run_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_run_cache_lock = threading.Lock()
+_run_cache_stats = {"hits": 0, "misses": 0}
+
+
+def cached_runs(paragraph_count):
+    """
+    Decorator for generator methods shaped like render(self, *paragraphs, *texts)
+    that only append runs to the given paragraphs. The runs rendered for a given
+    method and text pair are stored once and deep-copied into later paragraphs.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            paragraphs = args[:paragraph_count]
+            # Type is part of the key: 1 and True hash alike but render differently
+            key = (method.__qualname__,) + tuple((type(v), v) for v in args[paragraph_count:])
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args)
+
+            with _run_cache_lock:
+                cached = _run_cache.get(key)
+                if cached is not None:
+                    _run_cache.move_to_end(key)
+                    _run_cache_stats["hits"] += 1
+            if cached is not None:
+                for paragraph, elements in zip(paragraphs, cached):
+                    p = paragraph._p
+                    for element in elements:
+                        p.append(deepcopy(element))
+                return None
+
+            starts = [len(paragraph._p) for paragraph in paragraphs]
+            result = method(self, *args)
+            if len({id(paragraph._p) for paragraph in paragraphs}) == len(paragraphs):
+                rendered = tuple(
+                    tuple(deepcopy(element) for element in paragraph._p[start:])
+                    for paragraph, start in zip(paragraphs, starts)
+                )
+                with _run_cache_lock:
+                    _run_cache_stats["misses"] += 1
+                    _run_cache[key] = rendered
+                    while len(_run_cache) > RUN_CACHE_SIZE:
+                        _run_cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+
+def clear_diff_cache():
+    """Empties the shared diff caches (e.g. between unrelated batch runs)."""
+    line_diff_segments.cache_clear()
+    word_diff_segments.cache_clear()
+    token_diff_opcodes.cache_clear()
+    with _run_cache_lock:
+        _run_cache.clear()
+        _run_cache_stats.update(hits=0, misses=0)
+
+
+def diff_cache_info():
+    """Returns hit/miss statistics per cache (lru_cache infos plus the run cache)."""
+    with _run_cache_lock:
+        runs = RunCacheInfo(
+            _run_cache_stats["hits"], _run_cache_stats["misses"], RUN_CACHE_SIZE, len(_run_cache)
+        )
+    return {
+        "line": line_diff_segments.cache_info(),
+        "word": word_diff_segments.cache_info(),
+        "token": token_diff_opcodes.cache_info(),
+        "runs": runs,
+    }
@@ -7,8 +7,8 @@ from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
-import difflib
 from ..dependency_tracer import DependencyTracer
+from .diff_segments import cached_runs, line_diff_segments, word_diff_segments
 
 # OXML Helpers
 def get_or_add_child(parent, tag_name, ordering=None):
@@ -1157,34 +1157,14 @@ class ImpactDocxGenerator:
             shd.set(qn('w:fill'), 'E2E3E5') # Light Grey
             run.font.color.rgb = RGBColor(56, 61, 65) # Dark Grey
 
+    @cached_runs(1)
     def _render_rich_diff_inline(self, p, text_old, text_new):
         """Renders description diff inline with line splitting and color accuracy."""
         if not isinstance(text_old, str): text_old = str(text_old or "")
         if not isinstance(text_new, str): text_new = str(text_new or "")
         
-        # Split into lines
-        lines_old = text_old.splitlines(keepends=True)
-        lines_new = text_new.splitlines(keepends=True)
-        
-        s = difflib.SequenceMatcher(None, lines_old, lines_new, autojunk=False)
-        opcodes = s.get_opcodes()
-        
-        # Structural split: separate modifications from removals/additions
-        refined_opcodes = []
-        for tag, i1, i2, j1, j2 in opcodes:
-            if tag == 'replace':
-                old_count = i2 - i1
-                new_count = j2 - j1
-                if old_count > new_count:
-                    refined_opcodes.append(('replace', i1, i1 + new_count, j1, j2))
-                    refined_opcodes.append(('delete', i1 + new_count, i2, j2, j2))
-                elif new_count > old_count:
-                    refined_opcodes.append(('replace', i1, i2, j1, j1 + old_count))
-                    refined_opcodes.append(('insert', i2, i2, j1 + old_count, j2))
-                else:
-                    refined_opcodes.append((tag, i1, i2, j1, j2))
-            else:
-                refined_opcodes.append((tag, i1, i2, j1, j2))
+        # Line segments with lopsided replacements already split (cached per text pair)
+        segments = line_diff_segments(text_old, text_new)
 
         def apply_shading(run, color_hex):
             rPr = run._r.get_or_add_rPr()
@@ -1194,68 +1174,23 @@ class ImpactDocxGenerator:
             rPr.append(shd)
 
         def render_word_diff_inline(para, t_old, t_new):
-            import re
-            def split_words(text):
-                return re.findall(r'\w+|[^\w\s]|\s+', text)
-            
-            w_old = split_words(t_old)
-            w_new = split_words(t_new)
-            ws = difflib.SequenceMatcher(None, w_old, w_new, autojunk=False)
-            w_ops = ws.get_opcodes()
-            
-            # Refined merging for inline
-            merged_w_ops = []
-            wi = 0
-            while wi < len(w_ops):
-                tag, i1, i2, j1, j2 = w_ops[wi]
-                if tag == 'equal':
-                    merged_w_ops.append((tag, i1, i2, j1, j2))
-                    wi += 1
-                else:
-                    sw_i1, lw_i2 = i1, i1
-                    sw_j1, lw_j2 = j1, j2
-                    # Track what we actually saw
-                    actual_o = tag in ('delete', 'replace')
-                    actual_n = tag in ('insert', 'replace')
-                    sw_i1, lw_i2 = i1, i2
-                    sw_j1, lw_j2 = j1, j2
-                    
-                    wk = wi + 1
-                    while wk < len(w_ops):
-                        nt, ni1, ni2, nj1, nj2 = w_ops[wk]
-                        is_bridge = False
-                        if nt == 'equal':
-                            eq_text = "".join(w_old[ni1:ni2])
-                            if len(eq_text) <= 3 and '\n' not in eq_text: is_bridge = True
-                        if nt != 'equal' or is_bridge:
-                            if nt in ('delete', 'replace'): actual_o = True
-                            if nt in ('insert', 'replace'): actual_n = True
-                            lw_i2, lw_j2 = ni2, nj2
-                            wk += 1
-                        else: break
-                    wt = 'replace' if (actual_o and actual_n) else ('delete' if actual_o else 'insert')
-                    merged_w_ops.append((wt, sw_i1, lw_i2, sw_j1, lw_j2))
-                    wi = wk
+            word_segments = word_diff_segments(t_old, t_new)
 
             # Inline rendering...
-            for wt, wi1, wi2, wj1, wj2 in merged_w_ops:
-                txt = "".join(w_old[wi1:wi2])
+            for wt, txt, _ in word_segments:
                 if wt == 'equal': para.add_run(txt)
                 elif wt == 'delete': apply_shading(para.add_run(txt), "F8D7DA")
                 elif wt == 'replace': apply_shading(para.add_run(txt), "FFF3CD")
             
             para.add_run(" \u2192 ")
             
-            for wt, wi1, wi2, wj1, wj2 in merged_w_ops:
-                txt = "".join(w_new[wj1:wj2])
+            for wt, _, txt in word_segments:
                 if wt == 'equal': para.add_run(txt)
                 elif wt == 'insert': apply_shading(para.add_run(txt), "D4EDDA")
                 elif wt == 'replace': apply_shading(para.add_run(txt), "FFF3CD")
 
         # Process in sequence
-        for tag, i1, i2, j1, j2 in refined_opcodes:
-            txt_o = "".join(lines_old[i1:i2])
-            txt_n = "".join(lines_new[j1:j2])
+        for tag, txt_o, txt_n in segments:
             if tag == 'equal':
                 p.add_run(txt_o)
             elif tag == 'delete':
@@ -1264,7 +1199,7 @@ class ImpactDocxGenerator:
                 render_word_diff_inline(p, txt_o, txt_n)
 
         # Pure additions (not part of a replace)
-        for tag, i1, i2, j1, j2 in refined_opcodes:
+        for tag, _, txt_n in segments:
             if tag == 'insert':
                 p.add_run(" [+] ")
-                apply_shading(p.add_run("".join(lines_new[j1:j2])), "D4EDDA")
+                apply_shading(p.add_run(txt_n), "D4EDDA")
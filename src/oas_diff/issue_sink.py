@@ -0,0 +1,99 @@
+"""
+Streaming sinks for Interface Compatibility issues.
+
+Issues are written to disk one at a time as CompatibilityAnalyzer.iter_issues()
+yields them, so CI pipelines can consume compatibility results (JSON Lines or
+CSV) without holding the full issue list or building a DOCX report.
+
+CLI:
+    python -m src.oas_diff.issue_sink OLD.yaml NEW.yaml -o issues.jsonl
+"""
+
+import argparse
+import csv
+import json
+import sys
+from dataclasses import fields
+from typing import Iterable, Optional
+
+from .compatibility_analyzer import CompatibilityAnalyzer, CompatibilityIssue
+from .resolver import resolve_spec
+from .spec_loader import load_spec
+
+ISSUE_FIELDS = [f.name for f in fields(CompatibilityIssue)]
+SINK_FORMATS = ("jsonl", "csv")
+
+
+def detect_format(path: str) -> str:
+    """Picks the sink format from the output file extension (JSONL by default)."""
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def write_issues(issues: Iterable[CompatibilityIssue], path: str, fmt: Optional[str] = None,
+                 include_descriptions: bool = True) -> int:
+    """
+    Streams issues to path as JSON Lines or CSV and returns the number written.
+    include_descriptions=False drops 'Description Change' issues on the way out.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in SINK_FORMATS:
+        raise ValueError(f"Unsupported issue sink format: {fmt}")
+
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.writer(f)
+            writer.writerow(ISSUE_FIELDS)
+        for issue in issues:
+            if not include_descriptions and issue.issue_type == "Description Change":
+                continue
+            if fmt == "csv":
+                writer.writerow([_csv_value(getattr(issue, name)) for name in ISSUE_FIELDS])
+            else:
+                record = {name: getattr(issue, name) for name in ISSUE_FIELDS}
+                f.write(json.dumps(record, ensure_ascii=False, default=str))
+                f.write("\n")
+            count += 1
+    return count
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.oas_diff.issue_sink",
+        description="Stream Interface Compatibility issues between two OAS files to JSONL or CSV.",
+    )
+    parser.add_argument("old_spec", help="Baseline OAS file")
+    parser.add_argument("new_spec", help="Candidate OAS file")
+    parser.add_argument("-o", "--output", required=True, help="Output file (.jsonl or .csv)")
+    parser.add_argument("--format", choices=SINK_FORMATS, default=None, help="Override format detection")
+    parser.add_argument("--show-enum-order-changes", action="store_true")
+    parser.add_argument("--hide-validation-rule-only-description-changes", action="store_true")
+    parser.add_argument("--no-descriptions", action="store_true", help="Skip description changes entirely")
+    args = parser.parse_args(argv)
+
+    analyzer = CompatibilityAnalyzer(
+        resolve_spec(load_spec(args.old_spec)),
+        resolve_spec(load_spec(args.new_spec)),
+        show_enum_order_changes=args.show_enum_order_changes,
+        show_validation_rule_only_description_changes=not args.hide_validation_rule_only_description_changes,
+    )
+    count = write_issues(
+        analyzer.iter_issues(),
+        args.output,
+        fmt=args.format,
+        include_descriptions=not args.no_descriptions,
+    )
+    print(f"{count} compatibility issue(s) written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
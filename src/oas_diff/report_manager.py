@@ -1,6 +1,8 @@
 import os
-import yaml
+import time
+from concurrent.futures import ProcessPoolExecutor
 from .comparator import compare_specs
+from .spec_loader import load_spec
 from .heuristic_engine import HeuristicEngine
 from .generators.synthetic_generator import SyntheticDocxGenerator
 from .generators.analytic_generator import AnalyticDocxGenerator
@@ -9,28 +11,42 @@ from .resolver import resolve_spec
 from .compatibility_analyzer import CompatibilityAnalyzer
 from .generators.compatibility_generator import CompatibilityDocxGenerator
 
+REPORT_FILE_LABELS = {
+    'synthesis': 'Synthesis',
+    'analytical': 'Analytical',
+    'impact': 'Impact',
+    'compatibility': 'Interface_Compatibility',
+}
+
+
 class OASDiffReportManager:
     """
     Orchestrates the comparison of two OAS files and the generation of reports.
     Handles loading files, running the diff, and dispatching to specialized generators.
     """
 
-    def __init__(self, old_path, new_path, output_dir, preferences=None):
+    def __init__(self, old_path, new_path, output_dir, preferences=None, spec_cache_dir=None,
+                 old_spec=None, new_spec=None):
         self.old_path = old_path
         self.new_path = new_path
         self.output_dir = output_dir
         self.preferences = preferences or {}
+        self.spec_cache_dir = spec_cache_dir
         
-        self.spec1 = self._load_spec(old_path)
-        self.spec2 = self._load_spec(new_path)
+        # Already-parsed specs (e.g. a shared batch baseline) skip the file load
+        self.spec1 = old_spec if old_spec is not None else self._load_spec(old_path)
+        self.spec2 = new_spec if new_spec is not None else self._load_spec(new_path)
         
         self.diff = None
         self.insights = None
+        self.report_timings = {}
+        # Resolved paths for the compatibility report; resolved on demand when None
+        self.resolved1 = None
+        self.resolved2 = None
 
     def _load_spec(self, path):
-        """Loads an OAS file (YAML or JSON)."""
-        with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        """Loads an OAS file (YAML or JSON), reusing cached parses of identical content."""
+        return load_spec(path, cache_dir=self.spec_cache_dir)
 
     def run_comparison(self):
         """Executes the core comparison logic."""
@@ -44,10 +60,17 @@ class OASDiffReportManager:
         self.diff.insights = self.insights
         return self.diff
 
-    def generate_reports(self, report_types):
+    def generate_reports(self, report_types, parallel=None, max_workers=None):
         """
         Generates requested reports.
-        report_types: list of strings ('synthesis', 'analytical', 'impact')
+        report_types: list of strings ('synthesis', 'analytical', 'impact', 'compatibility')
+        parallel: render the reports concurrently in a process pool. Defaults to
+            the 'diff_parallel_reports' preference.
+        max_workers: pool size cap (defaults to one worker per report).
+
+        Returns the generated paths in the canonical report order (synthesis,
+        analytical, impact, compatibility), whatever the order of report_types;
+        per-report render times (seconds) are stored in self.report_timings.
         """
         if not self.diff:
             self.run_comparison()
@@ -55,82 +78,117 @@ class OASDiffReportManager:
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
-        results = []
-        static_vars = self.preferences.get('diff_static_variables', {})
-
-        # Report Dispatcher
-        if 'synthesis' in report_types:
-            path = os.path.join(self.output_dir, f"OAS_Comparison_Synthesis_{self._get_timestamp()}.docx")
-            gen = SyntheticDocxGenerator(
-                self.spec1, self.spec2, self.diff, 
-                old_path=self.old_path, new_path=self.new_path,
-                variables=static_vars,
-                template_path=self.preferences.get('diff_template_synthesis')
-            )
-            gen.generate(path)
-            results.append(path)
+        if parallel is None:
+            parallel = self.preferences.get('diff_parallel_reports', False)
 
-        if 'analytical' in report_types:
-            path = os.path.join(self.output_dir, f"OAS_Comparison_Analytical_{self._get_timestamp()}.docx")
-            gen = AnalyticDocxGenerator(
-                self.spec1, self.spec2, self.diff, 
-                old_path=self.old_path, new_path=self.new_path,
-                variables=static_vars,
-                template_path=self.preferences.get('diff_template_analytical')
-            )
-            gen.generate(path)
-            results.append(path)
+        jobs = [self._build_report_job(t) for t in REPORT_FILE_LABELS if t in report_types]
+        self.report_timings = {}
 
-        if 'impact' in report_types:
-            path = os.path.join(self.output_dir, f"OAS_Comparison_Impact_{self._get_timestamp()}.docx")
-            gen = ImpactDocxGenerator(
-                self.spec1, self.spec2, self.diff, 
-                old_path=self.old_path, new_path=self.new_path,
-                variables=static_vars,
-                template_path=self.preferences.get('diff_template_impact')
-            )
-            gen.generate(path)
-            results.append(path)
+        if parallel and len(jobs) > 1:
+            outcomes = self._render_jobs_parallel(jobs, max_workers)
+        else:
+            outcomes = [_render_report(job) for job in jobs]
 
-        if 'compatibility' in report_types:
-            path = os.path.join(self.output_dir, f"OAS_Comparison_Interface_Compatibility_{self._get_timestamp()}.docx")
-            # Resolve Specs First
-            r1 = resolve_spec(self.spec1)
-            r2 = resolve_spec(self.spec2)
-            # Run Analyzer
-            analyzer = CompatibilityAnalyzer(
-                r1,
-                r2,
-                show_enum_order_changes=self.preferences.get('diff_show_enum_order_changes', False),
-                show_validation_rule_only_description_changes=self.preferences.get(
-                    'diff_show_validation_rule_only_description_changes',
-                    True,
-                ),
-            )
-            issues = analyzer.analyze()
-            # Generate Report
-            gen = CompatibilityDocxGenerator(
-                issues, self.old_path, self.new_path, 
-                template_path=self.preferences.get('diff_template_compatibility'),
-                spec1=self.spec1,
-                spec2=self.spec2,
-                report_filters={
-                    "show_enum_order_changes": self.preferences.get(
-                        'diff_show_enum_order_changes',
-                        False,
-                    ),
-                    "show_validation_rule_only_description_changes": self.preferences.get(
-                        'diff_show_validation_rule_only_description_changes',
-                        True,
-                    ),
-                },
-            )
-
-            gen.generate(path)
+        results = []
+        for report_type, path, elapsed in outcomes:
+            self.report_timings[report_type] = elapsed
             results.append(path)
-
         return results
 
+    def _build_report_job(self, report_type):
+        """Packs everything a single report needs into a picklable job dict."""
+        label = REPORT_FILE_LABELS[report_type]
+        return {
+            "report_type": report_type,
+            "path": os.path.join(self.output_dir, f"OAS_Comparison_{label}_{self._get_timestamp()}.docx"),
+            "spec1": self.spec1,
+            "spec2": self.spec2,
+            "diff": self.diff,
+            "resolved1": self.resolved1,
+            "resolved2": self.resolved2,
+            "old_path": self.old_path,
+            "new_path": self.new_path,
+            "preferences": {
+                key: value for key, value in self.preferences.items()
+                if key.startswith('diff_')
+            },
+        }
+
+    def _render_jobs_parallel(self, jobs, max_workers=None):
+        """Renders report jobs in a process pool; outcomes keep the job order."""
+        workers = min(len(jobs), max_workers or len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [pool.submit(_render_report, job) for job in jobs]
+            return [future.result() for future in futures]
+
     def _get_timestamp(self):
         import datetime
         return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def _render_report(job):
+    """
+    Builds a single DOCX report from a job prepared by OASDiffReportManager.
+    Module-level so it can run inside a ProcessPoolExecutor worker.
+    Returns (report_type, path, elapsed_seconds).
+    """
+    started = time.perf_counter()
+    report_type = job["report_type"]
+    path = job["path"]
+    spec1 = job["spec1"]
+    spec2 = job["spec2"]
+    prefs = job["preferences"]
+    static_vars = prefs.get('diff_static_variables', {})
+
+    generator_classes = {
+        'synthesis': SyntheticDocxGenerator,
+        'analytical': AnalyticDocxGenerator,
+        'impact': ImpactDocxGenerator,
+    }
+
+    if report_type in generator_classes:
+        gen = generator_classes[report_type](
+            spec1, spec2, job["diff"],
+            old_path=job["old_path"], new_path=job["new_path"],
+            variables=static_vars,
+            template_path=prefs.get(f'diff_template_{report_type}')
+        )
+    else:
+        # Resolve Specs First (unless the caller already holds them)
+        r1 = job.get("resolved1")
+        r2 = job.get("resolved2")
+        if r1 is None:
+            r1 = resolve_spec(spec1)
+        if r2 is None:
+            r2 = resolve_spec(spec2)
+        # Run Analyzer
+        analyzer = CompatibilityAnalyzer(
+            r1,
+            r2,
+            show_enum_order_changes=prefs.get('diff_show_enum_order_changes', False),
+            show_validation_rule_only_description_changes=prefs.get(
+                'diff_show_validation_rule_only_description_changes',
+                True,
+            ),
+        )
+        issues = analyzer.analyze()
+        # Generate Report
+        gen = CompatibilityDocxGenerator(
+            issues, job["old_path"], job["new_path"],
+            template_path=prefs.get('diff_template_compatibility'),
+            spec1=spec1,
+            spec2=spec2,
+            report_filters={
+                "show_enum_order_changes": prefs.get(
+                    'diff_show_enum_order_changes',
+                    False,
+                ),
+                "show_validation_rule_only_description_changes": prefs.get(
+                    'diff_show_validation_rule_only_description_changes',
+                    True,
+                ),
+            },
+        )
+
+    gen.generate(path)
+    return report_type, path, time.perf_counter() - started
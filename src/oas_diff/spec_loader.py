@@ -0,0 +1,126 @@
+"""
+Fast, cached loading of OAS documents for the comparison engine.
+
+Specs are parsed with libyaml's CSafeLoader when PyYAML was built with it,
+JSON documents skip YAML entirely, and parsed specs are cached by the
+SHA-256 of their bytes. The cache keeps a pickled copy of each spec, so
+every caller receives an independent object without paying for a re-parse.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import yaml
+
+from src.generator_pkg.yaml_output import FastSafeLoader as _SafeLoader
+
+CACHE_FILE_SUFFIX = ".spec.pickle"
+MEMORY_CACHE_SIZE = 16
+
+_memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def content_hash(data: bytes) -> str:
+    """Returns the cache key (hex SHA-256) for raw spec bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_spec_bytes(data: bytes, path: str = "") -> Any:
+    """
+    Parses raw spec bytes. JSON documents (by extension or leading '{' / '[')
+    go through the json module; everything else through the fastest YAML loader.
+    """
+    text = data.decode("utf-8-sig")
+    if path.lower().endswith(".json") or text.lstrip()[:1] in ("{", "["):
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass  # YAML flow mapping rather than strict JSON
+    return yaml.load(text, Loader=_SafeLoader)
+
+
+def load_spec(path: str, cache_dir: Optional[str] = None, use_cache: bool = True) -> Any:
+    """
+    Loads an OAS file (YAML or JSON), reusing previous parses of identical content.
+
+    cache_dir: optional folder for a persistent pickle cache shared across runs.
+    use_cache: disable to force a fresh parse (the result is still not cached).
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if not use_cache:
+        return parse_spec_bytes(data, path)
+
+    key = content_hash(data)
+    with _cache_lock:
+        blob = _memory_cache.get(key)
+        if blob is not None:
+            _memory_cache.move_to_end(key)
+
+    if blob is not None:
+        return pickle.loads(blob)
+
+    if cache_dir:
+        blob = _read_disk_cache(cache_dir, key)
+        if blob is not None:
+            try:
+                spec = pickle.loads(blob)
+            except Exception:
+                pass  # Truncated or written by an incompatible interpreter
+            else:
+                _remember(key, blob)
+                return spec
+
+    spec = parse_spec_bytes(data, path)
+    blob = pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL)
+    _remember(key, blob)
+    if cache_dir:
+        _write_disk_cache(cache_dir, key, blob)
+    return spec
+
+
+def clear_spec_cache(cache_dir: Optional[str] = None):
+    """Drops the in-memory cache and, if given, the pickles in cache_dir."""
+    with _cache_lock:
+        _memory_cache.clear()
+    if cache_dir and os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            if name.endswith(CACHE_FILE_SUFFIX):
+                try:
+                    os.remove(os.path.join(cache_dir, name))
+                except OSError:
+                    pass
+
+
+def _remember(key: str, blob: bytes):
+    with _cache_lock:
+        _memory_cache[key] = blob
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _read_disk_cache(cache_dir: str, key: str) -> Optional[bytes]:
+    try:
+        with open(os.path.join(cache_dir, key + CACHE_FILE_SUFFIX), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_disk_cache(cache_dir: str, key: str, blob: bytes):
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        target = os.path.join(cache_dir, key + CACHE_FILE_SUFFIX)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, target)
+    except OSError as e:
+        print(f"Warning: Could not write spec cache: {e}")
@@ -368,8 +368,8 @@ class OASDiffDialog(ctk.CTkToplevel):
             self._log(f"Generating {len(report_types)} reports...")
             paths = manager.generate_reports(report_types)
             
-            for p in paths:
-                self._log(f"Generated: {os.path.basename(p)}")
+            for p, elapsed in zip(paths, manager.report_timings.values()):
+                self._log(f"Generated: {os.path.basename(p)} ({elapsed:.1f}s)")
                 
                 # Map paths back to buttons based on filename & Highlight cards
                 if "Synthesis" in p: 
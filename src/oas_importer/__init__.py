@@ -9,6 +9,7 @@ Modules:
     - oas_parser: Parse OAS YAML files
     - schema_flattener: Convert nested schemas to flat table format
     - excel_writer: Base Excel writing with style application
+    - import_progress: Structured progress events and phase timings
     - index_writer: Generate $index.xlsx
     - operation_writer: Generate operation files
     - reverse_mapper: High-level orchestrator
@@ -13,10 +13,189 @@ Usage:
 
 import json
 import os
-from typing import Dict, List, Any, Optional
+from copy import copy
+from typing import Dict, Iterable, List, Any, Optional, Sequence, Tuple
 from openpyxl import Workbook
+from openpyxl.cell import Cell
 from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.worksheet import Worksheet
+
+
+# Row value that leaves the target cell untouched (no value, no style)
+KEEP_CELL = object()
+
+# Cell style attribute -> StyleArray slot it sets
+_STYLE_SLOTS = {
+    'font': 'fontId',
+    'fill': 'fillId',
+    'border': 'borderId',
+    'number_format': 'numFmtId',
+    'protection': 'protectionId',
+    'alignment': 'alignmentId',
+}
+
+
+def cell_style_slots(cell: Cell,
+                     attrs: Sequence[str] = ('font', 'fill', 'border', 'number_format'),
+                     records: Optional[Dict[Tuple[str, int], int]] = None) -> tuple:
+    """
+    The style of an existing cell (e.g. a template row) in the resolved form
+    RowWriter accepts, as if each attribute were copied onto another cell.
+    
+    Args:
+        cell: Cell to take the style from
+        attrs: Style attributes to take
+        records: Optional memo (one per workbook) so each distinct style record
+                 is copied and registered only once
+    """
+    style = cell._style if cell._style is not None else StyleArray()
+    slots = []
+    for attr in attrs:
+        slot = _STYLE_SLOTS[attr]
+        key = (slot, getattr(style, slot))
+        record_id = records.get(key) if records is not None else None
+        if record_id is None:
+            # The copy can land on an equal, earlier record of the workbook
+            probe = Cell(cell.parent)
+            setattr(probe, attr, copy(getattr(cell, attr)))
+            record_id = getattr(probe._style, slot)
+            if records is not None:
+                records[key] = record_id
+        slots.append((slot, record_id))
+    return tuple(slots)
+
+
+class RowWriter:
+    """
+    Bulk writer for rows of one worksheet.
+    
+    Rows are sequences of values for a fixed list of columns. A style is a
+    dict of cell attributes (font, fill, border, number_format, alignment);
+    each distinct style is registered with the workbook once and its shared
+    style records are stamped onto the cells, instead of assigning every
+    attribute cell by cell. The longest value per column is tracked while
+    writing, so column widths need no rescan of the sheet.
+    
+    Usage:
+        rows = RowWriter(ws, columns=[1, 2, 3], styles=[style_a, style_b, None])
+        next_row = rows.write_rows(data, start_row=3)
+        rows.fit_columns([1, 2], padding=3, cap=55)
+    """
+    
+    def __init__(self, ws: Worksheet, columns: Sequence[int],
+                 styles: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+                 measure_limit: Optional[int] = None):
+        """
+        Args:
+            ws: Worksheet to write to
+            columns: Target column index for each position of a row
+            styles: Default style per position: a style dict, an already resolved
+                    style (resolve_styles(), cell_style_slots()) or None to leave
+                    the cell style as is
+            measure_limit: Only measure the first N written rows (None = all)
+        """
+        self.ws = ws
+        self.columns = list(columns)
+        self.lengths: Dict[int, int] = {}
+        self._measure_left = measure_limit
+        self._resolved: Dict[tuple, Tuple[Tuple[str, int], ...]] = {}
+        self._stamped: Dict[tuple, StyleArray] = {}
+        self.styles = self.resolve_styles(styles or [None] * len(self.columns))
+    
+    def resolve_styles(self, styles: Sequence[Optional[Dict[str, Any]]]) -> List[tuple]:
+        """
+        Register styles with the workbook (once each) for use in write_row().
+        Resolved styles are tuples; concatenating them applies them in order.
+        """
+        return [self._resolve(style) for style in styles]
+    
+    def write_rows(self, rows: Iterable[Sequence[Any]], start_row: int) -> int:
+        """
+        Write rows from start_row down with the default styles.
+        
+        Returns:
+            The row index after the last written row
+        """
+        row_idx = start_row
+        for values in rows:
+            self.write_row(row_idx, values)
+            row_idx += 1
+        return row_idx
+    
+    def write_row(self, row_idx: int, values: Sequence[Any],
+                  styles: Optional[List[tuple]] = None) -> None:
+        """
+        Write one row. None keeps an existing cell value (as ws.cell() does),
+        KEEP_CELL skips the cell entirely.
+        
+        Args:
+            row_idx: Target row
+            values: One value per column
+            styles: Resolved styles for this row (from resolve_styles())
+        """
+        ws = self.ws
+        measure = self._measure_left is None or self._measure_left > 0
+        lengths = self.lengths
+        for col, value, slots in zip(self.columns, values, styles or self.styles):
+            if value is KEEP_CELL:
+                continue
+            cell = ws.cell(row=row_idx, column=col, value=value)
+            if slots:
+                self._stamp(cell, slots)
+            if measure and value:
+                length = len(str(value))
+                if length > lengths.get(col, 0):
+                    lengths[col] = length
+        if self._measure_left is not None:
+            self._measure_left -= 1
+    
+    def measure_existing(self, min_row: int, max_row: int) -> None:
+        """Include values already in rows min_row..max_row (e.g. template headers) in the widths."""
+        for col in self.columns:
+            for row_idx in range(min_row, max_row + 1):
+                value = self.ws.cell(row=row_idx, column=col).value
+                if value:
+                    self.lengths[col] = max(self.lengths.get(col, 0), len(str(value)))
+    
+    def fit_columns(self, columns: Iterable[int], padding: int, cap: int) -> None:
+        """Set widths of measured columns to min(longest value + padding, cap)."""
+        for col in columns:
+            length = self.lengths.get(col, 0)
+            if length > 0:
+                self.ws.column_dimensions[get_column_letter(col)].width = min(length + padding, cap)
+    
+    def _resolve(self, style: Optional[Dict[str, Any]]) -> tuple:
+        """Style dict -> ((slot, record id), ...), registering records once."""
+        if not style:
+            return ()
+        if isinstance(style, tuple):
+            return style
+        key = tuple(style.items())
+        slots = self._resolved.get(key)
+        if slots is None:
+            # Assigning through a detached cell adds the records to the
+            # workbook exactly as a per-cell assignment would
+            probe = Cell(self.ws)
+            for attr, value in style.items():
+                setattr(probe, attr, value)
+            slots = tuple((_STYLE_SLOTS[attr], getattr(probe._style, _STYLE_SLOTS[attr]))
+                          for attr in style)
+            self._resolved[key] = slots
+        return slots
+    
+    def _stamp(self, cell: Cell, slots: tuple) -> None:
+        base = cell._style if cell._style is not None else StyleArray()
+        key = (tuple(base), slots)
+        stamped = self._stamped.get(key)
+        if stamped is None:
+            stamped = copy(base)
+            for slot, record_id in slots:
+                setattr(stamped, slot, record_id)
+            self._stamped[key] = stamped
+        # Own copy per cell: later per-cell assignments mutate it in place
+        cell._style = copy(stamped)
 
 
 class ExcelWriter:
@@ -101,29 +280,24 @@ class ExcelWriter:
         header_style = self._create_cell_style(
             style_config.get('header_row_style') if style_config else None
         )
-        
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=header_row_idx, column=col_idx, value=header)
-            self._apply_style(cell, header_style)
+        columns = list(range(1, len(headers) + 1))
+        RowWriter(ws, columns, [header_style] * len(headers)).write_row(header_row_idx, headers)
         
         # Apply header row height
         if style_config and style_config.get('row_height_header'):
             ws.row_dimensions[header_row_idx].height = style_config['row_height_header']
         
-        # Write data rows
+        # Write data rows (values by header name); widths are measured on the first 20
         data_style = self._create_cell_style(
             style_config.get('data_row_style') if style_config else None
         )
+        rows = RowWriter(ws, columns, [data_style] * len(headers), measure_limit=20)
+        rows.write_rows(([row_data.get(header) for header in headers] for row_data in data_rows),
+                        start_row=header_row_idx + 1)
         
-        for row_idx, row_data in enumerate(data_rows, start=header_row_idx + 1):
-            for col_idx, header in enumerate(headers, start=1):
-                # Get value by header name
-                value = row_data.get(header)
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                self._apply_style(cell, data_style)
-            
-            # Apply data row height
-            if style_config and style_config.get('row_height_data'):
+        # Apply data row height
+        if style_config and style_config.get('row_height_data'):
+            for row_idx in range(header_row_idx + 1, header_row_idx + 1 + len(data_rows)):
                 ws.row_dimensions[row_idx].height = style_config['row_height_data']
         
         # Apply column widths
@@ -132,7 +306,7 @@ class ExcelWriter:
                 ws.column_dimensions[col_letter].width = width
         else:
             # Auto-adjust column widths
-            self._auto_adjust_columns(ws, headers)
+            self._auto_adjust_columns(ws, headers, rows.lengths)
         
         # Apply freeze panes
         if style_config and style_config.get('freeze_panes'):
@@ -162,17 +336,10 @@ class ExcelWriter:
         )
         
         # Write title row
-        cell = ws.cell(row=1, column=1, value=sheet_name)
-        self._apply_style(cell, header_style)
+        RowWriter(ws, [1], [header_style]).write_row(1, [sheet_name])
         
         # Write key-value pairs
-        row_idx = 2
-        for key, value in data.items():
-            key_cell = ws.cell(row=row_idx, column=1, value=key)
-            val_cell = ws.cell(row=row_idx, column=2, value=value)
-            self._apply_style(key_cell, data_style)
-            self._apply_style(val_cell, data_style)
-            row_idx += 1
+        RowWriter(ws, [1, 2], [data_style, data_style]).write_rows(data.items(), start_row=2)
         
         # Apply column widths
         if style_config and 'column_widths' in style_config:
@@ -209,11 +376,7 @@ class ExcelWriter:
         )
         
         # Row 1: Response | Code | Description
-        ws.cell(row=1, column=1, value='Response')
-        ws.cell(row=1, column=2, value=sheet_name)
-        ws.cell(row=1, column=3, value=description)
-        for col in range(1, 4):
-            self._apply_style(ws.cell(row=1, column=col), header_style)
+        RowWriter(ws, [1, 2, 3], [header_style] * 3).write_row(1, ['Response', sheet_name, description])
         
         # Row 2: Column headers
         headers = style_config.get('header_labels', [
@@ -230,16 +393,14 @@ class ExcelWriter:
         else:
             data_headers = headers
         
-        for col_idx, header in enumerate(data_headers, start=1):
-            cell = ws.cell(row=2, column=col_idx, value=header)
-            self._apply_style(cell, header_style)
+        columns = list(range(1, len(data_headers) + 1))
+        RowWriter(ws, columns, [header_style] * len(data_headers)).write_row(2, data_headers)
         
         # Data rows
-        for row_idx, row_data in enumerate(rows, start=3):
-            for col_idx, header in enumerate(data_headers, start=1):
-                value = row_data.get(header)
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                self._apply_style(cell, data_style)
+        RowWriter(ws, columns, [data_style] * len(data_headers)).write_rows(
+            ([row_data.get(header) for header in data_headers] for row_data in rows),
+            start_row=3,
+        )
         
         # Apply column widths
         if style_config and 'column_widths' in style_config:
@@ -318,29 +479,14 @@ class ExcelWriter:
         
         return result
     
-    def _apply_style(self, cell, style: Dict[str, Any]) -> None:
-        """Apply a style dict to a cell."""
-        if 'font' in style:
-            cell.font = style['font']
-        if 'fill' in style:
-            cell.fill = style['fill']
-        if 'border' in style:
-            cell.border = style['border']
-        if 'alignment' in style:
-            cell.alignment = style['alignment']
-    
-    def _auto_adjust_columns(self, ws, headers: List[str]) -> None:
-        """Auto-adjust column widths based on content."""
+    def _auto_adjust_columns(self, ws, headers: List[str], lengths: Dict[int, int]) -> None:
+        """Set column widths from the header and the longest value measured while writing."""
         for col_idx, header in enumerate(headers, start=1):
             col_letter = get_column_letter(col_idx)
             # Start with header width
             max_width = len(str(header)) + 2
-            
-            # Check data in first 20 rows
-            for row in range(2, min(22, ws.max_row + 1)):
-                cell_value = ws.cell(row=row, column=col_idx).value
-                if cell_value:
-                    max_width = max(max_width, min(len(str(cell_value)) + 2, 50))
+            if lengths.get(col_idx):
+                max_width = max(max_width, min(lengths[col_idx] + 2, 50))
             
             ws.column_dimensions[col_letter].width = max_width
     
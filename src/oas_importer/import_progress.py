@@ -0,0 +1,143 @@
+"""
+Import Progress
+
+Structured progress events for OAS -> Excel imports. OASToExcelConverter
+reports its phases (parse, index write, endpoint writes), every endpoint file
+written and the rows its SchemaFlattener produced to an ImportProgress, which
+hands ImportProgressEvent objects to its listeners.
+
+Usage:
+    progress = ImportProgress(json_lines_listener(sys.stderr))
+    converter = OASToExcelConverter('path/to/oas.yaml', progress=progress)
+    converter.stream_import('output_folder')
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+# Phases in import order; 'flatten' is the time spent inside SchemaFlattener,
+# which runs during the index and endpoint writes (it overlaps both).
+PHASES = ('parse', 'flatten', 'index_write', 'endpoint_writes')
+
+
+@dataclass
+class ImportProgressEvent:
+    """One progress report; all counters are totals since the import started."""
+    event: str  # 'phase_start', 'phase_end', 'file' or 'done'
+    phase: Optional[str]
+    operations_done: int
+    operations_total: int
+    rows_flattened: int
+    bytes_written: int
+    elapsed: float  # Seconds since the import started
+    eta: Optional[float]  # Seconds left for the endpoint writes, once known
+    phase_seconds: Dict[str, float] = field(default_factory=dict)
+    path: Optional[str] = None  # File written ('file' events)
+
+    def to_json(self) -> str:
+        """The event as a single JSON line (no trailing newline)."""
+        data = asdict(self)
+        data['elapsed'] = round(self.elapsed, 3)
+        if self.eta is not None:
+            data['eta'] = round(self.eta, 1)
+        data['phase_seconds'] = {name: round(seconds, 3) for name, seconds in self.phase_seconds.items()}
+        return json.dumps(data)
+
+
+ProgressListener = Callable[[ImportProgressEvent], None]
+
+
+def json_lines_listener(stream: TextIO) -> ProgressListener:
+    """Listener writing each event to stream as one JSON line (for CLI callers)."""
+    def write(event: ImportProgressEvent) -> None:
+        stream.write(event.to_json() + '\n')
+        stream.flush()
+    return write
+
+
+class ImportProgress:
+    """
+    Collects import counters and phase timings and emits them as events.
+
+    Listeners are called on the thread doing the import; GUI listeners must
+    hand the event over to their UI thread themselves.
+    """
+
+    def __init__(self, *listeners: ProgressListener, clock: Callable[[], float] = time.perf_counter):
+        self.listeners: List[ProgressListener] = list(listeners)
+        self._clock = clock
+        self._started = clock()
+        self.operations_done = 0
+        self.operations_total = 0
+        self.rows_flattened = 0
+        self.bytes_written = 0
+        self.phase_seconds: Dict[str, float] = {}
+        self.current_phase: Optional[str] = None
+        self._phase_started = 0.0
+
+    def add_listener(self, listener: ProgressListener) -> None:
+        self.listeners.append(listener)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase name (repeated phases add up)."""
+        outer, outer_started = self.current_phase, self._phase_started
+        self.current_phase, self._phase_started = name, self._clock()
+        self._emit('phase_start')
+        try:
+            yield
+        finally:
+            self._add_seconds(name, self._clock() - self._phase_started)
+            self._emit('phase_end')
+            self.current_phase, self._phase_started = outer, outer_started
+
+    def add_flattened(self, rows: int, seconds: float) -> None:
+        """Count rows produced by a SchemaFlattener (no event of its own)."""
+        self.rows_flattened += rows
+        self._add_seconds('flatten', seconds)
+
+    def file_written(self, path: str, operations: int = 1) -> None:
+        """Count a saved file and the operations it holds, then emit a 'file' event."""
+        self.operations_done += operations
+        try:
+            self.bytes_written += os.path.getsize(path)
+        except OSError:
+            pass
+        self._emit('file', path=path)
+
+    def finish(self) -> None:
+        """Emit the final 'done' event."""
+        self._emit('done')
+
+    def eta(self) -> Optional[float]:
+        """Seconds left for the endpoint writes at the rate seen so far (None before the first file)."""
+        if self.current_phase != 'endpoint_writes' or not self.operations_done:
+            return None
+        elapsed = self._clock() - self._phase_started
+        remaining = max(self.operations_total - self.operations_done, 0)
+        return elapsed / self.operations_done * remaining
+
+    def _add_seconds(self, name: str, seconds: float) -> None:
+        self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+
+    def _emit(self, kind: str, path: Optional[str] = None) -> None:
+        if not self.listeners:
+            return
+        event = ImportProgressEvent(
+            event=kind,
+            phase=self.current_phase,
+            operations_done=self.operations_done,
+            operations_total=self.operations_total,
+            rows_flattened=self.rows_flattened,
+            bytes_written=self.bytes_written,
+            elapsed=self._clock() - self._started,
+            eta=self.eta(),
+            phase_seconds=dict(self.phase_seconds),
+            path=path,
+        )
+        for listener in self.listeners:
+            listener(event)
@@ -1,17 +1,89 @@
+import io
 import os
+
+import yaml
+from yaml.nodes import MappingNode, SequenceNode
+
+from src.generator_pkg.yaml_output import FastSafeDumper as _SafeDumper, FastSafeLoader as _SafeLoader
+
 from .oas_parser import OASParser
 
+COMPONENT_TYPES = ['schemas', 'parameters', 'responses', 'headers',
+                   'requestBodies', 'securitySchemes', 'links', 'callbacks', 'examples']
+
+
+class _LayoutDumper(_SafeDumper):
+    """Canonical block layout used to size subtrees (every object spelled out)."""
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def _last_line(node) -> int:
+    """Last line holding content of a composed node (0-based)."""
+    start = node.start_mark.line
+    # Block collections end where their last child ends
+    while isinstance(node, (MappingNode, SequenceNode)) and node.value and not node.flow_style:
+        node = node.value[-1][1] if isinstance(node, MappingNode) else node.value[-1]
+    end = node.end_mark
+    # Block scalars consume their final line break
+    return max(start, end.line if end.column > 0 else end.line - 1)
+
+
+def _node_lines(node) -> int:
+    return _last_line(node) - node.start_mark.line + 1
+
+
+def _subtree_line_counts(document) -> dict:
+    """
+    Line count of every path item and component of a document, keyed by
+    ('paths', name) or ('components', type, name).
+    
+    The document is laid out once in canonical block style without line
+    folding, so the counts depend on content only (not on the source file's
+    formatting), and composed once with libyaml; each count is the line span
+    of the subtree's node marks.
+    """
+    text = yaml.dump(document, Dumper=_LayoutDumper, default_flow_style=False,
+                     sort_keys=False, allow_unicode=True, width=2 ** 30)
+    root = yaml.compose(text, Loader=_SafeLoader)
+    counts = {}
+    if not isinstance(root, MappingNode):
+        return counts
+    for key_node, value_node in root.value:
+        if key_node.value == 'paths' and isinstance(value_node, MappingNode):
+            for name_node, item_node in value_node.value:
+                counts[('paths', name_node.value)] = _node_lines(item_node)
+        elif key_node.value == 'components' and isinstance(value_node, MappingNode):
+            for type_node, section_node in value_node.value:
+                if not isinstance(section_node, MappingNode):
+                    continue
+                for name_node, item_node in section_node.value:
+                    counts[('components', type_node.value, name_node.value)] = _node_lines(item_node)
+    return counts
+
+
 class OASComparator:
     """
     Compares two OAS files (Gold/Original vs Generated) 
     to validate roundtrip fidelity.
+    
+    Already-loaded documents can be passed instead of re-parsing the files
+    (gold_oas/gen_oas); line metrics then use gold_text/gen_text when given.
     """
     
-    def __init__(self, gold_path: str, gen_path: str):
+    def __init__(self, gold_path: str = None, gen_path: str = None,
+                 gold_oas: dict = None, gen_oas: dict = None,
+                 gold_text: str = None, gen_text: str = None):
         self.gold_path = gold_path
         self.gen_path = gen_path
-        self.gold_oas = OASParser(gold_path).oas
-        self.gen_oas = OASParser(gen_path).oas
+        self.gold_oas = gold_oas if gold_oas is not None else OASParser(gold_path).oas
+        self.gen_oas = gen_oas if gen_oas is not None else OASParser(gen_path).oas
+        self._gold_text = gold_text
+        self._gen_text = gen_text
+        # Per-side caches: document lines and subtree line counts
+        self._lines_cache = {}
+        self._line_counts_cache = {}
         
     def get_structure_comparison(self) -> dict:
         """
@@ -69,10 +141,7 @@ class OASComparator:
         
         comp_details = {}
         # Expand list to include ALL component types
-        comp_types = ['schemas', 'parameters', 'responses', 'headers', 
-                      'requestBodies', 'securitySchemes', 'links', 'callbacks', 'examples']
-                      
-        for key in comp_types:
+        for key in COMPONENT_TYPES:
             g_section = g_comps.get(key, {}) or {}
             t_section = t_comps.get(key, {}) or {}
             
@@ -103,7 +172,6 @@ class OASComparator:
         t_paths = self.gen_oas.get('paths', {})
         
         path_details = []
-        import yaml
         
         # Union of all paths
         all_paths = set(list(g_paths.keys()) + list(t_paths.keys()))
@@ -115,7 +183,6 @@ class OASComparator:
             # If path is missing
             if g_path_obj is None:
                 # Added
-                t_lines = len(str(t_path_obj).splitlines()) # Approximate or use yaml dump
                 path_details.append((path_name, 0, 1, 1)) # 0 vs 1 (Present)
                 continue
             if t_path_obj is None:
@@ -124,12 +191,9 @@ class OASComparator:
                 continue
                 
             # Both exist - compare content size (lines) to find changes
-            def count_yaml_lines(obj):
-                if not obj: return 0
-                return len(yaml.dump(obj, default_flow_style=False, sort_keys=False).strip().split('\n'))
-            
-            g_lines = count_yaml_lines(g_path_obj)
-            t_lines = count_yaml_lines(t_path_obj)
+            key = ('paths', path_name)
+            g_lines = self._subtree_lines('gold', key, g_path_obj) if g_path_obj else 0
+            t_lines = self._subtree_lines('gen', key, t_path_obj) if t_path_obj else 0
             delta = t_lines - g_lines
             
             if delta != 0:
@@ -141,18 +205,47 @@ class OASComparator:
         
         return breakdown
 
+    def _document_lines(self, side: str) -> list:
+        """Lines of the 'gold' or 'gen' document (in-memory text or file), read once."""
+        if side not in self._lines_cache:
+            if side == 'gold':
+                path, text = self.gold_path, self._gold_text
+            else:
+                path, text = self.gen_path, self._gen_text
+            if text is not None:
+                lines = io.StringIO(text).readlines()
+            elif path and os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+            else:
+                lines = []
+            self._lines_cache[side] = lines
+        return self._lines_cache[side]
+
+    def _subtree_lines(self, side: str, key: tuple, obj) -> int:
+        """
+        Line count of a path item / component (see _subtree_line_counts),
+        computed for the whole side on first use.
+        """
+        if side not in self._line_counts_cache:
+            document = self.gold_oas if side == 'gold' else self.gen_oas
+            try:
+                self._line_counts_cache[side] = _subtree_line_counts(document)
+            except yaml.YAMLError:
+                self._line_counts_cache[side] = {}
+        count = self._line_counts_cache[side].get(key)
+        if count is None:
+            # Names that do not survive as YAML key text (e.g. booleans)
+            count = len(yaml.dump(obj, Dumper=_LayoutDumper, default_flow_style=False, sort_keys=False,
+                                  allow_unicode=True, width=2 ** 30).strip().split('\n'))
+        return count
+
     def get_line_comparison(self) -> dict:
         """
         Returns line count comparison.
         """
-        def count_lines(path):
-            if not os.path.exists(path):
-                return 0
-            with open(path, 'r', encoding='utf-8') as f:
-                return len(f.readlines())
-                
-        g_lines = count_lines(self.gold_path)
-        t_lines = count_lines(self.gen_path)
+        g_lines = len(self._document_lines('gold'))
+        t_lines = len(self._document_lines('gen'))
         
         return {'Total Lines': (g_lines, t_lines)}
 
@@ -163,10 +256,8 @@ class OASComparator:
         """
         import difflib
         
-        with open(self.gold_path, 'r', encoding='utf-8') as f:
-            g_lines = f.readlines()
-        with open(self.gen_path, 'r', encoding='utf-8') as f:
-            t_lines = f.readlines()
+        g_lines = self._document_lines('gold')
+        t_lines = self._document_lines('gen')
             
         diff = list(difflib.unified_diff(g_lines, t_lines, n=0))
         
@@ -187,10 +278,8 @@ class OASComparator:
         """
         import difflib
         
-        with open(self.gold_path, 'r', encoding='utf-8') as f:
-            g_lines = f.readlines()
-        with open(self.gen_path, 'r', encoding='utf-8') as f:
-            t_lines = f.readlines()
+        g_lines = self._document_lines('gold')
+        t_lines = self._document_lines('gen')
             
         diff = difflib.unified_diff(
             g_lines, t_lines, 
@@ -206,16 +295,12 @@ class OASComparator:
         Format: {'schemas': [(name, src_lines, gen_lines, delta), ...], ...}
         Only includes items with non-zero delta.
         """
-        import yaml
         discrepancies = {}
         
         g_comps = self.gold_oas.get('components', {})
         t_comps = self.gen_oas.get('components', {})
         
-        comp_types = ['schemas', 'parameters', 'responses', 'headers', 
-                      'requestBodies', 'securitySchemes', 'links', 'callbacks', 'examples']
-                      
-        for c_type in comp_types:
+        for c_type in COMPONENT_TYPES:
             g_section = g_comps.get(c_type, {}) or {}
             t_section = t_comps.get(c_type, {}) or {}
             
@@ -225,25 +310,22 @@ class OASComparator:
             for name in all_keys:
                 g_obj = g_section.get(name)
                 t_obj = t_section.get(name)
+                key = ('components', c_type, name)
                 
                 if g_obj is None:
                     # Added
-                    t_lines = len(yaml.dump(t_obj, default_flow_style=False, sort_keys=False).strip().split('\n'))
+                    t_lines = self._subtree_lines('gen', key, t_obj)
                     type_diffs.append((name, 0, t_lines, t_lines))
                     continue
                 if t_obj is None:
                     # Removed
-                    g_lines = len(yaml.dump(g_obj, default_flow_style=False, sort_keys=False).strip().split('\n'))
+                    g_lines = self._subtree_lines('gold', key, g_obj)
                     type_diffs.append((name, g_lines, 0, -g_lines))
                     continue
                     
                 # Content Check via line count proxy
-                def count_lines(obj):
-                     if not obj: return 0
-                     return len(yaml.dump(obj, default_flow_style=False, sort_keys=False).strip().split('\n'))
-                
-                g_lines = count_lines(g_obj)
-                t_lines = count_lines(t_obj)
+                g_lines = self._subtree_lines('gold', key, g_obj) if g_obj else 0
+                t_lines = self._subtree_lines('gen', key, t_obj) if t_obj else 0
                 delta = t_lines - g_lines
                 
                 if delta != 0:
@@ -365,11 +447,25 @@ class OASComparator:
                     
         return categorized
 
+    def _same_subtree(self, gold, gen) -> bool:
+        """
+        True when two containers are identical, so nothing can be reported below them.
+        
+        Uses the interpreter's deep equality, which runs in C and stops at the
+        first difference. Parsed documents hold str/bool/None scalars
+        (SafeLoaderRawNumbers, as_loaded), for which == is type-exact.
+        """
+        return gold == gen
+
     def _compare_structures(self, gold, gen, path, results):
         """
         Recursive helper to compare dictionaries and lists.
+        Identical subtrees are skipped instead of being walked.
         """
-        if isinstance(gold, dict) and isinstance(gen, dict):
+        both_dicts = isinstance(gold, dict) and isinstance(gen, dict)
+        if (both_dicts or (isinstance(gold, list) and isinstance(gen, list))) and self._same_subtree(gold, gen):
+            return
+        if both_dicts:
             # Compare Keys
             gold_keys = set(gold.keys())
             gen_keys = set(gen.keys())
@@ -8,17 +8,30 @@ Usage:
     converter = OASToExcelConverter('path/to/oas.yaml')
     converter.generate_endpoint_files('output_folder')
     converter.generate_index_file('output_folder/$index.xlsx')
+
+    # Very large files, one path item in memory at a time
+    converter = OASToExcelConverter('path/to/huge.yaml', streaming=True)
+    converter.stream_import('output_folder')
+
+    # Progress events (see import_progress), e.g. as JSON lines
+    progress = ImportProgress(json_lines_listener(sys.stderr))
+    converter = OASToExcelConverter('path/to/oas.yaml', progress=progress)
 """
 
 import os
+import sys
+import argparse
 import datetime
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import pandas as pd
 from openpyxl import Workbook
 from src.generator_pkg.yaml_output import RawNumericValue, OASDumper, SafeLoaderRawNumbers
 from .oas_parser import OASParser, OperationInfo
 from .schema_flattener import SchemaFlattener, FlatRow
 from .template_writer import TemplateExcelWriter
+from .excel_writer import RowWriter
+from .import_progress import ImportProgress, json_lines_listener
 from src.swift_services import ensure_swift_server_rows_in_workbook
 
 
@@ -30,10 +43,22 @@ def _to_string(value: Any) -> str:
     return str(value)
 
 
-def _set_cell_as_text(ws, row: int, col: int, value: str) -> None:
-    """Write value to cell and force TEXT format to prevent Excel number conversion."""
-    cell = ws.cell(row=row, column=col, value=value)
-    cell.number_format = '@'  # Text format
+def _index_row_writer(ws, columns: int, text_columns: Tuple[int, ...] = (),
+                      header_rows: int = 1) -> RowWriter:
+    """
+    Row writer for an index sheet: every cell gets the global alignment, text_columns
+    are forced to TEXT format (prevents Excel number conversion). The template header
+    rows are measured so fit_columns() sizes the columns over the whole sheet.
+    """
+    from .template_writer import DEFAULT_ALIGNMENT
+    styles = [
+        {'number_format': '@', 'alignment': DEFAULT_ALIGNMENT} if col in text_columns
+        else {'alignment': DEFAULT_ALIGNMENT}
+        for col in range(1, columns + 1)
+    ]
+    rows = RowWriter(ws, range(1, columns + 1), styles)
+    rows.measure_existing(1, header_rows)
+    return rows
 
 
 class OASToExcelConverter:
@@ -44,36 +69,41 @@ class OASToExcelConverter:
     and TemplateExcelWriter for output generation.
     """
     
-    def __init__(self, oas_filepath: str, log_callback=None):
+    def __init__(self, oas_filepath: str, log_callback=None,
+                 parser: Optional[OASParser] = None,
+                 streaming: bool = False,
+                 progress: Optional[ImportProgress] = None):
         """
         Initialize converter with an OAS file.
         
         Args:
             oas_filepath: Path to the OAS YAML file
             log_callback: Optional function to log messages
+            parser: Optional already-loaded OASParser for oas_filepath
+                    (skips re-reading the file, e.g. in export workers)
+            streaming: Load the OAS without its paths (see stream_import())
+            progress: Optional ImportProgress receiving phase timings, files
+                      written and rows flattened (also times the parse)
         """
         self.oas_filepath = oas_filepath
         self.log_callback = log_callback
-        self.parser = OASParser(oas_filepath)
+        self.progress = progress or ImportProgress()
+        if parser is None:
+            with self.progress.phase('parse'):
+                parser = OASParser(oas_filepath, streaming=streaming)
+        self.parser = parser
+        self.progress.operations_total = parser.operation_count
         self.flattener = SchemaFlattener(self.parser.oas)
+        self.flattener.on_flattened = self.progress.add_flattened
 
     def log(self, message: str):
         if self.log_callback:
             self.log_callback(message)
             
-    def _autofit_columns(self, ws, max_cols: int = 2) -> None:
-        """Autofit first max_cols column widths based on cell content lengths to fit data."""
-        from openpyxl.utils import get_column_letter
-        for col in range(1, max_cols + 1):
-            max_length = 0
-            col_letter = get_column_letter(col)
-            for row in ws.iter_rows(min_col=col, max_col=col):
-                for cell in row:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-            if max_length > 0:
-                adjusted_width = min(max_length + 3, 55) # Cap at 55
-                ws.column_dimensions[col_letter].width = adjusted_width
+    @staticmethod
+    def _autofit_columns(rows: RowWriter, max_cols: int = 2) -> None:
+        """Autofit first max_cols column widths from the value lengths measured while writing."""
+        rows.fit_columns(range(1, max_cols + 1), padding=3, cap=55)  # Cap at 55
 
         
     def generate_endpoint_file(self, operation: OperationInfo, 
@@ -88,6 +118,19 @@ class OASToExcelConverter:
         Returns:
             Path to the generated file
         """
+        self._build_endpoint_writer(operation).save(output_path)
+        return output_path
+    
+    def build_endpoint_workbook(self, operation: OperationInfo) -> Workbook:
+        """
+        Build the endpoint workbook for a single operation in memory.
+        
+        Same content as generate_endpoint_file(), without writing it to disk.
+        """
+        return self._build_endpoint_writer(operation).detach_workbook()
+    
+    def _build_endpoint_writer(self, operation: OperationInfo) -> TemplateExcelWriter:
+        """Fill an endpoint template for the operation (not yet finalized)."""
         writer = TemplateExcelWriter('endpoint')
         writer.load_template()
         
@@ -114,39 +157,90 @@ class OASToExcelConverter:
             writer.add_response_sheet(status_code, response.description or '', 
                                       response_rows)
         
-        # Save
-        writer.save(output_path)
-        return output_path
+        return writer
     
-    def generate_all_endpoint_files(self, output_dir: str) -> List[str]:
+    def generate_all_endpoint_files(
+        self,
+        output_dir: str,
+        max_workers: Optional[int] = 1,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> List[str]:
         """
         Generate endpoint files for all operations in the OAS.
         
+        With max_workers > 1 (or None/0 for one per CPU) the workbooks are
+        built in a process pool; each worker receives the parsed OAS once and
+        produces the same files as the serial export.
+        
         Args:
             output_dir: Directory to save files
+            max_workers: Number of export processes (1 = in-process, serial)
+            progress_callback: Optional function(done, total, filepath) called
+                               after each file is written
             
         Returns:
-            List of generated file paths
+            List of generated file paths, in operation order
         """
         os.makedirs(output_dir, exist_ok=True)
         self.log(f"Generating endpoint files in: {output_dir}")
         
-        generated_files = []
         operations = self.parser.get_operations()
         total_ops = len(operations)
-        
-        for i, operation in enumerate(operations):
-            # Generate filename from operation ID or path
-            filename = self._operation_to_filename(operation)
-            filepath = os.path.join(output_dir, filename)
-            
-            # self.log(f"Processing ({i+1}/{total_ops}): {filename}")
-            self.generate_endpoint_file(operation, filepath)
-            generated_files.append(filepath)
+        generated_files = [
+            os.path.join(output_dir, self._operation_to_filename(operation))
+            for operation in operations
+        ]
+        
+        workers = max_workers or os.cpu_count() or 1
+        workers = max(1, min(workers, total_ops))
+        
+        self.progress.operations_total = total_ops
+        with self.progress.phase('endpoint_writes'):
+            if workers == 1:
+                for i, (operation, filepath) in enumerate(zip(operations, generated_files)):
+                    self.generate_endpoint_file(operation, filepath)
+                    self.progress.file_written(filepath)
+                    if progress_callback:
+                        progress_callback(i + 1, total_ops, filepath)
+            else:
+                self._generate_endpoint_files_parallel(generated_files, workers, progress_callback)
             
         self.log(f"Generated {len(generated_files)} endpoint files.")
         return generated_files
     
+    def _generate_endpoint_files_parallel(
+        self,
+        filepaths: List[str],
+        workers: int,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+    ) -> None:
+        """Export operations (by index) in a process pool."""
+        # Operations sharing a filename are written in order by the same task,
+        # so the file left on disk is the same one the serial export leaves.
+        jobs: Dict[str, List[int]] = {}
+        for index, filepath in enumerate(filepaths):
+            jobs.setdefault(filepath, []).append(index)
+        
+        total_ops = len(filepaths)
+        done = 0
+        self.log(f"Exporting {total_ops} operations with {workers} worker processes...")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_export_worker,
+            initargs=(self.oas_filepath, self.parser),
+        ) as pool:
+            futures = [
+                pool.submit(_export_endpoint_files, indices, filepath)
+                for filepath, indices in jobs.items()
+            ]
+            for future in as_completed(futures):
+                count, filepath, rows, seconds = future.result()
+                done += count
+                self.progress.add_flattened(rows, seconds)
+                self.progress.file_written(filepath, operations=count)
+                if progress_callback:
+                    progress_callback(done, total_ops, filepath)
+    
     def generate_index_file(
         self,
         output_path: str,
@@ -170,6 +264,115 @@ class OASToExcelConverter:
         Returns:
             Path to generated file
         """
+        with self.progress.phase('index_write'):
+            self._build_index_writer(info_overrides).save(output_path)
+            self.progress.file_written(output_path, operations=0)
+        self.log(f"Generated Master Index: {output_path}")
+        return output_path
+    
+    def stream_import(
+        self,
+        output_dir: str,
+        index_path: Optional[str] = None,
+        info_overrides: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> Tuple[str, List[str]]:
+        """
+        Write the index and all endpoint files, one path item at a time.
+        
+        Produces the same files as generate_index_file() followed by a serial
+        generate_all_endpoint_files(), but with a streaming parser only one path
+        item, its operations' rows and one endpoint workbook are in memory at
+        a time: each endpoint file is written and released before the next path
+        item is read, and the index Paths rows are added as operations go by.
+        
+        Args:
+            output_dir: Directory for the endpoint files
+            index_path: Index file path (default: output_dir/$index.xlsx)
+            info_overrides: As for generate_index_file()
+            progress_callback: Optional function(done, total, filepath) called
+                               after each endpoint file is written
+            
+        Returns:
+            Tuple of (index path, endpoint file paths in operation order)
+        
+        The progress events end with 'done' (a complete import).
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        index_path = index_path or os.path.join(output_dir, '$index.xlsx')
+        total_ops = self.parser.operation_count
+        self.log(f"Streaming {total_ops} operations from {self.parser.path_count} paths into: {output_dir}")
+        
+        with self.progress.phase('index_write'):
+            index_writer = self._build_index_writer(info_overrides, with_paths=False)
+            paths_rows = self._paths_sheet_writer(index_writer)
+        
+        generated_files = []
+        mark = self.flattener.cache_mark()
+        row_idx = 3  # Data starts row 3
+        current_path = None
+        with self.progress.phase('endpoint_writes'):
+            for operation in self.parser.iter_operations():
+                if operation.path != current_path:
+                    # Rows memoised for the previous path item would keep it alive
+                    self.flattener.release_cache(mark)
+                    current_path = operation.path
+                filepath = os.path.join(output_dir, self._operation_to_filename(operation))
+                self.generate_endpoint_file(operation, filepath)
+                self._write_paths_row(paths_rows, row_idx, operation)
+                row_idx += 1
+                generated_files.append(filepath)
+                self.progress.file_written(filepath)
+                if progress_callback:
+                    progress_callback(len(generated_files), total_ops, filepath)
+        self.flattener.release_cache(mark)
+        
+        with self.progress.phase('index_write'):
+            self._autofit_columns(paths_rows, max_cols=2)
+            index_writer.save(index_path)
+            self.progress.file_written(index_path, operations=0)
+        self.progress.finish()
+        self.log(f"Generated Master Index: {index_path}")
+        self.log(f"Generated {len(generated_files)} endpoint files.")
+        return index_path, generated_files
+    
+    def build_index_workbook(
+        self,
+        info_overrides: Optional[Dict[str, Any]] = None,
+    ) -> Workbook:
+        """
+        Build the $index workbook in memory.
+        
+        Same content as generate_index_file(), without writing it to disk.
+        """
+        return self._build_index_writer(info_overrides).detach_workbook()
+    
+    def build_template_workbooks(
+        self,
+        info_overrides: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Workbook, Dict[str, Workbook]]:
+        """
+        Build the complete template set in memory.
+        
+        Returns:
+            Tuple of ($index workbook, {endpoint file name: workbook}); the
+            file names are the ones referenced by the Paths sheet.
+        """
+        index_workbook = self.build_index_workbook(info_overrides)
+        endpoint_workbooks: Dict[str, Workbook] = {}
+        for operation in self.parser.get_operations():
+            # Operations sharing a file name keep the last one, as on disk
+            filename = self._operation_to_filename(operation)
+            endpoint_workbooks[filename] = self.build_endpoint_workbook(operation)
+        self.log(f"Built {len(endpoint_workbooks)} endpoint workbooks in memory.")
+        return index_workbook, endpoint_workbooks
+    
+    def _build_index_writer(
+        self,
+        info_overrides: Optional[Dict[str, Any]] = None,
+        with_paths: bool = True,
+    ) -> TemplateExcelWriter:
+        """Fill the index template (not yet finalized); stream_import() fills Paths itself."""
         writer = TemplateExcelWriter('index')
         writer.load_template()
         
@@ -177,7 +380,8 @@ class OASToExcelConverter:
         self._fill_general_description(writer, info_overrides=info_overrides)
         
         # 2. Paths sheet
-        self._fill_paths_sheet(writer)
+        if with_paths:
+            self._fill_paths_sheet(writer)
         
         # 3. Tags sheet
         self._fill_tags_sheet(writer)
@@ -194,9 +398,7 @@ class OASToExcelConverter:
         # 7. Responses sheet (component responses)
         self._fill_component_responses(writer)
         
-        writer.save(output_path)
-        self.log(f"Generated Master Index: {output_path}")
-        return output_path
+        return writer
     
     def _fill_general_description(
         self,
@@ -272,56 +474,58 @@ class OASToExcelConverter:
         
         Columns: Excel file, Path, Name, Method, Description, Tag, Summary, OperationId, Custom Extensions
         """
-        ws = writer.workbook['Paths']
-        
-        from .template_writer import DEFAULT_ALIGNMENT
+        rows = self._paths_sheet_writer(writer)
         
         operations = self.parser.get_operations()
         for row_idx, op in enumerate(operations, start=3):  # Data starts row 3
-            filename = self._operation_to_filename(op)
-            ws.cell(row=row_idx, column=1, value=filename)  # Excel file
-            ws.cell(row=row_idx, column=2, value=op.path)
-            ws.cell(row=row_idx, column=3, value=op.summary or op.operation_id or '')  # Name (prefer summary)
-            ws.cell(row=row_idx, column=4, value=op.method.lower())
-            ws.cell(row=row_idx, column=5, value=op.description or '')
-            ws.cell(row=row_idx, column=6, value=', '.join(op.tags) if op.tags else '')
-            ws.cell(row=row_idx, column=7, value=op.summary or '')
-            ws.cell(row=row_idx, column=8, value=op.operation_id or '')
-            
-            # Column 9: Custom Extensions as raw YAML text (preserves original formatting)
-            if op.extensions:
-                ext_text = self.parser.get_raw_extensions(op.path, op.method)
-                # Add 6-space indent to ALL lines to match Excel template style
-                # (original templates have top-level x-sandbox keys at 6-space indent)
-                if ext_text:
-                    lines = ext_text.split('\n')
-                    indented_lines = [('      ' + line) if line.strip() else line for line in lines]
-                    ext_text = '\n'.join(indented_lines)
-                ws.cell(row=row_idx, column=9, value=ext_text)
-            
-            from openpyxl.styles import Alignment
-            no_wrap_top = Alignment(horizontal='left', vertical='top', wrap_text=False)
-            for col in range(1, 10):
-                ws.cell(row=row_idx, column=col).alignment = DEFAULT_ALIGNMENT
+            self._write_paths_row(rows, row_idx, op)
                 
-        self._autofit_columns(ws, max_cols=2)
+        self._autofit_columns(rows, max_cols=2)
+
+    def _paths_sheet_writer(self, writer: TemplateExcelWriter) -> RowWriter:
+        return _index_row_writer(writer.workbook['Paths'], columns=9, header_rows=2)
+
+    def _write_paths_row(self, rows: RowWriter, row_idx: int, op: OperationInfo) -> None:
+        """Write the Paths sheet row of one operation."""
+        filename = self._operation_to_filename(op)
+        
+        # Column 9: Custom Extensions as raw YAML text (preserves original formatting)
+        ext_text = None
+        if op.extensions:
+            ext_text = self.parser.get_raw_extensions(op.path, op.method)
+            # Add 6-space indent to ALL lines to match Excel template style
+            # (original templates have top-level x-sandbox keys at 6-space indent)
+            if ext_text:
+                lines = ext_text.split('\n')
+                indented_lines = [('      ' + line) if line.strip() else line for line in lines]
+                ext_text = '\n'.join(indented_lines)
+        
+        rows.write_row(row_idx, [
+            filename,  # Excel file
+            op.path,
+            op.summary or op.operation_id or '',  # Name (prefer summary)
+            op.method.lower(),
+            op.description or '',
+            ', '.join(op.tags) if op.tags else '',
+            op.summary or '',
+            op.operation_id or '',
+            ext_text,
+        ])
 
 
     
     def _fill_tags_sheet(self, writer: TemplateExcelWriter) -> None:
         """Fill Tags sheet."""
         ws = writer.workbook['Tags']
+        rows = _index_row_writer(ws, columns=2)
         
         tags = self.parser.get_tags()
-        for row_idx, tag in enumerate(tags, start=2):  # Row 1 is header
-            ws.cell(row=row_idx, column=1, value=tag.get('name', ''))
-            ws.cell(row=row_idx, column=2, value=tag.get('description', ''))
-            
-            from .template_writer import DEFAULT_ALIGNMENT
-            ws.cell(row=row_idx, column=1).alignment = DEFAULT_ALIGNMENT
-            ws.cell(row=row_idx, column=2).alignment = DEFAULT_ALIGNMENT
+        rows.write_rows(
+            ([tag.get('name', ''), tag.get('description', '')] for tag in tags),
+            start_row=2,  # Row 1 is header
+        )
             
-        self._autofit_columns(ws, max_cols=2)
+        self._autofit_columns(rows, max_cols=2)
 
 
     
@@ -335,33 +539,19 @@ class OASToExcelConverter:
         
         ws = writer.workbook['Parameters']
         row_idx = 2  # Row 1 is header
-        
-        from .template_writer import DEFAULT_ALIGNMENT
+        rows = _index_row_writer(ws, columns=14, text_columns=(9, 10))
         
         for name, param_def in parameters.items():
             schema = param_def.get('schema', {})
             
-            ws.cell(row=row_idx, column=1, value=name)
-            ws.cell(row=row_idx, column=2, value=param_def.get('description', ''))
-            ws.cell(row=row_idx, column=3, value=param_def.get('in', ''))
             # Type: show 'schema' if using $ref
             type_val = schema.get('type', '')
             if not type_val and '$ref' in schema:
                 type_val = 'schema'
-            ws.cell(row=row_idx, column=4, value=type_val)
-            ws.cell(row=row_idx, column=5, value=schema.get('$ref', '').split('/')[-1] if '$ref' in schema else '')
             # Items data type (for arrays)
             items = schema.get('items', {})
-            ws.cell(row=row_idx, column=6, value=items.get('type', ''))
-            ws.cell(row=row_idx, column=7, value=schema.get('format', ''))
-            ws.cell(row=row_idx, column=8, value='M' if param_def.get('required', False) else '')
-            _set_cell_as_text(ws, row_idx, 9, str(schema.get('minLength', schema.get('minimum', ''))) or '')
-            _set_cell_as_text(ws, row_idx, 10, str(schema.get('maxLength', schema.get('maximum', ''))) or '')
-            ws.cell(row=row_idx, column=11, value='')  # PatternEba - not standard OAS
-            ws.cell(row=row_idx, column=12, value=schema.get('pattern', ''))  # Regex
             # Allowed values (enum) - col 13
             enum = schema.get('enum', [])
-            ws.cell(row=row_idx, column=13, value=', '.join(str(e) for e in enum) if enum else '')
             # Example: try param_def.example first (parameter level), then schema.example, then schema.examples[0], then resolve $ref
             example = param_def.get('example')
             if example is None:
@@ -378,15 +568,27 @@ class OASToExcelConverter:
                     examples_list = ref_schema.get('examples')
                     if examples_list and isinstance(examples_list, list) and len(examples_list) > 0:
                         example = examples_list[0]
-            ws.cell(row=row_idx, column=14, value=str(example) if example is not None else '')
             
-            # Apply alignment
-            for col in range(1, 15):
-                ws.cell(row=row_idx, column=col).alignment = DEFAULT_ALIGNMENT
+            rows.write_row(row_idx, [
+                name,
+                param_def.get('description', ''),
+                param_def.get('in', ''),
+                type_val,
+                schema.get('$ref', '').split('/')[-1] if '$ref' in schema else '',
+                items.get('type', ''),
+                schema.get('format', ''),
+                'M' if param_def.get('required', False) else '',
+                str(schema.get('minLength', schema.get('minimum', ''))) or '',  # TEXT
+                str(schema.get('maxLength', schema.get('maximum', ''))) or '',  # TEXT
+                '',  # PatternEba - not standard OAS
+                schema.get('pattern', ''),  # Regex
+                ', '.join(str(e) for e in enum) if enum else '',
+                str(example) if example is not None else '',
+            ])
                 
             row_idx += 1
             
-        self._autofit_columns(ws, max_cols=2)
+        self._autofit_columns(rows, max_cols=2)
 
     
     def _fill_component_headers(self, writer: TemplateExcelWriter) -> None:
@@ -399,27 +601,14 @@ class OASToExcelConverter:
         
         ws = writer.workbook['Headers']
         row_idx = 2  # Row 1 is header
-        
-        from .template_writer import DEFAULT_ALIGNMENT
+        rows = _index_row_writer(ws, columns=13, text_columns=(8, 9))
         
         for name, header_def in headers.items():
             schema = header_def.get('schema', {})
             
-            ws.cell(row=row_idx, column=1, value=name)
-            ws.cell(row=row_idx, column=2, value=header_def.get('description', ''))
-            ws.cell(row=row_idx, column=3, value=schema.get('type', ''))
-            ws.cell(row=row_idx, column=4, value=schema.get('$ref', '').split('/')[-1] if '$ref' in schema else '')
             # Items data type (for arrays)
             items = schema.get('items', {})
-            ws.cell(row=row_idx, column=5, value=items.get('type', ''))
-            ws.cell(row=row_idx, column=6, value=schema.get('format', ''))
-            ws.cell(row=row_idx, column=7, value='M' if header_def.get('required', False) else '')
-            _set_cell_as_text(ws, row_idx, 8, str(schema.get('minLength', schema.get('minimum', ''))) or '')
-            _set_cell_as_text(ws, row_idx, 9, str(schema.get('maxLength', schema.get('maximum', ''))) or '')
-            ws.cell(row=row_idx, column=10, value='')  # PatternEba - not standard OAS
-            ws.cell(row=row_idx, column=11, value=schema.get('pattern', ''))  # Regex
             enum = schema.get('enum', [])
-            ws.cell(row=row_idx, column=12, value=', '.join(str(e) for e in enum) if enum else '')  # Allowed value
             # Example: try header_def.example first, then schema.example, then schema.examples[0], then resolve $ref
             example = header_def.get('example')
             if example is None:
@@ -436,14 +625,26 @@ class OASToExcelConverter:
                     examples_list = ref_schema.get('examples')
                     if examples_list and isinstance(examples_list, list) and len(examples_list) > 0:
                         example = examples_list[0]
-            ws.cell(row=row_idx, column=13, value=_to_string(example) if example is not None else '')  # Example
             
-            for col in range(1, 14):
-                ws.cell(row=row_idx, column=col).alignment = DEFAULT_ALIGNMENT
+            rows.write_row(row_idx, [
+                name,
+                header_def.get('description', ''),
+                schema.get('type', ''),
+                schema.get('$ref', '').split('/')[-1] if '$ref' in schema else '',
+                items.get('type', ''),
+                schema.get('format', ''),
+                'M' if header_def.get('required', False) else '',
+                str(schema.get('minLength', schema.get('minimum', ''))) or '',  # TEXT
+                str(schema.get('maxLength', schema.get('maximum', ''))) or '',  # TEXT
+                '',  # PatternEba - not standard OAS
+                schema.get('pattern', ''),  # Regex
+                ', '.join(str(e) for e in enum) if enum else '',  # Allowed value
+                _to_string(example) if example is not None else '',  # Example
+            ])
                 
             row_idx += 1
             
-        self._autofit_columns(ws, max_cols=2)
+        self._autofit_columns(rows, max_cols=2)
 
     
     def _fill_schemas_sheet(self, writer: TemplateExcelWriter) -> None:
@@ -455,8 +656,9 @@ class OASToExcelConverter:
         
         ws = writer.workbook['Schemas']
         row_idx = 2  # Row 1 is header
-        
-        from .template_writer import DEFAULT_ALIGNMENT
+        rows = _index_row_writer(ws, columns=14, text_columns=(9, 10))
+        # Column A carries the visual indent per outline level (resolved once per indent)
+        indent_styles: Dict[int, list] = {}
         
         from openpyxl.styles import Alignment
         try:
@@ -467,29 +669,31 @@ class OASToExcelConverter:
         # Sort schemas alphabetically
         for schema_name in sorted(schemas.keys(), key=lambda x: x.lower()):
             # Flatten each schema
-            rows = self.flattener.flatten_schema(schema_name)
+            flat_rows = self.flattener.flatten_schema(schema_name)
             
             parent_map = {}  # Maps name -> parent for depth calculation
             
-            for flat_row in rows:
-                ws.cell(row=row_idx, column=1, value=flat_row.name)
-                ws.cell(row=row_idx, column=2, value=flat_row.parent or '')
-                ws.cell(row=row_idx, column=3, value=flat_row.description or '')
-                ws.cell(row=row_idx, column=4, value=flat_row.type or '')
-                ws.cell(row=row_idx, column=5, value=flat_row.items_type or '')
-                ws.cell(row=row_idx, column=6, value=flat_row.schema_name or '')
-                ws.cell(row=row_idx, column=7, value=flat_row.format or '')
+            for flat_row in flat_rows:
                 # Mandatory: keep 'M', map 'O' to empty string to match reference format
                 mand = flat_row.mandatory
                 if mand == 'O':
                     mand = ''
-                ws.cell(row=row_idx, column=8, value=mand or '')
-                _set_cell_as_text(ws, row_idx, 9, flat_row.min_value or '')
-                _set_cell_as_text(ws, row_idx, 10, flat_row.max_value or '')
-                ws.cell(row=row_idx, column=11, value=flat_row.pattern or '')
-                ws.cell(row=row_idx, column=12, value=flat_row.regex or '')
-                ws.cell(row=row_idx, column=13, value=flat_row.allowed_values or '')
-                ws.cell(row=row_idx, column=14, value=flat_row.example or '')
+                values = [
+                    flat_row.name,
+                    flat_row.parent or '',
+                    flat_row.description or '',
+                    flat_row.type or '',
+                    flat_row.items_type or '',
+                    flat_row.schema_name or '',
+                    flat_row.format or '',
+                    mand or '',
+                    flat_row.min_value or '',  # TEXT
+                    flat_row.max_value or '',  # TEXT
+                    flat_row.pattern or '',
+                    flat_row.regex or '',
+                    flat_row.allowed_values or '',
+                    flat_row.example or '',
+                ]
                 
                 # Outline level grouping
                 level = 0
@@ -517,22 +721,19 @@ class OASToExcelConverter:
                 
                 # Apply alignment & visual indent
                 indent = min(max(level, 0) * 2, 15)
-                for col in range(1, 15):
-                    cell = ws.cell(row=row_idx, column=col)
-                    cell.alignment = DEFAULT_ALIGNMENT
-                
-                from openpyxl.styles import Alignment
-                # Override column A with visual indent & KEEP wrap_text=True
-                try:
-                    cell_a = ws.cell(row=row_idx, column=1)
-                    cell_a.alignment = Alignment(horizontal="left", vertical="top", wrap_text=True, indent=indent)
-                except Exception:
-                    pass
+                styles = indent_styles.get(indent)
+                if styles is None:
+                    # Override column A with visual indent & KEEP wrap_text=True
+                    styles = rows.resolve_styles([{'alignment': Alignment(
+                        horizontal="left", vertical="top", wrap_text=True, indent=indent)}])
+                    styles += rows.styles[1:]
+                    indent_styles[indent] = styles
+                rows.write_row(row_idx, values, styles)
                     
                 row_idx += 1
             
         writer.add_schema_name_hyperlinks()
-        self._autofit_columns(ws, max_cols=2)
+        self._autofit_columns(rows, max_cols=2)
 
 
     
@@ -546,40 +747,38 @@ class OASToExcelConverter:
         
         ws = writer.workbook['Responses']
         row_idx = 2  # Row 1 is header
-        
-        from .template_writer import DEFAULT_ALIGNMENT
+        rows = _index_row_writer(ws, columns=15, text_columns=(10, 11))
         
         for resp_name, resp_def in responses.items():
             # Flatten each response with named root row
             flat_rows = self.flattener.flatten_component_response(resp_name, resp_def)
             
             for flat_row in flat_rows:
-                ws.cell(row=row_idx, column=1, value=flat_row.section or '')
-                ws.cell(row=row_idx, column=2, value=flat_row.name)
-                ws.cell(row=row_idx, column=3, value=flat_row.parent or '')
-                ws.cell(row=row_idx, column=4, value=flat_row.description or '')
-                ws.cell(row=row_idx, column=5, value=flat_row.type or '')
-                ws.cell(row=row_idx, column=6, value=flat_row.items_type or '')
-                ws.cell(row=row_idx, column=7, value=flat_row.schema_name or '')
-                ws.cell(row=row_idx, column=8, value=flat_row.format or '')
                 # Mandatory: keep 'M', map 'O' to empty string
                 mand = flat_row.mandatory
                 if mand == 'O':
                     mand = ''
-                ws.cell(row=row_idx, column=9, value=mand or '')
-                _set_cell_as_text(ws, row_idx, 10, flat_row.min_value or '')
-                _set_cell_as_text(ws, row_idx, 11, flat_row.max_value or '')
-                ws.cell(row=row_idx, column=12, value=flat_row.pattern or '')
-                ws.cell(row=row_idx, column=13, value=flat_row.regex or '')
-                ws.cell(row=row_idx, column=14, value=flat_row.allowed_values or '')
-                ws.cell(row=row_idx, column=15, value=flat_row.example or '')
-                
-                for col in range(1, 16):
-                    ws.cell(row=row_idx, column=col).alignment = DEFAULT_ALIGNMENT
+                rows.write_row(row_idx, [
+                    flat_row.section or '',
+                    flat_row.name,
+                    flat_row.parent or '',
+                    flat_row.description or '',
+                    flat_row.type or '',
+                    flat_row.items_type or '',
+                    flat_row.schema_name or '',
+                    flat_row.format or '',
+                    mand or '',
+                    flat_row.min_value or '',  # TEXT
+                    flat_row.max_value or '',  # TEXT
+                    flat_row.pattern or '',
+                    flat_row.regex or '',
+                    flat_row.allowed_values or '',
+                    flat_row.example or '',
+                ])
                     
                 row_idx += 1
                 
-        self._autofit_columns(ws, max_cols=2)
+        self._autofit_columns(rows, max_cols=2)
 
     
     def _extensions_to_yaml(self, extensions: Dict[str, Any]) -> str:
@@ -926,24 +1125,67 @@ class OASToExcelConverter:
         return f"{name}.{date_str}.xlsx"
 
 
-def main():
-    """Test the converter."""
-    import sys
+# Per-process state for parallel endpoint export (set by _init_export_worker)
+_worker_converter: Optional[OASToExcelConverter] = None
+_worker_operations: List[OperationInfo] = []
+
+
+def _init_export_worker(oas_filepath: str, parser: OASParser) -> None:
+    """Pool initializer: build one converter per worker from the parent's parser."""
+    global _worker_converter, _worker_operations
+    _worker_converter = OASToExcelConverter(oas_filepath, parser=parser)
+    _worker_operations = parser.get_operations()
+
+
+def _export_endpoint_files(indices: List[int], output_path: str):
+    """Pool task: write the operation(s) mapped to output_path, in order.
     
-    if len(sys.argv) < 2:
-        print("Usage: python oas_converter.py <oas_file> [output_dir]")
-        return
+    Also returns the rows flattened and flatten seconds, for the parent's progress.
+    """
+    progress = _worker_converter.progress
+    rows, seconds = progress.rows_flattened, progress.phase_seconds.get('flatten', 0.0)
+    for index in indices:
+        _worker_converter.generate_endpoint_file(_worker_operations[index], output_path)
+    return (
+        len(indices),
+        output_path,
+        progress.rows_flattened - rows,
+        progress.phase_seconds.get('flatten', 0.0) - seconds,
+    )
+
+
+def main(argv=None):
+    """Import an OAS file into Excel templates from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.oas_importer.oas_converter",
+        description="Create the $index and endpoint Excel templates from an OAS file.",
+    )
+    parser.add_argument("oas_file", help="Source OAS YAML file")
+    parser.add_argument("output_dir", nargs="?", default="output", help="Folder for the Excel files")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Endpoint export processes (0: CPU count)")
+    parser.add_argument("--stream", action="store_true", help="Stream the paths, one path item in memory at a time")
+    parser.add_argument("--progress-json", action="store_true",
+                        help="Write progress events to stderr as JSON lines")
+    args = parser.parse_args(argv)
     
-    oas_file = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else 'output'
+    progress = ImportProgress()
+    if args.progress_json:
+        progress.add_listener(json_lines_listener(sys.stderr))
     
-    converter = OASToExcelConverter(oas_file)
-    files = converter.generate_all_endpoint_files(output_dir)
+    converter = OASToExcelConverter(args.oas_file, streaming=args.stream, progress=progress)
+    if args.stream:
+        _, files = converter.stream_import(args.output_dir)
+    else:
+        os.makedirs(args.output_dir, exist_ok=True)
+        converter.generate_index_file(os.path.join(args.output_dir, '$index.xlsx'))
+        files = converter.generate_all_endpoint_files(args.output_dir, max_workers=args.workers)
+        progress.finish()
     
     print(f"Generated {len(files)} files:")
     for f in files:
         print(f"  - {f}")
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
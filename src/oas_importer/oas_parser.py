@@ -9,16 +9,86 @@ Usage:
     info = parser.get_info()
     paths = parser.get_paths()
     components = parser.get_components()
+
+    # Very large files: everything but `paths` is loaded, path items are
+    # read from the file one at a time
+    parser = OASParser('path/to/huge.yaml', streaming=True)
+    for operation in parser.iter_operations():
+        ...
 """
 
 import yaml
 import os
-from src.generator_pkg.yaml_output import SafeLoaderRawNumbers
-from typing import Dict, List, Any, Optional, Tuple
+from bisect import bisect_left
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import MappingEndEvent, MappingStartEvent, StreamEndEvent
+from yaml.nodes import MappingNode, ScalarNode
+from yaml.resolver import Resolver
+from src.generator_pkg.yaml_output import CParser as _CParser, SafeLoaderRawNumbers
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import OrderedDict
 
 
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'head', 'options')
+
+
+if _CParser is not None:
+    class _CStreamLoader(_CParser, SafeLoaderRawNumbers):
+        """SafeLoaderRawNumbers on libyaml events, composing nodes on demand."""
+
+        def __init__(self, stream):
+            _CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+def _stream_loader(stream):
+    """Loader whose compose_node() can be driven one subtree at a time."""
+    if _CParser is not None:
+        return _CStreamLoader(stream)
+    return SafeLoaderRawNumbers(stream)
+
+
+class _LineTap:
+    """
+    Text stream handed to the YAML reader. Keeps what was read as lines (numbered
+    like YAML marks) until released, so the raw text of the subtree just composed
+    is available without holding the whole file.
+    """
+
+    def __init__(self, f):
+        self._file = f
+        self.name = getattr(f, 'name', '<file>')
+        self._lines: List[str] = []
+        self._first = 0  # Line number of self._lines[0]
+        self._tail = ''
+
+    def read(self, size=-1) -> str:
+        chunk = self._file.read(size)
+        if chunk:
+            parts = (self._tail + chunk).split('\n')
+            self._tail = parts.pop()
+            self._lines.extend(parts)
+        elif self._tail:
+            self._lines.append(self._tail)
+            self._tail = ''
+        return chunk
+
+    def lines(self, start: int, end: int) -> List[str]:
+        """Lines start..end-1 (must not have been released)."""
+        return self._lines[start - self._first:end - self._first]
+
+    def release(self, before: int) -> None:
+        """Forget lines before line number `before`."""
+        drop = before - self._first
+        if drop > 0:
+            del self._lines[:drop]
+            self._first = before
+
+
 @dataclass
 class ParameterInfo:
     """Represents an OAS parameter."""
@@ -101,16 +171,29 @@ class OASParser:
     Supports both OAS 3.0 and 3.1 formats.
     """
     
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, streaming: bool = False):
         """
         Initialize parser with an OAS file.
         
         Args:
             filepath: Path to the OAS YAML file
+            streaming: Keep `paths` out of memory: self.oas holds everything
+                       else and iter_operations() reads the path items from
+                       the file one at a time
         """
         self.filepath = filepath
+        self.streaming = streaming
         self.oas: Dict[str, Any] = {}
-        self._load()
+        self.path_count = 0
+        self.operation_count = 0
+        self._raw_line_index: Optional[Tuple[List[str], Dict[str, List[int]]]] = None
+        self._raw_extensions_cache: Dict[Tuple[str, str], str] = {}
+        # Streaming: (path, raw lines) of the path item being processed
+        self._current_path_lines: Optional[Tuple[str, List[str]]] = None
+        if streaming:
+            self._load_streaming()
+        else:
+            self._load()
     
     def _load(self) -> None:
         """Load and parse the OAS YAML file."""
@@ -118,6 +201,106 @@ class OASParser:
             self._raw_content = f.read()
         # Use custom loader to preserve dateTime formats and numeric precision (e.g., 1.00 -> "1.00")
         self.oas = yaml.load(self._raw_content, Loader=SafeLoaderRawNumbers)
+        paths = self.oas.get('paths') if isinstance(self.oas, dict) else None
+        if isinstance(paths, dict):
+            self.path_count = len(paths)
+            self.operation_count = sum(
+                1 for item in paths.values() if isinstance(item, dict)
+                for method in HTTP_METHODS if method in item
+            )
+
+    def _load_streaming(self) -> None:
+        """Load everything but the path items, counting those as they stream past."""
+        document: Dict[str, Any] = {}
+        for kind, key, value in self._walk(construct_paths=False):
+            if kind == 'entry':
+                document[key] = value
+            else:
+                self.path_count += 1
+                self.operation_count += value
+        self.oas = document
+
+    def _walk(self, construct_paths: bool) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        Read the file once, composing one top-level entry or path item at a time.
+        
+        Yields ('entry', key, value) for top-level entries other than a `paths`
+        mapping and ('path', path, item) for each path item; without
+        construct_paths only the item's operation count is yielded, and with it
+        the item's raw lines are kept for get_raw_extensions() meanwhile.
+        """
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            tap = _LineTap(f)
+            loader = _stream_loader(tap)
+            try:
+                loader.get_event()  # StreamStart
+                if loader.check_event(StreamEndEvent):
+                    return
+                loader.get_event()  # DocumentStart
+                if not loader.check_event(MappingStartEvent):
+                    # Not an OAS document; nothing to stream
+                    loader.construct_document(loader.compose_node(None, None))
+                    return
+                loader.get_event()
+                while not loader.check_event(MappingEndEvent):
+                    key = loader.construct_document(loader.compose_node(None, None))
+                    if key != 'paths' or not loader.check_event(MappingStartEvent):
+                        value = loader.construct_document(loader.compose_node(None, None))
+                        tap.release(loader.peek_event().start_mark.line)
+                        yield 'entry', key, value
+                        continue
+                    loader.get_event()
+                    while not loader.check_event(MappingEndEvent):
+                        key_node = loader.compose_node(None, None)
+                        path = loader.construct_document(key_node)
+                        item_node = loader.compose_node(None, None)
+                        end = item_node.end_mark
+                        if construct_paths:
+                            self._current_path_lines = (
+                                path, tap.lines(key_node.start_mark.line, end.line + (1 if end.column else 0))
+                            )
+                            yield 'path', path, loader.construct_document(item_node)
+                            self._current_path_lines = None
+                        else:
+                            yield 'path', path, self._count_operations(item_node)
+                        tap.release(end.line)
+                    loader.get_event()  # End of paths
+            finally:
+                self._current_path_lines = None
+                loader.dispose()
+
+    @staticmethod
+    def _count_operations(item_node) -> int:
+        if not isinstance(item_node, MappingNode):
+            return 0
+        return sum(1 for key_node, _ in item_node.value
+                   if isinstance(key_node, ScalarNode) and key_node.value in HTTP_METHODS)
+
+    def iter_path_items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (path, path item) in document order.
+        
+        In streaming mode each item is read from the file when requested and
+        can be released by the caller before the next one is loaded.
+        """
+        if not self.streaming:
+            yield from self.oas.get('paths', {}).items()
+            return
+        for kind, path, item in self._walk(construct_paths=True):
+            if kind == 'path':
+                yield path, item
+
+    def iter_operations(self) -> Iterator[OperationInfo]:
+        """Yield the operations of get_operations() one path item at a time."""
+        for path, path_item in self.iter_path_items():
+            if not isinstance(path_item, dict):
+                continue
+            # Handle common parameters at path level
+            path_params = path_item.get('parameters', [])
+            
+            for method in HTTP_METHODS:
+                if method in path_item:
+                    yield self._parse_operation(path, method, path_item[method], path_params)
 
     
     @property
@@ -203,6 +386,10 @@ class OASParser:
         Returns:
             List of OperationInfo dataclasses
         """
+        if self.streaming:
+            # Everything at once; prefer iter_operations() for streamed files
+            return list(self.iter_operations())
+
         operations = []
         paths = self.oas.get('paths', {})
         
@@ -210,7 +397,7 @@ class OASParser:
             # Handle common parameters at path level
             path_params = path_item.get('parameters', [])
             
-            for method in ['get', 'post', 'put', 'patch', 'delete', 'head', 'options']:
+            for method in HTTP_METHODS:
                 if method in path_item:
                     op_data = path_item[method]
                     operation = self._parse_operation(path, method, op_data, path_params)
@@ -408,11 +595,39 @@ class OASParser:
         This extracts the exact text from the file to preserve formatting (literal blocks),
         but removes the common indentation so it fits cleanly into Excel.
         """
+        if self.streaming:
+            # Only the path item being streamed is at hand (nothing is cached)
+            if self._current_path_lines is None or self._current_path_lines[0] != path:
+                return ""
+            return self._extract_raw_extensions(self._current_path_lines[1], path, method)
+
         if not hasattr(self, '_raw_content'):
             return ""
 
-        lines = self._raw_content.split('\n')
-        
+        cache_key = (path, method)
+        cached = self._raw_extensions_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        lines, key_lines = self._get_raw_line_index()
+
+        # Outside the path block only a line that can open it changes the state
+        # below, so the scan jumps between those lines (all lines for keys that
+        # are not indexed).
+        occurrences = None
+        if path.startswith('/'):
+            occurrences = sorted(set(key_lines.get(path, ())) | set(key_lines.get(f"'{path}'", ())))
+        
+        result = self._extract_raw_extensions(lines, path, method, occurrences)
+        self._raw_extensions_cache[cache_key] = result
+        return result
+
+    def _extract_raw_extensions(self, lines: List[str], path: str, method: str,
+                                occurrences: Optional[List[int]] = None) -> str:
+        """
+        Find the operation's top-level x- block in lines. occurrences, when
+        given, are the only lines on which the path key can start.
+        """
         # State machine to find the specific operation
         in_path = False
         in_method = False
@@ -424,7 +639,15 @@ class OASParser:
         method_indent = -1
         op_indent = -1
         
-        for i, line in enumerate(lines):
+        i = 0
+        while i < len(lines):
+            if not in_path and occurrences is not None:
+                next_occurrence = bisect_left(occurrences, i)
+                if next_occurrence == len(occurrences):
+                    break
+                i = occurrences[next_occurrence]
+            line = lines[i]
+            i += 1
             stripped = line.strip()
             if not stripped:
                 if collecting:
@@ -498,6 +721,34 @@ class OASParser:
                         else:
                              extensions_lines.append(line)
 
+        return self._dedent_extension_lines(extensions_lines)
+
+    def _get_raw_line_index(self) -> Tuple[List[str], Dict[str, List[int]]]:
+        """
+        Split the raw file once and index it for get_raw_extensions().
+        
+        Returns the lines and, for lines starting with '/' or "'/", the line numbers
+        on which each colon-terminated prefix occurs (so "'/a/{id}': x" is listed
+        under "'/a/{id}'"). A path key P can only match a line that has P as such
+        a prefix.
+        """
+        if self._raw_line_index is None:
+            lines = self._raw_content.split('\n')
+            key_lines: Dict[str, List[int]] = {}
+            for i, line in enumerate(lines):
+                stripped = line.strip()
+                if not (stripped.startswith('/') or stripped.startswith("'/")):
+                    continue
+                pos = stripped.find(':')
+                while pos != -1:
+                    key_lines.setdefault(stripped[:pos], []).append(i)
+                    pos = stripped.find(':', pos + 1)
+            self._raw_line_index = (lines, key_lines)
+        return self._raw_line_index
+
+    @staticmethod
+    def _dedent_extension_lines(extensions_lines: List[str]) -> str:
+        """Join collected extension lines, removing their common indentation."""
         if not extensions_lines:
             return ""
             
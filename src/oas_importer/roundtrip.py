@@ -0,0 +1,128 @@
+"""
+In-memory roundtrip check.
+
+Imports an OAS into template workbooks, generates the OAS back from those
+workbooks and hands both documents to OASComparator. Nothing touches the disk
+unless artefacts are requested: the workbooks feed the generator directly and
+the generated document is compared as it would read back from YAML.
+
+Usage:
+    result = run_roundtrip('path/to/oas.yaml', with_text=True)
+    result.comparator.get_attribute_diff()
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from src import main as main_script
+from src.generator_pkg.yaml_output import as_loaded
+from .oas_comparator import OASComparator
+from .oas_converter import OASToExcelConverter
+
+RAW_EXTENSIONS_KEY = "__RAW_EXTENSIONS__"
+
+
+@dataclass
+class RoundtripResult:
+    """Outcome of run_roundtrip()."""
+    comparator: OASComparator
+    version: str  # "3.0" or "3.1"
+    generated_yaml: Optional[str] = None
+    artefact_dir: Optional[str] = None
+    generated_path: Optional[str] = None
+
+
+def detect_generation_version(oas_version: str) -> Optional[str]:
+    """Maps the document's `openapi` value to the generator version (None if unknown)."""
+    if oas_version.startswith('3.1'):
+        return "3.1"
+    if oas_version.startswith('3.0'):
+        return "3.0"
+    return None
+
+
+def run_roundtrip(
+    src_path: str,
+    with_text: bool = False,
+    artefact_dir: Optional[str] = None,
+    log_callback: Optional[Callable[[str], None]] = None,
+) -> RoundtripResult:
+    """
+    Run the import -> generate roundtrip for an OAS file in memory.
+
+    Args:
+        src_path: Path to the source OAS YAML file
+        with_text: Also render the generated YAML (needed for line metrics)
+        artefact_dir: When given, the templates and the generated YAML are
+                      written there as well (the comparison stays in memory)
+        log_callback: Optional function to log messages
+
+    Returns:
+        RoundtripResult with a comparator over source and generated documents
+    """
+    log = log_callback or (lambda message: None)
+
+    converter = OASToExcelConverter(src_path)
+    oas_version = str(converter.parser.version)
+    version = detect_generation_version(oas_version)
+    if version is None:
+        log(f"[Setup] Unknown OAS version '{oas_version}'. Defaulting to 3.0 Generation.")
+        version = "3.0"
+    else:
+        log(f"[Setup] Detected OAS {version} (Version: {oas_version})")
+
+    log("[Import] Building Excel templates in memory...")
+    index_workbook, endpoint_workbooks = converter.build_template_workbooks()
+    log(f"[Import] {len(endpoint_workbooks)} endpoint workbooks built.")
+
+    if artefact_dir:
+        os.makedirs(artefact_dir, exist_ok=True)
+        index_workbook.save(os.path.join(artefact_dir, main_script.INDEX_FILENAME))
+        for filename, workbook in endpoint_workbooks.items():
+            workbook.save(os.path.join(artefact_dir, filename))
+        log(f"[Import] Templates saved to: {artefact_dir}")
+
+    log("[Gen] Generating OAS from templates in memory...")
+    generators = main_script.generate_oas_documents(
+        index_workbook,
+        endpoint_workbooks,
+        gen_30=version == "3.0",
+        gen_31=version == "3.1",
+        log_callback=lambda message: log(f"  [Gen] {message}"),
+    )
+    generator = generators[version]
+    document = generator.get_document()
+    # Convert before rendering: render_yaml() consumes the raw extension markers
+    gen_oas = as_loaded(document, raw_yaml_key=RAW_EXTENSIONS_KEY)
+
+    generated_yaml = None
+    generated_path = None
+    if with_text or artefact_dir:
+        generated_yaml = generator.render_yaml(document)
+    if artefact_dir:
+        generated_path = os.path.join(artefact_dir, f"generated_oas_{version}.yaml")
+        with open(generated_path, 'w', encoding='utf-8') as f:
+            f.write(generated_yaml)
+        log(f"[Gen] Generated OAS saved to: {generated_path}")
+
+    gold_text = None
+    if with_text:
+        with open(src_path, 'r', encoding='utf-8') as f:
+            gold_text = f.read()
+
+    comparator = OASComparator(
+        gold_path=src_path,
+        gen_path=generated_path,
+        gold_oas=converter.parser.oas,
+        gen_oas=gen_oas,
+        gold_text=gold_text,
+        gen_text=generated_yaml,
+    )
+    return RoundtripResult(
+        comparator=comparator,
+        version=version,
+        generated_yaml=generated_yaml,
+        artefact_dir=artefact_dir,
+        generated_path=generated_path,
+    )
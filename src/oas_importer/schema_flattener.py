@@ -9,18 +9,38 @@ Usage:
     rows = flattener.flatten_schema('MySchema')
 """
 
-from typing import Dict, List, Any, Optional, Set
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
+import copy
 import datetime
+import functools
+import time
 from collections import OrderedDict
 import pandas as pd
 from .oas_parser import OASParser
 from src.generator_pkg.yaml_output import RawNumericValue, OASDumper
 
 
-@dataclass
+def _reports_flattened(method):
+    """Report rows and time of an outermost flatten_*() call to on_flattened."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.on_flattened is None or self._reporting:
+            return method(self, *args, **kwargs)
+        self._reporting = True
+        started = time.perf_counter()
+        try:
+            rows = method(self, *args, **kwargs)
+        finally:
+            self._reporting = False
+        self.on_flattened(len(rows), time.perf_counter() - started)
+        return rows
+    return wrapper
+
+
+@dataclass(slots=True)
 class FlatRow:
-    """Represents a single row in the flattened schema table."""
+    """Represents a single row in the flattened schema table (slotted: specs can yield tens of thousands)."""
     section: Optional[str] = None  # For response sheets: 'headers', 'content', 'links'
     name: str = ''
     parent: Optional[str] = None
@@ -110,6 +130,68 @@ class SchemaFlattener:
         self.oas = oas_dict
         self.schemas = oas_dict.get('components', {}).get('schemas', {})
         self._visited: Set[str] = set()  # Prevent infinite recursion
+        # Flattened rows per (schema object, name, parent, section, required, is_root).
+        # Component schemas and shared requestBody/header definitions are the same
+        # dict objects wherever they are reached, so repeats are served as copies of
+        # the cached row templates. The schema is stored with its rows so its id()
+        # cannot be reused while the entry exists.
+        self._flatten_cache: Dict[tuple, Tuple[Dict[str, Any], Tuple[FlatRow, ...]]] = {}
+        self._pointer_table: Dict[str, Any] = self._build_pointer_table()
+        # Optional function(rows, seconds) called after each top-level flatten_*()
+        # call (e.g. ImportProgress.add_flattened); nested calls are not reported.
+        self.on_flattened: Optional[Callable[[int, float], None]] = None
+        self._reporting = False
+
+    def clear_cache(self) -> None:
+        """Drop memoised rows and resolved pointers (call after mutating self.oas)."""
+        self._flatten_cache.clear()
+        self._pointer_table = self._build_pointer_table()
+
+    def cache_mark(self) -> int:
+        """Current size of the row memo, for release_cache()."""
+        return len(self._flatten_cache)
+
+    def release_cache(self, mark: int) -> None:
+        """
+        Forget rows memoised since cache_mark() returned mark, except those of
+        component definitions. Used when the document part the other rows came
+        from (e.g. a streamed path item) is being released.
+        """
+        components = {id(definition) for definition in self._pointer_table.values()}
+        for key in list(self._flatten_cache)[mark:]:
+            if id(self._flatten_cache[key][0]) not in components:
+                del self._flatten_cache[key]
+
+    def _build_pointer_table(self) -> Dict[str, Any]:
+        """Map every '#/components/<type>/<name>' pointer to its definition."""
+        table = {}
+        components = self.oas.get('components', {})
+        if not isinstance(components, dict):
+            return table
+        for component_type, entries in components.items():
+            if not isinstance(entries, dict):
+                continue
+            for name, definition in entries.items():
+                # Names containing '/' resolve differently through the pointer walk
+                if '/' not in str(name):
+                    table[f"#/components/{component_type}/{name}"] = definition
+        return table
+
+    def _flatten_cached(self, schema: Dict[str, Any],
+                        name: str,
+                        parent: Optional[str],
+                        required: Optional[bool],
+                        section: Optional[str],
+                        is_root: bool = False) -> List[FlatRow]:
+        """_flatten_schema_def() memoised per schema object and placement."""
+        key = (id(schema), name, parent, section, required, is_root)
+        cached = self._flatten_cache.get(key)
+        if cached is None or cached[0] is not schema:
+            rows = self._flatten_schema_def(schema, name, parent, required, section, is_root)
+            cached = (schema, tuple(copy.copy(row) for row in rows))
+            self._flatten_cache[key] = cached
+            return rows
+        return [copy.copy(row) for row in cached[1]]
     
     def _get_mandatory_flag(self, required: Optional[bool]) -> Optional[str]:
         """Convert required boolean to 'M', 'O', or None (empty)."""
@@ -323,6 +405,7 @@ class SchemaFlattener:
         else:
             return value
 
+    @_reports_flattened
     def flatten_schema(self, schema_name: str, 
                        root_name: Optional[str] = None,
                        section: Optional[str] = None,
@@ -359,7 +442,7 @@ class SchemaFlattener:
         # Flatten the schema with this name as parent for all children
         # For combinators: parent=None so combinator row becomes root
         # For regular schemas: parent=name so properties are nested under root
-        child_rows = self._flatten_schema_def(
+        child_rows = self._flatten_cached(
             schema, 
             name=name,
             parent=name if (include_root and not is_combinator) else None,
@@ -370,6 +453,7 @@ class SchemaFlattener:
         rows.extend(child_rows)
         return rows
     
+    @_reports_flattened
     def flatten_inline_schema(self, schema: Dict[str, Any],
                               name: str = 'root',
                               parent: Optional[str] = None,
@@ -388,7 +472,7 @@ class SchemaFlattener:
         Returns:
             List of FlatRow objects
         """
-        return self._flatten_schema_def(schema, name, parent, required, section)
+        return self._flatten_cached(schema, name, parent, required, section)
     
     def _flatten_schema_def(self, schema: Dict[str, Any],
                             name: str,
@@ -653,6 +737,7 @@ class SchemaFlattener:
         """Extract schema name from $ref string."""
         return ref.split('/')[-1]
     
+    @_reports_flattened
     def flatten_request_body(self, request_body: Dict[str, Any],
                              section: Optional[str] = None) -> List[FlatRow]:
         """
@@ -702,6 +787,7 @@ class SchemaFlattener:
         
         return rows
     
+    @_reports_flattened
     def flatten_component_response(self, resp_name: str, response: Dict[str, Any]) -> List[FlatRow]:
         """
         Flatten a named component response including a root row.
@@ -922,6 +1008,7 @@ class SchemaFlattener:
                 example=_to_string(value) if value is not None else None
             ))
     
+    @_reports_flattened
     def flatten_response(self, response: Dict[str, Any]) -> List[FlatRow]:
         """
         Flatten a response definition including headers and content.
@@ -978,7 +1065,7 @@ class SchemaFlattener:
             # 2. Flatten Schema Children
             # Only flatten if NOT a Ref (preserves usage of Global Components)
             if not ref_name:
-                child_rows = self._flatten_schema_def(
+                child_rows = self._flatten_cached(
                     schema,
                     name=media_type,
                     parent=None, # Parent of root is None
@@ -1094,6 +1181,10 @@ class SchemaFlattener:
         if not ref.startswith('#/'):
             return {}
         
+        resolved = self._pointer_table.get(ref)
+        if resolved is not None:
+            return resolved
+        
         parts = ref[2:].split('/')
         result = self.oas
         for part in parts:
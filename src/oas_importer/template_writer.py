@@ -16,20 +16,74 @@ Usage:
     writer.save('output/my_endpoint.xlsx')
 """
 
+import io
 import os
 import sys
-import copy
+import pickle
 import re
-from typing import Dict, List, Any, Optional
+import threading
+import zipfile
+from typing import Dict, List, Any, Optional, Tuple
 from openpyxl import load_workbook, Workbook
 from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.utils import get_column_letter
 from openpyxl.utils.cell import range_boundaries
+from openpyxl.worksheet.table import TableList
 from openpyxl.worksheet.worksheet import Worksheet
 
+from .excel_writer import KEEP_CELL, RowWriter, cell_style_slots
+
 # Global alignment for all data cells
 DEFAULT_ALIGNMENT = Alignment(horizontal='left', vertical='top', wrap_text=True)
 
+# Parsed master templates, per process: (path, mtime_ns, size) -> (pickled workbook
+# or None if the template does not survive pickling, original CF formulas).
+# Unpickling is several times cheaper than load_workbook and yields an independent
+# workbook with the same styles, column dimensions, CF rules, data validations and
+# Response sheet as the file on disk.
+_TEMPLATE_PROTOTYPES: Dict[Tuple[str, int, int], Tuple[Optional[bytes], Dict[tuple, List[str]]]] = {}
+_TEMPLATE_PROTOTYPES_LOCK = threading.Lock()
+
+
+class _TemplatePickler(pickle.Pickler):
+    """Pickler for openpyxl workbooks that keeps dict subclasses with custom items()."""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, TableList):
+            # TableList.items() yields (name, ref) pairs, not the Table objects
+            return (TableList, (), None, None, iter(dict.items(obj)))
+        return NotImplemented
+
+
+def _dump_workbook(workbook: Workbook) -> bytes:
+    buffer = io.BytesIO()
+    _TemplatePickler(buffer, pickle.HIGHEST_PROTOCOL).dump(workbook)
+    return buffer.getvalue()
+
+
+def _load_workbook_blob(blob: bytes) -> Workbook:
+    workbook = pickle.loads(blob)
+    for ws in workbook.worksheets:
+        # DimensionHolder (a defaultdict) does not pickle its default_factory,
+        # which openpyxl binds to the owning sheet in Worksheet._setup().
+        ws.row_dimensions.default_factory = ws._add_row
+        ws.column_dimensions.default_factory = ws._add_column
+    return workbook
+
+
+def _saved_parts(workbook: Workbook) -> Dict[str, bytes]:
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    with zipfile.ZipFile(buffer) as archive:
+        return {name: archive.read(name) for name in archive.namelist()
+                if name != 'docProps/core.xml'}
+
+
+def clear_template_cache() -> None:
+    """Forget parsed master templates (they are also refreshed when the file changes)."""
+    with _TEMPLATE_PROTOTYPES_LOCK:
+        _TEMPLATE_PROTOTYPES.clear()
+
 
 class TemplateExcelWriter:
     """
@@ -68,9 +122,11 @@ class TemplateExcelWriter:
         self.workbook: Optional[Workbook] = None
         self._response_template_ws: Optional[Worksheet] = None
         self._original_cf_formulas: Dict[tuple[str, str, int], List[str]] = {}
+        # Template style record -> record a copy of it registers as (per workbook)
+        self._template_records: Dict[Tuple[str, int], int] = {}
         
     def load_template(self) -> Workbook:
-        """Load the appropriate master template."""
+        """Load the appropriate master template (parsed once per process, then copied from memory)."""
         if self.template_type == 'index':
             template_path = os.path.join(self.TEMPLATES_DIR, self.INDEX_TEMPLATE)
         else:
@@ -79,12 +135,8 @@ class TemplateExcelWriter:
         if not os.path.exists(template_path):
             raise FileNotFoundError(f"Template not found: {template_path}")
         
-        self.workbook = load_workbook(template_path)
-
-        # Snapshot conditional formatting formulas as they exist in the template file.
-        # We'll use this to avoid modifying rules that were intentionally written with
-        # absolute row references.
-        self._snapshot_original_conditional_formatting_formulas()
+        self.workbook = self._instantiate_template(template_path)
+        self._template_records = {}
         
         # Store reference to Response template for cloning
         if 'Response' in self.workbook.sheetnames:
@@ -92,6 +144,48 @@ class TemplateExcelWriter:
         
         return self.workbook
 
+    def _instantiate_template(self, template_path: str) -> Workbook:
+        """Return a fresh workbook built from the cached prototype of template_path."""
+        stat = os.stat(template_path)
+        key = (os.path.abspath(template_path), stat.st_mtime_ns, stat.st_size)
+
+        with _TEMPLATE_PROTOTYPES_LOCK:
+            prototype = _TEMPLATE_PROTOTYPES.get(key)
+
+        if prototype is None:
+            self.workbook = load_workbook(template_path)
+            # Snapshot conditional formatting formulas as they exist in the template file.
+            # We'll use this to avoid modifying rules that were intentionally written with
+            # absolute row references.
+            self._snapshot_original_conditional_formatting_formulas()
+            blob = self._build_prototype_blob(template_path)
+            prototype = (blob, self._original_cf_formulas)
+            with _TEMPLATE_PROTOTYPES_LOCK:
+                for stale in [k for k in _TEMPLATE_PROTOTYPES if k[0] == key[0]]:
+                    del _TEMPLATE_PROTOTYPES[stale]
+                _TEMPLATE_PROTOTYPES[key] = prototype
+            if blob is None:
+                return self.workbook
+
+        blob, cf_formulas = prototype
+        self._original_cf_formulas = {k: list(v) for k, v in cf_formulas.items()}
+        if blob is None:
+            return load_workbook(template_path)
+        return _load_workbook_blob(blob)
+
+    def _build_prototype_blob(self, template_path: str) -> Optional[bytes]:
+        """
+        Pickle the freshly loaded template, or return None when a copy made from
+        the pickle would not save exactly like the template loaded from disk.
+        """
+        try:
+            blob = _dump_workbook(self.workbook)
+            if _saved_parts(_load_workbook_blob(blob)) == _saved_parts(load_workbook(template_path)):
+                return blob
+        except Exception:
+            pass
+        return None
+
     def _snapshot_original_conditional_formatting_formulas(self) -> None:
         if not self.workbook:
             return
@@ -271,7 +365,26 @@ class TemplateExcelWriter:
         # Ensure directory exists
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        # Finalize before saving
+        workbook = self.detach_workbook()
+        workbook.save(filepath)
+        
+        # Close workbook to release file handles
+        workbook.close()
+
+    def detach_workbook(self) -> Workbook:
+        """
+        Finalize the workbook and hand it over without saving it.
+        
+        Used by in-memory consumers (e.g. the roundtrip check) that read the
+        filled template directly. The writer no longer owns the workbook.
+        
+        Returns:
+            The finalized workbook
+        """
+        if self.workbook is None:
+            raise ValueError("No workbook loaded")
+        
+        # Finalize before handing over
         self.finalize()
 
         # openpyxl can rewrite conditional formatting formulas and turn relative row
@@ -280,11 +393,9 @@ class TemplateExcelWriter:
         # rows while preserving optional absolute column ($A2).
         self._sanitize_conditional_formatting_formulas()
         
-        self.workbook.save(filepath)
-        
-        # Close workbook to release file handles
-        self.workbook.close()
+        workbook = self.workbook
         self.workbook = None
+        return workbook
 
     def _sanitize_conditional_formatting_formulas(self) -> None:
         if not self.workbook:
@@ -397,35 +508,31 @@ class TemplateExcelWriter:
         template_styles = {}
         for col in range(1, ws.max_column + 1):
             template_cell = ws.cell(row=start_row, column=col)
-            template_styles[col] = {
-                'font': copy.copy(template_cell.font),
-                'fill': copy.copy(template_cell.fill),
-                'border': copy.copy(template_cell.border),
-                'alignment': copy.copy(template_cell.alignment),
-                'number_format': template_cell.number_format
-            }
-        
-        # Fill data
-        for row_idx, row_data in enumerate(data_rows, start=start_row):
-            for header, value in row_data.items():
-                if header in col_map:
-                    col = col_map[header]
-                    cell = ws.cell(row=row_idx, column=col, value=value)
-                    
-                    # Apply template style (font, fill, border, number_format)
-                    if col in template_styles:
-                        style = template_styles[col]
-                        cell.font = style['font']
-                        cell.fill = style['fill']
-                        cell.border = style['border']
-                        cell.number_format = style['number_format']
-                    
-                    # Force TEXT format for Min/Max columns to preserve exact numeric representation
-                    if 'Min' in header or 'Max' in header:
-                        cell.number_format = '@'
-                    
-                    # Apply global alignment (left, top, word wrap) to ALL cells
-                    cell.alignment = DEFAULT_ALIGNMENT
+            template_styles[col] = cell_style_slots(template_cell, records=self._template_records)
+        
+        # Columns written by any row, in first-seen order
+        headers = list(dict.fromkeys(
+            header for row_data in data_rows for header in row_data if header in col_map
+        ))
+        columns = [col_map[header] for header in headers]
+        
+        rows = RowWriter(ws, columns)
+        # Global alignment (left, top, word wrap) for ALL cells; TEXT format for
+        # Min/Max columns to preserve exact numeric representation
+        aligned, aligned_text = rows.resolve_styles([
+            {'alignment': DEFAULT_ALIGNMENT},
+            {'number_format': '@', 'alignment': DEFAULT_ALIGNMENT},
+        ])
+        rows.styles = [
+            template_styles[col] + (aligned_text if 'Min' in header or 'Max' in header else aligned)
+            for header, col in zip(headers, columns)
+        ]
+        
+        # Fill data (keys missing from a row leave that cell untouched)
+        rows.write_rows(
+            ([row_data.get(header, KEEP_CELL) for header in headers] for row_data in data_rows),
+            start_row=start_row,
+        )
 
 
 # Backward compatibility wrapper
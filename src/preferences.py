@@ -266,6 +266,9 @@ class PreferencesManager:
         "gen_x_info_oasis_version": True,
         "excel_gen_attr_diff": True,
         "excel_gen_line_diff": False,
+        "excel_gen_keep_artefacts": False,  # Roundtrip check also writes templates + YAML to disk
+        "import_export_workers": 1,     # Endpoint workbook export processes (0 = one per CPU)
+        "import_streaming_min_mb": 50,  # Stream imports of OAS files from this size (0 = never)
         # File Display
         "file_sort_order": "alphabetical",  # alphabetical, newest_first, oldest_first
         # View Options
@@ -285,7 +288,8 @@ class PreferencesManager:
         "update_check_enabled": True,
         "update_manifest_url": DEFAULT_UPDATE_MANIFEST_URL,
         "update_download_url": "",
-        "linter_engine": "spectral",  # spectral or vacuum
+        "linter_engine": "spectral",  # spectral, vacuum or native (in-process)
+        "lint_after_generation": False,  # Lint each generated OAS in memory (native rules) into the Generation log
         "ignore_bad_request": True,
         "validation_font_size": 11,
         "remember_window_pos": False,
@@ -327,6 +331,7 @@ class PreferencesManager:
         "diff_show_enum_order_changes": False,
         "diff_show_validation_rule_only_description_changes": True,
         "diff_debug_mode": False,
+        "diff_parallel_reports": False,
 
         
         # Restored Functional Keys (mistakenly treated as orphans)
@@ -26,6 +26,50 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+IMPORT_WORKER_CHOICES = ["1", "2", "4", "8", "Auto"]
+
+
+def _import_workers_label(value):
+    """Map the import_export_workers preference (0 = one per CPU) to its combobox label."""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        value = 1
+    return "Auto" if value <= 0 else str(value)
+
+
+def _import_workers_value(label):
+    """Inverse of _import_workers_label."""
+    if label == "Auto":
+        return 0
+    try:
+        return max(1, int(label))
+    except (TypeError, ValueError):
+        return 1
+
+
+IMPORT_STREAMING_CHOICES = ["Never", "10 MB", "25 MB", "50 MB", "100 MB"]
+
+
+def _import_streaming_label(value):
+    """Map the import_streaming_min_mb preference (0 = never) to its combobox label."""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        value = 50
+    return "Never" if value <= 0 else f"{value} MB"
+
+
+def _import_streaming_value(label):
+    """Inverse of _import_streaming_label."""
+    if label == "Never":
+        return 0
+    try:
+        return max(1, int(str(label).split()[0]))
+    except (TypeError, ValueError, IndexError):
+        return 50
+
+
 class AutoHideScrollableFrame(ctk.CTkScrollableFrame):
     """Scrollable frame that shows its scrollbar only when content overflows."""
 
@@ -388,6 +432,25 @@ class PreferencesDialog(ctk.CTkToplevel):
         self.chk_excel_line_diff = ctk.CTkSwitch(self.scroll_templates_general, text="Line Diff", progress_color="#0A809E")
         self.chk_excel_line_diff.pack(anchor="w", padx=20, pady=(3, 6))
 
+        self.chk_excel_keep_artefacts = ctk.CTkSwitch(self.scroll_templates_general, text="Keep Roundtrip Artefacts", progress_color="#0A809E")
+        self.chk_excel_keep_artefacts.pack(anchor="w", padx=20, pady=(3, 6))
+
+        frame_import_workers = ctk.CTkFrame(self.scroll_templates_general, fg_color="transparent")
+        frame_import_workers.pack(anchor="w", padx=20, pady=(3, 6))
+        ctk.CTkLabel(frame_import_workers, text="Endpoint export processes:").pack(side="left", padx=(0, 10))
+        self.cbo_import_export_workers = ctk.CTkComboBox(
+            frame_import_workers, values=IMPORT_WORKER_CHOICES, width=100, button_color="#0A809E"
+        )
+        self.cbo_import_export_workers.pack(side="left")
+
+        frame_import_streaming = ctk.CTkFrame(self.scroll_templates_general, fg_color="transparent")
+        frame_import_streaming.pack(anchor="w", padx=20, pady=(3, 6))
+        ctk.CTkLabel(frame_import_streaming, text="Stream OAS files from:").pack(side="left", padx=(0, 10))
+        self.cbo_import_streaming_min_mb = ctk.CTkComboBox(
+            frame_import_streaming, values=IMPORT_STREAMING_CHOICES, width=100, button_color="#0A809E"
+        )
+        self.cbo_import_streaming_min_mb.pack(side="left")
+
         # --- Section: Legacy Tools ---
         self._add_section_separator(self.scroll_templates_general, "Legacy Tools")
         self.frame_legacy_switches = ctk.CTkFrame(self.scroll_templates_general, fg_color="transparent")
@@ -488,7 +551,7 @@ class PreferencesDialog(ctk.CTkToplevel):
         frame_linter.pack(anchor="w", padx=20, pady=(20, 10))
         ctk.CTkLabel(frame_linter, text="Linter Engine:").pack(side="left", padx=(0, 10))
         self.cbo_linter_engine = ctk.CTkComboBox(
-            frame_linter, values=["Spectral", "Vacuum"], width=150, button_color="#0A809E"
+            frame_linter, values=["Spectral", "Vacuum", "Native"], width=150, button_color="#0A809E"
         )
         self.cbo_linter_engine.pack(side="left")
 
@@ -497,6 +560,11 @@ class PreferencesDialog(ctk.CTkToplevel):
         )
         self.chk_ignore_br.pack(anchor="w", padx=20, pady=(10, 20))
 
+        self.chk_lint_after_generation = ctk.CTkSwitch(
+            self.tab_val, text="Lint Generated Files in the Generation Log", progress_color="#0A809E"
+        )
+        self.chk_lint_after_generation.pack(anchor="w", padx=20, pady=(0, 20))
+
         frame_val_font = ctk.CTkFrame(self.tab_val, fg_color="transparent")
         frame_val_font.pack(anchor="w", padx=20, pady=(0, 20))
         ctk.CTkLabel(frame_val_font, text="Issues Font Size:").pack(side="left", padx=(0, 10))
@@ -607,6 +675,16 @@ class PreferencesDialog(ctk.CTkToplevel):
         ctk.CTkButton(self.vars_controls, text="Add Variable", width=100, fg_color="#0A809E", hover_color="#076075", command=self._on_add_var).pack(side="left", padx=(0, 5))
         ctk.CTkButton(self.vars_controls, text="Clear All", width=100, fg_color="#D04040", hover_color="#B03030", command=self._on_clear_vars).pack(side="left")
 
+        self._add_section_separator(self.diff_tab_general, "Performance")
+        self.var_diff_parallel_reports = ctk.BooleanVar(value=False)
+        self.chk_diff_parallel_reports = ctk.CTkSwitch(
+            self.diff_tab_general,
+            text="Render reports in parallel (one process per report)",
+            variable=self.var_diff_parallel_reports,
+            progress_color="#0A809E",
+        )
+        self.chk_diff_parallel_reports.pack(anchor="w", padx=20, pady=(8, 6))
+
         def _add_report_template_tab(tab, label, attr_name, browse_key):
             self._add_section_separator(tab, "Custom Template")
             frame = ctk.CTkFrame(tab, fg_color="transparent")
@@ -814,12 +892,18 @@ class PreferencesDialog(ctk.CTkToplevel):
         else: self.chk_excel_attr_diff.deselect()
         if prefs.get("excel_gen_line_diff", False): self.chk_excel_line_diff.select()
         else: self.chk_excel_line_diff.deselect()
+        if prefs.get("excel_gen_keep_artefacts", False): self.chk_excel_keep_artefacts.select()
+        else: self.chk_excel_keep_artefacts.deselect()
+        self.cbo_import_export_workers.set(_import_workers_label(prefs.get("import_export_workers", 1)))
+        self.cbo_import_streaming_min_mb.set(_import_streaming_label(prefs.get("import_streaming_min_mb", 50)))
 
         # Validation
         engine = prefs.get("linter_engine", "spectral").capitalize()
-        if engine in ["Spectral", "Vacuum"]: self.cbo_linter_engine.set(engine)
+        if engine in ["Spectral", "Vacuum", "Native"]: self.cbo_linter_engine.set(engine)
         if prefs.get("ignore_bad_request", True): self.chk_ignore_br.select()
         else: self.chk_ignore_br.deselect()
+        if prefs.get("lint_after_generation", False): self.chk_lint_after_generation.select()
+        else: self.chk_lint_after_generation.deselect()
         self.slider_validation_font.set(prefs.get("validation_font_size", 11))
         self.lbl_validation_font_val.configure(text=str(prefs.get("validation_font_size", 11)))
 
@@ -878,6 +962,7 @@ class PreferencesDialog(ctk.CTkToplevel):
         )
 
 
+        self.var_diff_parallel_reports.set(prefs.get("diff_parallel_reports", False))
             
         self.current_diff_vars = prefs.get("diff_static_variables", {}).copy()
         self._refresh_vars_list()
@@ -1235,10 +1320,14 @@ class PreferencesDialog(ctk.CTkToplevel):
             # Excel Generation
             "excel_gen_attr_diff": bool(self.chk_excel_attr_diff.get()),
             "excel_gen_line_diff": bool(self.chk_excel_line_diff.get()),
+            "excel_gen_keep_artefacts": bool(self.chk_excel_keep_artefacts.get()),
+            "import_export_workers": _import_workers_value(self.cbo_import_export_workers.get()),
+            "import_streaming_min_mb": _import_streaming_value(self.cbo_import_streaming_min_mb.get()),
             
             # Validation
             "linter_engine": self.cbo_linter_engine.get().lower(),
             "ignore_bad_request": bool(self.chk_ignore_br.get()),
+            "lint_after_generation": bool(self.chk_lint_after_generation.get()),
             "validation_font_size": int(self.slider_validation_font.get()),
             
             # View
@@ -1278,6 +1367,7 @@ class PreferencesDialog(ctk.CTkToplevel):
                 self.var_diff_show_validation_rule_only_description_changes.get()
             ),
 
+            "diff_parallel_reports": bool(self.var_diff_parallel_reports.get()),
             "diff_debug_mode": False,
             "diff_static_variables": self.current_diff_vars,
         }
@@ -1349,6 +1439,9 @@ class PreferencesDialog(ctk.CTkToplevel):
     def _reset_templates_general_defaults(self):
         self._set_switch_value(self.chk_excel_attr_diff, self._default_value("excel_gen_attr_diff"))
         self._set_switch_value(self.chk_excel_line_diff, self._default_value("excel_gen_line_diff"))
+        self._set_switch_value(self.chk_excel_keep_artefacts, self._default_value("excel_gen_keep_artefacts"))
+        self.cbo_import_export_workers.set(_import_workers_label(self._default_value("import_export_workers")))
+        self.cbo_import_streaming_min_mb.set(_import_streaming_label(self._default_value("import_streaming_min_mb")))
 
         self.var_legacy_tracing.set(self._default_value("tools_legacy_tracing_enabled"))
         self.var_legacy_collision_desc.set(self._default_value("tools_legacy_collision_include_descriptions"))
@@ -1372,6 +1465,7 @@ class PreferencesDialog(ctk.CTkToplevel):
     def _reset_validation_defaults(self):
         self.cbo_linter_engine.set(str(self._default_value("linter_engine")).capitalize())
         self._set_switch_value(self.chk_ignore_br, self._default_value("ignore_bad_request"))
+        self._set_switch_value(self.chk_lint_after_generation, self._default_value("lint_after_generation"))
         font_size = self._default_value("validation_font_size")
         self.slider_validation_font.set(font_size)
         self.lbl_validation_font_val.configure(text=str(font_size))
@@ -1394,6 +1488,7 @@ class PreferencesDialog(ctk.CTkToplevel):
     def _reset_diff_general_defaults(self):
         self.current_diff_vars = self._default_value("diff_static_variables")
         self._refresh_vars_list()
+        self.var_diff_parallel_reports.set(self._default_value("diff_parallel_reports"))
 
     def _reset_diff_template_entry(self, entry, preference_key):
         self._set_entry_value(entry, self._default_value(preference_key))
@@ -1434,6 +1529,8 @@ class PreferencesDialog(ctk.CTkToplevel):
                 [
                     "excel_gen_attr_diff",
                     "excel_gen_line_diff",
+                    "excel_gen_keep_artefacts",
+                    "import_export_workers",
                     "tools_legacy_tracing_enabled",
                     "tools_legacy_collision_include_descriptions",
                     "tools_legacy_collision_include_examples",
@@ -1451,7 +1548,11 @@ class PreferencesDialog(ctk.CTkToplevel):
         if current_tab == "OAS Comparison":
             current_subtab = self.diff_tabview.get()
             if current_subtab == "General":
-                return "OAS Comparison > General", self._reset_diff_general_defaults, ["diff_static_variables"]
+                return (
+                    "OAS Comparison > General",
+                    self._reset_diff_general_defaults,
+                    ["diff_static_variables", "diff_parallel_reports"],
+                )
             if current_subtab == "Synthesis":
                 return (
                     "OAS Comparison > Synthesis",
@@ -1507,7 +1608,7 @@ class PreferencesDialog(ctk.CTkToplevel):
             ),
             "Validation": (
                 self._reset_validation_defaults,
-                ["linter_engine", "ignore_bad_request", "validation_font_size"],
+                ["linter_engine", "ignore_bad_request", "lint_after_generation", "validation_font_size"],
             ),
             "View": (
                 self._reset_view_defaults,
@@ -1,5 +1,114 @@
+import functools
+import hashlib
+import json
 import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+
+import yaml
+
+from src.generator_pkg.yaml_output import FastSafeLoader as _SafeLoader
+
+
+REDOC_ASSET_NAME = "redoc.standalone.js"
+DOCS_DIR_NAME = "docs"  # default export folder, inside the OAS output folder
+EXPORT_MANIFEST_NAME = ".redoc_export.json"  # content hashes of the last export
+EXPORT_EXTENSIONS = (".yaml", ".yml")
+SPEC_JSON_CACHE_SIZE = 16  # specs (by content hash) kept converted to JSON
+
+_spec_json_cache = OrderedDict()  # sha256 of the YAML -> spec JSON
+_spec_json_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_redoc_js(js_path):
+    """The bundled Redoc JS, read once per process."""
+    with open(js_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _inline_script(js_content):
+    return f"""<script>
+{js_content}
+    </script>"""
+
+
+def inline_shared_asset(html, asset_dir):
+    """
+    Standalone copy of a page generated with a shared asset: the reference
+    to the Redoc JS in asset_dir is replaced by the JS itself.
+    """
+    shared_script = f'<script src="{REDOC_ASSET_NAME}"></script>'
+    if shared_script not in html:
+        return html
+    try:
+        with open(os.path.join(asset_dir, REDOC_ASSET_NAME), "r", encoding="utf-8") as f:
+            js_content = f.read()
+    except OSError:
+        js_content = _load_redoc_js(RedocGenerator().js_path)
+    return html.replace(shared_script, _inline_script(js_content))
+
+
+class _DateTimeEncoder(json.JSONEncoder):
+    """JSON encoder for the datetime values YAML may produce."""
+
+    def default(self, obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+def spec_to_json(oas_content_yaml, cache=True):
+    """JSON of a YAML/JSON spec, cached by content hash (unless cache is False)."""
+    if not cache:
+        return json.dumps(yaml.load(oas_content_yaml, Loader=_SafeLoader), cls=_DateTimeEncoder)
+    key = hashlib.sha256(oas_content_yaml.encode("utf-8")).hexdigest()
+    with _spec_json_lock:
+        if key in _spec_json_cache:
+            _spec_json_cache.move_to_end(key)
+            return _spec_json_cache[key]
+    spec_json = json.dumps(yaml.load(oas_content_yaml, Loader=_SafeLoader), cls=_DateTimeEncoder)
+    with _spec_json_lock:
+        _spec_json_cache[key] = spec_json
+        while len(_spec_json_cache) > SPEC_JSON_CACHE_SIZE:
+            _spec_json_cache.popitem(last=False)
+    return spec_json
+
+
+def _page_name(spec_name):
+    """File name of the documentation page of a spec file."""
+    return os.path.splitext(spec_name)[0] + ".html"
+
+
+def _export_page(job):  # module-level: pickled into the export pool
+    """
+    Renders the documentation page of one spec of an export_folder() job.
+    The spec is hashed first: when the hash equals the previous export's and
+    the page still exists, nothing is rendered ("unchanged"). Otherwise the
+    page is written to a temporary file and moved over html_path.
+    Returns (spec path, {"status", "html", "error", "hash"}).
+    """
+    spec_path, html_path, redoc_script, previous_hash = job
+    result = {"status": "failed", "html": html_path, "error": "", "hash": None}
+    try:
+        with open(spec_path, "r", encoding="utf-8-sig") as f:
+            content = f.read()
+        result["hash"] = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if previous_hash == result["hash"] and os.path.exists(html_path):
+            result["status"] = "unchanged"
+            return spec_path, result
+        html = RedocGenerator()._build_html(spec_to_json(content, cache=False), redoc_script)
+        tmp_path = f"{html_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp_path, html_path)
+        result["status"] = "exported"
+    except Exception as e:
+        result["error"] = str(e)
+    return spec_path, result
 
 
 class RedocGenerator:
@@ -14,43 +123,177 @@ class RedocGenerator:
         else:
             self.resource_dir = resource_dir
 
-        self.js_path = os.path.join(self.resource_dir, "redoc.standalone.js")
+        self.js_path = os.path.join(self.resource_dir, REDOC_ASSET_NAME)
 
-    def get_html_content(self, oas_content_yaml):
+    def write_shared_asset(self, asset_dir):
         """
-        Generates a self-contained HTML string with embedded OAS spec and Redoc JS.
-        Works completely offline.
+        Writes the Redoc JS into asset_dir (unless an identical copy is already
+        there) and returns its file name, to be referenced relative to the HTML.
         """
-        # Read the bundled Redoc JS
-        js_content = ""
+        js_content = _load_redoc_js(self.js_path)
+        js_bytes = js_content.encode("utf-8")
+        asset_path = os.path.join(asset_dir, REDOC_ASSET_NAME)
         try:
-            with open(self.js_path, "r", encoding="utf-8") as f:
-                js_content = f.read()
+            with open(asset_path, "rb") as f:
+                if f.read() == js_bytes:
+                    return REDOC_ASSET_NAME
+        except OSError:
+            pass
+        os.makedirs(asset_dir, exist_ok=True)
+        # Write then rename, so a concurrent writer or reader never sees a partial file
+        tmp_path = f"{asset_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(js_bytes)
+        os.replace(tmp_path, asset_path)
+        return REDOC_ASSET_NAME
+
+    def export_folder(self, oas_dir, docs_dir=None, force=False, log_callback=None, max_workers=None):
+        """
+        Renders the documentation HTML of every YAML spec in oas_dir into
+        docs_dir (default: oas_dir/docs), in a process pool.
+
+        All pages reference one shared copy of the Redoc JS. A spec whose
+        content (and the Redoc JS) hashes the same as at the previous export,
+        and whose page still exists, is skipped unless force is set. Pages of
+        specs exported before but no longer in oas_dir are deleted.
+
+        Returns:
+            Dict of spec path -> {"status": "exported" | "unchanged" | "failed"
+            | "removed", "html": page path, "error": message}
+        """
+
+        def log(msg):
+            if log_callback:
+                log_callback(msg)
+
+        docs_dir = docs_dir or os.path.join(oas_dir, DOCS_DIR_NAME)
+        spec_paths = [
+            os.path.join(oas_dir, name)
+            for name in sorted(os.listdir(oas_dir))
+            if name.lower().endswith(EXPORT_EXTENSIONS) and os.path.isfile(os.path.join(oas_dir, name))
+        ]
+
+        manifest_path = os.path.join(docs_dir, EXPORT_MANIFEST_NAME)
+        manifest = {}
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if not isinstance(manifest, dict):
+            manifest = {}
+        previous_asset = manifest.get("asset")
+        exported_before = manifest.get("files") or {}
+
+        results = {}
+        # Pages of specs that were exported before but are gone now
+        spec_names = {os.path.basename(path) for path in spec_paths}
+        for name in sorted(set(exported_before) - spec_names):
+            html_path = os.path.join(docs_dir, _page_name(name))
+            result = {"status": "removed", "html": html_path, "error": ""}
+            try:
+                if os.path.exists(html_path):
+                    os.remove(html_path)
+                log(f"Removed {os.path.basename(html_path)} ({name} no longer exists)")
+            except OSError as e:
+                result.update(status="failed", error=str(e), hash=exported_before[name])  # retried next time
+                log(f"FAILED to remove {os.path.basename(html_path)}: {e}")
+            results[os.path.join(oas_dir, name)] = result
+
+        manifest = {"asset": previous_asset, "files": {}}
+        if not spec_paths:
+            log(f"No YAML files to export in {oas_dir}")
+        else:
+            asset_name = self.write_shared_asset(docs_dir)
+            asset_hash = hashlib.sha256(_load_redoc_js(self.js_path).encode("utf-8")).hexdigest()
+            previous = exported_before if previous_asset == asset_hash and not force else {}
+            jobs = [
+                (
+                    path,
+                    os.path.join(docs_dir, _page_name(os.path.basename(path))),
+                    f'<script src="{asset_name}"></script>',
+                    previous.get(os.path.basename(path)),
+                )
+                for path in spec_paths
+            ]
+
+            workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs)))
+            log(f"Exporting documentation for {len(jobs)} files to {docs_dir} with {workers} worker processes...")
+            if workers == 1:
+                outcomes = map(_export_page, jobs)
+            else:
+                pool = ProcessPoolExecutor(max_workers=workers)
+                outcomes = as_completed([pool.submit(_export_page, job) for job in jobs])
+                outcomes = (future.result() for future in outcomes)
+            try:
+                for spec_path, result in outcomes:
+                    name = os.path.basename(spec_path)
+                    if result["status"] == "exported":
+                        log(f"Exported {name} -> {os.path.basename(result['html'])}")
+                    elif result["status"] == "failed":
+                        log(f"FAILED {name}: {result['error']}")
+                    results[spec_path] = result
+            finally:
+                if workers > 1:
+                    pool.shutdown()
+
+            manifest = {
+                "asset": asset_hash,
+                "files": {
+                    os.path.basename(path): result["hash"]
+                    for path, result in results.items()
+                    if result["status"] in ("exported", "unchanged")
+                },
+            }
+
+        manifest["files"].update(
+            (os.path.basename(path), result["hash"])
+            for path, result in results.items()
+            if result["status"] == "failed" and not os.path.exists(path)
+        )
+        for result in results.values():
+            result.pop("hash", None)
+        if os.path.isdir(docs_dir):
+            tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(manifest, f, indent=2)
+                os.replace(tmp_path, manifest_path)
+            except OSError as e:
+                log(f"Warning: Could not write export manifest: {e}")
+        return dict(sorted(results.items()))
+
+    def get_html_content(self, oas_content_yaml, asset_dir=None):
+        """
+        Generates an HTML string with the embedded OAS spec; works completely offline.
+
+        The Redoc JS is inlined (self-contained file) unless asset_dir is given:
+        then it is written once into asset_dir as a shared file the HTML
+        (saved in that same folder) references.
+        """
+        try:
+            if asset_dir is None:
+                redoc_script = _inline_script(_load_redoc_js(self.js_path))
+            else:
+                asset_name = self.write_shared_asset(asset_dir)
+                redoc_script = f'<script src="{asset_name}"></script>'
         except FileNotFoundError:
             return "<html><body><h1>Error: redoc.standalone.js not found</h1></body></html>"
 
-        # Escape closing script tags in YAML to prevent breaking HTML
-        safe_yaml = oas_content_yaml.replace("</script>", "<\\/script>")
-
         # Parse YAML to JSON in Python and embed as JSON
         # This avoids Redoc treating string as file path
-        import yaml
-        import json
-        from datetime import datetime, date
-
-        # Custom encoder to handle datetime objects
-        class DateTimeEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, (datetime, date)):
-                    return obj.isoformat()
-                return super().default(obj)
-
         try:
-            spec_obj = yaml.safe_load(oas_content_yaml)
-            spec_json = json.dumps(spec_obj, cls=DateTimeEncoder)
+            spec_json = spec_to_json(oas_content_yaml)
         except Exception as e:
             return f"<html><body><h1>Error parsing YAML: {e}</h1></body></html>"
 
+        return self._build_html(spec_json, redoc_script)
+
+    def _build_html(self, spec_json, redoc_script):
+        """The documentation page for a spec (as JSON) and the Redoc <script> element."""
+        # Escape closing script tags in the spec to prevent breaking HTML
+        spec_json = spec_json.replace("</", "<\\/")
+
         html_template = f"""<!DOCTYPE html>
 <html>
 <head>
@@ -347,6 +590,13 @@ class RedocGenerator:
             // Keep only the Redoc script
             
             var htmlContent = '<!DOCTYPE html>\\n' + clonedDoc.outerHTML;
+            
+            // A page referencing the shared Redoc asset is saved by the viewer, which
+            // inlines the asset so the saved copy is standalone
+            if (document.querySelector('script[src]') && window.pywebview && window.pywebview.api) {{
+                window.pywebview.api.save_html(htmlContent);
+                return;
+            }}
             var blob = new Blob([htmlContent], {{ type: 'text/html' }});
             var url = URL.createObjectURL(blob);
             var a = document.createElement('a');
@@ -390,9 +640,7 @@ class RedocGenerator:
         }});
     </script>
     
-    <script>
-{js_content}
-    </script>
+    {redoc_script}
     
     <script>
         document.addEventListener('DOMContentLoaded', function() {{
@@ -0,0 +1,105 @@
+"""
+In-memory search over the text shown in the YAML viewer.
+
+The Tk text widget can only search incrementally (one match per call), so
+counting matches in a multi-megabyte spec froze the UI. TextSearchIndex
+keeps the line start offsets of the text and runs one compiled regex per
+query, giving every match at once: exact counts, jumping to the Nth match
+and the matches of a line range (to highlight only the viewport).
+
+Positions are returned as (line, column) with 1-based lines, i.e. what a
+Tk "line.column" index means.
+"""
+
+import bisect
+import re
+
+
+class TextSearchIndex:
+    """Case-insensitive literal search over one text."""
+
+    def __init__(self, text):
+        self.text = text
+        self._line_starts = [0]
+        self._line_starts.extend(match.end() for match in re.finditer("\n", text))
+        self._query = None
+        self._starts = []
+        self._ends = []
+
+    @property
+    def line_count(self):
+        return len(self._line_starts)
+
+    # --- offsets and Tk positions ---
+
+    def position(self, offset):
+        """(line, column) of a character offset."""
+        line = bisect.bisect_right(self._line_starts, offset) - 1
+        return line + 1, offset - self._line_starts[line]
+
+    def index(self, offset):
+        """Tk "line.column" index of a character offset."""
+        line, column = self.position(offset)
+        return f"{line}.{column}"
+
+    def offset(self, line, column=0):
+        """Character offset of a 1-based line and column (clamped to the text)."""
+        line = min(max(int(line), 1), len(self._line_starts))
+        start = self._line_starts[line - 1]
+        end = self._line_starts[line] - 1 if line < len(self._line_starts) else len(self.text)
+        return start + min(max(int(column), 0), end - start)
+
+    def offset_of_index(self, tk_index):
+        """Character offset of a Tk "line.column" index."""
+        line, _, column = str(tk_index).partition(".")
+        return self.offset(int(line), int(column or 0))
+
+    # --- matches ---
+
+    def find_all(self, query):
+        """Start offsets of all matches of query (cached until the query changes)."""
+        if query != self._query:
+            self._query = query
+            self._starts = []
+            self._ends = []
+            if query:
+                for match in re.finditer(re.escape(query), self.text, re.IGNORECASE):
+                    self._starts.append(match.start())
+                    self._ends.append(match.end())
+        return self._starts
+
+    def count(self, query):
+        return len(self.find_all(query))
+
+    def span(self, query, number):
+        """(start, end) offsets of the match at 0-based position number."""
+        self.find_all(query)
+        return self._starts[number], self._ends[number]
+
+    def match_at_or_before(self, query, offset):
+        """0-based number of the last match starting at or before offset, or -1."""
+        return bisect.bisect_right(self.find_all(query), offset) - 1
+
+    def next_match(self, query, offset, backwards=False):
+        """
+        0-based number of the first match starting after offset (or the last
+        starting before it when backwards), wrapping around; None without matches.
+        """
+        starts = self.find_all(query)
+        if not starts:
+            return None
+        if backwards:
+            number = bisect.bisect_left(starts, offset) - 1
+            return number if number >= 0 else len(starts) - 1
+        number = bisect.bisect_right(starts, offset)
+        return number if number < len(starts) else 0
+
+    def matches_in_lines(self, query, first_line, last_line):
+        """range() of the numbers of the matches starting on lines first_line..last_line."""
+        starts = self.find_all(query)
+        low = bisect.bisect_left(starts, self.offset(first_line))
+        if last_line >= len(self._line_starts):
+            high = len(starts)
+        else:
+            high = bisect.bisect_left(starts, self._line_starts[max(int(last_line), 0)])
+        return range(low, max(low, high))
@@ -0,0 +1,402 @@
+"""
+Virtualized issue list for the Validation tab.
+
+Only the cards in view (plus a few above and below) exist as widgets. They
+are recycled while scrolling, so showing, filtering or re-wrapping 10k+
+issues costs the same as showing a screenful. Card heights are estimated
+from the text until a card has been shown, then measured.
+"""
+
+import bisect
+import tkinter as tk
+import tkinter.font as tkfont
+from itertools import accumulate
+
+import customtkinter as ctk
+from customtkinter import ThemeManager
+
+
+SEVERITY_BADGES = {
+    "error": ("#FF4444", "white"),
+    "warning": ("#FFBB33", "black"),
+    "info": ("#33B5E5", "white"),
+}
+CARD_PADDING = 6  # Vertical gap between cards
+
+
+def estimate_card_height(item, wrap_chars, line_height, header_height):
+    """Height of an issue card whose wrapped lines hold about wrap_chars characters."""
+    def text_lines(text):
+        return sum(max(1, -(-len(part) // wrap_chars)) for part in str(text).split("\n"))
+
+    height = header_height + text_lines(item.get("message") or "") * line_height
+    path = item.get("path")
+    if path and path != "Root":
+        height += text_lines(f"Path: {path}") * line_height
+    return height + CARD_PADDING
+
+
+class IssueRowLayout:
+    """
+    Vertical layout of a list of rows with known or estimated heights.
+
+    offset(i) is the top of row i; visible_range() bisects the offsets, so
+    finding the rows of a viewport is O(log n) whatever the list size.
+    """
+
+    def __init__(self, heights=()):
+        self.set_heights(heights)
+
+    def set_heights(self, heights):
+        self._heights = list(heights)
+        self._offsets = None
+
+    def __len__(self):
+        return len(self._heights)
+
+    def _ensure_offsets(self):
+        if self._offsets is None:
+            self._offsets = [0]
+            self._offsets.extend(accumulate(self._heights))
+
+    def height(self, index):
+        return self._heights[index]
+
+    def set_height(self, index, height):
+        """Records the measured height of a row; returns True if it changed."""
+        if self._heights[index] == height:
+            return False
+        self._heights[index] = height
+        self._offsets = None
+        return True
+
+    def offset(self, index):
+        self._ensure_offsets()
+        return self._offsets[index]
+
+    @property
+    def total_height(self):
+        self._ensure_offsets()
+        return self._offsets[-1]
+
+    def index_at(self, y):
+        """Row containing y (clamped to the list)."""
+        self._ensure_offsets()
+        if not self._heights:
+            return 0
+        return min(max(bisect.bisect_right(self._offsets, y) - 1, 0), len(self._heights) - 1)
+
+    def visible_range(self, top, bottom, overscan=0):
+        """range() of the rows intersecting [top, bottom), widened by overscan rows on both sides."""
+        if not self._heights:
+            return range(0)
+        first = max(self.index_at(top) - overscan, 0)
+        last = min(self.index_at(max(bottom - 1, top)) + overscan, len(self._heights) - 1)
+        return range(first, last + 1)
+
+
+class _IssueCard:
+    """One recyclable card; bind() points it at another issue."""
+
+    def __init__(self, owner, font_size):
+        self.owner = owner
+        self.index = None
+        self.frame = ctk.CTkFrame(
+            owner.canvas,
+            border_width=1,
+            border_color="#C0C0C0",
+            fg_color=("#E0E0E0", "#2B2B2B"),
+            corner_radius=6,
+        )
+        self.window = owner.canvas.create_window(0, 0, window=self.frame, anchor="nw", state="hidden")
+
+        small_size = max(8, font_size - 1)
+        header = ctk.CTkFrame(self.frame, fg_color="transparent")
+        header.pack(fill="x", padx=6, pady=6)
+        self.badge = ctk.CTkLabel(
+            header, text="", corner_radius=6, font=("Arial", small_size, "bold"), height=20
+        )
+        self.badge.pack(side="left")
+        self.code = ctk.CTkLabel(
+            header, text="", font=("Arial", max(9, font_size), "bold"), text_color=("#333333", "#F0F0F0")
+        )
+        self.code.pack(side="left", padx=8)
+        self.btn_line = ctk.CTkButton(
+            header,
+            text="",
+            font=("Arial", small_size),
+            fg_color="transparent",
+            text_color=("#666666", "#AAAAAA"),
+            hover_color=("#D0D0D0", "#3A3A3A"),
+            border_width=1,
+            border_color=("#BBBBBB", "#555555"),
+            corner_radius=4,
+            width=60,
+            height=20,
+            command=lambda: owner.goto_line(self.line),
+        )
+        self.btn_line.pack(side="right")
+        self.btn_template = ctk.CTkButton(
+            header,
+            text="Template Sheet",
+            height=20,
+            width=100,
+            fg_color="transparent",
+            border_width=1,
+            border_color="#107C41",
+            text_color="#107C41",
+            hover_color="#E6F2EA",
+            font=("Arial", small_size, "bold"),
+            corner_radius=4,
+            command=lambda: owner.open_template(*self.template),
+        )
+        self.path = ctk.CTkLabel(
+            self.frame,
+            text="",
+            text_color=("#555555", "#AAAAAA"),
+            font=("Consolas", small_size),
+            anchor="w",
+            justify="left",
+        )
+        self.message = ctk.CTkLabel(
+            self.frame,
+            text="",
+            anchor="w",
+            justify="left",
+            font=("Arial", font_size),
+            text_color=("#333333", "#FFFFFF"),
+        )
+        self.message.pack(fill="x", padx=5, pady=(0, 5))
+        self.line = 0
+        self.template = (None, None)
+        self.has_path = False
+        self.has_template = False
+
+        for widget in (self.frame, header, self.badge, self.code, self.path, self.message):
+            owner.bind_scroll(widget)
+
+    def bind(self, index, item, wraplength):
+        self.index = index
+        self.line = item["line"]
+        badge_fg, badge_text = SEVERITY_BADGES.get(item["severity"], ("gray", "white"))
+        self.badge.configure(text=f" {item['severity'].upper()} ", fg_color=badge_fg, text_color=badge_text)
+        self.code.configure(text=item["code"])
+        self.btn_line.configure(text=f"Line {self.line}")
+
+        template = self.owner.template_for(item["path"]) if item["path"] else None
+        if template and template[0]:
+            self.template = template
+            if not self.has_template:
+                self.btn_template.pack(side="right", padx=5, after=self.btn_line)
+                self.has_template = True
+        elif self.has_template:
+            self.btn_template.pack_forget()
+            self.has_template = False
+
+        if item["path"] and item["path"] != "Root":
+            self.path.configure(text=f"Path: {item['path']}", wraplength=wraplength)
+            if not self.has_path:
+                self.path.pack(fill="x", padx=5, pady=2, before=self.message)
+                self.has_path = True
+        elif self.has_path:
+            self.path.pack_forget()
+            self.has_path = False
+
+        self.message.configure(text=item["message"] or "", wraplength=wraplength)
+
+    def destroy(self):
+        self.owner.canvas.delete(self.window)
+        self.frame.destroy()
+
+
+class VirtualIssueList(ctk.CTkFrame):
+    """
+    Titled, scrollable list of validation issue cards.
+
+    goto_line(line): called by a card's "Line N" button
+    open_template(file, sheet): called by a card's "Template Sheet" button
+    """
+
+    OVERSCAN = 3
+
+    def __init__(self, master, goto_line, open_template, label_text="", **kwargs):
+        super().__init__(master, **kwargs)
+        self.goto_line = goto_line
+        self.open_template = open_template
+        self.template_for = lambda path: None
+
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        label_fg = ThemeManager.theme.get("CTkScrollableFrame", {}).get("label_fg_color", ("#D0D0D0", "#3A3A3A"))
+        self.label = ctk.CTkLabel(self, text=label_text, fg_color=label_fg, corner_radius=0)
+        self.label.grid(row=0, column=0, columnspan=2, sticky="ew")
+        self.canvas = tk.Canvas(
+            self, bg=self._apply_appearance_mode(self._fg_color), highlightthickness=0, bd=0, yscrollincrement=20
+        )
+        self.canvas.grid(row=1, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._yview)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        self.items = []
+        self.layout = IssueRowLayout()
+        self._font_size = None
+        self._cards = []  # pool, bound or free
+        self._measured = set()  # rows whose height is measured, not estimated
+        self._message_id = None
+        self._width = 0
+        self._refresh_job = None
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.bind_scroll(self.canvas)
+
+    # --- public API ---
+
+    def set_title(self, text):
+        self.label.configure(text=text)
+
+    def set_issues(self, items, font_size=None, template_for=None):
+        """
+        Shows items (dicts with severity, code, path, line, message) from the top.
+        font_size: None keeps the current one.
+        """
+        self._clear_message()
+        self.items = list(items)
+        self.template_for = template_for or (lambda path: None)
+        if font_size is not None and font_size != self._font_size:
+            # Fonts are fixed at card creation: rebuild the (small) pool
+            for card in self._cards:
+                card.destroy()
+            self._cards = []
+            self._font_size = font_size
+        for card in self._cards:
+            card.index = None
+        self._measured = set()
+        self._estimate_heights()
+        self.canvas.yview_moveto(0)
+        self._refresh()
+
+    def show_message(self, text, text_color="#0A809E", font_size=None):
+        """Replaces the cards by a single centered message."""
+        self.set_issues([])
+        font = ("Arial", font_size) if font_size else None
+        self._message_id = self.canvas.create_text(
+            max(self.canvas.winfo_width(), 1) // 2, 20, text=text, fill=text_color, font=font, anchor="n"
+        )
+
+    def clear(self):
+        self.set_issues([])
+
+    # --- layout ---
+
+    def _wraplength(self):
+        return max(220, self._width - 70) if self._width > 120 else 350
+
+    def _estimate_heights(self):
+        font = tkfont.Font(family="Arial", size=self._font_size or 11)
+        char_width = max(font.measure("abcdefghijklmnopqrstuvwxyz") / 26.0, 1.0)
+        wrap_chars = max(int(self._wraplength() / char_width), 1)
+        line_height = font.metrics("linespace")
+        header_height = 32 + 5
+        self.layout.set_heights(
+            estimate_card_height(item, wrap_chars, line_height, header_height) for item in self.items
+        )
+
+    def _refresh(self, passes=2):
+        """Binds pooled cards to the rows in view, measures new ones and positions them."""
+        self._refresh_job = None
+        canvas_height = max(self.canvas.winfo_height(), 1)
+        self._update_scrollregion()
+        top = self.canvas.canvasy(0)
+        rows = self.layout.visible_range(top, top + canvas_height, self.OVERSCAN)
+
+        free = [card for card in self._cards if card.index not in rows]
+        bound = {card.index: card for card in self._cards if card.index in rows}
+        wraplength = self._wraplength()
+        for index in rows:
+            if index in bound:
+                continue
+            card = free.pop() if free else self._new_card()
+            card.bind(index, self.items[index], wraplength)
+            bound[index] = card
+        for card in free:
+            card.index = None
+            self.canvas.itemconfigure(card.window, state="hidden")
+
+        unmeasured = [card for index, card in bound.items() if index not in self._measured]
+        if unmeasured and passes > 0:
+            self.update_idletasks()
+            anchor = self.layout.index_at(top)
+            anchor_delta = top - self.layout.offset(anchor)
+            changed = False
+            for card in unmeasured:
+                self._measured.add(card.index)
+                changed |= self.layout.set_height(card.index, card.frame.winfo_reqheight() + CARD_PADDING)
+            if changed:
+                # Measured heights move the rows below: keep the top row where it was
+                self._update_scrollregion()
+                total = max(self.layout.total_height, canvas_height)
+                self.canvas.yview_moveto((self.layout.offset(anchor) + anchor_delta) / total)
+                self._refresh(passes - 1)
+                return
+
+        width = max(self.canvas.winfo_width() - 4, 1)
+        for index, card in bound.items():
+            self.canvas.coords(card.window, 2, self.layout.offset(index) + CARD_PADDING // 2)
+            self.canvas.itemconfigure(card.window, width=width, state="normal")
+
+    def _new_card(self):
+        card = _IssueCard(self, self._font_size or 11)
+        self._cards.append(card)
+        return card
+
+    def _update_scrollregion(self):
+        height = max(self.layout.total_height, self.canvas.winfo_height(), 1)
+        self.canvas.configure(scrollregion=(0, 0, max(self.canvas.winfo_width(), 1), height))
+
+    def _clear_message(self):
+        if self._message_id is not None:
+            self.canvas.delete(self._message_id)
+            self._message_id = None
+
+    def _schedule_refresh(self):
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self._refresh)
+
+    # --- events ---
+
+    def _on_configure(self, event):
+        if abs(event.width - self._width) >= 24:
+            # Re-wrap: re-estimate and re-bind the visible cards at the new width
+            self._width = event.width
+            for card in self._cards:
+                card.index = None
+            self._measured = set()
+            self._estimate_heights()
+        if self._message_id is not None:
+            self.canvas.coords(self._message_id, event.width // 2, 20)
+        self._schedule_refresh()
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._schedule_refresh()
+
+    def _on_mousewheel(self, event):
+        if getattr(event, "num", None) == 4:
+            step = -1
+        elif getattr(event, "num", None) == 5:
+            step = 1
+        else:
+            step = int(-1 * (event.delta / 120)) or (-1 if event.delta > 0 else 1)
+        if self.layout.total_height > self.canvas.winfo_height():
+            self.canvas.yview_scroll(step * 2, "units")
+            self._schedule_refresh()
+        return "break"
+
+    def bind_scroll(self, widget):
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_mousewheel)
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self.canvas.configure(bg=self._apply_appearance_mode(self._fg_color))
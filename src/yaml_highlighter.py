@@ -0,0 +1,223 @@
+"""
+Viewport-lazy syntax highlighting for the YAML viewer.
+
+CodeView.highlight_all() lexes the whole text and adds one Tk tag range per
+token on the UI thread, which froze the viewer for seconds on large specs.
+Here the text is tokenised once (in a background thread for large texts)
+into TokenSpans, a compact line -> (start column, end column, token) table,
+and LazyHighlighter only adds the tags of the blocks of lines around the
+viewport, as the user scrolls. Per-line marker tags (validation issues) are
+applied the same way.
+"""
+
+import threading
+from array import array
+from collections import defaultdict
+
+from chlorophyll import CodeView
+
+
+UNTAGGED_TOKENS = {"Token.Text", "Token.Text.Whitespace"}  # as CodeView.highlight_all
+BLOCK_LINES = 200  # tags are added per block of lines
+MARGIN_LINES = 200  # lines above and below the viewport highlighted ahead of scrolling
+SYNC_TOKENIZE_CHARS = 20000  # smaller texts are tokenised on the UI thread
+
+
+class TokenSpans:
+    """Token spans of a text, per line, in flat integer arrays."""
+
+    def __init__(self, names, line_starts, spans):
+        self.names = names  # token id -> tag name ("Token.Name.Tag")
+        self._line_starts = line_starts  # line i (0-based) owns spans[line_starts[i]:line_starts[i + 1]]
+        self._spans = spans  # (start column, end column, token id) triples, flattened
+
+    @property
+    def line_count(self):
+        return len(self._line_starts) - 1
+
+    def line_spans(self, line):
+        """(start column, end column, tag name) of the tokens of a 1-based line."""
+        if not 1 <= line <= self.line_count:
+            return
+        spans = self._spans
+        names = self.names
+        for i in range(self._line_starts[line - 1] * 3, self._line_starts[line] * 3, 3):
+            yield spans[i], spans[i + 1], names[spans[i + 2]]
+
+
+def tokenize_lines(text, lexer):
+    """TokenSpans of text; tokens spanning several lines are split per line."""
+    names = []
+    token_ids = {}
+    line_starts = array("l", [0])
+    spans = array("l")
+    column = 0
+    for _, token_type, value in lexer.get_tokens_unprocessed(text):
+        name = str(token_type)
+        token_id = None
+        if name not in UNTAGGED_TOKENS:
+            token_id = token_ids.get(name)
+            if token_id is None:
+                token_id = token_ids[name] = len(names)
+                names.append(name)
+        for number, part in enumerate(value.split("\n")):
+            if number:
+                line_starts.append(len(spans) // 3)
+                column = 0
+            if part and token_id is not None:
+                spans.extend((column, column + len(part), token_id))
+            column += len(part)
+    line_starts.append(len(spans) // 3)
+    return TokenSpans(names, line_starts, spans)
+
+
+class LazyHighlighter:
+    """Adds token and line tags to a Tk text widget only around its viewport."""
+
+    def __init__(self, widget, block_lines=BLOCK_LINES, margin_lines=MARGIN_LINES):
+        self.widget = widget
+        self.block_lines = block_lines
+        self.margin_lines = margin_lines
+        self.lexer = None
+        self.spans = None
+        self._generation = 0
+        self._reload_job = None
+        self._token_blocks = set()  # blocks whose token tags are applied
+        self._line_tags = {}  # block -> {tag: [lines]}
+        self._marker_blocks = set()  # blocks whose line tags are applied
+        self._marker_tags = set()
+
+    # --- tokens ---
+
+    def load(self, text, lexer):
+        """Tokenise text (in a background thread when large) and tag the viewport once done."""
+        self._cancel_reload()
+        self._generation += 1
+        generation = self._generation
+        self.lexer = lexer
+        if len(text) <= SYNC_TOKENIZE_CHARS:
+            self._on_tokenized(generation, tokenize_lines(text, lexer))
+            return
+
+        def worker():
+            spans = tokenize_lines(text, lexer)
+            try:
+                self.widget.after(0, self._on_tokenized, generation, spans)
+            except Exception:
+                pass  # widget destroyed meanwhile
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_tokenized(self, generation, spans):
+        if generation != self._generation:
+            return  # a newer text was loaded meanwhile
+        self.spans = spans
+        self.rehighlight()
+
+    def schedule_reload(self, delay=300):
+        """Re-tokenise the widget's text after an edit (debounced)."""
+        self._cancel_reload()
+        self._reload_job = self.widget.after(delay, self._reload)
+
+    def _reload(self):
+        self._reload_job = None
+        self.load(self.widget.get("1.0", "end-1c"), self.lexer)
+
+    def _cancel_reload(self):
+        if self._reload_job is not None:
+            try:
+                self.widget.after_cancel(self._reload_job)
+            except Exception:
+                pass
+            self._reload_job = None
+
+    def rehighlight(self):
+        """Drop all token tags and re-tag the viewport (e.g. after a colour scheme change)."""
+        for tag in self.widget.tag_names():
+            if str(tag).startswith("Token"):
+                self.widget.tag_remove(tag, "1.0", "end")
+        self._token_blocks.clear()
+        self.refresh()
+
+    # --- line tags ---
+
+    def set_line_tags(self, line_tags):
+        """Replace the line tags ({1-based line: tag}); applied lazily like the tokens."""
+        for tag in self._marker_tags:
+            self.widget.tag_remove(tag, "1.0", "end")
+        self._line_tags = {}
+        for line, tag in line_tags.items():
+            lines = self._line_tags.setdefault((int(line) - 1) // self.block_lines, {})
+            lines.setdefault(tag, []).append(int(line))
+        self._marker_tags = set(line_tags.values())
+        self._marker_blocks.clear()
+        self.refresh()
+
+    # --- viewport ---
+
+    def visible_lines(self):
+        """(first, last) 1-based lines shown in the widget."""
+        first = int(str(self.widget.index("@0,0")).split(".")[0])
+        last = int(str(self.widget.index(f"@0,{self.widget.winfo_height()}")).split(".")[0])
+        return first, last
+
+    def blocks_around(self, first, last):
+        """Blocks covering lines first..last plus the margin."""
+        low = max(first - self.margin_lines, 1)
+        high = last + self.margin_lines
+        return range((low - 1) // self.block_lines, (high - 1) // self.block_lines + 1)
+
+    def refresh(self):
+        """Tag the not yet tagged blocks around the viewport."""
+        line_count = int(str(self.widget.index("end-1c")).split(".")[0])
+        first, last = self.visible_lines()
+        for block in self.blocks_around(first, min(last, line_count)):
+            if block * self.block_lines >= line_count:
+                break
+            if self.spans is not None and block not in self._token_blocks:
+                self._tag_tokens(block)
+            if block in self._line_tags and block not in self._marker_blocks:
+                self._tag_lines(block, line_count)
+
+    def _tag_tokens(self, block):
+        ranges = defaultdict(list)
+        first = block * self.block_lines + 1
+        for line in range(first, min(first + self.block_lines, self.spans.line_count + 1)):
+            for start, end, name in self.spans.line_spans(line):
+                ranges[name].extend((f"{line}.{start}", f"{line}.{end}"))
+        for name, indexes in ranges.items():
+            self.widget.tag_add(name, *indexes)
+        self._token_blocks.add(block)
+
+    def _tag_lines(self, block, line_count):
+        for tag, lines in self._line_tags[block].items():
+            indexes = []
+            for line in lines:
+                if line <= line_count:
+                    # +1c includes the newline so the whole line is coloured
+                    indexes.extend((f"{line}.0", f"{line}.end+1c"))
+            if indexes:
+                self.widget.tag_add(tag, *indexes)
+        self._marker_blocks.add(block)
+
+
+class LazyCodeView(CodeView):
+    """CodeView whose full-text highlighting is viewport-lazy (see LazyHighlighter)."""
+
+    def __init__(self, *args, **kwargs):
+        # CodeView.__init__ already highlights (lexer and colour scheme setup)
+        self.highlighter = LazyHighlighter(self)
+        super().__init__(*args, **kwargs)
+
+    def highlight_all(self):
+        if self.highlighter.lexer is self._lexer:
+            self.highlighter.rehighlight()
+        else:
+            self.highlighter.load(self.get("1.0", "end-1c"), self._lexer)
+
+    def _cmd_proxy(self, command, *args):
+        result = super()._cmd_proxy(command, *args)
+        if command in {"insert", "delete", "replace"}:
+            # CodeView re-highlights the edited lines; the span table must follow
+            self.highlighter.schedule_reload()
+        return result
@@ -0,0 +1,170 @@
+"""
+Structural indexes of the OAS shown in the YAML viewer.
+
+Syncing the editor with the docs viewer used to re-read the whole text
+widget and regex-scan it line by line, and resolving the template of an
+issue probed the source map once per parent path string. These indexes are
+built once per loaded file (or source map) instead:
+
+- YamlStructureIndex: line -> JSON path, JSON path -> line range and
+  operationId (and summary) -> line, from one YAML parse (native_linter.load_with_lines).
+- SourceMapIndex: the generator's source map ("paths./pets.get" keys) as a
+  trie, resolving the closest mapped ancestor of a path in one walk.
+
+Lines are 1-based (Tk text line numbers); JSON paths are tuples of strings.
+"""
+
+import bisect
+
+try:
+    from . import native_linter
+    from .native_linter import HTTP_METHODS
+except ImportError:
+    import native_linter
+    from native_linter import HTTP_METHODS
+
+
+OPERATION_SECTIONS = ("paths", "webhooks")
+
+
+def json_pointer_path(pointer):
+    """JSON path of a JSON pointer / URL hash ("#/paths/~1pets/get" -> ("paths", "/pets", "get"))."""
+    pointer = str(pointer or "").lstrip("#").strip("/")
+    if not pointer:
+        return ()
+    return tuple(part.replace("~1", "/").replace("~0", "~") for part in pointer.split("/"))
+
+
+class YamlStructureIndex:
+    """Where each JSON path and operation of one YAML text is."""
+
+    def __init__(self, text):
+        self.text = text
+        try:
+            document, positions = native_linter.load_with_lines(text)
+        except Exception:
+            document, positions = None, {}  # unparsable text: empty index
+        line_count = text.count("\n") + 1
+
+        entries = sorted(
+            ((line + 1, column, path) for path, (line, column) in positions.items() if path),
+            key=lambda entry: (entry[0], entry[1], len(entry[2])),
+        )
+        self._starts = [line for line, _, _ in entries]
+        self._paths = [path for _, _, path in entries]
+        self._ranges = {}
+
+        # A path ends where the next path that is not its descendant starts
+        open_paths = []
+        for line, _, path in entries:
+            while open_paths and path[: len(open_paths[-1])] != open_paths[-1]:
+                closed = open_paths.pop()
+                start = self._ranges[closed][0]
+                self._ranges[closed] = (start, max(start, line - 1))
+            self._ranges[path] = (line, line_count)
+            open_paths.append(path)
+
+        self.operation_ids = {}  # operationId -> line of its key
+        self.summaries = {}  # operation summary -> line of its key
+        self._operation_of = {}  # operation path ("paths", url, method) -> operationId
+        operations = []
+        for section in OPERATION_SECTIONS:
+            items = document.get(section) if isinstance(document, dict) else None
+            if not isinstance(items, dict):
+                continue
+            for url, item in items.items():
+                if not isinstance(item, dict):
+                    continue
+                for method, operation in item.items():
+                    if method not in HTTP_METHODS or not isinstance(operation, dict):
+                        continue
+                    operation_id = operation.get("operationId")
+                    path = (section, str(url), method)
+                    summary_line = self.line_of(path + ("summary",))
+                    if isinstance(operation.get("summary"), str) and summary_line is not None:
+                        self.summaries.setdefault(operation["summary"], summary_line)
+                    line = self.line_of(path + ("operationId",))
+                    if isinstance(operation_id, str) and line is not None:
+                        self.operation_ids.setdefault(operation_id, line)
+                        self._operation_of[path] = operation_id
+                        operations.append((line, operation_id))
+        operations.sort()
+        self._operation_lines = [line for line, _ in operations]
+        self._operation_names = [name for _, name in operations]
+
+    def __len__(self):
+        return len(self._paths)
+
+    def line_of(self, path):
+        """First line of a JSON path, or None."""
+        line_range = self._ranges.get(tuple(path))
+        return line_range[0] if line_range else None
+
+    def closest_line(self, path):
+        """First line of the deepest indexed ancestor-or-self of a JSON path, or None."""
+        path = tuple(path)
+        while path:
+            if path in self._ranges:
+                return self._ranges[path][0]
+            path = path[:-1]
+        return None
+
+    def range_of(self, path):
+        """(first, last) lines of a JSON path (its key and value), or None."""
+        return self._ranges.get(tuple(path))
+
+    def path_at(self, line):
+        """Deepest JSON path whose range contains line (() outside of any)."""
+        position = bisect.bisect_right(self._starts, line) - 1
+        if position < 0:
+            return ()
+        path = self._paths[position]
+        while path and self._ranges[path][1] < line:
+            path = path[:-1]
+        return path
+
+    def operation_at(self, line):
+        """(operationId, line) of the operation containing line, or None."""
+        path = self.path_at(line)
+        operation_id = self._operation_of.get(path[:3])
+        if operation_id is None:
+            return None
+        return operation_id, self.operation_ids[operation_id]
+
+    def next_operation(self, line):
+        """(operationId, line) of the first operationId at or after line, or None."""
+        position = bisect.bisect_left(self._operation_lines, line)
+        if position >= len(self._operation_lines):
+            return None
+        return self._operation_names[position], self._operation_lines[position]
+
+
+class SourceMapIndex:
+    """Template source ({"file", "sheet"}) lookup over a generator source map."""
+
+    def __init__(self, source_map):
+        self.source_map = source_map
+        self._root = {}  # segment -> child node; the node's source is under None
+        for key, source in (source_map or {}).items():
+            node = self._root
+            for segment in str(key).split("."):
+                node = node.setdefault(segment, {})
+            node[None] = source
+
+    def resolve(self, json_path):
+        """
+        Source of the closest mapped ancestor-or-self of a linter path
+        ("paths > /pets > get > responses"), or None.
+        """
+        if not json_path:
+            return None
+        # Linter paths use " > ", the map uses "."
+        clean_path = str(json_path).replace(" > ", ".").replace("Root.", "")
+        node = self._root
+        found = None
+        for segment in clean_path.split("."):
+            node = node.get(segment)
+            if node is None:
+                break
+            found = node.get(None, found)
+        return found
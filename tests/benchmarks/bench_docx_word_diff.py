@@ -0,0 +1,137 @@
+"""
+Benchmark: DOCX report rendering on a description-heavy OAS diff.
+
+Builds two synthetic specs where every property description changes and most
+of them share the same validation-rule text (the common case in our templates),
+then times the Analytical, Impact and Interface Compatibility reports.
+
+Usage:
+    python tests/benchmarks/bench_docx_word_diff.py [--endpoints 60] [--properties 25]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+from docx import Document
+
+from src.oas_diff.generators import diff_segments
+from src.oas_diff.generators.analytic_generator import AnalyticDocxGenerator
+from src.oas_diff.report_manager import OASDiffReportManager
+
+SHARED_RULES = [
+    "It must be present in Routing Repositories (errorCode PY01)",
+    "It must be a valid BIC (errorCode FF01)",
+    "It must match the sender of the request (errorCode PY02)",
+]
+
+
+BODY = (
+    "Identifier of the participant on whose behalf the operation is submitted. "
+    "The value is checked against the participant directory valid on the business day "
+    "of the request and must refer to an active, reachable participant of the service. "
+    "When the participant acts through an indirect connection the identifier of the "
+    "direct participant is used for routing and liquidity checks."
+)
+
+
+def _description(prop, version):
+    rule = SHARED_RULES[prop % len(SHARED_RULES)]
+    if version == "old":
+        return f"{BODY}\n\n**Validation Rule(s)**\n- {rule}\n- It must be unique in the request"
+    return (
+        f"{BODY.replace('active, reachable', 'active and reachable')} "
+        "Participants suspended during the day are rejected.\n\n"
+        f"**Validation Rule(s)**\n- {rule}. Otherwise the request is rejected\n"
+        "- It must be unique in the request (errorCode DU01)"
+    )
+
+
+def build_spec(version, endpoints, properties):
+    schemas = {}
+    paths = {}
+    for e in range(endpoints):
+        name = f"Payload{e}"
+        schemas[name] = {
+            "type": "object",
+            "properties": {
+                f"field{p}": {"type": "string", "description": _description(p, version)}
+                for p in range(properties)
+            },
+        }
+        paths[f"/resource{e}"] = {
+            "post": {
+                "operationId": f"op{e}",
+                "requestBody": {
+                    "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/{name}"}}}
+                },
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/{name}"}}},
+                    }
+                },
+            }
+        }
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Benchmark", "version": "1.0.0" if version == "old" else "1.1.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--endpoints", type=int, default=60)
+    parser.add_argument("--properties", type=int, default=25)
+    args = parser.parse_args()
+
+    import yaml
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path = Path(tmp) / "old.yaml"
+        new_path = Path(tmp) / "new.yaml"
+        old_path.write_text(yaml.safe_dump(build_spec("old", args.endpoints, args.properties)), encoding="utf-8")
+        new_path.write_text(yaml.safe_dump(build_spec("new", args.endpoints, args.properties)), encoding="utf-8")
+
+        manager = OASDiffReportManager(str(old_path), str(new_path), str(Path(tmp) / "out"))
+        manager.run_comparison()
+
+        diff_segments.clear_diff_cache()
+        started = time.perf_counter()
+        manager.generate_reports(["analytical", "impact", "compatibility"], parallel=False)
+        total = time.perf_counter() - started
+
+    print(f"\nChanged descriptions: {args.endpoints * args.properties}")
+    for report_type, seconds in manager.report_timings.items():
+        print(f"  {report_type:<14} {seconds:7.2f}s")
+    print(f"  {'total':<14} {total:7.2f}s")
+    for name, info in diff_segments.diff_cache_info().items():
+        print(f"  {name} diff cache: {info.hits} hits / {info.misses} misses")
+
+    # Rich-diff rendering alone: every description pair rendered into fresh runs,
+    # once with the cache emptied before each pair and once with a shared cache.
+    pairs = [
+        (_description(p, "old"), _description(p, "new"))
+        for _ in range(args.endpoints)
+        for p in range(args.properties)
+    ]
+    generator = AnalyticDocxGenerator(manager.spec1, manager.spec2, manager.diff)
+    for label, clear_each in (("uncached", True), ("cached", False)):
+        diff_segments.clear_diff_cache()
+        doc = Document()
+        started = time.perf_counter()
+        for old_text, new_text in pairs:
+            if clear_each:
+                diff_segments.clear_diff_cache()
+            generator._render_rich_diff(doc.add_paragraph(), doc.add_paragraph(), old_text, new_text)
+            generator._render_rich_diff_inline(doc.add_paragraph(), old_text, new_text)
+        print(f"  rich diff rendering ({label}): {time.perf_counter() - started:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
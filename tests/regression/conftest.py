@@ -0,0 +1,73 @@
+"""
+Shared fixtures for the regression tests.
+"""
+
+import json
+import stat
+import sys
+import textwrap
+
+import pytest
+
+
+# Stand-in for `spectral lint <file> --ruleset <ruleset> -f json --output <out>`
+# (and `spectral --version`): reports one warning per file (an error for
+# "broken" files) and records the file, ruleset and run window of each run.
+FAKE_SPECTRAL = textwrap.dedent(
+    """\
+    #!{python}
+    import json, sys, time
+    if sys.argv[1] == "--version":
+        print(open({version!r}).read())
+        sys.exit(0)
+    file_path, ruleset, out = sys.argv[2], sys.argv[4], sys.argv[8]
+    start = time.time()
+    time.sleep({delay!r})
+    with open({runs!r}, "a") as log:
+        log.write(json.dumps([file_path, ruleset, open(ruleset).read(), start, time.time()]) + "\\n")
+    issues = [{{"code": "info-contact", "message": "Missing contact", "path": ["info"],
+               "severity": 1, "source": file_path, "range": {{"start": {{"line": 1}}}}}}]
+    if "broken" in file_path:
+        issues[0]["severity"] = 0
+    with open(out, "w") as f:
+        json.dump(issues, f)
+    """
+)
+
+
+class FakeSpectral:
+    """An executable fake linter in a directory, with its engine version file and run log."""
+
+    def __init__(self, directory, delay=0.0):
+        self.version = directory / "version.txt"
+        self.version.write_text("6.11.0")
+        self.log = directory / "runs.jsonl"
+        self.log.write_text("")
+        script = directory / "fake-spectral"
+        script.write_text(
+            FAKE_SPECTRAL.format(python=sys.executable, version=str(self.version), runs=str(self.log), delay=delay)
+        )
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        self.cmd = str(script)
+
+    def runs(self):
+        """[file, ruleset path, ruleset text, start, end] of each lint run so far."""
+        return [json.loads(line) for line in self.log.read_text().splitlines()]
+
+
+@pytest.fixture
+def write_spec(tmp_path):
+    """Returns a function writing spec text to tmp_path/name and returning the path."""
+
+    def _write(text="openapi: 3.0.3\n", name="source.yaml"):
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    return _write
+
+
+@pytest.fixture
+def fake_spectral(tmp_path):
+    """Returns a factory of FakeSpectral linters in tmp_path (delay: seconds per run)."""
+    return lambda delay=0.0: FakeSpectral(tmp_path, delay)
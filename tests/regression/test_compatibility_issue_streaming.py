@@ -0,0 +1,60 @@
+import csv
+import json
+
+from src.oas_diff.compatibility_analyzer import CompatibilityAnalyzer
+from src.oas_diff.issue_sink import ISSUE_FIELDS, write_issues
+
+
+def _op(param_type, description):
+    return {
+        "parameters": [
+            {"name": "limit", "in": "query", "description": description, "schema": {"type": param_type}}
+        ],
+        "responses": {},
+    }
+
+
+OLD = {
+    "/a": {"get": _op("integer", "Page size."), "delete": _op("integer", "x")},
+    "/b": {"get": _op("string", "Same.")},
+    "/gone": {"get": _op("string", "Old.")},
+}
+NEW = {
+    "/a": {"get": _op("string", "Maximum page size.")},
+    "/b": {"get": _op("string", "Same.")},
+    "/fresh": {"post": _op("string", "New.")},
+}
+
+
+def test_iter_issues_matches_analyze_and_yields_lazily():
+    expected = CompatibilityAnalyzer(OLD, NEW).analyze()
+
+    iterator = CompatibilityAnalyzer(OLD, NEW).iter_issues()
+    first = next(iterator)
+    streamed = [first] + list(iterator)
+
+    assert streamed == expected
+    assert first.path == "/gone"
+    assert {(i.path, i.method, i.issue_type) for i in expected} >= {
+        ("/a", "GET", "Constraint Mismatch"),
+        ("/a", "GET", "Description Change"),
+        ("/a", "DELETE", "Removed"),
+        ("/fresh", "POST", "Added"),
+    }
+
+
+def test_write_issues_streams_jsonl_and_csv(tmp_path):
+    issues = CompatibilityAnalyzer(OLD, NEW).analyze()
+
+    jsonl_path = tmp_path / "issues.jsonl"
+    count = write_issues(CompatibilityAnalyzer(OLD, NEW).iter_issues(), str(jsonl_path))
+    records = [json.loads(line) for line in jsonl_path.read_text(encoding="utf-8").splitlines()]
+    assert count == len(records) == len(issues)
+    assert list(records[0].keys()) == ISSUE_FIELDS
+
+    csv_path = tmp_path / "issues.csv"
+    count = write_issues(iter(issues), str(csv_path), include_descriptions=False)
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert count == len(rows) == len([i for i in issues if i.issue_type != "Description Change"])
+    assert all(row["issue_type"] != "Description Change" for row in rows)
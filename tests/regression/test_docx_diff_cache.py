@@ -0,0 +1,66 @@
+from docx import Document
+
+from src.oas_diff.comparator import DiffResult
+from src.oas_diff.generators import diff_segments
+from src.oas_diff.generators.analytic_generator import AnalyticDocxGenerator
+from src.oas_diff.generators.compatibility_generator import CompatibilityDocxGenerator
+from src.oas_diff.generators.impact_generator import ImpactDocxGenerator
+
+
+OLD = "Identifier of the participant.\n\n**Validation Rule(s)**\n- It must be a valid BIC"
+NEW = "Identifier of the sending participant.\n\n**Validation Rule(s)**\n- It must be a valid BIC (errorCode FF01)\n- New rule"
+
+
+def _xml(paragraph):
+    return "".join(el.xml for el in paragraph._p)
+
+
+def _render_twice(method, owner, paragraph_count, *texts):
+    """Renders texts with the undecorated method and twice through the run cache."""
+    doc = Document()
+    reference = [doc.add_paragraph() for _ in range(paragraph_count)]
+    method.__wrapped__(owner, *reference, *texts)
+
+    outputs = []
+    for _ in range(2):
+        paragraphs = [doc.add_paragraph() for _ in range(paragraph_count)]
+        method(owner, *paragraphs, *texts)
+        outputs.append([_xml(p) for p in paragraphs])
+    return [_xml(p) for p in reference], outputs
+
+
+def test_cached_rich_diff_runs_match_uncached_rendering():
+    diff_segments.clear_diff_cache()
+    analytic = AnalyticDocxGenerator({}, {}, DiffResult())
+    impact = ImpactDocxGenerator({}, {}, DiffResult())
+    compatibility = CompatibilityDocxGenerator([], "old.yaml", "new.yaml")
+
+    cases = [
+        (AnalyticDocxGenerator._render_rich_diff, analytic, 2),
+        (AnalyticDocxGenerator._render_rich_diff_inline, analytic, 1),
+        (ImpactDocxGenerator._render_rich_diff_inline, impact, 1),
+        (CompatibilityDocxGenerator._render_rich_diff, compatibility, 2),
+    ]
+    for method, owner, paragraph_count in cases:
+        reference, (first, second) = _render_twice(method, owner, paragraph_count, OLD, NEW)
+        assert first == reference
+        assert second == reference
+        assert any("w:shd" in xml for xml in reference)
+
+    info = diff_segments.diff_cache_info()["runs"]
+    assert info.misses == 4
+    assert info.hits == 4
+
+
+def test_run_cache_key_distinguishes_value_types():
+    diff_segments.clear_diff_cache()
+    analytic = AnalyticDocxGenerator({}, {}, DiffResult())
+    doc = Document()
+
+    p1, p2 = doc.add_paragraph(), doc.add_paragraph()
+    analytic._render_rich_diff(p1, p2, 1, 2)
+    p3, p4 = doc.add_paragraph(), doc.add_paragraph()
+    analytic._render_rich_diff(p3, p4, True, 2)
+
+    assert "True" in _xml(p3)
+    assert diff_segments.diff_cache_info()["runs"].hits == 0
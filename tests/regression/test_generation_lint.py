@@ -0,0 +1,72 @@
+import os
+import sys
+from collections import OrderedDict
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src import main as main_script
+from src.generator import OASGenerator
+from src.generator_pkg.yaml_output import RawNumericValue
+from src.linter import OASLinter
+from src.native_linter import load_with_lines
+
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "..", "Converted Templates")
+
+
+def _document():
+    return OrderedDict(
+        openapi="3.0.3",
+        info={"title": "Lines", "version": "1", "description": "multi\nline\ntext"},
+        paths={
+            "/a": {
+                "get": {
+                    "operationId": "a",
+                    "__RAW_EXTENSIONS__": "x-one: 1\nx-two: |\n  first\n\n  second",
+                    "responses": {"200": {"description": "OK"}},
+                },
+                "post": {
+                    "parameters": [{"name": "q", "in": "query"}, {"name": "r", "in": "query"}],
+                    "__RAW_EXTENSIONS__": "x-three: true",
+                    "responses": {},
+                },
+            }
+        },
+        components={"schemas": {"S": {"type": "number", "enum": [RawNumericValue("1.00"), RawNumericValue("2")]}}},
+    )
+
+
+def test_emission_line_index_matches_a_reparse():
+    generator = OASGenerator(version="3.0.0")
+    line_index = {}
+
+    text = generator.render_yaml(_document(), line_index=line_index)
+    _, parsed_index = load_with_lines(text)
+
+    assert text == generator.render_yaml(_document())
+    assert {path: line for path, (line, _) in line_index.items()} == {
+        path: line for path, (line, _) in parsed_index.items()
+    }
+    assert line_index[("paths", "/a", "post", "x-three")][0] == text.split("\n").index("      x-three: true")
+
+
+def test_generated_files_are_linted_in_memory(tmp_path):
+    logs = []
+    linter = OASLinter("native", engine="native")
+
+    results = main_script.generate_oas(
+        TEMPLATES_DIR, gen_30=True, gen_31=True, output_dir=str(tmp_path), log_callback=logs.append, linter=linter
+    )
+
+    assert len(results) == 2
+    for path, result in results.items():
+        from_disk = OASLinter("native", engine="native").run_lint(path)
+        assert result["details"] == from_disk["details"]
+        assert result["raw_data"][0]["source"] == os.path.abspath(path)
+        summary_line = next(line for line in logs if line.startswith(f"Lint {os.path.basename(path)}:"))
+        # Issues are logged right after the file is written
+        assert logs.index(summary_line) == logs.index(f"Writing OAS {'3.0' if '3.0' in path else '3.1'} to: {path}") + 1
+
+    assert main_script.generate_oas(TEMPLATES_DIR, gen_31=False, output_dir=str(tmp_path), log_callback=logs.append) == {}
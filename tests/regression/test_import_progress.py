@@ -0,0 +1,113 @@
+import io
+import json
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.oas_importer.import_progress import ImportProgress, json_lines_listener
+from src.oas_importer.oas_converter import OASToExcelConverter
+
+
+SPEC = """openapi: 3.0.3
+info:
+  title: Progress API
+  version: 1.0.0
+paths:
+  /accounts:
+    get:
+      operationId: listAccounts
+      responses:
+        '200':
+          description: Accounts
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/Account'
+    post:
+      operationId: createAccount
+      requestBody:
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/Account'
+      responses:
+        '201':
+          description: Created
+  /accounts/{accountId}:
+    delete:
+      operationId: deleteAccount
+      responses:
+        '204':
+          description: Deleted
+components:
+  schemas:
+    Account:
+      type: object
+      properties:
+        id: {type: string}
+        balance: {type: number}
+"""
+
+
+def _summary(events):
+    return [(e.event, e.phase, e.operations_done) for e in events]
+
+
+def test_stream_import_reports_phases_files_and_rows(tmp_path, write_spec):
+    events = []
+    converter = OASToExcelConverter(write_spec(SPEC), streaming=True,
+                                    progress=ImportProgress(events.append))
+    index_path, files = converter.stream_import(str(tmp_path / "out"))
+
+    assert _summary(events) == [
+        ("phase_start", "parse", 0), ("phase_end", "parse", 0),
+        ("phase_start", "index_write", 0), ("phase_end", "index_write", 0),
+        ("phase_start", "endpoint_writes", 0),
+        ("file", "endpoint_writes", 1), ("file", "endpoint_writes", 2), ("file", "endpoint_writes", 3),
+        ("phase_end", "endpoint_writes", 3),
+        ("phase_start", "index_write", 3), ("file", "index_write", 3), ("phase_end", "index_write", 3),
+        ("done", None, 3),
+    ]
+    done = events[-1]
+    assert done.operations_total == 3
+    assert done.bytes_written == sum(os.path.getsize(f) for f in files + [index_path])
+    # Schemas sheet (Account + 2 properties) plus the response and body rows
+    assert done.rows_flattened == converter.progress.rows_flattened > 3
+    assert set(done.phase_seconds) == {"parse", "flatten", "index_write", "endpoint_writes"}
+    assert [e.path for e in events if e.event == "file"][:3] == files
+
+
+def test_parallel_export_counts_worker_rows(tmp_path, write_spec):
+    src_path = write_spec(SPEC)
+    serial = OASToExcelConverter(src_path)
+    serial.generate_all_endpoint_files(str(tmp_path / "serial"))
+
+    parallel = OASToExcelConverter(src_path)
+    parallel.generate_all_endpoint_files(str(tmp_path / "parallel"), max_workers=2)
+
+    assert parallel.progress.operations_done == serial.progress.operations_done == 3
+    assert parallel.progress.rows_flattened == serial.progress.rows_flattened > 0
+    assert parallel.progress.bytes_written == serial.progress.bytes_written
+
+
+def test_eta_and_json_lines():
+    now = [0.0]
+    stream = io.StringIO()
+    progress = ImportProgress(json_lines_listener(stream), clock=lambda: now[0])
+    progress.operations_total = 4
+
+    with progress.phase("endpoint_writes"):
+        now[0] = 2.0
+        progress.file_written("missing.xlsx")
+        assert progress.eta() == 6.0
+    assert progress.eta() is None
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["event"] for line in lines] == ["phase_start", "file", "phase_end"]
+    assert lines[1]["eta"] == 6.0 and lines[1]["path"] == "missing.xlsx"
+    assert lines[2]["phase_seconds"] == {"endpoint_writes": 2.0}
@@ -0,0 +1,68 @@
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.lint_cache import CACHE_FILE_SUFFIX
+from src.linter import OASLinter
+
+
+def test_identical_content_is_linted_once(tmp_path, monkeypatch, fake_spectral, write_spec):
+    monkeypatch.chdir(tmp_path)
+    spectral = fake_spectral()
+    cmd = spectral.cmd
+    cache_dir = tmp_path / "cache"
+    spec = write_spec(name="api.yaml")
+    copy = write_spec(name="copy.yaml")
+
+    first = OASLinter(cmd, cache_dir=cache_dir).run_lint(spec)
+    # New session, rewritten file (new mtime, same bytes) and a copy under another name
+    spec = write_spec(name="api.yaml")
+    again = OASLinter(cmd, cache_dir=cache_dir).run_lint(spec)
+    other = OASLinter(cmd, cache_dir=cache_dir).run_lint(copy)
+
+    assert [run[0] for run in spectral.runs()] == [spec]
+    assert again["cached"] and other["cached"]
+    assert again["details"] == first["details"]
+    assert other["raw_data"][0]["source"] == os.path.abspath(copy)
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_content_engine_version_and_ruleset_are_part_of_the_key(tmp_path, monkeypatch, fake_spectral, write_spec):
+    monkeypatch.chdir(tmp_path)
+    spectral = fake_spectral()
+    cmd = spectral.cmd
+    cache_dir = tmp_path / "cache"
+    spec = write_spec(name="api.yaml")
+
+    OASLinter(cmd, cache_dir=cache_dir).run_lint(spec)
+    write_spec("openapi: 3.1.0\n", name="api.yaml")
+    OASLinter(cmd, cache_dir=cache_dir).run_lint(spec)
+    spectral.version.write_text("6.12.0")
+    OASLinter(cmd, cache_dir=cache_dir).run_lint(spec)
+    (tmp_path / ".spectral.yaml").write_text("extends: [[spectral:oas, recommended]]\n")
+    OASLinter(cmd, cache_dir=cache_dir).run_lint(spec)
+
+    assert len(spectral.runs()) == 4
+    assert len([n for n in os.listdir(cache_dir) if n.endswith(CACHE_FILE_SUFFIX)]) == 4
+
+    OASLinter(cmd, cache_dir=cache_dir).clear_cache()
+    assert os.listdir(cache_dir) == []
+
+
+def test_unknown_engine_version_disables_the_cache(tmp_path, monkeypatch, fake_spectral, write_spec):
+    monkeypatch.chdir(tmp_path)
+    spectral = fake_spectral()
+    cmd = spectral.cmd
+    cache_dir = tmp_path / "cache"
+    spec = write_spec(name="api.yaml")
+    linter = OASLinter(cmd, cache_dir=cache_dir)
+    linter._engine_version = ""
+
+    linter.run_lint(spec)
+    linter.run_lint(spec)
+
+    assert len(spectral.runs()) == 2
+    assert not os.path.exists(cache_dir)
@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.linter import OASLinter, main as lint_main
+
+
+def test_run_lint_many_shares_one_ruleset_and_bounds_the_pool(tmp_path, monkeypatch, fake_spectral, write_spec):
+    monkeypatch.chdir(tmp_path)  # no .spectral.yaml: a temporary default is used
+    linter = fake_spectral(delay=0.3)
+    cmd = linter.cmd
+    paths = [write_spec(name=name) for name in ["a.yaml", "b.yaml", "c.yaml", "broken.yaml"]]
+
+    results = OASLinter(cmd).run_lint_many(paths + [paths[0]], max_workers=2)
+
+    assert list(results) == paths
+    assert [r["summary"]["warning"] for r in results.values()] == [1, 1, 1, 0]
+    assert results[paths[3]]["summary"]["error"] == 1
+    assert results[paths[0]]["details"][0]["line"] == 2
+
+    runs = linter.runs()
+    assert sorted(run[0] for run in runs) == sorted(paths)
+    assert {run[1] for run in runs} == {runs[0][1]}
+    assert runs[0][2] == "extends: spectral:oas\n"
+    assert not os.path.exists(runs[0][1])  # removed after the batch
+
+    # Never more than max_workers linter processes at once
+    for _, _, _, start, _ in runs:
+        assert sum(1 for run in runs if run[3] <= start < run[4]) <= 2
+
+
+def test_summaries_and_cli(tmp_path, monkeypatch, capsys, fake_spectral, write_spec):
+    monkeypatch.chdir(tmp_path)
+    cmd = fake_spectral().cmd
+    paths = [write_spec(name=name) for name in ["a.yaml", "broken.yaml"]]
+    missing = str(tmp_path / "missing.yaml")
+
+    rows = OASLinter.summarize_many(OASLinter(cmd).run_lint_many(paths + [missing]))
+    assert [(r["success"], r["error"], r["warning"]) for r in rows] == [(True, 0, 1), (True, 1, 0), (False, 0, 0)]
+    assert rows[2]["error_msg"] == "File not found"
+
+    assert lint_main(paths[:1] + ["--cmd", cmd, "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)[0]["warning"] == 1
+    assert lint_main(paths + ["--cmd", cmd]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "a.yaml: 0 error, 1 warning, 0 info, 0 hint",
+        "broken.yaml: 1 error, 0 warning, 0 info, 0 hint",
+    ]
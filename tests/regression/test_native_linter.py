@@ -0,0 +1,131 @@
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.generator_pkg.yaml_output import RawNumericValue
+from src.linter import OASLinter
+from src.native_linter import lint_document, load_with_lines, rule_severities
+
+
+SPEC = """openapi: 3.0.3
+info:
+  title: Lint API
+  version: 1.0.0
+servers:
+- url: https://api.example.com/v1/
+tags:
+- name: pets
+  description: Pets
+paths:
+  /pets/{petId}/:
+    parameters:
+    - name: petId
+      in: path
+      schema: {type: string}
+    get:
+      operationId: getPet
+      tags: [pets]
+      description: Get a pet
+      parameters:
+      - name: q
+        in: query
+      - name: q
+        in: query
+      responses:
+        '200':
+          description: OK
+          content:
+            application/json:
+              examples:
+                broken:
+                  summary: neither value nor externalValue
+    delete:
+      operationId: getPet
+      tags: [owners]
+      responses:
+        '404':
+          description: Missing
+  /owners/{ownerId}:
+    post:
+      tags: [pets]
+      description: <script>alert(1)</script>
+      responses:
+        '201':
+          $ref: '#/components/responses/Created'
+          description: sibling
+components:
+  responses:
+    Created:
+      description: Created
+  schemas:
+    Unused:
+      type: string
+      enum: [a, 1, a]
+"""
+
+
+def _issues(tmp_path, ruleset=None):
+    spec = tmp_path / "api.yaml"
+    spec.write_text(SPEC, encoding="utf-8")
+    ruleset_path = None
+    if ruleset is not None:
+        ruleset_path = tmp_path / ".spectral.yaml"
+        ruleset_path.write_text(ruleset, encoding="utf-8")
+    return OASLinter("native", engine="native").run_lint(str(spec), ruleset_path=str(ruleset_path) if ruleset_path else None)
+
+
+def test_core_rules_with_source_lines(tmp_path):
+    result = _issues(tmp_path, "extends: [spectral:oas]\nrules: {}\n")
+    found = {(d["code"], d["path"], d["line"]) for d in result["details"]}
+
+    assert found == {
+        ("info-contact", "info", 2),
+        ("info-description", "info", 2),
+        ("oas3-server-trailing-slash", "servers > 0 > url", 6),
+        ("path-keys-no-trailing-slash", "paths > /pets/{petId}/", 11),
+        ("path-params", "paths > /pets/{petId}/ > parameters > 0", 13),
+        ("operation-parameters", "paths > /pets/{petId}/ > get > parameters > 1", 23),
+        ("oas3-examples-value-or-externalValue",
+         "paths > /pets/{petId}/ > get > responses > 200 > content > application/json > examples > broken", 31),
+        ("operation-operationId-unique", "paths > /pets/{petId}/ > delete > operationId", 34),
+        ("operation-description", "paths > /pets/{petId}/ > delete", 33),
+        ("operation-tag-defined", "paths > /pets/{petId}/ > delete > tags > 0", 35),
+        ("operation-success-response", "paths > /pets/{petId}/ > delete > responses", 36),
+        ("operation-operationId", "paths > /owners/{ownerId} > post", 40),
+        ("path-params", "paths > /owners/{ownerId} > post", 40),
+        ("no-script-tags-in-markdown", "paths > /owners/{ownerId} > post > description", 42),
+        ("no-$ref-siblings", "paths > /owners/{ownerId} > post > responses > 201 > description", 46),
+        ("oas3-unused-component", "components > schemas > Unused", 52),
+        ("typed-enum", "components > schemas > Unused > enum > 1", 54),
+        ("duplicated-entry-in-enum", "components > schemas > Unused > enum > 2", 54),
+    }
+    assert result["success"] and result["engine"] == "native"
+    assert result["summary"]["error"] == 4
+    assert result["raw_data"][0]["source"].endswith("api.yaml")
+
+
+def test_ruleset_switches_rules(tmp_path):
+    result = _issues(tmp_path, "extends: spectral:oas\nrules:\n  info-contact: off\n"
+                               "  oas3-parameter-description: error\n  my-custom-rule:\n    given: $\n")
+    codes = {d["code"]: d["severity"] for d in result["details"]}
+
+    assert "info-contact" not in codes
+    assert codes["oas3-parameter-description"] == "error"
+    assert rule_severities({"rules": {"my-custom-rule": "warn"}})[1] == ["my-custom-rule"]
+
+
+def test_in_memory_document_with_line_lookup():
+    document, index = load_with_lines(SPEC)
+    schema = document["components"]["schemas"]["Unused"]
+    schema["type"] = "number"
+    schema["enum"] = [RawNumericValue("4800.00"), RawNumericValue("1")]
+
+    issues = lint_document(document, line_of=lambda path: index.get(tuple(map(str, path))))
+    by_code = {issue["code"]: issue for issue in issues}
+
+    assert "typed-enum" not in by_code
+    assert by_code["info-contact"]["range"]["start"]["line"] == 1
+    assert lint_document(document)[0]["range"]["start"] == {"line": 0, "character": 0}
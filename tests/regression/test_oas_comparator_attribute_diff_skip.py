@@ -0,0 +1,106 @@
+import copy
+import os
+import sys
+
+import yaml
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.generator_pkg.yaml_output import SafeLoaderRawNumbers
+from src.oas_importer.oas_comparator import OASComparator
+
+
+GOLD = yaml.load(
+    """
+openapi: 3.0.3
+info:
+  title: Skip
+  version: '1.0'
+tags:
+- name: pets
+- name: owners
+security:
+- apiKey: []
+paths:
+  /pets:
+    get:
+      parameters:
+      - name: limit
+        in: query
+        schema:
+          type: integer
+          maximum: 100
+      responses:
+        '200':
+          description: OK
+  /owners:
+    get:
+      responses:
+        '200':
+          description: OK
+components:
+  schemas:
+    Pet:
+      type: object
+      required: [id, name]
+      properties:
+        id: {type: string}
+        name: {type: string, description: "Name  "}
+        kind:
+          oneOf:
+          - {type: string}
+          - {type: integer}
+""",
+    Loader=SafeLoaderRawNumbers,
+)
+
+
+def _without_skip(comparator):
+    comparator._same_subtree = lambda gold, gen: False
+    return comparator
+
+
+def test_attribute_diff_matches_full_walk():
+    gen = copy.deepcopy(GOLD)
+    gen["paths"]["/pets"]["get"]["parameters"][0]["schema"]["maximum"] = "200"
+    gen["components"]["schemas"]["Pet"]["required"] = ["name", "id", "tag"]
+    gen["components"]["schemas"]["Pet"]["properties"]["name"]["description"] = "Name"
+    gen["components"]["schemas"]["Pet"]["properties"]["kind"]["oneOf"].append({"type": "boolean"})
+    gen["tags"].reverse()
+    del gen["paths"]["/owners"]
+
+    fast = OASComparator(gold_oas=GOLD, gen_oas=gen).get_attribute_diff()
+    full = _without_skip(OASComparator(gold_oas=GOLD, gen_oas=gen)).get_attribute_diff()
+
+    assert fast == full
+    assert fast["Paths"]["modified"] == [
+        {"path": "paths/pets/get/parameters[limit|query]/schema/maximum", "old": "100", "new": "200"}
+    ]
+    assert fast["Paths"]["removed"] == ["paths/owners"]
+    assert sorted(fast["Components"]["added"]) == [
+        "components/schemas/Pet/properties/kind/oneOf[2]",
+        "components/schemas/Pet/required/tag",
+    ]
+
+
+def test_identical_subtrees_are_not_descended():
+    gen = copy.deepcopy(GOLD)
+    gen["info"]["title"] = "Changed"
+
+    comparator = OASComparator(gold_oas=GOLD, gen_oas=gen)
+    visited = []
+    compare = comparator._compare_structures
+
+    def recording(gold, gen_value, path, results):
+        visited.append(path)
+        return compare(gold, gen_value, path, results)
+
+    comparator._compare_structures = recording
+    result = comparator.get_attribute_diff()
+
+    assert result["Info"]["modified"] == [{"path": "info/title", "old": "Skip", "new": "Changed"}]
+    # Root plus the top-level keys; only info is entered
+    assert sorted(visited) == sorted(["", "openapi", "info", "info/title", "info/version",
+                                      "tags", "security", "paths", "components"])
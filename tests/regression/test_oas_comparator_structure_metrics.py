@@ -0,0 +1,99 @@
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.oas_importer import oas_comparator
+from src.oas_importer.oas_comparator import OASComparator
+
+
+GOLD = """openapi: 3.0.3
+info: {title: Metrics, version: 1.0.0}
+paths:
+  /pets:
+    get:
+      summary: List pets   # a comment the generated file will not have
+      responses:
+        '200': {description: OK}
+components:
+  schemas:
+    Pet:
+      type: object
+      properties:
+        name: {type: string, description: "A long description that a default yaml.dump would fold across several lines of output"}
+        tags: [a, b]
+    Owner:
+      type: string
+"""
+
+GEN = """openapi: 3.0.3
+info:
+  title: Metrics
+  version: 1.0.0
+paths:
+  /pets:
+    get:
+      summary: List pets
+      responses:
+        '200':
+          description: OK
+components:
+  schemas:
+    Pet:
+      type: object
+      properties:
+        name:
+          type: string
+          description: A long description that a default yaml.dump would fold across several lines of output
+        tags:
+        - a
+        - b
+        - c
+    Extra:
+      type: integer
+"""
+
+
+def _comparator(tmp_path):
+    gold = tmp_path / "gold.yaml"
+    gen = tmp_path / "gen.yaml"
+    gold.write_text(GOLD, encoding="utf-8")
+    gen.write_text(GEN, encoding="utf-8")
+    return OASComparator(str(gold), str(gen))
+
+
+def test_subtree_line_counts_ignore_source_formatting(tmp_path):
+    comparator = _comparator(tmp_path)
+
+    breakdown = comparator.get_detailed_structure_breakdown()
+    assert breakdown["components"]["schemas"] == (2, 2, 0)
+    # Same content in flow vs block style: no line delta for the path
+    assert breakdown["paths"] == []
+
+    discrepancies = comparator.get_component_discrepancies()
+    assert sorted(discrepancies["schemas"]) == [
+        ("Extra", 0, 1, 1),
+        ("Owner", 1, 0, -1),
+        ("Pet", 8, 9, 1),
+    ]
+    assert comparator.get_line_comparison() == {"Total Lines": (17, 25)}
+
+
+def test_each_document_is_laid_out_once(tmp_path, monkeypatch):
+    calls = []
+    real = oas_comparator._subtree_line_counts
+
+    def counting(document):
+        calls.append(document)
+        return real(document)
+
+    monkeypatch.setattr(oas_comparator, "_subtree_line_counts", counting)
+    comparator = _comparator(tmp_path)
+
+    comparator.get_detailed_structure_breakdown()
+    comparator.get_component_discrepancies()
+    comparator.get_detailed_structure_breakdown()
+
+    assert len(calls) == 2
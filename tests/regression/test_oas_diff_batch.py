@@ -0,0 +1,92 @@
+import csv
+import os
+
+import yaml
+
+from src.oas_diff.batch import SUMMARY_COLUMNS, compare_batch, main
+
+
+BASELINE = {
+    "openapi": "3.0.3",
+    "info": {"title": "Demo", "version": "1.0.0"},
+    "paths": {
+        "/items": {
+            "get": {
+                "operationId": "listItems",
+                "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer"}}],
+                "responses": {"200": {"description": "OK"}},
+            }
+        },
+        "/orders": {
+            "get": {"operationId": "listOrders", "responses": {"200": {"description": "OK"}}}
+        },
+    },
+}
+
+
+def _write(path, spec):
+    path.write_text(yaml.safe_dump(spec), encoding="utf-8")
+    return str(path)
+
+
+def _candidates(tmp_path):
+    unchanged = _write(tmp_path / "unchanged.yaml", BASELINE)
+
+    breaking = yaml.safe_load(yaml.safe_dump(BASELINE))
+    del breaking["paths"]["/orders"]
+    breaking["paths"]["/items"]["get"]["parameters"] = []
+    breaking_path = _write(tmp_path / "breaking.yaml", breaking)
+    return unchanged, breaking_path
+
+
+def test_compare_batch_writes_per_candidate_reports_and_summary_matrix(tmp_path):
+    old_path = _write(tmp_path / "baseline.yaml", BASELINE)
+    unchanged, breaking = _candidates(tmp_path)
+    out_dir = tmp_path / "out"
+
+    result = compare_batch(
+        old_path,
+        [unchanged, breaking, breaking],
+        str(out_dir),
+        report_types=["synthesis"],
+        max_workers=2,
+        log_callback=lambda msg: None,
+    )
+
+    rows = result["rows"]
+    assert [row["candidate"] for row in rows] == [unchanged, breaking, breaking]
+    assert [row["error"] for row in rows] == ["", "", ""]
+    assert rows[0]["breaking"] == 0
+    assert rows[1]["breaking"] == rows[2]["breaking"] >= 2
+    assert rows[1]["removed_paths"] == 1
+
+    # Duplicate candidate names get their own report folder
+    assert [os.path.basename(row["report_dir"]) for row in rows] == ["unchanged", "breaking", "breaking_2"]
+    for row in rows:
+        assert any(name.startswith("OAS_Comparison_Synthesis_") for name in os.listdir(row["report_dir"]))
+
+    with open(result["summary_path"], encoding="utf-8", newline="") as f:
+        summary = list(csv.DictReader(f))
+    assert list(summary[0].keys()) == SUMMARY_COLUMNS
+    assert [int(r["breaking"]) for r in summary] == [row["breaking"] for row in rows]
+
+
+def test_batch_cli_reports_failed_candidates_without_aborting(tmp_path):
+    old_path = _write(tmp_path / "baseline.yaml", BASELINE)
+    unchanged, _ = _candidates(tmp_path)
+
+    exit_code = main([
+        old_path,
+        unchanged,
+        str(tmp_path / "missing.yaml"),
+        "-o", str(tmp_path / "out"),
+        "-r", "synthesis",
+        "-w", "1",
+    ])
+
+    assert exit_code == 1
+    summary_files = [n for n in os.listdir(tmp_path / "out") if n.endswith(".csv")]
+    with open(tmp_path / "out" / summary_files[0], encoding="utf-8", newline="") as f:
+        summary = list(csv.DictReader(f))
+    assert summary[0]["error"] == ""
+    assert summary[1]["error"].startswith("FileNotFoundError")
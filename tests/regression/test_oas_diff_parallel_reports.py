@@ -0,0 +1,82 @@
+import os
+
+import yaml
+from docx import Document
+
+from src.oas_diff.report_manager import OASDiffReportManager
+
+
+OLD_SPEC = {
+    "openapi": "3.0.3",
+    "info": {"title": "Demo", "version": "1.0.0"},
+    "paths": {
+        "/items": {
+            "get": {
+                "operationId": "listItems",
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Item"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "Item": {
+                "type": "object",
+                "properties": {"id": {"type": "string", "description": "Item id."}},
+            }
+        }
+    },
+}
+
+
+def _write_specs(tmp_path):
+    new_spec = yaml.safe_load(yaml.safe_dump(OLD_SPEC))
+    new_spec["info"]["version"] = "1.1.0"
+    new_spec["components"]["schemas"]["Item"]["properties"]["id"]["description"] = "Unique item id."
+    new_spec["components"]["schemas"]["Item"]["required"] = ["id"]
+
+    old_path = tmp_path / "old.yaml"
+    new_path = tmp_path / "new.yaml"
+    old_path.write_text(yaml.safe_dump(OLD_SPEC), encoding="utf-8")
+    new_path.write_text(yaml.safe_dump(new_spec), encoding="utf-8")
+    return str(old_path), str(new_path)
+
+
+def _document_text(path):
+    document = Document(path)
+    paragraphs = [paragraph.text for paragraph in document.paragraphs]
+    cells = [cell.text for table in document.tables for row in table.rows for cell in row.cells]
+    return paragraphs, cells
+
+
+def test_parallel_report_generation_matches_serial_output_and_records_timings(tmp_path):
+    old_path, new_path = _write_specs(tmp_path)
+    report_types = ["compatibility", "synthesis", "impact", "analytical"]
+
+    serial = OASDiffReportManager(old_path, new_path, str(tmp_path / "serial"))
+    serial_paths = serial.generate_reports(report_types, parallel=False)
+
+    parallel = OASDiffReportManager(old_path, new_path, str(tmp_path / "parallel"))
+    parallel_paths = parallel.generate_reports(report_types, parallel=True, max_workers=2)
+
+    assert [os.path.basename(p).rsplit("_", 2)[0] for p in parallel_paths] == [
+        "OAS_Comparison_Synthesis",
+        "OAS_Comparison_Analytical",
+        "OAS_Comparison_Impact",
+        "OAS_Comparison_Interface_Compatibility",
+    ]
+    assert len(serial_paths) == len(parallel_paths) == 4
+    assert all(os.path.exists(p) for p in serial_paths + parallel_paths)
+    assert list(parallel.report_timings) == ["synthesis", "analytical", "impact", "compatibility"]
+    assert all(seconds >= 0 for seconds in parallel.report_timings.values())
+    assert list(serial.report_timings) == list(parallel.report_timings)
+    for serial_path, parallel_path in zip(serial_paths, parallel_paths):
+        assert _document_text(serial_path) == _document_text(parallel_path)
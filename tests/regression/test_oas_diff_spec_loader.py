@@ -0,0 +1,57 @@
+import json
+import os
+
+import yaml
+
+from src.oas_diff import spec_loader
+
+
+SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "Demo", "version": "1.0.0"},
+    "paths": {"/items": {"get": {"operationId": "listItems", "responses": {"200": {"description": "OK"}}}}},
+}
+
+
+def test_load_spec_parses_yaml_and_json_like_safe_load(tmp_path):
+    yaml_path = tmp_path / "spec.yaml"
+    json_path = tmp_path / "spec.json"
+    yaml_path.write_text(yaml.safe_dump(SPEC), encoding="utf-8")
+    json_path.write_text(json.dumps(SPEC), encoding="utf-8")
+
+    assert spec_loader.load_spec(str(yaml_path), use_cache=False) == SPEC
+    assert spec_loader.load_spec(str(json_path), use_cache=False) == SPEC
+
+
+def test_cached_specs_are_independent_copies(tmp_path):
+    spec_loader.clear_spec_cache()
+    path = tmp_path / "spec.yaml"
+    path.write_text(yaml.safe_dump(SPEC), encoding="utf-8")
+
+    first = spec_loader.load_spec(str(path))
+    first["info"]["title"] = "Mutated"
+    second = spec_loader.load_spec(str(path))
+
+    assert second == SPEC
+    assert second is not first
+
+
+def test_disk_cache_is_keyed_by_content_hash(tmp_path):
+    spec_loader.clear_spec_cache()
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "spec.yaml"
+    data = yaml.safe_dump(SPEC).encode("utf-8")
+    path.write_bytes(data)
+
+    spec_loader.load_spec(str(path), cache_dir=str(cache_dir))
+    cache_file = cache_dir / (spec_loader.content_hash(data) + spec_loader.CACHE_FILE_SUFFIX)
+    assert cache_file.exists()
+
+    # A fresh process (empty memory cache) is served from disk, even for another file name.
+    spec_loader.clear_spec_cache()
+    copy_path = tmp_path / "copy.yaml"
+    copy_path.write_bytes(data)
+    assert spec_loader.load_spec(str(copy_path), cache_dir=str(cache_dir)) == SPEC
+
+    spec_loader.clear_spec_cache(str(cache_dir))
+    assert not os.listdir(cache_dir)
@@ -81,3 +81,173 @@ def test_switching_to_validation_refreshes_file_list_before_validation():
     app._on_tab_change()
 
     assert calls == ["update_file_list", "run_validation"]
+
+
+def _issue(i):
+    return {"severity": "warning", "code": "info-contact", "path": "Root", "line": i + 1, "message": "Missing"}
+
+
+class _RecordingList:
+    def __init__(self):
+        self.calls = []
+
+    def set_issues(self, items, font_size=11, template_for=None):
+        self.calls.append(("set_issues", len(items), font_size, template_for))
+
+    def show_message(self, text, text_color="#0A809E", font_size=None):
+        self.calls.append(("show_message", text, font_size))
+
+
+class _FontSizePrefs:
+    def get(self, key, default=None):
+        return 14 if key == "validation_font_size" else default
+
+
+def test_render_hands_the_data_to_the_virtual_list():
+    app = object.__new__(OASGenApp)
+    app.frame_list = _RecordingList()
+    app.prefs_manager = _FontSizePrefs()
+    app.current_source_map = {"paths./a.get": {"file": "a.xlsx", "sheet": "Parameters"}}
+
+    app._render_validation_issue_list([_issue(i) for i in range(10000)])
+    app.current_source_map = {}
+    app._render_validation_issue_list([_issue(0), _issue(1)])
+    app._render_validation_issue_list([])
+
+    (_, count, font_size, template_for), second, empty = app.frame_list.calls
+    assert (count, font_size) == (10000, 14)
+    assert template_for == app._issue_template_source
+    assert second == ("set_issues", 2, 14, None)
+    assert empty == ("show_message", "No issues found! Great job!", 19)
+
+
+class _FakeYamlView:
+    """Text widget stand-in: tracks the insert mark, tags and viewport."""
+
+    def __init__(self, first_line=1, last_line=1000):
+        self.marks = {"insert": "1.0"}
+        self.tags = {}
+        self.viewport = (first_line, last_line)
+        self.seen = None
+
+    def index(self, index):
+        if index == "@0,0":
+            return f"{self.viewport[0]}.0"
+        if index.startswith("@0,"):
+            return f"{self.viewport[1]}.0"
+        return self.marks.get(index, index)
+
+    def mark_set(self, name, index):
+        self.marks[name] = index
+
+    def tag_remove(self, tag, start, end):
+        self.tags[tag] = []
+
+    def tag_add(self, tag, start, end):
+        self.tags.setdefault(tag, []).append((start, end))
+
+    def tag_config(self, *args, **kwargs):
+        pass
+
+    def tag_raise(self, tag):
+        pass
+
+    def see(self, index):
+        self.seen = index
+
+    def winfo_height(self):
+        return 400
+
+
+class _Label:
+    def __init__(self):
+        self.text = None
+
+    def configure(self, text=None, **kwargs):
+        self.text = text
+
+    def winfo_exists(self):
+        return True
+
+
+class _HistoryPrefs:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def save(self):
+        pass
+
+
+def _search_app(content, query, viewport=(1, 1000)):
+    app = object.__new__(OASGenApp)
+    app._current_yaml_content = content
+    app.txt_yaml = _FakeYamlView(*viewport)
+    app.search_entry = _DummyEntry(query)
+    app.search_window = _Label()
+    app.lbl_search_count = _Label()
+    app.prefs_manager = _HistoryPrefs()
+    app._yaml_search_index = None
+    app._yaml_search_current = None
+    return app
+
+
+def test_yaml_search_counts_every_match_and_steps_through_them():
+    content = "".join(f"  - id: {i}\n    name: Item\n" for i in range(500))
+    app = _search_app(content, "item", viewport=(3, 6))
+
+    app._update_match_count()
+    assert app.lbl_search_count.text == "?/500"
+    # Only the matches in the viewport are highlighted
+    assert app.txt_yaml.tags["found_all"] == [("4.10", "4.14"), ("6.10", "6.14")]
+
+    app._find_next()
+    assert app.txt_yaml.tags["found"] == [("2.10", "2.14")]
+    assert app.lbl_search_count.text == "1/500"
+    app._find_next()
+    assert app.txt_yaml.marks["insert"] == "4.14"
+    app._find_prev()
+    app._find_prev()
+    assert app.txt_yaml.tags["found"] == [("1000.10", "1000.14")]
+    assert app.lbl_search_count.text == "500/500"
+
+    app._goto_match(249)
+    assert app.txt_yaml.seen == "500.10"
+    assert app.lbl_search_count.text == "250/500"
+    assert app.prefs_manager.values["search_history"] == ["item"]
+
+
+def test_doc_viewer_sync_looks_lines_up_in_the_structure_index():
+    content = "".join(
+        f"  /items/{i}:\n    get:\n      operationId: item{i}\n      summary: Item {i}\n" for i in range(300)
+    )
+    content = "paths:\n" + content
+    app = object.__new__(OASGenApp)
+    app._current_yaml_content = content
+    app._yaml_structure_index = None
+    app._on_doc_focus = lambda viewer: None
+    logs = []
+    app.val_log_print = logs.append
+    scheduled = []
+    app.after = lambda delay, callback: scheduled.append(callback)
+    app._scroll_to_line_and_highlight = lambda line: logs.append(line)
+
+    app._on_doc_sync_editor(None, {"operationId": "item250"})
+    app._on_doc_sync_editor(None, {"hash": "#/paths/~1items~17/get"})
+    app._on_doc_sync_editor(None, {"operationId": "missing", "sectionTitle": "Item 3"})
+    app._on_doc_sync_editor(None, {"operationId": "missing"})
+    for callback in scheduled:
+        callback()
+
+    assert logs[:3] == [
+        "⬆️ Syncing editor to line 1004 (matched: 'operationId: item250')",
+        "⬆️ Syncing editor to line 31 (matched: 'paths > /items/7 > get')",
+        "⬆️ Syncing editor to line 17 (matched: 'summary: Item 3')",
+    ]
+    assert logs[3] == "⚠️ Sync: Could not find 'operationId: missing' in YAML."
+    assert logs[4:] == [1004, 31, 17]
@@ -0,0 +1,40 @@
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.oas_importer.oas_converter import OASToExcelConverter
+
+
+SOURCE_OAS = Path(__file__).resolve().parents[2] / "logs" / "debug_new_spec.yaml"
+
+
+def _workbook_parts(path):
+    # docProps/core.xml carries the save timestamp; every other part must match.
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist() if name != "docProps/core.xml"}
+
+
+def test_parallel_endpoint_export_matches_serial_export(tmp_path):
+    converter = OASToExcelConverter(str(SOURCE_OAS))
+
+    serial_files = converter.generate_all_endpoint_files(str(tmp_path / "serial"))
+
+    progress = []
+    parallel_files = converter.generate_all_endpoint_files(
+        str(tmp_path / "parallel"),
+        max_workers=2,
+        progress_callback=lambda done, total, path: progress.append((done, total)),
+    )
+
+    assert [os.path.basename(p) for p in parallel_files] == [os.path.basename(p) for p in serial_files]
+    for serial_path, parallel_path in zip(serial_files, parallel_files):
+        assert _workbook_parts(parallel_path) == _workbook_parts(serial_path)
+
+    total = len(serial_files)
+    assert progress[-1] == (total, total)
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
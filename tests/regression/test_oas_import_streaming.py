@@ -0,0 +1,115 @@
+import os
+import sys
+import zipfile
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.oas_importer.oas_converter import OASToExcelConverter
+from src.oas_importer.oas_parser import OASParser
+
+
+SPEC = """openapi: 3.0.3
+info:
+  title: Streaming API
+  version: 1.0.0
+tags:
+- name: accounts
+paths:
+  /accounts/{accountId}:
+    parameters:
+    - name: accountId
+      in: path
+      required: true
+      schema:
+        type: string
+    get:
+      operationId: getAccount
+      summary: Get account
+      x-rate-limit:
+        tier: gold
+        burst: 10
+      responses:
+        '200':
+          description: The account
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/Account'
+    delete:
+      operationId: deleteAccount
+      responses:
+        '204':
+          description: Deleted
+  '/accounts':
+    post:
+      operationId: createAccount
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                balance: {type: number, minimum: 0.00}
+      responses:
+        '201':
+          description: Created
+components:
+  schemas:
+    Account:
+      type: object
+      properties:
+        id: {type: string, example: ACC-1}
+        balance: {type: number, example: 4800.00}
+"""
+
+
+def _parts(folder):
+    parts = {}
+    for name in sorted(os.listdir(folder)):
+        with zipfile.ZipFile(os.path.join(folder, name)) as archive:
+            parts[name] = {part: archive.read(part) for part in archive.namelist()
+                           if part != "docProps/core.xml"}
+    return parts
+
+
+def test_streaming_parser_matches_full_load(tmp_path, write_spec):
+    src_path = write_spec(SPEC)
+    full = OASParser(src_path)
+    streamed = OASParser(src_path, streaming=True)
+
+    assert "paths" not in streamed.oas
+    assert streamed.oas == {key: value for key, value in full.oas.items() if key != "paths"}
+    assert (streamed.path_count, streamed.operation_count) == (2, 3)
+
+    extensions = []
+    for operation, expected in zip(streamed.iter_operations(), full.get_operations()):
+        assert operation == expected
+        extensions.append(streamed.get_raw_extensions(operation.path, operation.method))
+    assert extensions == ["x-rate-limit:\n  tier: gold\n  burst: 10", "", ""]
+    # Outside its path item the raw text is gone
+    assert streamed.get_raw_extensions("/accounts/{accountId}", "GET") == ""
+
+
+def test_stream_import_writes_same_files(tmp_path, write_spec):
+    src_path = write_spec(SPEC)
+    eager_dir = tmp_path / "eager"
+    stream_dir = tmp_path / "stream"
+
+    converter = OASToExcelConverter(src_path)
+    converter.generate_index_file(str(eager_dir / "$index.xlsx"))
+    eager_files = converter.generate_all_endpoint_files(str(eager_dir))
+
+    progress = []
+    streaming = OASToExcelConverter(src_path, streaming=True)
+    index_path, stream_files = streaming.stream_import(
+        str(stream_dir), progress_callback=lambda done, total, path: progress.append((done, total))
+    )
+
+    assert index_path == str(stream_dir / "$index.xlsx")
+    assert [os.path.basename(f) for f in stream_files] == [os.path.basename(f) for f in eager_files]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert _parts(stream_dir) == _parts(eager_dir)
+    # Rows memoised for the streamed path items were released with them
+    assert len(streaming.flattener._flatten_cache) <= len(streaming.flattener._pointer_table)
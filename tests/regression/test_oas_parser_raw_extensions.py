@@ -0,0 +1,79 @@
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.oas_importer.oas_parser import OASParser
+
+
+SPEC = """openapi: 3.0.3
+info:
+  title: Raw extensions
+  version: '1'
+  description: |
+    /orders: is mentioned here before the paths section
+paths:
+  /orders:
+    get:
+      operationId: listOrders
+      responses:
+        '200':
+          description: OK
+          content:
+            application/json:
+              example:
+                x-nested: ignored
+      x-sandbox:
+        when: |
+          first line
+
+          second: line
+        then: ok
+      summary: after extensions
+    post:
+      operationId: createOrder
+      responses: {}
+  '/orders/{id}':
+    delete:
+      operationId: deleteOrder
+      x-flag: true
+      responses: {}
+  /orders/{id}:cancel:
+    post:
+      operationId: cancelOrder
+      responses: {}
+      x-list:
+        - a
+        - b
+"""
+
+
+def _parser(tmp_path):
+    source = tmp_path / "spec.yaml"
+    source.write_text(SPEC, encoding="utf-8")
+    return OASParser(str(source))
+
+
+def test_raw_extensions_are_sliced_per_operation(tmp_path):
+    parser = _parser(tmp_path)
+
+    assert parser.get_raw_extensions("/orders", "get") == (
+        "x-sandbox:\n  when: |\n    first line\n\n    second: line\n  then: ok"
+    )
+    assert parser.get_raw_extensions("/orders", "post") == ""
+    assert parser.get_raw_extensions("/orders/{id}", "delete") == "x-flag: true"
+    assert parser.get_raw_extensions("/orders/{id}:cancel", "POST") == "x-list:\n  - a\n  - b"
+    assert parser.get_raw_extensions("/missing", "get") == ""
+
+
+def test_raw_line_index_is_built_once(tmp_path):
+    parser = _parser(tmp_path)
+
+    parser.get_raw_extensions("/orders", "get")
+    index = parser._raw_line_index
+    parser.get_raw_extensions("/orders/{id}", "delete")
+
+    assert parser._raw_line_index is index
+    assert index[1]["/orders"] == [5, 7]
@@ -0,0 +1,138 @@
+import os
+import sys
+from pathlib import Path
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src import main as main_script
+from src.oas_importer.oas_comparator import OASComparator
+from src.oas_importer.roundtrip import run_roundtrip
+
+
+SPEC = """openapi: 3.0.3
+info:
+  title: Roundtrip API
+  version: 1.0.0
+  description: Accounts service
+servers:
+- url: https://api.example.com/v1
+tags:
+- name: accounts
+  description: Account operations
+paths:
+  /accounts/{accountId}:
+    get:
+      tags:
+      - accounts
+      operationId: getAccount
+      summary: Get account
+      description: Returns one account.
+      parameters:
+      - name: accountId
+        in: path
+        required: true
+        description: Account identifier
+        schema:
+          type: string
+          maxLength: 35
+      x-rate-limit:
+        tier: gold
+        burst: 10
+      responses:
+        '200':
+          description: The account
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/Account'
+        '404':
+          description: Not found
+  /accounts:
+    post:
+      tags:
+      - accounts
+      operationId: createAccount
+      summary: Create account
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/Account'
+      responses:
+        '201':
+          description: Created
+components:
+  schemas:
+    Account:
+      type: object
+      required:
+      - id
+      properties:
+        id:
+          type: string
+          description: Identifier
+          example: ACC-1
+        balance:
+          type: number
+          minimum: 0.00
+          example: 4800.00
+        status:
+          type: string
+          enum:
+          - OPEN
+          - CLOSED
+"""
+
+
+def test_in_memory_roundtrip_matches_file_based_comparison(tmp_path, write_spec):
+    src_path = write_spec(SPEC)
+    artefacts = tmp_path / "artefacts"
+
+    result = run_roundtrip(src_path, with_text=True, artefact_dir=str(artefacts))
+
+    assert result.version == "3.0"
+    assert (artefacts / main_script.INDEX_FILENAME).exists()
+    assert len(list(artefacts.glob("*.xlsx"))) == 3
+
+    # The generated document compares exactly like the YAML written to disk
+    on_disk = OASComparator(src_path, result.generated_path)
+    in_memory = result.comparator
+    assert in_memory.gen_oas == on_disk.gen_oas
+    assert in_memory.gen_oas["paths"]["/accounts/{accountId}"]["get"]["x-rate-limit"] == {
+        "tier": "gold",
+        "burst": "10",
+    }
+    for method in (
+        "get_structure_comparison",
+        "get_attribute_diff",
+        "get_line_comparison",
+        "get_line_diff_stats",
+        "get_detailed_line_diff",
+        "get_component_discrepancies",
+    ):
+        assert getattr(in_memory, method)() == getattr(on_disk, method)(), method
+
+    # Generating from the saved templates gives the same YAML as the in-memory workbooks
+    written = []
+    main_script.generate_oas(
+        str(artefacts),
+        gen_30=True,
+        gen_31=False,
+        output_dir=str(tmp_path / "generated"),
+        log_callback=lambda msg: written.append(msg.split(": ", 1)[1]) if "Writing OAS" in msg else None,
+    )
+    assert Path(written[0]).read_text(encoding="utf-8") == result.generated_yaml
+
+
+def test_in_memory_roundtrip_writes_nothing_by_default(tmp_path, write_spec):
+    src_path = write_spec(SPEC)
+
+    result = run_roundtrip(src_path)
+
+    assert sorted(os.listdir(tmp_path)) == ["source.yaml"]
+    assert result.generated_yaml is None
+    assert result.generated_path is None
+    assert result.comparator.get_structure_comparison()["Paths"] == (2, 2)
@@ -0,0 +1,88 @@
+import os
+import sys
+
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.oas_importer.excel_writer import KEEP_CELL, ExcelWriter, RowWriter
+from src.oas_importer.template_writer import TemplateExcelWriter, _saved_parts
+
+
+STYLE = {
+    "font": Font(name="Arial", bold=True),
+    "fill": PatternFill(fill_type="solid", fgColor="FFEEEEEE"),
+    "border": Border(left=Side(style="thin")),
+    "number_format": "@",
+    "alignment": Alignment(horizontal="left", vertical="top", wrap_text=True),
+}
+ROWS = [["a" * (i + 1), str(i), None if i % 3 else "x"] for i in range(30)]
+
+
+def test_bulk_rows_save_like_per_cell_styling():
+    reference = Workbook()
+    ws = reference.active
+    ws["B5"] = "kept"
+    ws["B5"].font = Font(italic=True)
+    for row_idx, values in enumerate(ROWS, start=2):
+        for col, value in zip((1, 2, 4), values):
+            cell = ws.cell(row=row_idx, column=col, value=value)
+            for attr, style in STYLE.items():
+                setattr(cell, attr, style)
+
+    bulk = Workbook()
+    ws = bulk.active
+    ws["B5"] = "kept"
+    ws["B5"].font = Font(italic=True)
+    rows = RowWriter(ws, [1, 2, 4], [STYLE] * 3)
+    assert rows.write_rows(ROWS, start_row=2) == 32
+
+    assert _saved_parts(bulk) == _saved_parts(reference)
+    # Cells own their style: a later per-cell change stays local
+    ws["A2"].font = Font(color="FF0000")
+    assert ws["A3"].font.color is None
+
+
+def test_widths_are_tracked_while_writing():
+    wb = Workbook()
+    rows = RowWriter(wb.active, [1, 2, 3])
+    rows.write_row(1, ["name", KEEP_CELL, 0])
+    rows.write_row(2, ["longer name", "b", ""])
+
+    assert wb.active.cell(row=1, column=2).value is None
+    assert rows.lengths == {1: 11, 2: 1}
+
+    rows.fit_columns([1, 2, 3], padding=3, cap=10)
+    assert wb.active.column_dimensions["A"].width == 10
+    assert wb.active.column_dimensions["B"].width == 4
+
+
+def test_auto_adjust_uses_first_twenty_rows(tmp_path):
+    writer = ExcelWriter(styles_config_path=str(tmp_path / "no_styles.json"))
+    writer.add_sheet("Misc", [{"Key": "k" * i} for i in range(40)])
+
+    # Header "Key" (3 + 2) vs the longest of the first 20 rows (19 + 2)
+    assert writer.workbook["Misc"].column_dimensions["A"].width == 21
+
+
+def test_template_rows_keep_template_style():
+    writer = TemplateExcelWriter("endpoint")
+    writer.load_template()
+    ws = writer.workbook["Parameters"]
+    template = ws.cell(row=3, column=2)
+    font, border = template.font, template.border.left.style
+
+    writer.fill_parameters_sheet([
+        {"Name": "id", "Description": "Identifier", "Min  \nValue/Length/Item": "1"},
+        {"Name": "limit"},
+    ])
+
+    assert ws["A4"].value == "limit"
+    assert ws["B4"].value is None and not ws["B4"].has_style
+    assert (ws["B3"].font.name, ws["B3"].font.sz) == (font.name, font.sz)
+    assert ws["B3"].border.left.style == border
+    assert ws["B3"].alignment.wrap_text and ws["B3"].number_format != "@"
+    assert ws["I3"].number_format == "@"
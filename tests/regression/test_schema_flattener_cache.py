@@ -0,0 +1,63 @@
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.oas_importer.schema_flattener import FlatRow, SchemaFlattener
+
+
+OAS = {
+    "components": {
+        "schemas": {
+            "Order": {
+                "type": "object",
+                "required": ["id"],
+                "properties": {
+                    "id": {"type": "string", "example": 12},
+                    "lines": {
+                        "type": "array",
+                        "items": {"type": "object", "properties": {"sku": {"type": "string"}}},
+                    },
+                    "customer": {"$ref": "#/components/schemas/Customer"},
+                },
+            },
+            "Customer": {"type": "string"},
+        },
+        "headers": {"X-Request-ID": {"schema": {"type": "string"}, "required": True}},
+    }
+}
+
+
+def test_repeated_flattening_returns_fresh_copies_of_cached_rows():
+    flattener = SchemaFlattener(OAS)
+
+    first = flattener.flatten_schema("Order")
+    first[1].parent = "mutated by caller"
+    second = flattener.flatten_schema("Order")
+
+    assert [row.name for row in second] == ["Order", "id", "lines", "sku", "customer"]
+    assert second[1].parent == "Order"
+    assert second[1] is not first[1]
+    assert second == SchemaFlattener(OAS).flatten_schema("Order")
+
+    shared_body = {"content": {"application/json": {"schema": OAS["components"]["schemas"]["Order"]}}}
+    body_rows = flattener.flatten_request_body(shared_body)
+    assert flattener.flatten_request_body(shared_body) == body_rows
+    assert body_rows[1].parent == "application/json"
+
+
+def test_pointer_table_resolves_component_refs_like_the_pointer_walk():
+    flattener = SchemaFlattener(OAS)
+
+    assert flattener._resolve_ref("#/components/headers/X-Request-ID") is OAS["components"]["headers"]["X-Request-ID"]
+    assert flattener._resolve_ref("#/components/schemas/Order/properties/id") == {"type": "string", "example": 12}
+    assert flattener._resolve_ref("#/components/schemas/Missing") == {}
+    assert flattener._resolve_ref("external.yaml#/Order") == {}
+
+
+def test_flat_row_uses_slots():
+    row = FlatRow(name="id")
+    assert not hasattr(row, "__dict__")
+    assert row.to_dict()["Name"] == "id"
@@ -0,0 +1,65 @@
+import os
+import shutil
+import sys
+import zipfile
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from openpyxl import load_workbook
+
+from src.oas_importer import template_writer
+from src.oas_importer.template_writer import TemplateExcelWriter
+
+
+def _parts(path):
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist() if name != "docProps/core.xml"}
+
+
+def test_endpoint_template_is_parsed_once_and_copied_per_writer(tmp_path, monkeypatch):
+    template_writer.clear_template_cache()
+    loads = []
+    real_load = template_writer.load_workbook
+    monkeypatch.setattr(template_writer, "load_workbook", lambda *a, **k: loads.append(a) or real_load(*a, **k))
+
+    first = TemplateExcelWriter("endpoint")
+    first.load_template()
+    first.fill_parameters_sheet([{"Name": "limit"}])
+    first.add_response_sheet("200", "OK", [])
+    first.save(str(tmp_path / "first.xlsx"))
+    loads_after_first = len(loads)
+
+    second = TemplateExcelWriter("endpoint")
+    second.load_template()
+    assert len(loads) == loads_after_first
+    assert "200" not in second.workbook.sheetnames
+    assert second._original_cf_formulas
+    second.save(str(tmp_path / "second.xlsx"))
+
+    reference_path = tmp_path / "reference.xlsx"
+    reference = TemplateExcelWriter("endpoint")
+    reference.workbook = real_load(os.path.join(TemplateExcelWriter.TEMPLATES_DIR, "endpoint.xlsx"))
+    reference._snapshot_original_conditional_formatting_formulas()
+    reference._response_template_ws = reference.workbook["Response"]
+    reference.save(str(reference_path))
+    assert _parts(tmp_path / "second.xlsx") == _parts(reference_path)
+
+
+def test_template_prototype_is_refreshed_when_master_changes(tmp_path, monkeypatch):
+    template_writer.clear_template_cache()
+    shutil.copy(os.path.join(TemplateExcelWriter.TEMPLATES_DIR, "endpoint.xlsx"), tmp_path / "endpoint.xlsx")
+    monkeypatch.setattr(TemplateExcelWriter, "TEMPLATES_DIR", str(tmp_path))
+
+    TemplateExcelWriter("endpoint").load_template()
+
+    wb = load_workbook(tmp_path / "endpoint.xlsx")
+    wb["Body"].cell(row=1, column=1, value="Changed master")
+    wb.save(tmp_path / "endpoint.xlsx")
+    os.utime(tmp_path / "endpoint.xlsx", ns=(0, 0))
+
+    writer = TemplateExcelWriter("endpoint")
+    writer.load_template()
+    assert writer.workbook["Body"].cell(row=1, column=1).value == "Changed master"
+    assert len(template_writer._TEMPLATE_PROTOTYPES) == 1
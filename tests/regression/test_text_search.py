@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.text_search import TextSearchIndex
+
+
+TEXT = "openapi: 3.0.3\ninfo:\n  title: Pets\npaths:\n  /pets:\n    get:\n      operationId: listPETS\n"
+
+
+def test_positions_are_tk_indexes():
+    index = TextSearchIndex(TEXT)
+
+    assert index.line_count == 8
+    assert index.index(0) == "1.0"
+    assert index.index(TEXT.index("title")) == "3.2"
+    assert index.offset_of_index("3.2") == TEXT.index("title")
+    # Columns past the end of a line clamp to it
+    assert index.offset_of_index("2.99") == TEXT.index("info:") + len("info:")
+    assert index.offset_of_index("99.0") == len(TEXT)
+
+
+def test_every_match_is_found_case_insensitively():
+    index = TextSearchIndex(TEXT)
+
+    assert index.count("pets") == 3
+    assert [index.index(start) for start in index.find_all("pets")] == ["3.9", "5.3", "7.23"]
+    assert index.count("a.b") == 0  # literal, not a pattern
+    assert index.count("") == 0
+
+
+def test_navigation_wraps_and_counts_current_match():
+    index = TextSearchIndex(TEXT)
+    second = index.find_all("pets")[1]
+
+    assert index.next_match("pets", second) == 2
+    assert index.next_match("pets", len(TEXT)) == 0
+    assert index.next_match("pets", second, backwards=True) == 0
+    assert index.next_match("pets", 0, backwards=True) == 2
+    assert index.next_match("missing", 0) is None
+    assert index.match_at_or_before("pets", second + 2) == 1
+    assert index.match_at_or_before("pets", 0) == -1
+    assert index.span("pets", 1) == (second, second + 4)
+
+
+def test_matches_of_a_line_range():
+    index = TextSearchIndex(TEXT)
+
+    assert list(index.matches_in_lines("pets", 4, 6)) == [1]
+    assert list(index.matches_in_lines("pets", 7, 100)) == [2]
+    assert list(index.matches_in_lines("pets", 1, 2)) == []
+
+
+def test_large_text_counts_exactly():
+    text = "  - name: item\n    description: Item value\n" * 100000
+    index = TextSearchIndex(text)
+
+    start = time.perf_counter()
+    assert index.count("ITEM") == 200000
+    assert time.perf_counter() - start < 2
+    assert index.position(index.span("item", 199999)[0]) == (200000, 17)
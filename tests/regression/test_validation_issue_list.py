@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.validation_issue_list import CARD_PADDING, IssueRowLayout, estimate_card_height
+
+
+def _issues(count):
+    return [
+        {
+            "severity": "warning",
+            "code": "info-contact",
+            "path": "Root" if i % 3 == 0 else f"paths > /items/{i} > get",
+            "line": i + 1,
+            "message": "x" * (i % 250),
+        }
+        for i in range(count)
+    ]
+
+
+def test_card_height_estimate_follows_wrapped_text():
+    short = {"message": "Missing contact", "path": "Root"}
+    long = {"message": "a" * 95 + "\nsecond", "path": "info"}
+
+    assert estimate_card_height(short, 40, 15, 37) == 37 + 15 + CARD_PADDING
+    # 3 wrapped message lines + 1 line break + 1 path line
+    assert estimate_card_height(long, 40, 15, 37) == 37 + 4 * 15 + 15 + CARD_PADDING
+
+
+def test_visible_range_of_a_large_list_is_a_window():
+    layout = IssueRowLayout(estimate_card_height(item, 60, 15, 37) for item in _issues(20000))
+
+    start = time.perf_counter()
+    top = layout.offset(12345) + 3
+    rows = layout.visible_range(top, top + 600, overscan=2)
+    assert time.perf_counter() - start < 0.5
+
+    assert rows[0] == 12343
+    assert layout.offset(rows[-1] - 2) < top + 600 <= layout.offset(rows[-1] - 1)
+    assert len(rows) < 40
+    assert layout.index_at(-10) == 0 and layout.index_at(layout.total_height + 10) == 19999
+
+
+def test_measured_heights_shift_the_rows_below():
+    layout = IssueRowLayout([50, 50, 50])
+
+    assert not layout.set_height(1, 50)
+    assert layout.set_height(1, 80)
+    assert [layout.offset(i) for i in range(3)] == [0, 50, 130]
+    assert layout.total_height == 180
+    assert list(layout.visible_range(60, 100)) == [1]
+    assert list(IssueRowLayout().visible_range(0, 100)) == []
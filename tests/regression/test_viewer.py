@@ -93,6 +93,87 @@ class TestRedocGenerator:
         # Check that HTML is generated with title
         assert 'API Documentation' in html, "Should contain API Documentation title"
 
+    def test_redoc_html_inline_or_shared_asset(self, tmp_path):
+        """Test that the Redoc JS is inlined by default or referenced as one shared file."""
+        from src.redoc_gen import REDOC_ASSET_NAME, RedocGenerator, inline_shared_asset
+
+        spec = "openapi: 3.0.3\ninfo:\n  title: Pets\n  description: '</script><b>'\npaths: {}\n"
+        gen = RedocGenerator()
+        with open(gen.js_path, 'r', encoding='utf-8') as f:
+            js_content = f.read()
+
+        inline = gen.get_html_content(spec)
+        shared = gen.get_html_content(spec, asset_dir=str(tmp_path))
+
+        assert js_content in inline
+        assert js_content not in shared
+        assert f'<script src="{REDOC_ASSET_NAME}"></script>' in shared
+        assert (tmp_path / REDOC_ASSET_NAME).read_text(encoding='utf-8') == js_content
+        # A closing script tag inside the spec does not end the embedding script
+        assert '</script><b>' not in inline and '<\\/script><b>' in inline
+
+        # A standalone copy of the shared page references no external script
+        assert '<script src=' not in inline
+        standalone = inline_shared_asset(shared, str(tmp_path))
+        assert '<script src=' not in standalone and js_content in standalone
+
+        # An up-to-date asset is not rewritten
+        mtime = os.path.getmtime(tmp_path / REDOC_ASSET_NAME)
+        os.utime(tmp_path / REDOC_ASSET_NAME, (mtime - 100, mtime - 100))
+        gen.get_html_content(spec, asset_dir=str(tmp_path))
+        assert os.path.getmtime(tmp_path / REDOC_ASSET_NAME) == mtime - 100
+
+    def test_spec_json_is_cached_by_content(self, monkeypatch):
+        """Test that converting the same spec again does not parse it again."""
+        from src import redoc_gen
+
+        spec = "openapi: 3.1.0\ninfo:\n  title: Cached\n  x-date: 2024-01-02\n"
+        first = redoc_gen.spec_to_json(spec)
+        monkeypatch.setattr(redoc_gen.yaml, 'load', lambda *a, **k: pytest.fail("spec parsed again"))
+
+        assert redoc_gen.spec_to_json(spec) is first
+        assert '"x-date": "2024-01-02"' in first
+
+    def test_export_folder_skips_unchanged_specs(self, tmp_path):
+        """Test that a folder export renders changed specs only and removes the pages of deleted ones."""
+        from src.redoc_gen import EXPORT_MANIFEST_NAME, REDOC_ASSET_NAME, RedocGenerator
+
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.yaml").write_text(f"openapi: 3.0.3\ninfo:\n  title: {name}\npaths: {{}}\n")
+        (tmp_path / "broken.yaml").write_text("openapi: [\n")
+        (tmp_path / "notes.txt").write_text("not a spec")
+        docs = tmp_path / "docs"
+        gen = RedocGenerator()
+        logs = []
+
+        first = gen.export_folder(str(tmp_path), log_callback=logs.append, max_workers=3)
+
+        assert [os.path.basename(path) for path in first] == ["a.yaml", "b.yaml", "broken.yaml", "c.yaml"]
+        assert [result["status"] for result in first.values()] == ["exported", "exported", "failed", "exported"]
+        assert sorted(os.listdir(docs)) == sorted(
+            [EXPORT_MANIFEST_NAME, REDOC_ASSET_NAME, "a.html", "b.html", "c.html"]
+        )
+        assert f'<script src="{REDOC_ASSET_NAME}"></script>' in (docs / "b.html").read_text(encoding="utf-8")
+        assert any(line.startswith("FAILED broken.yaml") for line in logs)
+
+        (tmp_path / "b.yaml").write_text("openapi: 3.0.3\ninfo:\n  title: B2\npaths: {}\n")
+        (docs / "c.html").unlink()
+        second = gen.export_folder(str(tmp_path))
+
+        assert {os.path.basename(path): result["status"] for path, result in second.items()} == {
+            "a.yaml": "unchanged", "b.yaml": "exported", "broken.yaml": "failed", "c.yaml": "exported",
+        }
+        assert '"B2"' in (docs / "b.html").read_text(encoding="utf-8")
+        forced = gen.export_folder(str(tmp_path), force=True)
+        assert forced[str(tmp_path / "a.yaml")]["status"] == "exported"
+
+        (tmp_path / "a.yaml").unlink()
+        pruned = gen.export_folder(str(tmp_path), log_callback=logs.append)
+        assert pruned[str(tmp_path / "a.yaml")]["status"] == "removed"
+        assert not (docs / "a.html").exists()
+        assert any(line.startswith("Removed a.html") for line in logs)
+        assert "a.yaml" not in gen.export_folder(str(tmp_path)).keys()
+
 
 class TestDocViewer:
     """
@@ -122,6 +203,36 @@ class TestDocViewer:
         assert hasattr(api, 'get_snap_state'), "Should have get_snap_state method"
         assert hasattr(api, 'sync_editor'), "Should have sync_editor method"
     
+    def test_doc_viewer_saves_standalone_html(self, tmp_path, monkeypatch):
+        """Test that Save HTML of a page using the shared asset writes a standalone file."""
+        from src.doc_viewer import DocViewerAPI
+        from src.redoc_gen import RedocGenerator
+        from multiprocessing import Value
+        import ctypes
+        import types
+
+        gen = RedocGenerator()
+        html_path = tmp_path / "api.html"
+        html_path.write_text(
+            gen.get_html_content("openapi: 3.0.3\ninfo:\n  title: T\npaths: {}\n", asset_dir=str(tmp_path)),
+            encoding='utf-8',
+        )
+        target = tmp_path / "saved" / "api_documentation.html"
+        target.parent.mkdir()
+
+        class _Window:
+            def create_file_dialog(self, dialog_type, save_filename=None):
+                return (str(target),)
+
+        monkeypatch.setitem(sys.modules, 'webview', types.SimpleNamespace(SAVE_DIALOG=30))
+        api = DocViewerAPI(Value(ctypes.c_int, 1), html_path=str(html_path))
+        api._window = _Window()
+
+        assert api.save_html(html_path.read_text(encoding='utf-8'))
+        saved = target.read_text(encoding='utf-8')
+        assert '<script src=' not in saved
+        assert 'Redoc' in saved and len(saved) > len(html_path.read_text(encoding='utf-8'))
+
     def test_doc_viewer_api_snap_toggle(self):
         """Test snap state toggling."""
         from src.doc_viewer import DocViewerAPI
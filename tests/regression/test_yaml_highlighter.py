@@ -0,0 +1,126 @@
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+import pygments.lexers
+
+from src.yaml_highlighter import SYNC_TOKENIZE_CHARS, LazyHighlighter, tokenize_lines
+
+
+TEXT = "openapi: 3.0.3\ninfo:\n  title: Pets\n  description: |\n    multi\n    line\n# comment\n"
+
+
+class _FakeText:
+    """The parts of a Tk text widget the highlighter uses; shows `height` lines from `top`."""
+
+    def __init__(self, text, top=1, height=20):
+        self.text = text
+        self.top = top
+        self.height = height
+        self.tags = {}  # tag -> set of tagged lines
+        self.calls = []
+
+    def line_count(self):
+        return self.text.count("\n") + 1
+
+    def index(self, index):
+        if index == "end-1c":
+            return f"{self.line_count()}.0"
+        y = int(index.split(",")[1])
+        return f"{min(self.top + y, self.line_count())}.0"
+
+    def winfo_height(self):
+        return self.height - 1
+
+    def get(self, start, end):
+        return self.text
+
+    def tag_names(self):
+        return list(self.tags)
+
+    def tag_add(self, tag, *indexes):
+        self.calls.append(tag)
+        lines = self.tags.setdefault(tag, set())
+        lines.update(int(index.split(".")[0]) for index in indexes[::2])
+
+    def tag_remove(self, tag, start, end):
+        self.tags.pop(tag, None)
+
+    def after(self, delay, callback, *args):
+        self.calls.append(("after", callback, args))
+
+    def tagged_lines(self, prefix):
+        return set().union(*[lines for tag, lines in self.tags.items() if tag.startswith(prefix)])
+
+
+def test_spans_follow_the_pygments_tokens_per_line():
+    lexer = pygments.lexers.YamlLexer()
+    spans = tokenize_lines(TEXT, lexer)
+
+    assert spans.line_count == TEXT.count("\n") + 1
+    lines = TEXT.split("\n")
+    for number, line in enumerate(lines, start=1):
+        for start, end, name in spans.line_spans(number):
+            assert name not in {"Token.Text", "Token.Text.Whitespace"}
+            assert 0 <= start < end <= len(line)
+    assert [(s, e, n) for s, e, n in spans.line_spans(1)][0] == (0, 7, "Token.Name.Tag")
+    assert [lines[5][s:e] for s, e, _ in spans.line_spans(6)] == ["line"]
+    assert list(spans.line_spans(0)) == [] and list(spans.line_spans(99)) == []
+
+
+def test_only_blocks_around_the_viewport_are_tagged():
+    text = "key: value\n" * 1000
+    widget = _FakeText(text, top=500, height=20)
+    highlighter = LazyHighlighter(widget, block_lines=50, margin_lines=10)
+
+    highlighter.load(text, pygments.lexers.YamlLexer())
+
+    # lines 490..529 plus margin -> blocks 9 and 10 (lines 451..550)
+    assert widget.tagged_lines("Token") == set(range(451, 551))
+    assert len(widget.calls) == 2 * len(highlighter.spans.names)
+
+    widget.top = 1
+    highlighter.refresh()
+    assert widget.tagged_lines("Token") == set(range(1, 51)) | set(range(451, 551))
+
+
+def test_line_tags_are_applied_lazily_and_replaced():
+    text = "key: value\n" * 1000
+    widget = _FakeText(text, top=1, height=20)
+    highlighter = LazyHighlighter(widget, block_lines=50, margin_lines=10)
+
+    highlighter.set_line_tags({3: "error_line", 10: "warning_line", 900: "error_line", 5000: "info_line"})
+    assert widget.tags == {"error_line": {3}, "warning_line": {10}}
+
+    widget.top = 890
+    highlighter.refresh()
+    assert widget.tags["error_line"] == {3, 900}
+    assert "info_line" not in widget.tags  # past the end of the text
+
+    highlighter.set_line_tags({})
+    assert widget.tags == {}
+
+
+def test_large_texts_are_tokenised_in_the_background():
+    text = "key: value\n" * (SYNC_TOKENIZE_CHARS // 5)
+    widget = _FakeText(text)
+    highlighter = LazyHighlighter(widget, block_lines=50, margin_lines=10)
+    lexer = pygments.lexers.YamlLexer()
+
+    highlighter.load(text, lexer)
+    highlighter.load(text, lexer)  # supersedes the first load
+    deadline = time.time() + 10
+    while sum(isinstance(call, tuple) for call in widget.calls) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert highlighter.spans is None and widget.tags == {}
+
+    results = [call for call in widget.calls if isinstance(call, tuple)]
+    for _, callback, args in results:
+        callback(*args)
+    latest = next(args[1] for _, _, args in results if args[0] == 2)
+    assert highlighter.spans is latest
+    assert widget.tagged_lines("Token") == set(range(1, 51))
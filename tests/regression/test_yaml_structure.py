@@ -0,0 +1,106 @@
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+from src.yaml_structure import SourceMapIndex, YamlStructureIndex, json_pointer_path
+
+
+TEXT = """openapi: 3.0.3
+info:
+  title: Pets
+paths:
+  /pets:
+    get:
+      operationId: listPets
+      summary: List pets
+      parameters:
+        - name: limit
+          in: query
+      responses:
+        '200':
+          description: |
+            A list
+
+    post:
+      operationId: "createPet"
+      responses: {}
+components: {}
+"""
+
+
+def test_paths_and_line_ranges():
+    index = YamlStructureIndex(TEXT)
+
+    assert index.line_of(("paths", "/pets", "get")) == 6
+    assert index.range_of(("paths", "/pets", "get")) == (6, 16)
+    assert index.range_of(("paths", "/pets", "get", "responses", "200", "description")) == (14, 16)
+    assert index.range_of(("components",)) == (20, 21)
+    assert index.line_of(("paths", "/missing")) is None
+    assert index.closest_line(("paths", "/pets", "get", "x-missing", "deeper")) == 6
+
+    assert index.path_at(1) == ("openapi",)
+    assert index.path_at(3) == ("info", "title")
+    assert index.path_at(10) == ("paths", "/pets", "get", "parameters", "0", "name")
+    assert index.path_at(11) == ("paths", "/pets", "get", "parameters", "0", "in")
+    assert index.path_at(16) == ("paths", "/pets", "get", "responses", "200", "description")
+    assert index.path_at(17) == ("paths", "/pets", "post")
+    assert index.path_at(0) == ()
+
+
+def test_operations_by_id_and_line():
+    index = YamlStructureIndex(TEXT)
+
+    assert index.operation_ids == {"listPets": 7, "createPet": 18}
+    assert index.summaries == {"List pets": 8}
+    assert index.operation_at(12) == ("listPets", 7)
+    assert index.operation_at(2) is None
+    assert index.next_operation(2) == ("listPets", 7)
+    assert index.next_operation(8) == ("createPet", 18)
+    assert index.next_operation(19) is None
+
+
+def test_unparsable_text_gives_an_empty_index():
+    index = YamlStructureIndex("a: [\n")
+
+    assert len(index) == 0
+    assert index.path_at(1) == () and index.next_operation(1) is None
+
+
+def test_json_pointer_paths():
+    assert json_pointer_path("#/paths/~1pets~1{id}/get") == ("paths", "/pets/{id}", "get")
+    assert json_pointer_path("#/") == ()
+
+
+def test_source_map_resolves_the_closest_mapped_parent():
+    sources = SourceMapIndex(
+        {
+            "tags": {"file": "$index.xlsx", "sheet": "Tags"},
+            "paths./pets.get.parameters": {"file": "pets", "sheet": "Parameters"},
+            "paths./pets.get.responses.200": {"file": "pets", "sheet": "200"},
+        }
+    )
+
+    assert sources.resolve("paths > /pets > get > responses > 200 > content")["sheet"] == "200"
+    assert sources.resolve("Root.paths > /pets > get > parameters > 0")["sheet"] == "Parameters"
+    assert sources.resolve("paths > /pets > get") is None
+    assert sources.resolve("tags > 0")["file"] == "$index.xlsx"
+    assert sources.resolve("") is None
+
+
+def test_large_document_queries_are_fast():
+    text = "paths:\n" + "".join(
+        f"  /items/{i}:\n    get:\n      operationId: item{i}\n      responses:\n        '200':\n          description: OK\n"
+        for i in range(5000)
+    )
+    index = YamlStructureIndex(text)
+
+    start = time.perf_counter()
+    for line in range(1, 30000, 7):
+        index.path_at(line)
+        index.operation_at(line) or index.next_operation(line)
+    assert time.perf_counter() - start < 1
+    assert index.operation_at(6 * 4321 + 7) == ("item4321", 6 * 4321 + 4)